@@ -42,7 +42,7 @@ from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.objective import Objective
 from pyomo.core.base.set_types import *
 from pyomo.core.base.suffix import active_import_suffix_generator
-from pyomo.core.base.symbol_map import SymbolMap
+from pyomo.core.base.symbol_map import SymbolMap, IntegerSymbolMap
 from pyomo.core.base.indexed_component import IndexedComponent
 from pyomo.core.base.DataPortal import *
 from pyomo.core.base.plugin import *
@@ -52,9 +52,15 @@ from pyomo.core.base.sets import Set
 from pyomo.core.base.component import register_component, Component, ComponentUID
 from pyomo.core.base.plugin import TransformationFactory
 from pyomo.core.base.label import CNameLabeler, CuidLabeler
+from pyomo.core.base.expr_profiler import expression_profiler
 import pyomo.opt
 from pyomo.opt.base import ProblemFormat, guess_format
-from pyomo.opt.results import SolverResults, Solution, SolutionStatus, UndefinedData
+from pyomo.opt.results import (SolverResults,
+                               Solution,
+                               SolutionStatus,
+                               SymbolColumns,
+                               NumberedSymbols,
+                               UndefinedData)
 
 from six import itervalues, iteritems, StringIO, string_types
 from six.moves import xrange
@@ -119,6 +125,10 @@ class ModelSolution(object):
         #
         for name in ['objective', 'variable', 'constraint', 'problem']:
             self._entry[name] = {}
+        #
+        # columns[name]: (object list, SymbolColumns)
+        #
+        self._columns = {}
 
     def __getattr__(self, name):
         if name[0] == '_':
@@ -131,6 +141,53 @@ class ModelSolution(object):
             return
         self.__dict__['_metadata'][name] = val
 
+    def _materialize(self):
+        """
+        Move the columnar data into the entry dictionaries.
+        """
+        for name, (objs, entries) in iteritems(self._columns):
+            tmp = self._entry[name]
+            for i, obj in enumerate(objs):
+                if (obj is None) or (id(obj) in tmp):
+                    continue
+                tmp[id(obj)] = (weakref_ref(obj), dict(entries.entry(i)))
+        self._columns = {}
+
+
+def _column_objects(smap, symbols):
+    """
+    Return the list of objects for the symbols of a SymbolColumns
+    object, with None for the symbols that are not in the symbol map.
+    """
+    if isinstance(symbols, NumberedSymbols) and \
+       isinstance(smap, IntegerSymbolMap):
+        objs = smap.numberedObjects(symbols.prefix)[:len(symbols)]
+        return objs + [None]*(len(symbols) - len(objs))
+    bySymbol = smap.bySymbol
+    aliases = smap.aliases
+    objs = []
+    for symb in symbols:
+        obj = bySymbol.get(symb, None)
+        if obj is None:
+            obj = aliases.get(symb, None)
+        objs.append(None if obj is None else obj())
+    return objs
+
+
+def _numbered_objects(smap, prefix, n):
+    """
+    Return the first n objects (or all the objects, if n is None) with
+    numbered symbols prefix0, prefix1, ... in a symbol map.
+    """
+    if isinstance(smap, IntegerSymbolMap):
+        return smap.numberedObjects(prefix)[:n]
+    bySymbol = smap.bySymbol
+    if n is None:
+        n = 0
+        while (prefix+str(n)) in bySymbol:
+            n += 1
+    return [bySymbol[prefix+str(i)]() for i in xrange(n)]
+
 
 class ModelSolutions(object):
 
@@ -151,6 +208,7 @@ class ModelSolutions(object):
         state['_instance'] = self._instance()
         solutions = []
         for soln in self.solutions:
+            soln._materialize()
             soln_ = {}
             soln_['metadata'] = soln._metadata
             tmp = {}
@@ -239,6 +297,30 @@ class ModelSolutions(object):
             results._smap = None
         else:
             smap_id = results.__dict__.get('_smap_id')
+        #
+        # Values read with values_only=True (see the fast_load solve
+        # option) are loaded directly into the model, and no solution
+        # is stored
+        #
+        sol_values = results.__dict__.get('_sol_values', None)
+        if (sol_values is not None) and (smap_id is not None):
+            if (select != 0) or (id not in (None, 0)):
+                raise ValueError(
+                    "Cannot load solver results read with the fast_load "
+                    "option with select=%s and id=%s: the values are loaded "
+                    "directly into the model and no solution is stored"
+                    % (select, id))
+            with PauseGC():
+                self._load_values(
+                    sol_values,
+                    self.symbol_map[smap_id],
+                    allow_consistent_values_for_fixed_vars=allow_consistent_values_for_fixed_vars,
+                    default_variable_value=default_variable_value,
+                    ignore_fixed_vars=ignore_fixed_vars)
+            results._sol_values = None
+            if delete_symbol_map:
+                self.delete_symbol_map(smap_id)
+            return
         cache = {}
         if not id is None:
             self.add_solution(results.solution(id),
@@ -269,6 +351,71 @@ class ModelSolutions(object):
                 ignore_invalid_labels=ignore_invalid_labels,
                 ignore_fixed_vars=ignore_fixed_vars)
 
+    def _load_values(self,
+                     values,
+                     smap,
+                     allow_consistent_values_for_fixed_vars=False,
+                     default_variable_value=None,
+                     ignore_fixed_vars=True):
+        """
+        Load the values returned by a results reader with
+        values_only=True into the model.  The values are lists in the
+        order of the numbered symbols of the symbol map ('v0', 'v1',
+        ..., 'c0', ...).  The options are applied as in add_solution()
+        and select(): the values of fixed variables are never changed.
+        """
+        instance = self._instance()
+        if not (ignore_fixed_vars or allow_consistent_values_for_fixed_vars):
+            # (add_solution() stores the values of all the fixed
+            # variables in the solution)
+            for vdata in instance.component_data_objects(Var):
+                if vdata.fixed:
+                    msg = "Variable '%s' in model '%s' is currently fixed - new" \
+                          ' value is not expected in solution'
+                    raise TypeError(msg % ( vdata.cname(), instance.name ))
+        instance._flag_vars_as_stale()
+        valid_import_suffixes = dict(active_import_suffix_generator(instance))
+        for suffix in itervalues(valid_import_suffixes):
+            suffix.clear_all_values()
+
+        x = values.x
+        if default_variable_value is None:
+            variables = _numbered_objects(smap, 'v', len(x))
+        else:
+            # (variables without a value in the results)
+            variables = _numbered_objects(smap, 'v', None)
+            x = list(x) + \
+                [default_variable_value]*(len(variables) - len(x))
+        for vdata, val in zip(variables, x):
+            if (vdata is None) or vdata.fixed:
+                continue
+            vdata.value = val
+            vdata.stale = False
+
+        if 'dual' in valid_import_suffixes:
+            y = values.y
+            suffix = valid_import_suffixes['dual']
+            for cdata, val in zip(_numbered_objects(smap, 'c', len(y)), y):
+                if cdata is not None:
+                    suffix[cdata] = val
+
+        prefixes = ('v', 'c', 'o')
+        for name, kind, indices, suffix_values in values.suffixes:
+            name = name[0].lower() + name[1:]
+            if name not in valid_import_suffixes:
+                continue
+            suffix = valid_import_suffixes[name]
+            if kind == 3:
+                for val in suffix_values:
+                    suffix[instance] = val
+                continue
+            if not len(indices):
+                continue
+            objs = _numbered_objects(smap, prefixes[kind], max(indices)+1)
+            for i, val in zip(indices, suffix_values):
+                if objs[i] is not None:
+                    suffix[objs[i]] = val
+
     def store_to(self, results, cuid=False):
         """
         Return a Solution() object that is populated with the values in the model.
@@ -278,6 +425,7 @@ class ModelSolutions(object):
         results._smap_id = None
 
         for soln_ in self.solutions:
+            soln_._materialize()
             soln = Solution()
             soln._cuid = cuid
             for key, val in iteritems(soln_._metadata):
@@ -358,7 +506,10 @@ class ModelSolutions(object):
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
                     tmp = soln._entry[name]
-                    for cuid, val in iteritems(getattr(solution, name)):
+                    entries = getattr(solution, name)
+                    if isinstance(entries, SymbolColumns):
+                        entries = entries.todict()
+                    for cuid, val in iteritems(entries):
                         obj = cache.get(cuid, None)
                         if obj is None:
                             if ignore_invalid_labels:
@@ -379,7 +530,10 @@ class ModelSolutions(object):
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
                     tmp = soln._entry[name]
-                    for symb, val in iteritems(getattr(solution, name)):
+                    entries = getattr(solution, name)
+                    if isinstance(entries, SymbolColumns):
+                        entries = entries.todict()
+                    for symb, val in iteritems(entries):
                         obj = cache.get(symb, None)
                         if obj is None:
                             if ignore_invalid_labels:
@@ -393,7 +547,24 @@ class ModelSolutions(object):
             smap = self.symbol_map[smap_id]
             for name in ['problem', 'objective', 'variable', 'constraint']:
                 tmp = soln._entry[name]
-                for symb, val in iteritems(getattr(solution, name)):
+                entries = getattr(solution, name)
+                if isinstance(entries, SymbolColumns):
+                    #
+                    # Columnar data is stored with the list of objects,
+                    # and loaded by select() without per-symbol
+                    # dictionaries
+                    #
+                    objs = _column_objects(smap, entries.symbols)
+                    if not ignore_missing_symbols:
+                        for symb, obj in zip(entries.symbols, objs):
+                            if obj is None:
+                                raise RuntimeError(
+                                    "ERROR: Symbol %s is missing from "
+                                    "model %s when loading with a symbol "
+                                    "map!" % (symb, instance.name))
+                    soln._columns[name] = (objs, entries)
+                    continue
+                for symb, val in iteritems(entries):
                     if symb in smap.bySymbol:
                         obj = smap.bySymbol[symb]
                     elif symb in smap.aliases:
@@ -420,6 +591,12 @@ class ModelSolutions(object):
         # Collect fixed variables
         #
         tmp = soln._entry['variable']
+        covered = ()
+        if (default_variable_value is not None) and \
+           ('variable' in soln._columns):
+            covered = set(id(vdata) for vdata
+                          in soln._columns['variable'][0]
+                          if vdata is not None)
         for vdata in instance.component_data_objects(Var):
             id_ = id(vdata)
             if vdata.fixed:
@@ -427,7 +604,8 @@ class ModelSolutions(object):
             elif (default_variable_value is not None) and \
                  (smap_id is not None) and \
                  (id_ in smap.byObject) and \
-                 (id_ not in tmp):
+                 (id_ not in tmp) and \
+                 (id_ not in covered):
                 tmp[id_] = (weakref_ref(vdata), {'Value':default_variable_value})
 
         self.solutions.append(soln)
@@ -534,6 +712,30 @@ class ModelSolutions(object):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
                 if attr_key in valid_import_suffixes:
                     valid_import_suffixes[attr_key][cdata] = attr_value
+        #
+        # Load columnar data (values and suffixes).  Fixed variables
+        # are skipped, since their values are stored in the variable
+        # entries by add_solution().
+        #
+        for name, (objs, entries) in iteritems(soln._columns):
+            is_var = name == 'variable'
+            if is_var and ('Value' in entries.columns):
+                for vdata, val in zip(objs, entries.column('Value')):
+                    if (vdata is None) or vdata.fixed or (val != val):
+                        continue
+                    vdata.value = val
+                    vdata.stale = False
+            for _attr_key in entries.columns:
+                attr_key = _attr_key[0].lower() + _attr_key[1:]
+                if (is_var and attr_key == 'value') or \
+                   (attr_key not in valid_import_suffixes):
+                    continue
+                suffix = valid_import_suffixes[attr_key]
+                for obj, val in zip(objs, entries.column(_attr_key)):
+                    if (obj is None) or (val != val) or \
+                       (is_var and obj.fixed):
+                        continue
+                    suffix[obj] = val
 
 
 class Model(SimpleBlock):
@@ -620,6 +822,9 @@ use the AbstractModel or ConcreteModel class instead.""")
             namespaces:         A list of namespaces used to select data.
             profile_memory:     A number that indicates the profiling level.
             report_timing:      Report timing statistics during construction.
+                                    If expression profiling is enabled
+                                    (see enable_expression_profiling()),
+                                    also report the expression profile.
         """
         #
         # Generate a warning if this is a concrete model but the
@@ -691,11 +896,17 @@ constructed model; returning a clone of the current model instance.""")
         if None not in _namespaces:
             _namespaces.append(None)
 
+        if expression_profiler.enabled:
+            expression_profiler.reset()
+
         instance.load( data,
                        namespaces=_namespaces,
                        profile_memory=profile_memory,
                        report_timing=report_timing )
 
+        if report_timing is True and expression_profiler.enabled:
+            expression_profiler.report()
+
         #
         # Preprocess the new model
         #
@@ -728,8 +939,8 @@ constructed model; returning a clone of the current model instance.""")
         instance._constructed = True
         return instance
 
-    def clone(self):
-        instance = SimpleBlock.clone(self)
+    def clone(self, share_structure=False):
+        instance = SimpleBlock.clone(self, share_structure)
         # Do not keep cloned solutions, which point to the original model
         instance.solutions.clear()
         instance.solutions._instance = weakref_ref(instance)
@@ -914,7 +1125,10 @@ from solvers are immediately loaded into the original model instance.""")
                           declaration.__class__.__name__,
                           declaration.cname(), _blockName, str(data) )
         try:
-            declaration.construct(data)
+            if expression_profiler.enabled:
+                expression_profiler.construct(declaration, data)
+            else:
+                declaration.construct(data)
         except:
             err = sys.exc_info()[1]
             logger.error(
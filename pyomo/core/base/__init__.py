@@ -11,6 +11,7 @@ import pyomo.core.base.log_config
 from pyomo.core.base.config import PyomoOptions
 
 from pyomo.core.base.expr import *
+from pyomo.core.base.expr_profiler import *
 from pyomo.core.base.numvalue import *
 from pyomo.core.base.expression import *
 from pyomo.core.base.label import *
@@ -27,6 +28,7 @@ from pyomo.core.base.sets import *
 from pyomo.core.base.param import *
 from pyomo.core.base.var import *
 from pyomo.core.base.constraint import *
+from pyomo.core.base.expr_tape import *
 from pyomo.core.base.objective import *
 from pyomo.core.base.connector import *
 from pyomo.core.base.sos import *
@@ -45,6 +47,7 @@ from pyomo.core.base.util import *
 from pyomo.core.base.rangeset import *
 
 from pyomo.core.base.instance2dat import *
+from pyomo.core.base.instance_archive import *
 
 from pyomo.core.base.register_numpy_types import *
 
@@ -22,12 +22,14 @@ from six import iteritems, itervalues, StringIO, string_types, \
 
 from pyomo.core.base.plugin import *
 from pyomo.core.base.component import Component, ActiveComponentData, \
-    ComponentUID, register_component
+    ComponentUID, register_component, _StructureRevision, \
+    _cname_index_strings
 from pyomo.core.base.sets import Set,  _SetDataBase
 from pyomo.core.base.var import Var
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.indexed_component import IndexedComponent, \
     ActiveIndexedComponent, UnindexedComponent_set
+from pyomo.core.base.expr_profiler import expression_profiler
 
 logger = logging.getLogger('pyomo.core')
 
@@ -454,6 +456,11 @@ class _BlockData(ActiveComponentData):
             del ans['_canonical_repn']
         if '_ampl_repn' in ans:
             del ans['_ampl_repn']
+        # The component data caches are rebuilt on demand
+        if '_component_data_cache' in ans:
+            del ans['_component_data_cache']
+        if '_cname_cache' in ans:
+            del ans['_cname_cache']
         return ans
 
     def __setstate__(self, state):
@@ -773,6 +780,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        _StructureRevision.value += 1
         #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
@@ -846,7 +854,10 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                               val.__class__.__name__, val.cname(),
                               _blockName, str(data) )
             try:
-                val.construct(data)
+                if expression_profiler.enabled:
+                    expression_profiler.construct(val, data)
+                else:
+                    val.construct(data)
             except:
                 err = sys.exc_info()[1]
                 logger.error(
@@ -889,6 +900,11 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.type()]
+        _StructureRevision.value += 1
+        cname_cache = self.__dict__.get('_cname_cache', None)
+        if cname_cache is not None:
+            cname_cache.pop((id(obj), True), None)
+            cname_cache.pop((id(obj), False), None)
 
         # Clear the _parent attribute
         obj._parent = None
@@ -948,6 +964,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 ctype_info[1] = prev
 
         obj._type = new_ctype
+        _StructureRevision.value += 1
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -974,9 +991,19 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self):
+    def clone(self, share_structure=False):
         """
-        TODO
+        Create a copy of this block and all components beneath it.
+
+        If share_structure is True, the copy shares immutable data with
+        this block instead of copying it: the members of constructed
+        Sets, the values of immutable Params, and (for coopr3 expression
+        trees) every expression subtree that does not reference a
+        component declared beneath this block.  Only the component
+        objects, their data (Vars, mutable Params, Constraints, ...),
+        and the expression nodes that lead to those data are copied.
+        Shared Sets must not be modified (e.g., with add() or remove())
+        after cloning, as the change would be seen by both blocks.
         """
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
@@ -991,10 +1018,91 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # copying certain "reserved" components (like Any,
         # NonNegativeReals, etc).
         #
-        new_block = copy.deepcopy(self, {'__block_scope__': set( (id(self),) )})
+        memo = {'__block_scope__': set( (id(self),) )}
+        if share_structure:
+            self._add_shared_structure(memo)
+        new_block = copy.deepcopy(self, memo)
         new_block._parent = None
         return new_block
 
+    def _add_shared_structure(self, memo):
+        """
+        Seed a deepcopy memo so that the immutable data beneath this
+        block map onto themselves (i.e., are shared and not copied).
+        """
+        from pyomo.core.base import expr_common
+        from pyomo.core.base.param import Param
+        from pyomo.core.base.constraint import Constraint
+        from pyomo.core.base.objective import Objective
+        from pyomo.core.base.expression import Expression
+
+        # Set members (the containers are replaced -- not modified --
+        # when a Set is re-sorted)
+        for setdata in self.component_data_objects(Set):
+            if not setdata.parent_component()._constructed:
+                continue
+            for name in ('value', 'order_dict'):
+                val = getattr(setdata, name, None)
+                if val.__class__ in (set, frozenset, list, dict):
+                    memo[id(val)] = val
+
+        # Immutable Param values (scalar Params store their value on the
+        # component, which is copied anyway)
+        for param in self.component_objects(Param):
+            if param._constructed and not param._mutable \
+                    and param.is_indexed():
+                memo[id(param._data)] = param._data
+
+        # Expression subtrees.  The pyomo4 trees keep a reference to the
+        # (single) parent expression, so we only share coopr3 trees.
+        if expr_common.mode is not expr_common.Mode.coopr3_trees:
+            return
+        from pyomo.core.base.expr_coopr3 import _ExpressionBase, \
+            _ProductExpression, _ExternalFunctionExpression
+
+        local = set(id(c) for c in self.component_objects())
+        local.update(id(c) for c in self.component_data_objects())
+        _shareable = {}
+
+        def _check(node):
+            # Return True if node does not reference data in this block
+            # (and record the maximal shareable subtrees in the memo)
+            ans = _shareable.get(id(node), None)
+            if ans is not None:
+                return ans
+            if node.__class__ is _ProductExpression:
+                args = node._numerator + node._denominator
+            else:
+                args = node._args
+            ans = node.__class__ is not _ExternalFunctionExpression \
+                or id(node._fcn) not in local
+            subtrees = []
+            for arg in args:
+                if id(arg) in local:
+                    ans = False
+                elif isinstance(arg, _ExpressionBase):
+                    if _check(arg):
+                        subtrees.append(arg)
+                    else:
+                        ans = False
+            if not ans:
+                for arg in subtrees:
+                    memo[id(arg)] = arg
+            _shareable[id(node)] = ans
+            return ans
+
+        def _share(expr):
+            if isinstance(expr, _ExpressionBase) and _check(expr):
+                memo[id(expr)] = expr
+
+        for con in self.component_data_objects(Constraint):
+            _share(con.body)
+            _share(con.lower)
+            _share(con.upper)
+        for ctype in (Objective, Expression):
+            for data in self.component_data_objects(ctype):
+                _share(data.expr)
+
     def contains_component(self, ctype):
         """
         Return True if the component type is in _ctypes and ... TODO.
@@ -1137,6 +1245,100 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             for x in _block.component_map( ctype, active, sort ).itervalues():
                 yield x
 
+    def _component_data_list(self, ctype, active, descend_into,
+                             descent_order):
+        """
+        Return a list of the component data objects in this block (and
+        all sub-blocks, if descend_into is True).
+
+        The lists are cached on the block (one per ctype, active flag
+        and traversal).  A cached list is a snapshot: it is returned
+        only while the block structure (tracked by _StructureRevision:
+        components added, removed, activated or deactivated anywhere)
+        and the data of every component that contributed to it
+        (tracked by the revision of the component's _data dictionary)
+        are unchanged.  Callers must not modify the list.
+        """
+        cache = self.__dict__.get('_component_data_cache', None)
+        if cache is None:
+            cache = {}
+            super(_BlockData, self).__setattr__(
+                '_component_data_cache', cache)
+        key = (ctype, active, descend_into, descent_order)
+        entry = cache.get(key, None)
+        if entry is not None and entry[0] == _StructureRevision.value:
+            for comp, data, revision in entry[1]:
+                if comp._data is not data or \
+                   getattr(data, 'revision', len(data)) != revision:
+                    break
+            else:
+                return entry[2]
+
+        revision = _StructureRevision.value
+        if descend_into:
+            blocks = self.block_data_objects(active=active,
+                                             descend_into=True,
+                                             descent_order=descent_order)
+            # new sub-blocks change the list, too
+            ctypes = (ctype,) if ctype is Block else (ctype, Block)
+        else:
+            blocks = (self,)
+            ctypes = (ctype,)
+        revisions = []
+        ans = []
+        for block in blocks:
+            for comp in block.component_map(ctypes).itervalues():
+                data = getattr(comp, '_data', None)
+                if data is not None:
+                    # (containers without a revision, e.g., the
+                    # immutable rows of a MatrixConstraint, are
+                    # checked by size)
+                    revisions.append(
+                        (comp, data, getattr(data, 'revision', len(data))))
+            ans.extend(data for name, data
+                       in block._component_data_iter(ctype, active))
+        cache[key] = (revision, revisions, ans)
+        return ans
+
+    def _component_data_names(self, component, fully_qualified=False,
+                              translate=None):
+        """
+        Return a dictionary that maps id(data) to the name of each
+        component data object in an indexed component on this block.
+        If translate is not None, the names are mapped through the
+        translate function (e.g., cpxlp_label_from_name).
+
+        The names for all of the component data are generated in one
+        pass and cached on the block (along with the translated names).
+        They are regenerated when the component's name changes (i.e.,
+        the component or one of its parent blocks is renamed or moved)
+        or when component data are added or removed.
+        """
+        cache = self.__dict__.get('_cname_cache', None)
+        if cache is None:
+            cache = {}
+            super(_BlockData, self).__setattr__('_cname_cache', cache)
+        key = (id(component), fully_qualified)
+        base = component.cname(fully_qualified)
+        data = component._data
+        entry = cache.get(key, None)
+        if entry is None or entry[0] != base or entry[1] is not data \
+                or len(entry[2]) != len(data):
+            # Note: the entry holds references to the component data so
+            # that their ids are not reused while the entry exists.
+            keys = list(data.keys())
+            objs = [data[k] for k in keys]
+            names = dict(zip(map(id, objs),
+                             [base + s for s in _cname_index_strings(keys)]))
+            entry = (base, data, objs, {None: names})
+            cache[key] = entry
+        labels = entry[3].get(translate, None)
+        if labels is None:
+            labels = dict((k, translate(v))
+                          for k, v in iteritems(entry[3][None]))
+            entry[3][translate] = labels
+        return labels
+
     def component_data_objects(self,
                                ctype=None,
                                active=None,
@@ -1149,6 +1351,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 	    block.  By default, this generator recursively descends
 	    into sub-blocks.
         """
+        if isclass(ctype) and not SortComponents.sort_names(sort) \
+                and not SortComponents.sort_indices(sort):
+            for x in self._component_data_list(ctype, active,
+                                               descend_into, descent_order):
+                yield x
+            return
         if not descend_into:
             for x in self._component_data_iter(ctype=ctype,
                                                active=active,
@@ -17,30 +17,56 @@ from copy import deepcopy
 import pyomo.util
 from pyomo.core.base.plugin import register_component
 from pyomo.core.base.misc import tabular_writer
+from pyomo.core.base.numvalue import native_types
 
-from six import iteritems, string_types
+from six import iteritems, string_types, integer_types
+
+class _StructureRevision(object):
+    """
+    A counter of structural changes to Pyomo models.
+
+    The counter is incremented whenever components are added to or
+    removed from a block, or components (or component data) are
+    activated or deactivated.  Changes to the component data of an
+    indexed component are tracked separately, by the revision of its
+    _data dictionary (see _ComponentDataDict).  Blocks use both to
+    validate their cached lists of component data.
+    """
+    value = 0
+
+def _escape(x):
+    # We need to quote set members (because people put things like
+    # spaces - or worse commas - in their set names).  Our plan is to
+    # put the strings in single quotes... but that requires escaping
+    # any single quotes in the string... which in turn requires
+    # escaping the escape character.
+    x = x.replace("\\", "\\\\").replace("'", "\\'")
+    if ',' in x or "'" in x:
+        return "'"+x+"'"
+    else:
+        return x
 
 def _cname_index_generator(idx):
     """
     Return a string representation of an index.
     """
-    def _escape(x):
-        # We need to quote set members (because people put things like
-        # spaces - or worse commas - in their set names).  Our plan is to
-        # put the strings in single quotes... but that requires escaping
-        # any single quotes in the string... which in turn requires
-        # escaping the escape character.
-        x = x.replace("\\", "\\\\").replace("'", "\\'")
-        if ',' in x or "'" in x:
-            return "'"+x+"'"
-        else:
-            return x
-
     if idx.__class__ is tuple:
         return "[" + ",".join(_escape(str(i)) for i in idx) + "]"
     else:
         return "[" + _escape(str(idx)) + "]"
 
+def _cname_index_strings(indices):
+    """
+    Return the string representations of a sequence of indices.
+
+    This is equivalent to calling _cname_index_generator() for each
+    index, but handles the common case of integer indices in bulk.
+    """
+    indices = list(indices)
+    if all(idx.__class__ in integer_types for idx in indices):
+        return ["[%d]" % idx for idx in indices]
+    return [_cname_index_generator(idx) for idx in indices]
+
 
 def cname(component, index=None, fully_qualified=False):
     """
@@ -354,10 +380,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active=True
+        _StructureRevision.value += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active=False
+        _StructureRevision.value += 1
 
 
 class ComponentData(object):
@@ -529,7 +557,17 @@ class ComponentData(object):
         # update the _parent refs appropriately, and since this is a
         # slot-ized class, we cannot overwrite the __deepcopy__
         # attribute to prevent infinite recursion.
-        ans.__setstate__(deepcopy(self.__getstate__(), memo))
+        #
+        # The state keys are attribute names, and atomic values
+        # (numbers, strings, None) need not be copied, so we only
+        # deepcopy the remaining values (instead of the state dict).
+        state = {}
+        for key, val in iteritems(self.__getstate__()):
+            if val.__class__ in native_types:
+                state[key] = val
+            else:
+                state[key] = deepcopy(val, memo)
+        ans.__setstate__(state)
         return ans
 
     def parent_component(self):
@@ -610,21 +648,28 @@ class ComponentData(object):
         #
         base = c.cname(fully_qualified, name_buffer)
         if name_buffer is not None:
-            # Iterate through the dictionary and generate all names in the buffer
-            for idx, obj in iteritems(c):
-                name_buffer[id(obj)] = base + _cname_index_generator(idx)
+            block = c.parent_block()
+            if block is not None:
+                # Copy all of the names (which are cached on the block)
+                # into the buffer
+                name_buffer.update(
+                    block._component_data_names(c, fully_qualified) )
+            else:
+                # Iterate through the dictionary and generate all names
+                # in the buffer
+                for idx, obj in iteritems(c):
+                    name_buffer[id(obj)] = base + _cname_index_generator(idx)
             if id(self) in name_buffer:
                 # Return the name if it is in the buffer
                 return name_buffer[id(self)]
-        else:
-            #
-            # No buffer, so we iterate through the component _data
-            # dictionary until we find this object.  This can be much
-            # more expensive than if a buffer is provided.
-            #
-            for idx, obj in iteritems(c):
-                if obj is self:
-                    return base + _cname_index_generator(idx)
+        #
+        # No buffer, so we iterate through the component _data
+        # dictionary until we find this object.  This can be much
+        # more expensive than if a buffer is provided.
+        #
+        for idx, obj in iteritems(c):
+            if obj is self:
+                return base + _cname_index_generator(idx)
         #
         raise RuntimeError("Fatal error: cannot find the component data in "
                            "the owning component's _data dictionary.")
@@ -719,10 +764,12 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _StructureRevision.value += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _StructureRevision.value += 1
 
 
 class ComponentUID(object):
@@ -613,6 +613,11 @@ class Constraint(ActiveIndexedComponent):
         expr            A Pyomo expression for this constraint
         rule            A function that is used to construct constraint
                             expressions
+        lazy            If True, then the rule of an indexed constraint
+                            is only applied to an index when the index
+                            is first accessed (all remaining indices are
+                            constructed when the constraint is iterated
+                            over)
         doc             A text string describing this component
         name            A name for this component
 
@@ -653,6 +658,7 @@ class Constraint(ActiveIndexedComponent):
     def __init__(self, *args, **kwargs):
         self.rule = kwargs.pop('rule', None)
         self._init_expr = kwargs.pop('expr', None)
+        self._lazy_construction = kwargs.pop('lazy', False)
         #if self.rule is None and self._init_expr is None:
         #    raise ValueError("A simple Constraint component requires a 'rule' or 'expr' option")
         kwargs.setdefault('ctype', Constraint)
@@ -726,30 +732,57 @@ class Constraint(ActiveIndexedComponent):
                     "Cannot initialize multiple indices of a "
                     "constraint with a single expression")
 
+            if self._lazy_construction:
+                # The rule is applied when the indices are accessed
+                self._lazy = set()
+                return
             for ndx in self._index:
-                try:
-                    tmp = apply_indexed_rule(self,
-                                             _init_rule,
-                                             _self_parent,
-                                             ndx)
-                except Exception:
-                    err = sys.exc_info()[1]
-                    logger.error(
-                        "Rule failed when generating expression for "
-                        "constraint %s with index %s:\n%s: %s"
-                        % (self.cname(True),
-                           str(ndx),
-                           type(err).__name__,
-                           err))
-                    raise
-                if tmp is None:
-                    raise ValueError(
-                        "Constraint rule returned None instead of "
-                        "Constraint.Skip for index %s" % str(ndx))
+                self._construct_index(ndx)
+
+    def _construct_index(self, ndx):
+        """
+        Apply the constraint rule to an index and add the resulting
+        constraint data.
+        """
+        try:
+            tmp = apply_indexed_rule(self,
+                                     self.rule,
+                                     self._parent(),
+                                     ndx)
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "constraint %s with index %s:\n%s: %s"
+                % (self.cname(True),
+                   str(ndx),
+                   type(err).__name__,
+                   err))
+            raise
+        if tmp is None:
+            raise ValueError(
+                "Constraint rule returned None instead of "
+                "Constraint.Skip for index %s" % str(ndx))
 
-                cdata = self._check_skip_add(ndx, tmp)
-                if cdata is not None:
-                    self._data[ndx] = cdata
+        cdata = self._check_skip_add(ndx, tmp)
+        if cdata is not None:
+            self._data[ndx] = cdata
+        return cdata
+
+    def _default(self, idx):
+        """
+        Returns the constraint data of an index that has not been
+        constructed (for lazy constraints).
+        """
+        if self._lazy is None:
+            return super(Constraint, self)._default(idx)
+        cdata = self._construct_lazy_index(idx)
+        if cdata is None:
+            raise KeyError(
+                "Index '%s' is not valid for constraint '%s': the "
+                "constraint rule skipped this index"
+                % (idx, self.cname(True)))
+        return cdata
 
     def _pprint(self):
         """
@@ -1077,6 +1110,9 @@ class IndexedConstraint(Constraint):
     #
     def add(self, index, expr):
         """Add a constraint with a given index."""
+        if self._lazy is not None:
+            # the rule is not applied to explicitly added indices
+            self._lazy.add(index)
         cdata = self._check_skip_add(index, expr)
         if cdata is not None:
             self._data[index] = cdata
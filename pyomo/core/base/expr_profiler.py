@@ -0,0 +1,204 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Instrumentation for expression tree construction.
+#
+# When enabled, the profiler counts expression nodes allocated, clones
+# performed by clone_expression(), and the time spent constructing each
+# component (i.e., evaluating its rule).  When disabled, the expression
+# system runs the original (uninstrumented) functions: enabling the
+# profiler swaps counting wrappers into the expression modules and
+# disabling it puts the originals back.
+#
+
+__all__ = ( 'enable_expression_profiling', 'disable_expression_profiling',
+            'expression_profiling_enabled', 'expression_profiler' )
+
+import sys
+import time
+
+from pyomo.core.base.numvalue import native_numeric_types
+
+
+class _ComponentRecord(object):
+    __slots__ = ('name', 'depth', 'ctype', 'size', 'seconds', 'nodes',
+                 'clones')
+
+    def __init__(self, name, depth, ctype, size, seconds, nodes, clones):
+        self.name = name
+        self.depth = depth
+        self.ctype = ctype
+        self.size = size
+        self.seconds = seconds
+        self.nodes = nodes
+        self.clones = clones
+
+
+def _counting_init(profiler, init):
+    def __init__(self, *args, **kwds):
+        profiler.nodes += 1
+        init(self, *args, **kwds)
+    return __init__
+
+def _counting_clone_expression(profiler, clone_expression):
+    def counting_clone_expression(exp):
+        if exp.__class__ not in native_numeric_types and exp.is_expression():
+            profiler._clone_expression_calls += 1
+        return clone_expression(exp)
+    return counting_clone_expression
+
+
+def _sync_expr_module():
+    # pyomo.core.base.expr re-exports clone_expression from the module
+    # implementing the current expression tree format
+    from pyomo.core.base import expr, expr_common
+    expr.set_expression_tree_format(expr_common.mode)
+
+def _generator_clone_count():
+    from pyomo.core.base import expr_coopr3
+    return expr_coopr3.generate_expression.clone_counter \
+        + expr_coopr3.generate_relational_expression.clone_counter \
+        + expr_coopr3.generate_intrinsic_function_expression.clone_counter
+
+
+class ExpressionProfiler(object):
+    """
+    Collect expression construction statistics.
+
+    Counters:
+        nodes:      expression nodes allocated (nodes recycled from the
+                        coopr3 expression pools are not new allocations
+                        and are not counted)
+        clones:     calls to clone_expression() that copied an expression,
+                        plus the expressions cloned by the (coopr3)
+                        generate_*expression() functions because they
+                        were referenced by other expressions
+        components: one record per constructed component, in
+                        construction order.  Records of components that
+                        construct other components (e.g., Blocks) include
+                        the time and counts of their subcomponents, which
+                        are reported (indented) after them.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._originals = []
+        self.nodes = 0
+        self._clone_expression_calls = 0
+        self._clone_counter_base = None
+        self.components = []
+        self._depth = 0
+
+    def reset(self):
+        """Zero all counters and discard the component records"""
+        self.nodes = 0
+        self._clone_expression_calls = 0
+        self._clone_counter_base = _generator_clone_count()
+        self.components = []
+        self._depth = 0
+
+    @property
+    def clones(self):
+        if self._clone_counter_base is None:
+            return self._clone_expression_calls
+        return self._clone_expression_calls \
+            + _generator_clone_count() - self._clone_counter_base
+
+    def enable(self):
+        """Install the counting hooks in the expression modules"""
+        if self.enabled:
+            return
+        if self._clone_counter_base is None:
+            self._clone_counter_base = _generator_clone_count()
+        from pyomo.core.base import expr_coopr3, expr_pyomo4
+
+        for module in (expr_coopr3, expr_pyomo4):
+            base = module._ExpressionBase
+            base_init = base.__dict__['__init__']
+            clone_expression = module.clone_expression
+            counting_clone_expression = _counting_clone_expression(
+                self, clone_expression)
+            self._originals.append((base, '__init__', base_init))
+            self._originals.append(
+                (module, 'clone_expression', clone_expression))
+            base.__init__ = _counting_init(self, base_init)
+            module.clone_expression = counting_clone_expression
+        _sync_expr_module()
+        self.enabled = True
+
+    def disable(self):
+        """Restore the original (uninstrumented) expression functions"""
+        while self._originals:
+            obj, name, value = self._originals.pop()
+            setattr(obj, name, value)
+        _sync_expr_module()
+        self.enabled = False
+
+    def construct(self, component, data=None):
+        """Construct a component, recording the time spent and the
+        number of expression nodes and clones it generated."""
+        nodes = self.nodes
+        clones = self.clones
+        record = _ComponentRecord(
+            None, self._depth, component.type().__name__, 1, 0, 0, 0)
+        self.components.append(record)
+        self._depth += 1
+        start_time = time.time()
+        try:
+            component.construct(data)
+        finally:
+            record.seconds = time.time() - start_time
+            self._depth -= 1
+            record.name = component.cname(True)
+            if component.is_indexed():
+                record.size = len(component)
+            record.nodes = self.nodes - nodes
+            record.clones = self.clones - clones
+
+    def report(self, ostream=None):
+        """Print a table of the component records and counter totals"""
+        if ostream is None:
+            ostream = sys.stdout
+        rows = [ ("  "*r.depth + r.name, r.ctype, str(r.size),
+                  "%.3f" % r.seconds, str(r.nodes), str(r.clones))
+                 for r in self.components ]
+        header = ('Component', 'Type', 'Indices', 'Seconds',
+                  'Nodes', 'Clones')
+        total = ('[Total]', '', '',
+                 "%.3f" % sum(r.seconds for r in self.components
+                                  if not r.depth),
+                 str(self.nodes), str(self.clones))
+        widths = [ max(len(row[i]) for row in [header, total] + rows)
+                   for i in range(len(header)) ]
+        fmt = "      %%-%ds  %%-%ds  %%%ds  %%%ds  %%%ds  %%%ds\n" \
+              % tuple(widths)
+        rule = "      " + "-" * (sum(widths) + 2*(len(widths)-1)) + "\n"
+        ostream.write("      Expression construction profile:\n")
+        ostream.write(fmt % header)
+        ostream.write(rule)
+        for row in rows:
+            ostream.write(fmt % row)
+        ostream.write(rule)
+        ostream.write(fmt % total)
+
+
+expression_profiler = ExpressionProfiler()
+
+def enable_expression_profiling(reset=True):
+    """Turn on expression construction profiling"""
+    if reset:
+        expression_profiler.reset()
+    expression_profiler.enable()
+
+def disable_expression_profiling():
+    """Turn off expression construction profiling"""
+    expression_profiler.disable()
+
+def expression_profiling_enabled():
+    return expression_profiler.enabled
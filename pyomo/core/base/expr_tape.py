@@ -0,0 +1,442 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Compiled expressions for repeated numeric evaluation.
+#
+# An expression is flattened once into a postfix instruction tape that
+# refers to its variables and mutable parameters by slot.  Evaluating
+# the tape gathers the current slot values and runs the instructions
+# in a single loop over a value stack, instead of recursively walking
+# the expression tree through value() and __call__().  Subexpressions
+# whose operands are all constant (numbers and immutable parameters)
+# are folded into a single constant when the tape is compiled.
+#
+
+from __future__ import division
+
+__all__ = ('CompiledExpression', 'compile_expression')
+
+from pyomo.core.base.numvalue import (native_numeric_types,
+                                      value)
+from pyomo.core.base.var import _VarData
+from pyomo.core.base.expression import _ExpressionData
+from pyomo.core.base.constraint import _ConstraintData
+from pyomo.core.base import expr_coopr3
+
+from six.moves import xrange, zip
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+#
+# Instruction opcodes.  Each instruction is an (opcode, argument) tuple:
+#
+#   _CONST  value                       push value
+#   _SLOT   slot index                  push the value of a slot
+#   _SUM    (coefs, const)              pop len(coefs) values v, push
+#                                           sum(c*v) + const
+#   _PROD   (coef, nnum, nden)          pop nnum numerator and nden
+#                                           denominator values, push
+#                                           coef*prod(num)/prod(den)
+#   _FCN    (name, operator, nargs)     pop nargs values, push
+#                                           operator(*values)
+#   _INEQ   strict                      pop len(strict)+1 values, push
+#                                           the chained (strict)
+#                                           inequality
+#   _EQ     None                        pop 2 values, push equality
+#   _IF     (if, then, else)            evaluate the if tape, and the
+#                                           then or else tape
+#   _NODE   expression                  push value(expression) (for
+#                                           expressions that are not
+#                                           compiled)
+#
+_CONST, _SLOT, _SUM, _PROD, _FCN, _INEQ, _EQ, _IF, _NODE = range(9)
+
+_numpy_functions = {
+    'log': 'log', 'log10': 'log10', 'sin': 'sin', 'cos': 'cos',
+    'tan': 'tan', 'cosh': 'cosh', 'sinh': 'sinh', 'tanh': 'tanh',
+    'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan', 'exp': 'exp',
+    'sqrt': 'sqrt', 'asinh': 'arcsinh', 'acosh': 'arccosh',
+    'atanh': 'arctanh', 'ceil': 'ceil', 'floor': 'floor', 'abs': 'abs',
+    'pow': 'power',
+    }
+
+_compiled_function_types = (expr_coopr3._IntrinsicFunctionExpression,
+                            expr_coopr3._AbsExpression,
+                            expr_coopr3._PowExpression)
+
+
+class _TapeCompiler(object):
+    """Flatten an expression tree into an instruction tape."""
+
+    def __init__(self):
+        self.slots = []
+        self.slot_index = {}
+        # (object, attribute, expected value) for the named
+        # expressions inlined into the tape
+        self.watch = []
+
+    def slot(self, obj):
+        _id = id(obj)
+        if _id not in self.slot_index:
+            self.slot_index[_id] = len(self.slots)
+            self.slots.append(obj)
+        return self.slot_index[_id]
+
+    def compile(self, exp):
+        tape = []
+        self._compile(exp, tape)
+        return tape
+
+    def _emit(self, tape, instruction, nargs):
+        """Append an instruction that pops nargs values.  If the
+        operands are all constants, they are replaced by the
+        (constant) result of the instruction."""
+        start = len(tape) - nargs
+        for op, arg in tape[start:]:
+            if op is not _CONST:
+                tape.append(instruction)
+                return
+        tape.append(instruction)
+        try:
+            ans = _evaluate_tape(tape[start:], ())
+        except Exception:
+            # e.g., log(0): the error is raised when the tape is
+            # evaluated
+            return
+        tape[start:] = [(_CONST, ans)]
+
+    def _compile(self, exp, tape):
+        exp_class = exp.__class__
+        if exp_class in native_numeric_types:
+            tape.append((_CONST, exp))
+        elif exp_class is expr_coopr3._SumExpression:
+            for arg in exp._args:
+                self._compile(arg, tape)
+            self._emit(tape, (_SUM, (tuple(exp._coef), exp._const)),
+                       len(exp._args))
+        elif exp_class is expr_coopr3._ProductExpression:
+            for arg in exp._numerator:
+                self._compile(arg, tape)
+            for arg in exp._denominator:
+                self._compile(arg, tape)
+            self._emit(tape, (_PROD, (exp._coef,
+                                      len(exp._numerator),
+                                      len(exp._denominator))),
+                       len(exp._numerator) + len(exp._denominator))
+        elif exp_class in _compiled_function_types:
+            for arg in exp._args:
+                self._compile(arg, tape)
+            self._emit(tape,
+                       (_FCN, (exp._name, exp._operator, len(exp._args))),
+                       len(exp._args))
+        elif exp_class is expr_coopr3._InequalityExpression:
+            for arg in exp._args:
+                self._compile(arg, tape)
+            self._emit(tape, (_INEQ, tuple(exp._strict)), len(exp._args))
+        elif exp_class is expr_coopr3._EqualityExpression:
+            for arg in exp._args:
+                self._compile(arg, tape)
+            self._emit(tape, (_EQ, None), 2)
+        elif exp_class is expr_coopr3.Expr_if:
+            if_tape = self.compile(exp._if)
+            if len(if_tape) == 1 and if_tape[0][0] is _CONST:
+                # constant condition: only the branch that is taken
+                # is compiled
+                if if_tape[0][1]:
+                    self._compile(exp._then, tape)
+                else:
+                    self._compile(exp._else, tape)
+            else:
+                tape.append((_IF, (if_tape,
+                                   self.compile(exp._then),
+                                   self.compile(exp._else))))
+        elif not exp.is_expression():
+            if isinstance(exp, _VarData) or not exp.is_constant():
+                # variables and mutable parameters
+                tape.append((_SLOT, self.slot(exp)))
+            else:
+                tape.append((_CONST, value(exp)))
+        elif isinstance(exp, _ExpressionData):
+            # named expressions are inlined; the tape is recompiled if
+            # the expression is changed
+            self.watch.append((exp, 'expr', exp.expr))
+            if exp.expr is None:
+                tape.append((_NODE, exp))
+            else:
+                self._compile(exp.expr, tape)
+        else:
+            # e.g., external functions and the Pyomo4 expression trees
+            tape.append((_NODE, exp))
+
+
+def _evaluate_tape(tape, values):
+    stack = []
+    push = stack.append
+    for op, arg in tape:
+        if op is _SLOT:
+            push(values[arg])
+        elif op is _SUM:
+            coefs, const = arg
+            n = len(coefs)
+            if n:
+                args = stack[-n:]
+                del stack[-n:]
+                push(sum(c*v for c, v in zip(coefs, args)) + const)
+            else:
+                push(const)
+        elif op is _PROD:
+            ans, nnum, nden = arg
+            n = nnum + nden
+            if n:
+                args = stack[-n:]
+                del stack[-n:]
+                for v in args[:nnum]:
+                    ans *= v
+                for v in args[nnum:]:
+                    ans /= v
+            push(ans)
+        elif op is _CONST:
+            push(arg)
+        elif op is _FCN:
+            n = arg[2]
+            args = stack[-n:]
+            del stack[-n:]
+            push(arg[1](*args))
+        elif op is _INEQ:
+            n = len(arg) + 1
+            args = stack[-n:]
+            del stack[-n:]
+            ans = True
+            for strict, lhs, rhs in zip(arg, args, args[1:]):
+                if not ((lhs < rhs) if strict else (lhs <= rhs)):
+                    ans = False
+                    break
+            push(ans)
+        elif op is _EQ:
+            rhs = stack.pop()
+            push(stack.pop() == rhs)
+        elif op is _IF:
+            if _evaluate_tape(arg[0], values):
+                push(_evaluate_tape(arg[1], values))
+            else:
+                push(_evaluate_tape(arg[2], values))
+        else: # _NODE
+            push(value(arg))
+    return stack[0]
+
+
+def _evaluate_tape_batch(tape, columns, npoints):
+    stack = []
+    push = stack.append
+    for op, arg in tape:
+        if op is _SLOT:
+            push(columns[arg])
+        elif op is _SUM:
+            coefs, const = arg
+            n = len(coefs)
+            ans = const
+            if n:
+                args = stack[-n:]
+                del stack[-n:]
+                for c, v in zip(coefs, args):
+                    ans = ans + c*v
+            push(ans)
+        elif op is _PROD:
+            ans, nnum, nden = arg
+            n = nnum + nden
+            if n:
+                args = stack[-n:]
+                del stack[-n:]
+                for v in args[:nnum]:
+                    ans = ans * v
+                for v in args[nnum:]:
+                    ans = ans / v
+            push(ans)
+        elif op is _CONST:
+            push(arg)
+        elif op is _FCN:
+            n = arg[2]
+            args = stack[-n:]
+            del stack[-n:]
+            push(getattr(numpy, _numpy_functions[arg[0]])(*args))
+        elif op is _INEQ:
+            n = len(arg) + 1
+            args = stack[-n:]
+            del stack[-n:]
+            ans = True
+            for strict, lhs, rhs in zip(arg, args, args[1:]):
+                ans = numpy.logical_and(
+                    ans, numpy.less(lhs, rhs) if strict
+                    else numpy.less_equal(lhs, rhs))
+            push(ans)
+        elif op is _EQ:
+            rhs = stack.pop()
+            push(numpy.equal(stack.pop(), rhs))
+        elif op is _IF:
+            push(numpy.where(_evaluate_tape_batch(arg[0], columns, npoints),
+                             _evaluate_tape_batch(arg[1], columns, npoints),
+                             _evaluate_tape_batch(arg[2], columns, npoints)))
+        else: # _NODE
+            if not arg.is_fixed():
+                raise TypeError(
+                    "Cannot evaluate the expression '%s' in batch mode: "
+                    "only fixed subexpressions that are not compiled "
+                    "(e.g., external functions) can be evaluated for "
+                    "multiple value vectors" % (arg,))
+            push(value(arg))
+    ans = stack[0]
+    if numpy.ndim(ans) == 0:
+        return numpy.repeat(ans, npoints)
+    return ans
+
+
+class CompiledExpression(object):
+    """
+    An expression compiled into a postfix instruction tape.
+
+    Constructor arguments:
+        expr        The expression to compile.  This may also be a
+                        constraint (the body is compiled) or an
+                        objective or named expression: the tape is
+                        recompiled automatically if the constraint body
+                        or the (objective) expression is replaced.
+
+    The tape refers to the variables and mutable parameters (slots) of
+    the expression, and evaluate() reads their current values, so
+    changing values (or fixing variables) does not require recompiling.
+    Named expressions in the tree are inlined; changing their
+    expression also triggers recompilation.  Expression trees are not
+    otherwise modified in place: the expression system clones any
+    (sub)expression that is referenced elsewhere before operating on it.
+    Call invalidate() after modifying an expression object directly.
+    """
+
+    __slots__ = ('_source', '_attr', '_tape', '_slots', '_watch')
+
+    def __init__(self, expr):
+        if isinstance(expr, _ConstraintData):
+            self._source = expr
+            self._attr = 'body'
+        elif isinstance(expr, _ExpressionData):
+            self._source = expr
+            self._attr = 'expr'
+        else:
+            self._source = expr
+            self._attr = None
+        self._tape = None
+        self._slots = None
+        self._watch = None
+
+    def _compile(self):
+        compiler = _TapeCompiler()
+        if self._attr is None:
+            exp = self._source
+        else:
+            exp = getattr(self._source, self._attr)
+            compiler.watch.append((self._source, self._attr, exp))
+            if exp is None:
+                raise ValueError("Cannot compile '%s': no expression has "
+                                 "been defined" % (self._source.cname(True),))
+        self._tape = compiler.compile(exp)
+        self._slots = tuple(compiler.slots)
+        self._watch = tuple(compiler.watch)
+
+    @property
+    def expr(self):
+        """The expression (or component) that was compiled"""
+        return self._source
+
+    @property
+    def slots(self):
+        """The variables and mutable parameters referenced by the tape,
+        in slot order"""
+        self._check()
+        return self._slots
+
+    @property
+    def tape(self):
+        """The instruction tape, as a list of (opcode, argument) tuples"""
+        self._check()
+        return self._tape
+
+    def invalidate(self):
+        """Discard the tape; it is recompiled on the next evaluation"""
+        self._tape = None
+
+    def is_valid(self):
+        """Return True if the tape is current"""
+        if self._tape is None:
+            return False
+        for obj, attr, expected in self._watch:
+            if getattr(obj, attr) is not expected:
+                return False
+        return True
+
+    def _check(self):
+        if not self.is_valid():
+            self._compile()
+
+    def slot_values(self):
+        """Return the list of the current slot values"""
+        self._check()
+        values = [s.value for s in self._slots]
+        if None in values:
+            for s, val in zip(self._slots, values):
+                if val is None:
+                    raise ValueError(
+                        "No value for uninitialized NumericValue "
+                        "object %s" % (s.cname(True),))
+        return values
+
+    def evaluate(self, values=None):
+        """
+        Evaluate the tape, using the current values of the slots, or
+        the list of values (in slot order), if specified.
+        """
+        if values is None:
+            values = self.slot_values()
+        else:
+            self._check()
+            if len(values) != len(self._slots):
+                raise ValueError(
+                    "Expected %d slot values (got %d)"
+                    % (len(self._slots), len(values)))
+        return _evaluate_tape(self._tape, values)
+
+    __call__ = evaluate
+
+    def evaluate_batch(self, values):
+        """
+        Evaluate the tape for multiple value vectors using NumPy.
+
+        The values are a (npoints x nslots) array (one row per value
+        vector, in slot order).  Returns an array with the npoints
+        expression values.
+        """
+        if not numpy_available:
+            raise RuntimeError("evaluate_batch() requires NumPy")
+        self._check()
+        values = numpy.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != len(self._slots):
+            raise ValueError(
+                "Expected a 2-dimensional array with %d columns (got "
+                "shape %s)" % (len(self._slots), values.shape))
+        npoints = values.shape[0]
+        columns = [values[:, i] for i in xrange(len(self._slots))]
+        return _evaluate_tape_batch(self._tape, columns, npoints)
+
+
+def compile_expression(expr):
+    """Compile an expression (or a constraint, objective or named
+    expression) into a CompiledExpression."""
+    return CompiledExpression(expr)
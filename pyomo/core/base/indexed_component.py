@@ -11,7 +11,8 @@ __all__ = ['IndexedComponent', 'ActiveIndexedComponent']
 
 import pyutilib.misc
 
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import Component, ActiveComponent, \
+    _StructureRevision
 from pyomo.core.base.config import PyomoOptions
 
 from six import PY3, itervalues, iteritems, advance_iterator
@@ -37,6 +38,50 @@ def normalize_index(index):
     return ndx
 normalize_index.flatten = True
 
+
+class _ComponentDataDict(dict):
+    """
+    The dictionary that maps indices to the component data objects of
+    an IndexedComponent.
+
+    Every change to the contents of the dictionary increments its
+    revision.  Caches that are derived from the component data (e.g.,
+    IndexedComponent.index_order() and the component data lists of
+    blocks) compare revisions instead of relying on the code that
+    modifies the data to invalidate them.
+    """
+
+    revision = 0
+
+    def __setitem__(self, key, val):
+        dict.__setitem__(self, key, val)
+        self.revision += 1
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.revision += 1
+
+    def clear(self):
+        dict.clear(self)
+        self.revision += 1
+
+    def pop(self, key, *args):
+        self.revision += 1
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self.revision += 1
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.revision += 1
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwds):
+        dict.update(self, *args, **kwds)
+        self.revision += 1
+
+
 class _IndexedComponent_slicer(object):
     """Special iterator for slicing through hierarchical component trees
 
@@ -216,6 +261,12 @@ class IndexedComponent(Component):
     component data value.  When enabled, the default does not
     change the access and iteration methods.
 
+    Derived components may also support lazy construction, where the
+    component data for an index is only constructed (by a call to
+    _construct_index()) when the index is first accessed.  All
+    remaining component data is constructed the first time that the
+    component is iterated over or its length is requested.
+
     Constructor arguments:
         ctype       The class type for the derived subclass
         doc         A text string describing this component
@@ -226,6 +277,10 @@ class IndexedComponent(Component):
         _index              The set of valid indices
         _implicit_subsets   A temporary data element that stores
                                 sets that are transfered to the model
+        _lazy               The set of indices that have been
+                                constructed by a lazy component (None
+                                if the component is not lazy, or if
+                                all its data has been constructed)
     """
 
     #
@@ -243,7 +298,9 @@ class IndexedComponent(Component):
         kwds.pop('noruleinit', None)
         Component.__init__(self, **kwds)
         #
-        self._data = {}
+        self._data = _ComponentDataDict()
+        self._index_order = None
+        self._lazy = None
         #
         if len(args) == 0:
             #
@@ -277,6 +334,15 @@ class IndexedComponent(Component):
             self._implicit_subsets = tmp
             self._index = tmp[0].cross(*tmp[1:])
 
+    def __getstate__(self):
+        """
+        This method must be defined to support pickling because the
+        cached index order is not part of the component state.
+        """
+        state = super(IndexedComponent, self).__getstate__()
+        state['_index_order'] = None
+        return state
+
     def to_dense_data(self):
         """TODO"""
         for ndx in self._index:
@@ -286,7 +352,7 @@ class IndexedComponent(Component):
     def clear(self):
         """Clear the data in this component"""
         if UnindexedComponent_set != self._index:
-            self._data = {}
+            self._data = _ComponentDataDict()
         else:
             raise NotImplementedError(
                 "Derived scalar component %s failed to define clear().\n"
@@ -307,20 +373,58 @@ class IndexedComponent(Component):
             return 0
         return getattr(self._index, 'dimen', 0)
 
+    def _construct_index(self, ndx):
+        """
+        Construct the component data for an index of a lazy component
+        and add it to the _data dictionary.  Returns the component data
+        (or None if there is no data for this index).
+        """
+        raise NotImplementedError(
+            "Derived component %s failed to define _construct_index().\n"
+            "\tPlease report this to the Pyomo developers"
+            % (self.__class__.__name__,))
+
+    def _construct_lazy_index(self, ndx):
+        """
+        Construct the component data for an index of a lazy component,
+        unless it was constructed before.  Returns the component data
+        (or None if there is no data for this index).
+        """
+        if ndx not in self._lazy:
+            self._lazy.add(ndx)
+            return self._construct_index(ndx)
+        return self._data.get(ndx, None)
+
+    def _construct_lazy_data(self):
+        """Construct all remaining component data of a lazy component"""
+        lazy = self._lazy
+        for ndx in self._index:
+            if ndx not in lazy:
+                lazy.add(ndx)
+                self._construct_index(ndx)
+        self._lazy = None
+
     def __len__(self):
         """
         Return the number of component data objects stored by this
         component.
         """
+        if self._lazy is not None:
+            self._construct_lazy_data()
         return len(self._data)
 
     def __contains__(self, ndx):
         """Return true if the index is in the dictionary"""
+        if self._lazy is not None and ndx not in self._data \
+                and ndx in self._index:
+            return self._construct_lazy_index(ndx) is not None
         return ndx in self._data
 
     def __iter__(self):
         """Iterate over the keys in the dictionary"""
 
+        if self._lazy is not None:
+            self._construct_lazy_data()
         if not getattr(self._index, 'concrete', True):
             #
             # If the index set is virtual (e.g., Any) then return the
@@ -390,6 +494,26 @@ You can silence this warning by one of three ways:
         """Return a list (index,data) tuples from the dictionary"""
         return [ (x, self[x]) for x in self ]
 
+    def index_order(self):
+        """
+        Return a tuple of the keys in the dictionary in a stable order.
+
+        This is the order used by the array-oriented methods of
+        derived components (e.g., Var.get_array()).  The tuple is
+        cached, and it is only regenerated when the component data
+        (see _ComponentDataDict) or the size of the index set change.
+        """
+        n = len(self)
+        data = self._data
+        index = self._index
+        key = (getattr(data, 'revision', None),
+               n,
+               len(index) if getattr(index, 'concrete', True) else None)
+        cache = self._index_order
+        if cache is None or cache[0] is not data or cache[1] != key:
+            cache = self._index_order = (data, key, tuple(self))
+        return cache[2]
+
     def iterkeys(self):
         """Return an iterator of the keys in the dictionary"""
         return self.__iter__()
@@ -572,10 +696,12 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
         ActiveComponent.activate(self)
         for component_data in itervalues(self):
             component_data._active = True
+        _StructureRevision.value += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         ActiveComponent.deactivate(self)
         for component_data in itervalues(self):
             component_data._active = False
+        _StructureRevision.value += 1
 
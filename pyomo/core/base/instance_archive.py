@@ -0,0 +1,457 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# A binary archive format for constructed model instances.
+#
+# Pickling a model calls __getstate__()/__setstate__() on every
+# component data object and expression node, building (and then
+# consuming) one state dictionary per object.  The archive avoids this
+# for the slot-only classes that use the generic ComponentData /
+# NumericValue state handling (variable, constraint, parameter, ...
+# data and the coopr3 expression nodes): these objects are replaced in
+# the pickle stream by integer ids, and their slots are written as one
+# column per (class, slot), which is gathered and restored with the
+# slot descriptors.  Expressions are therefore stored as a flat table
+# of nodes.  Everything else (the block and component tree, sets,
+# index keys, domains, ...) is pickled as usual.
+#
+# Layout of an archive:
+#
+#   magic      8 bytes
+#   location   offset and length of the header (two 8 byte integers)
+#   stream     the pickle stream: the model, followed by one table of
+#                  slot columns per round of newly referenced objects
+#   sections   raw array data: the class code of each object, the
+#                  object ids of each table and the numeric columns
+#   header     pickled dictionary (format version, class table, stream
+#                  and section locations, and the key given to the
+#                  dump functions)
+#
+# Numeric columns (all float, float or None, int or bool values) are
+# stored as raw arrays.  Loading an archive from a file maps it into
+# memory and only reads the sections as they are needed.
+#
+
+__all__ = ('dump_instance', 'dumps_instance',
+           'load_instance', 'loads_instance', 'load_instance_key')
+
+import mmap
+import struct
+from array import array
+from collections import deque
+from weakref import ref as weakref_ref
+
+from pyutilib.misc import PauseGC
+
+from pyomo.core.base.component import ComponentData
+from pyomo.core.base.numvalue import NumericValue
+
+from six import PY3, iteritems, string_types
+from six.moves import xrange, zip
+
+if PY3:
+    import pickle
+    from io import BytesIO
+else:
+    import cPickle as pickle
+    from cStringIO import StringIO as BytesIO
+
+_MAGIC = b'PYOMOAR\x01'
+_FORMAT_VERSION = 1
+_PROTOCOL = 2
+_LOCATION = struct.Struct('<QQ')
+
+#
+# Column kinds:
+#
+#   _OBJECTS            pickled list of values
+#   _CONSTANT           the value shared by every object
+#   _DOUBLES            section number of an array('d')
+#   _OPTIONAL_DOUBLES   section numbers of an array('d') and an
+#                           array('b') flagging the None values
+#   _INTS               section number of an array('i')
+#   _BOOLS              section number of an array('b')
+#
+_OBJECTS, _CONSTANT, _DOUBLES, _OPTIONAL_DOUBLES, _INTS, _BOOLS = range(6)
+
+_member_descriptor = type(ComponentData.__dict__['_component'])
+
+# The __setstate__ implementations that only assign the state
+# dictionary to the object attributes (converting the '_component'
+# reference back to a weakref)
+_generic_setstate = frozenset((ComponentData.__dict__['__setstate__'],
+                               NumericValue.__dict__['__setstate__']))
+
+if PY3:
+    def _tobytes(data):
+        return data.tobytes()
+    def _frombytes(data, buf):
+        data.frombytes(buf)
+else:
+    def _tobytes(data):
+        return data.tostring()
+    def _frombytes(data, buf):
+        data.fromstring(buf)
+
+
+def _slot_layout(cls, obj):
+    """Return the list of (slot name, descriptor) pairs that holds
+    the state of objects of this class, or None if the class is
+    pickled normally."""
+    if hasattr(obj, '__dict__'):
+        return None
+    for base in cls.__mro__:
+        if base is object:
+            continue
+        setstate = base.__dict__.get('__setstate__', None)
+        if setstate is not None and setstate not in _generic_setstate:
+            return None
+        if '__reduce__' in base.__dict__ or \
+           '__reduce_ex__' in base.__dict__:
+            return None
+    try:
+        state = obj.__getstate__()
+    except Exception:
+        return None
+    if type(state) is not dict:
+        return None
+    layout = []
+    for name, val in iteritems(state):
+        desc = getattr(cls, name, None)
+        if type(desc) is not _member_descriptor:
+            return None
+        # Only the _component weakref may be altered by __getstate__
+        if name != '_component' and desc.__get__(obj) is not val:
+            return None
+        layout.append((name, desc))
+    layout.sort(key=lambda x: x[0])
+    return layout
+
+
+class _Missing(object):
+    """Placeholder for slots that are not set"""
+    pass
+
+
+class _ArchiveWriter(object):
+
+    def __init__(self, key=None):
+        self.key = key
+        self.stream = BytesIO()
+        # the slot objects in id order and their class codes
+        self.objects = []
+        self.codes = array('i')
+        self.ids = {}
+        # the slot classes and their layouts, indexed by class code
+        self.classes = []
+        self.layouts = []
+        self.class_codes = {}
+        self.sections = []
+        if PY3:
+            writer = self
+            class _Pickler(pickle.Pickler):
+                def persistent_id(self, obj):
+                    return writer.persistent_id(obj)
+            self.pickler = _Pickler(self.stream, _PROTOCOL)
+        else:
+            self.pickler = pickle.Pickler(self.stream, _PROTOCOL)
+            self.pickler.inst_persistent_id = self.persistent_id
+
+    def persistent_id(self, obj):
+        _id = id(obj)
+        pid = self.ids.get(_id, None)
+        if pid is not None:
+            return pid
+        cls = obj.__class__
+        code = self.class_codes.get(cls, None)
+        if code is None:
+            layout = _slot_layout(cls, obj)
+            if layout is None:
+                code = False
+            else:
+                code = len(self.classes)
+                self.classes.append(cls)
+                self.layouts.append(layout)
+            self.class_codes[cls] = code
+        if code is False:
+            return None
+        pid = self.ids[_id] = len(self.objects)
+        self.objects.append(obj)
+        self.codes.append(code)
+        return pid
+
+    def add_section(self, data):
+        self.sections.append(data)
+        return len(self.sections)-1
+
+    def encode_column(self, values):
+        if len(set(map(id, values))) == 1:
+            return _CONSTANT, values[0]
+        types = set(map(type, values))
+        if types == set((float,)):
+            return _DOUBLES, self.add_section(array('d', values))
+        if types == set((float, type(None))):
+            mask = array('b', (v is None for v in values))
+            data = array('d', (0.0 if v is None else v for v in values))
+            return _OPTIONAL_DOUBLES, (self.add_section(data),
+                                       self.add_section(mask))
+        if types == set((bool,)):
+            return _BOOLS, self.add_section(array('b', values))
+        if types == set((int,)):
+            try:
+                return _INTS, self.add_section(array('i', values))
+            except OverflowError:
+                pass
+        return _OBJECTS, values
+
+    def table(self, start, end):
+        """Return the slot columns of objects[start:end] grouped by
+        class"""
+        groups = {}
+        codes = self.codes
+        for pid in xrange(start, end):
+            code = codes[pid]
+            if code in groups:
+                groups[code].append(pid)
+            else:
+                groups[code] = [pid]
+        table = []
+        for code in sorted(groups):
+            pids = groups[code]
+            objs = list(map(self.objects.__getitem__, pids))
+            columns = []
+            for name, desc in self.layouts[code]:
+                missing = None
+                try:
+                    values = list(map(desc.__get__, objs))
+                except AttributeError:
+                    values = [getattr(obj, name, _Missing) for obj in objs]
+                    missing = [i for i, val in enumerate(values)
+                               if val is _Missing]
+                    for i in missing:
+                        values[i] = None
+                if name == '_component':
+                    if len(set(map(id, values))) == 1:
+                        ref = values[0]
+                        values = [None if ref is None else ref()]*len(values)
+                    else:
+                        values = [None if ref is None else ref()
+                                  for ref in values]
+                kind, data = self.encode_column(values)
+                columns.append((name, kind, data, missing))
+            table.append((code, self.add_section(array('i', pids)), columns))
+        return table
+
+    def write(self, instance, ostream):
+        pickler = self.pickler
+        pickler.dump(instance)
+        # the columns of each table can reference more slot objects
+        # (e.g., expression nodes), which go into the next table
+        rounds = 0
+        start = 0
+        while start < len(self.objects):
+            end = len(self.objects)
+            pickler.dump(self.table(start, end))
+            rounds += 1
+            start = end
+        codes = self.add_section(self.codes)
+
+        stream = self.stream.getvalue()
+        stream_offset = len(_MAGIC) + _LOCATION.size
+        offset = stream_offset + len(stream)
+        sections = []
+        for data in self.sections:
+            nbytes = len(data)*data.itemsize
+            sections.append((data.typecode, offset, nbytes))
+            offset += nbytes
+        header = pickle.dumps({'version': _FORMAT_VERSION,
+                               'classes': self.classes,
+                               'objects': len(self.objects),
+                               'codes': codes,
+                               'rounds': rounds,
+                               'stream': (stream_offset, len(stream)),
+                               'sections': sections,
+                               'key': self.key},
+                              _PROTOCOL)
+        ostream.write(_MAGIC)
+        ostream.write(_LOCATION.pack(offset, len(header)))
+        ostream.write(stream)
+        for data in self.sections:
+            ostream.write(_tobytes(data))
+        ostream.write(header)
+
+
+def _read_location(data):
+    """Return the offset and length of the header from the first
+    bytes of an archive"""
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("The data is not a Pyomo instance archive")
+    return _LOCATION.unpack(data[len(_MAGIC):len(_MAGIC)+_LOCATION.size])
+
+
+def _read_header(data):
+    """Unpickle and check the archive header"""
+    header = pickle.loads(data)
+    if header['version'] != _FORMAT_VERSION:
+        raise ValueError("Unsupported Pyomo instance archive version: %s"
+                         % (header['version'],))
+    return header
+
+
+def _read_archive(buf):
+    """Load an instance from a buffer that supports slicing (bytes or
+    an mmap)"""
+    offset, length = _read_location(buf)
+    header = _read_header(buf[offset:offset+length])
+    sections = header['sections']
+    def section(i):
+        typecode, offset, nbytes = sections[i]
+        data = array(typecode)
+        _frombytes(data, buf[offset:offset+nbytes])
+        return data
+
+    classes = header['classes']
+    new = [cls.__new__ for cls in classes]
+    objs = [new[code](classes[code]) for code in section(header['codes'])]
+    assert len(objs) == header['objects']
+
+    offset, length = header['stream']
+    istream = BytesIO(buf[offset:offset+length])
+    if PY3:
+        class _Unpickler(pickle.Unpickler):
+            def persistent_load(self, pid):
+                return objs[pid]
+        unpickler = _Unpickler(istream)
+    else:
+        unpickler = pickle.Unpickler(istream)
+        unpickler.persistent_load = objs.__getitem__
+
+    instance = unpickler.load()
+    for i in xrange(header['rounds']):
+        for code, pids, columns in unpickler.load():
+            cls = classes[code]
+            group = list(map(objs.__getitem__, section(pids)))
+            n = len(group)
+            for name, kind, data, missing in columns:
+                if kind == _OBJECTS:
+                    values = data
+                elif kind == _CONSTANT:
+                    values = [data]*n
+                elif kind == _DOUBLES or kind == _INTS:
+                    values = section(data)
+                elif kind == _OPTIONAL_DOUBLES:
+                    values = [None if flag else val for val, flag in
+                              zip(section(data[0]), section(data[1]))]
+                elif kind == _BOOLS:
+                    values = list(map(bool, section(data)))
+                else:
+                    raise ValueError("Unknown column type in Pyomo "
+                                     "instance archive: %s" % (kind,))
+                if name == '_component':
+                    if kind == _CONSTANT:
+                        values = [None if data is None
+                                  else weakref_ref(data)]*n
+                    else:
+                        values = [None if val is None else weakref_ref(val)
+                                  for val in values]
+                desc = getattr(cls, name)
+                deque(map(desc.__set__, group, values), maxlen=0)
+                if missing:
+                    for j in missing:
+                        desc.__delete__(group[j])
+    return instance
+
+
+def dumps_instance(instance, key=None):
+    """
+    Return a constructed model instance as a binary archive (a bytes
+    object), which is read back with loads_instance().
+    """
+    ostream = BytesIO()
+    with PauseGC():
+        _ArchiveWriter(key).write(instance, ostream)
+    return ostream.getvalue()
+
+
+def dump_instance(instance, output, key=None):
+    """
+    Write a constructed model instance as a binary archive to a file.
+
+    Args:
+        instance: The model instance (or any picklable object that
+            holds model components).
+        output: A filename or a binary file-like object.
+        key: A picklable object stored in the archive header, which
+            is returned by load_instance_key() (e.g., to check that a
+            cached instance is still valid).
+    """
+    if isinstance(output, string_types):
+        with open(output, 'wb') as ostream:
+            dump_instance(instance, ostream, key=key)
+        return
+    with PauseGC():
+        _ArchiveWriter(key).write(instance, output)
+
+
+def loads_instance(data):
+    """
+    Load a model instance from an archive created by dumps_instance().
+    """
+    with PauseGC():
+        return _read_archive(data)
+
+
+def load_instance(source, use_mmap=True):
+    """
+    Load a model instance from an archive file.
+
+    Args:
+        source: A filename or a binary file-like object.
+        use_mmap: Map the file into memory instead of reading it
+            (only used for files that support fileno()).
+    """
+    if isinstance(source, string_types):
+        with open(source, 'rb') as istream:
+            return load_instance(istream, use_mmap=use_mmap)
+    if use_mmap:
+        # file-like objects without a file descriptor raise
+        # UnsupportedOperation (a subclass of IOError and ValueError)
+        try:
+            fileno = source.fileno()
+        except (AttributeError, IOError, ValueError):
+            fileno = None
+        if fileno is not None:
+            buf = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            try:
+                with PauseGC():
+                    return _read_archive(buf)
+            finally:
+                buf.close()
+    with PauseGC():
+        return _read_archive(source.read())
+
+
+def load_instance_key(source):
+    """
+    Return the key stored in an archive by dump_instance() or
+    dumps_instance() (None if no key was given). Only the archive
+    header is read.
+
+    Args:
+        source: A filename or a binary file-like object that
+            supports seek().
+    """
+    if isinstance(source, string_types):
+        with open(source, 'rb') as istream:
+            return load_instance_key(istream)
+    start = source.tell()
+    offset, length = _read_location(
+        source.read(len(_MAGIC) + _LOCATION.size))
+    source.seek(start + offset)
+    return _read_header(source.read(length))['key']
@@ -80,30 +80,51 @@ class NumericLabeler(object):
 # (particularly PySP), and I don't know how much depends on the labels
 # actually being LP-compliant.
 #
-class CNameLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
-    def __call__(self, obj):
-        return obj.cname(True, self.name_buffer)
-
-class TextLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
-
-    def __call__(self, obj):
-        return cpxlp_label_from_name(obj.cname(True, self.name_buffer))
+class _CachedNameLabeler(object):
+    """
+    Base class for labelers that generate labels from the fully
+    qualified component names (mapped through the translate function).
 
-class AlphaNumTextLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
+    The labels for the data in indexed components are generated for
+    the entire component at once and are cached on the owning block
+    (see _BlockData._component_data_names), so writing a model
+    repeatedly does not regenerate (or re-translate) the names.
+    """
 
-    def __call__(self, obj):
-        return alphanum_label_from_name(obj.cname(True, self.name_buffer))
+    translate = None
 
-class NameLabeler(object):
     def __init__(self):
         self.name_buffer = {}
+        self.labels = {}
 
     def __call__(self, obj):
-        return obj.cname(True, self.name_buffer)
+        labels = self.labels
+        try:
+            return labels[id(obj)]
+        except KeyError:
+            pass
+        c = obj.parent_component()
+        if c is not obj:
+            block = c.parent_block()
+            if block is not None:
+                labels.update(block._component_data_names(
+                    c, True, self.translate))
+                if id(obj) in labels:
+                    return labels[id(obj)]
+        ans = obj.cname(True, self.name_buffer)
+        if self.translate is not None:
+            ans = self.translate(ans)
+        labels[id(obj)] = ans
+        return ans
+
+class CNameLabeler(_CachedNameLabeler):
+    pass
+
+class TextLabeler(_CachedNameLabeler):
+    translate = staticmethod(cpxlp_label_from_name)
+
+class AlphaNumTextLabeler(_CachedNameLabeler):
+    translate = staticmethod(alphanum_label_from_name)
+
+class NameLabeler(_CachedNameLabeler):
+    pass
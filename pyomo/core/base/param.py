@@ -22,8 +22,16 @@ from pyomo.core.base.set_types import Any
 
 from six import iteritems, iterkeys, next, itervalues
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 logger = logging.getLogger('pyomo.core')
 
+_nan = float('nan')
+
 
 class _ParamData(ComponentData, NumericValue):
     """
@@ -335,6 +343,62 @@ class Param(IndexedComponent):
             # scalars have to be handled differently
             self._data[None] = new_values
 
+    def get_array(self):
+        """
+        Return the parameter values, ordered as index_order().
+
+        The result is a NumPy array if NumPy is available, and a list
+        otherwise.  Undefined values are returned as NaN.
+        """
+        data = self._data
+        if self.is_indexed():
+            ans = [ data[ndx] if ndx in data else self[ndx]
+                    for ndx in self.index_order() ]
+        else:
+            ans = [ self.value ]
+        if self._mutable:
+            ans = [ val.value if isinstance(val, _ParamData) else val
+                    for val in ans ]
+        ans = [ _nan if val is None else val for val in ans ]
+        return numpy.array(ans, dtype=float) if numpy_available else ans
+
+    def set_array(self, values, check=True):
+        """
+        A utility to update a mutable Param from a NumPy array (or any
+        iterable) ordered as index_order().  NaN values are stored as
+        None.
+
+        If check=True, then the values are checked through the
+        __setitem__ method.  Using check=False should only be used by
+        developers!
+        """
+        if not self._mutable:
+            raise RuntimeError("Cannot call set_array method on immutable "
+                               "Param="+ self.cname(True))
+        order = self.index_order()
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        if len(values) != len(order):
+            raise ValueError(
+                "Cannot set Param '%s' from %d values: expected %d values"
+                % (self.cname(True), len(values), len(order)))
+        if numpy_available and values.__class__ is numpy.ndarray:
+            # convert to native types
+            values = values.tolist()
+        values = [ None if val != val else val for val in values ]
+        if check:
+            for ndx, val in zip(order, values):
+                self[ndx] = val
+        elif not self.is_indexed():
+            self.value = values[0]
+        else:
+            data = self._data
+            for ndx, val in zip(order, values):
+                if ndx in data:
+                    data[ndx].value = val
+                else:
+                    data[ndx] = _ParamData(self, val)
+
     def _default(self, idx):
         """
         Returns the default component data value
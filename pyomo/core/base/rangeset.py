@@ -13,7 +13,7 @@ import logging
 import math
 from six.moves import xrange
 
-from pyomo.core.base.sets import OrderedSimpleSet
+from pyomo.core.base.sets import OrderedSimpleSet, _OrderedSetSlice
 from pyomo.core.base.expr import _ExpressionBase
 from pyomo.core.base.set_types import Integers, Reals
 from pyomo.core.base.misc import apply_indexed_rule
@@ -170,7 +170,12 @@ class RangeSet(OrderedSimpleSet):
         Return the value associated with this key.  Valid
         index values are 1 .. len(set), or -1 .. -len(set).
         Negative key values index from the end of the set.
+
+        If key is a slice, this returns a view of the set members (see
+        _OrderedSetSlice).
         """
+        if key.__class__ is slice:
+            return _OrderedSetSlice(self, key)
         if key >= 1:
             if key > self._len:
                 raise IndexError("Cannot index a RangeSet past the last element")
@@ -182,6 +187,63 @@ class RangeSet(OrderedSimpleSet):
         else:
             raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
 
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The 
+        position indices start at 1.
+        """
+        if self.filter is None and self.validate is None:
+            if self._set_contains(match_element):
+                return int(round((match_element - self._start_val)
+                                 / float(self._step_val))) + 1
+        else:
+            for i, val in enumerate(self):
+                if val == match_element:
+                    return i+1
+        raise KeyError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.cname(True))
+
+    def next(self, match_element, k=1):
+        """
+        Return the next element in the set.  The default behavior is to
+        return the very next element.  The k option can specify how many
+        steps are taken to get the next element.
+
+        If the next element is beyond the end of the set, then an
+        exception is raised.
+        """
+        try:
+            position = self.ord(match_element) + k
+        except KeyError:
+            raise KeyError("Cannot obtain next() member of set="+self.cname(True)+"; input element="+str(match_element)+" is not a member of the set!")
+        if position < 1 or position > self._len:
+            raise IndexError("Cannot obtain next() member of set="+self.cname(True)+"; failed to access item in position="+str(position))
+        return self._member(position)
+
+    def nextw(self, match_element, k=1):
+        """
+        Return the next element in the set.  The default behavior is to
+        return the very next element.  The k option can specify how many
+        steps are taken to get the next element.
+
+        If the next element goes beyond the end of the list of elements
+        in the set, then this wraps around to the beginning of the list.
+        """
+        try:
+            position = self.ord(match_element) + k
+        except KeyError:
+            raise KeyError("Cannot obtain nextw() member of set="+self.cname(True)+"; input element="+str(match_element)+" is not a member of the set!")
+        return self._member((position-1) % self._len + 1)
+
+    def _member(self, position):
+        """
+        Return the member at a (valid, 1-based) position in the set.
+        """
+        if self.filter is None and self.validate is None:
+            return self._start_val + (position-1)*self._step_val
+        for i, val in enumerate(self):
+            if i+1 == position:
+                return val
+
     def _set_contains(self, element):
         """
         Test if the specified element in this set.
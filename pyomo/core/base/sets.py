@@ -11,24 +11,35 @@
 # . rename 'filter' to something else
 # . confirm that filtering is efficient
 
-__all__ = ['Set', 'set_options', 'simple_set_rule', 'SetOf']
+__all__ = ['Set', 'set_options', 'simple_set_rule', 'SetOf',
+           'SparseSetProduct']
 
 import logging
 import sys
 import types
 import copy
 import itertools
+import operator
+from array import array
+from bisect import bisect_left
 from weakref import ref as weakref_ref
 
 from pyutilib.misc import flatten_tuple as pyutilib_misc_flatten_tuple
 
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
 from pyomo.core.base.component import Component, register_component, ComponentData
-from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
+from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set, \
+    _ComponentDataDict
 from pyomo.core.base.numvalue import native_numeric_types
 
 from six import itervalues, iteritems
-from six.moves import xrange
+from six.moves import xrange, map
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 
 logger = logging.getLogger('pyomo.core')
 
@@ -192,6 +203,21 @@ class _SetData(_SetDataBase):
             self._component()._verify(val)
         self.value.add(val)
 
+    def _add_bulk(self, values):
+        """
+        Add a list of (verified) elements to an empty set.
+
+        Returns False (and leaves the set unchanged) if the set is not
+        empty or the list contains duplicate values.
+        """
+        if self.value:
+            return False
+        tmp = set(values)
+        if len(tmp) != len(values):
+            return False
+        self.value = tmp
+        return True
+
     def _discard(self, val):
         """
         Discard an element of this set.  This does not return an error
@@ -230,7 +256,7 @@ class _OrderedSetData(_SetDataBase):
         value       The set values
         _bounds     The tuple of bound values
         order_dict  A dictionary that maps from element value to element id.
-                        Indices in this dictionary start with 1 (not 0).
+                        Indices in this dictionary start with 0 (not 1).
 
     The ordering supported in this class depends on the 'ordered' attribute
     of the owning component:
@@ -241,6 +267,11 @@ class _OrderedSetData(_SetDataBase):
                                 the Python ordering of the set types is used.
                                 Note that a _stable_ sort method is required
                                 if the discard method is used.
+
+    Membership tests, ord(), next(), prev() and indexing are O(1).
+    Sorted sets are only re-sorted (lazily) when an element is added
+    out of order.  Slicing a set (e.g., model.T[1:10]) returns a view
+    that does not copy the set members (see _OrderedSetSlice).
     """
 
     __slots__ = ('value', 'order_dict', '_bounds', '_is_sorted')
@@ -293,11 +324,13 @@ class _OrderedSetData(_SetDataBase):
         """
         Sort the set using the 'ordered' attribute of the owning
         component.  This recreates the order_dict dictionary, which indicates
-        that the set is sorted.
+        that the set is sorted.  The value list is replaced (and not
+        sorted in place), as it may be shared by a clone of the set.
         """
         _sorter = self.parent_component().ordered
-        self.value = sorted(self.value, key=None if _sorter is Set.SortedOrder else _sorter)
-        self.order_dict = dict((j,i) for i,j in enumerate(self.value))
+        self.value = sorted(
+            self.value, key=None if _sorter is Set.SortedOrder else _sorter)
+        self.order_dict = dict(zip(self.value, xrange(len(self.value))))
         self._is_sorted = 1
 
     def _clear(self):
@@ -317,10 +350,47 @@ class _OrderedSetData(_SetDataBase):
         """
         if verify:
             self._component()._verify(val)
+        if self._is_sorted == 1 and self.value:
+            # The set remains sorted if the new element sorts after
+            # the last element
+            _sorter = self.parent_component().ordered
+            _last = self.value[-1]
+            try:
+                if _sorter is Set.SortedOrder:
+                    if not _last < val:
+                        self._is_sorted = 2
+                elif not _sorter(_last) < _sorter(val):
+                    self._is_sorted = 2
+            except TypeError:
+                self._is_sorted = 2
         self.order_dict[val] = len(self.value)
         self.value.append(val)
+
+    def _add_bulk(self, values):
+        """
+        Add a list of (verified) elements to an empty set.
+
+        Returns False (and leaves the set unchanged) if the set is not
+        empty or the list contains duplicate values.
+        """
+        if self.value:
+            return False
+        order_dict = dict(zip(values, xrange(len(values))))
+        if len(order_dict) != len(values):
+            return False
+        self.value = values
+        self.order_dict = order_dict
         if self._is_sorted:
+            # Check if the values are already sorted
             self._is_sorted = 2
+            if self.parent_component().ordered is Set.SortedOrder:
+                try:
+                    if all(map(operator.lt, values,
+                               itertools.islice(values, 1, None))):
+                        self._is_sorted = 1
+                except TypeError:
+                    pass
+        return True
 
     def _discard(self, val):
         """
@@ -381,9 +451,14 @@ class _OrderedSetData(_SetDataBase):
         
         The public Set API is 1-based, even though the
         internal order_dict is (pythonically) 0-based.
+
+        If idx is a slice, this returns a view of the set members (see
+        _OrderedSetSlice).
         """
         if self._is_sorted == 2:
             self._sort()
+        if idx.__class__ is slice:
+            return _OrderedSetSlice(self, idx)
         if idx >= 1:
             if idx > len(self):
                 raise IndexError("Cannot index a RangeSet past the last element")
@@ -405,8 +480,8 @@ class _OrderedSetData(_SetDataBase):
             self._sort()
         try:
             return self.order_dict[match_element] + 1
-        except IndexError:
-            raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.cname(True))
+        except KeyError:
+            raise KeyError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.cname(True))
 
     def next(self, match_element, k=1):
         """
@@ -417,15 +492,16 @@ class _OrderedSetData(_SetDataBase):
 	    If the next element is beyond the end of the set, then an
 	    exception is raised.
         """
+        if self._is_sorted == 2:
+            self._sort()
         try:
-            element_position = self.ord(match_element)
-        except IndexError:
+            position = self.order_dict[match_element] + k
+        except KeyError:
             raise KeyError("Cannot obtain next() member of set="+self.cname(True)+"; input element="+str(match_element)+" is not a member of the set!")
         #
-        try:
-            return self[element_position+k]
-        except KeyError:
-            raise KeyError("Cannot obtain next() member of set="+self.cname(True)+"; failed to access item in position="+str(element_position+k))
+        if position < 0 or position >= len(self.value):
+            raise IndexError("Cannot obtain next() member of set="+self.cname(True)+"; failed to access item in position="+str(position+1))
+        return self.value[position]
 
     def nextw(self, match_element, k=1):
         """
@@ -436,12 +512,14 @@ class _OrderedSetData(_SetDataBase):
         If the next element goes beyond the end of the list of elements
         in the set, then this wraps around to the beginning of the list.
         """
+        if self._is_sorted == 2:
+            self._sort()
         try:
-            element_position = self.ord(match_element)
+            position = self.order_dict[match_element] + k
         except KeyError:
             raise KeyError("Cannot obtain nextw() member of set="+self.cname(True)+"; input element="+str(match_element)+" is not a member of the set!")
         #
-        return self[(element_position+k-1) % len(self.value) + 1]
+        return self.value[position % len(self.value)]
 
     def prev(self, match_element, k=1):
         """
@@ -468,6 +546,77 @@ class _OrderedSetData(_SetDataBase):
         return self.nextw(match_element, k=-k)
 
 
+class _OrderedSetSlice(object):
+    """
+    A read-only view of a slice of the members of an ordered set.
+
+    Slices follow Python list semantics on the sequence of set members
+    (e.g., model.T[:3] holds the first three members of model.T), while
+    the view itself supports the 1-based Set API (view[1] is the first
+    member of the view).  The members are not copied: the view refers
+    to the positions of the members in the set when it was created.
+    """
+
+    __slots__ = ('_set', '_start', '_stop', '_step', '_len')
+
+    def __init__(self, set_, slice_):
+        self._set = set_
+        self._start, self._stop, self._step = slice_.indices(len(set_))
+        self._len = len(xrange(self._start, self._stop, self._step))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        _value = self._set.value
+        if _value.__class__ is list and self._step > 0:
+            return itertools.islice(_value, self._start, self._stop, self._step)
+        _set = self._set
+        return (_set[i+1] for i in xrange(self._start, self._stop, self._step))
+
+    def __reversed__(self):
+        _set = self._set
+        return ( _set[self._start + i*self._step + 1]
+                 for i in xrange(self._len-1, -1, -1) )
+
+    def __contains__(self, val):
+        try:
+            i = self._set.ord(val) - 1 - self._start
+        except (KeyError, IndexError, TypeError):
+            return False
+        if i % self._step:
+            return False
+        return 0 <= i // self._step < self._len
+
+    def __getitem__(self, idx):
+        """
+        Return the specified member of the view (indices are 1-based).
+        """
+        if idx >= 1:
+            if idx > self._len:
+                raise IndexError("Cannot index a Set slice past the last element")
+            idx -= 1
+        elif idx < 0:
+            if self._len+idx < 0:
+                raise IndexError("Cannot index a Set slice past the first element")
+            idx += self._len
+        else:
+            raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        return self._set[self._start + idx*self._step + 1]
+
+    def first(self):
+        """Return the first member of the view"""
+        return self[1]
+
+    def last(self):
+        """Return the last member of the view"""
+        return self[-1]
+
+    def __repr__(self):
+        return "%s[%s:%s:%s]" % ( self._set.cname(True), self._start,
+                                  self._stop, self._step )
+
+
 class _IndexedSetData(_SetData):
     """
     This class adds the __call__ method, which is expected for
@@ -650,6 +799,13 @@ class Set(IndexedComponent):
             #
             if type(self.initialize) in (tuple, types.GeneratorType):
                 self.initialize = list(self.initialize)
+            elif numpy_available and \
+                    isinstance(self.initialize, numpy.ndarray):
+                if self.initialize.ndim > 1:
+                    self.initialize = [ tuple(x) for x in
+                                        self.initialize.tolist() ]
+                else:
+                    self.initialize = self.initialize.tolist()
             #
             # Try to guess dimen from the initialize list
             #
@@ -756,6 +912,48 @@ class SimpleSetBase(Set):
             except TypeError:
                 raise TypeError("Problem inserting "+str(tmp)+" into set "+self.cname(True))
 
+    def _add_values(self, values):
+        """
+        Add the members of an iterable to this set.
+
+        This is equivalent to calling add() for each value, but if the
+        set is empty and one-dimensional, the values are inserted in
+        bulk (and are only verified individually if the set has a
+        domain or validation rule).
+        """
+        values = list(values)
+        if not self.virtual and self.dimen == 1 and \
+                tuple not in set(map(type, values)):
+            if self.domain is not None or self.validate is not None:
+                for val in values:
+                    self._verify(val)
+            try:
+                if self._add_bulk(values):
+                    return
+            except TypeError:
+                pass
+        self.add(*values)
+
+    def _update_bounds(self, values):
+        """
+        Update the bounds of this set from a list of values, if all of
+        the values are numeric.
+        """
+        if not set(map(type, values)).issubset(native_numeric_types):
+            return
+        if type(self._bounds) is tuple:
+            first, last = self._bounds
+        else:
+            first = last = None
+        if values:
+            lb = min(values)
+            ub = max(values)
+            if first is None or lb < first:
+                first = lb
+            if last is None or ub > last:
+                last = ub
+        self._bounds = (first, last)
+
     def remove(self, element):
         """
         Remove an element from the set.
@@ -1077,32 +1275,20 @@ class SimpleSetBase(Set):
         # Construct using the input values list
         #
         if values is not None:
-            if type(self._bounds) is tuple:
-                first=self._bounds[0]
-                last=self._bounds[1]
-            else:
-                first=None
-                last=None
-            all_numeric=True
             #
             # TODO: verify that values is not a list
             #
-            for val in values[None]:
+            _values = values[None]
+            if self.filter is not None:
                 #
-                # Skip the value if it is filtered
+                # Skip the values that are filtered
                 #
-                if not self.filter is None and not apply_indexed_rule(self, self.filter, self._parent(), val):
-                    continue
-                self.add(val)
-                if type(val) in native_numeric_types:
-                    if first is None or val<first:
-                        first=val
-                    if last is None or val>last:
-                        last=val
-                else:
-                    all_numeric=False
-            if all_numeric:
-                self._bounds = (first, last)
+                _values = [ val for val in _values if apply_indexed_rule(
+                    self, self.filter, self._parent(), val) ]
+            else:
+                _values = list(_values)
+            self._add_values(_values)
+            self._update_bounds(_values)
         #
         # Construct using the initialize rule
         #
@@ -1175,28 +1361,15 @@ class SimpleSetBase(Set):
         elif self.initialize is not None:
             if type(self.initialize) is dict:
                 raise ValueError("Cannot initialize set "+self.cname(True)+" with dictionary data")
-            if type(self._bounds) is tuple:
-                first=self._bounds[0]
-                last=self._bounds[1]
+            if self.filter is not None:
+                # Skip the values that are filtered
+                _values = [ val for val in self.initialize
+                            if apply_indexed_rule(
+                                self, self.filter, self._parent(), val) ]
             else:
-                first=None
-                last=None
-            all_numeric=True
-            for val in self.initialize:
-                # Skip the value if it is filtered
-                if not self.filter is None and \
-                   not apply_indexed_rule(self, self.filter, self._parent(), val):
-                    continue
-                if type(val) in native_numeric_types:
-                    if first is None or val<first:
-                        first=val
-                    if last is None or val>last:
-                        last=val
-                else:
-                    all_numeric=False
-                self.add(val)
-            if all_numeric:
-                self._bounds = (first,last)
+                _values = list(self.initialize)
+            self._add_values(_values)
+            self._update_bounds(_values)
 
 
 class SimpleSet(SimpleSetBase,_SetData):
@@ -1235,6 +1408,14 @@ class OrderedSimpleSet(SimpleSetBase,_OrderedSetData):
         """
         return _OrderedSetData.__getitem__(self, key)
 
+    def __iter__(self):
+        """
+        Return an iterator for the underlying set
+        """
+        if self._is_sorted == 2:
+            self._sort()
+        return SimpleSetBase.__iter__(self)
+
     def _set_contains(self, element):
         """
         A wrapper function that tests if the element is in
@@ -1494,6 +1675,12 @@ class _SetProduct(_SetOperator):
         # if type(element) is not tuple:
         #    return False
         try:
+            if self.dimen == len(self.set_tuple) == len(element):
+                # Flat product: check each member in the matching set
+                for subset, member in zip(self.set_tuple, element):
+                    if not subset._set_contains(member):
+                        return False
+                return True
             ctr = 0
             for subset in self.set_tuple:
                 d = subset.dimen
@@ -1572,6 +1759,161 @@ class _SetProduct(_SetOperator):
             next_tuple_index += member_set.dimen
         return True
 
+
+# The typecode used to store the member codes of a SparseSetProduct
+_code_typecode = 'l' if array('l').itemsize >= 8 else 'd'
+
+class SparseSetProduct(_SetProduct):
+    """
+    A sparse subset of the cross product of one-dimensional sets.
+
+    The members of the set are not stored as tuples.  Each member
+    (a_1, ..., a_n) is coded as a single integer: the mixed-radix number
+    formed by the positions of a_i in the i-th set.  The set stores a
+    sorted array of these codes, so membership tests decompose the
+    tuple and perform a binary search, and iteration decodes the
+    members on demand (in the order of the product).  Indexed
+    components can be declared over a SparseSetProduct without
+    expanding it into a Python set of tuples.
+
+    Constructor Arguments:
+        *args           The sets in the product.  Each set must have
+                            dimen=1, and the sets must not change after
+                            this set is constructed.
+        initialize      An iterable of member tuples (or a function
+                            f(model) that returns one).
+        filter          A rule f(model, *index) that returns True for
+                            the members of the product in this set.  If
+                            initialize is not specified, the filter is
+                            applied to the full product.
+    """
+
+    def __init__(self, *args, **kwds):
+        if len(args) < 2:
+            raise TypeError("Two or more arguments required for a "
+                            "SparseSetProduct")
+        self._sparse_initialize = kwds.pop('initialize', None)
+        self._sparse_filter = kwds.pop('filter', None)
+        args = [ arg if isinstance(arg, Set) else SetOf(arg)
+                 for arg in args ]
+        kwds['dimen_test'] = False
+        _SetOperator.__init__(self, args[0], args[1], **kwds)
+        self.set_tuple = args
+        self._implicit_subsets = args
+        self._setA = self._setB = None
+        self._compute_dimen()
+        if self.dimen != len(args):
+            raise ValueError("The sets in a SparseSetProduct must have dimen=1")
+        self.ordered = all(arg.ordered for arg in args)
+        self._constructed = False
+        self._codes = ()
+        self._members = None
+        self._positions = None
+
+    def construct(self, values=None):
+        """
+        Compute the codes of the members of this set.
+        """
+        if self._constructed:
+            return
+        self._constructed = True
+        self._members = [ list(s) for s in self.set_tuple ]
+        self._positions = [ dict(zip(m, xrange(len(m))))
+                            for m in self._members ]
+        _filter = self._sparse_filter
+        _parent = None if self._parent is None else self._parent()
+        if values is not None:
+            init = values[None]
+        else:
+            init = self._sparse_initialize
+            if type(init) is types.FunctionType:
+                init = init(_parent)
+        if init is None:
+            # Filter the full product (which is generated in code order)
+            if _filter is None:
+                codes = xrange(_SetProduct.__len__(self))
+            else:
+                codes = ( code for code, idx in enumerate(
+                              itertools.product(*self._members))
+                          if apply_indexed_rule(self, _filter, _parent, idx) )
+        else:
+            codes = ( self._encode_member(idx) for idx in init
+                      if _filter is None or
+                      apply_indexed_rule(self, _filter, _parent, idx) )
+        # Note: the codes are stored without creating an intermediate
+        # list (which would take several times the memory of the array)
+        if _code_typecode == 'l' and \
+           _SetProduct.__len__(self) <= sys.maxsize:
+            self._codes = array(_code_typecode, codes)
+        else:
+            self._codes = list(codes)
+        if init is not None:
+            # Sort the codes and remove duplicates (if necessary)
+            codes = self._codes
+            if not all(map(operator.lt, codes,
+                           itertools.islice(codes, 1, None))):
+                codes = sorted(set(codes))
+                if self._codes.__class__ is array:
+                    codes = array(_code_typecode, codes)
+                self._codes = codes
+
+    def _encode_member(self, element):
+        """
+        Return the code of a member of the product.
+        """
+        code = self._encode(element)
+        if code is None:
+            raise ValueError(
+                "The value=%s is not a member of the product "
+                "of the sets in set=%s" % (element, self.cname(True)))
+        return code
+
+    def _encode(self, element):
+        """
+        Return the code of a tuple (or None if it is not in the product).
+        """
+        if element.__class__ is not tuple or len(element) != self.dimen:
+            return None
+        code = 0
+        try:
+            for positions, member in zip(self._positions, element):
+                code = code * len(positions) + positions[member]
+        except (KeyError, TypeError):
+            return None
+        return code
+
+    def _decode(self, code):
+        """
+        Return the tuple for a code.
+        """
+        ans = []
+        for members in reversed(self._members):
+            code, i = divmod(code, len(members))
+            ans.append(members[i])
+        ans.reverse()
+        return tuple(ans)
+
+    def __len__(self):
+        """The number of members of the set."""
+        if self._constructed:
+            return len(self._codes)
+        return _SetProduct.__len__(self)
+
+    def __iter__(self):
+        if not self._constructed:
+            raise RuntimeError(
+                "Cannot iterate over SparseSetProduct '%s' before it has "
+                "been constructed (initialized)." % (self.cname(True),) )
+        return ( self._decode(code) for code in self._codes )
+
+    def _set_contains(self, element):
+        code = self._encode(element)
+        if code is None:
+            return False
+        codes = self._codes
+        i = bisect_left(codes, code)
+        return i < len(codes) and codes[i] == code
+
 # REVIEW - END
 
 class IndexedSet(Set):
@@ -1609,7 +1951,7 @@ class IndexedSet(Set):
         Clear that data in this component.
         """
         if UnindexedComponent_set != self._index:
-            self._data = {}
+            self._data = _ComponentDataDict()
         else:
             #
             # TODO: verify that this could happen
@@ -7,10 +7,15 @@
 #  This software is distributed under the BSD License.
 #  _________________________________________________________________________
 
-__all__ = ['SymbolMap', 'symbol_map_from_instance']
+__all__ = ['SymbolMap', 'IntegerSymbolMap', 'symbol_map_from_instance']
 
+try:
+    from collections.abc import Mapping
+except ImportError:                                 #pragma:nocover
+    from collections import Mapping
 from weakref import ref as weakref_ref
-from six import iteritems, iterkeys
+from six import iteritems, iterkeys, string_types
+from six.moves import xrange, zip, map
 from pyomo.core.base.label import TextLabeler
 
 
@@ -191,3 +196,265 @@ class SymbolMap(object):
             return self.aliases[symbol]()
         else:
             return SymbolMap.UnknownSymbol
+
+
+class _IntegerSymbolMapByObject(Mapping):
+    """The byObject view (id -> symbol) of an IntegerSymbolMap"""
+
+    __slots__ = ('_smap',)
+
+    def __init__(self, smap):
+        self._smap = smap
+
+    def __getitem__(self, obj_id):
+        return self._smap._symbol(self._smap._get_index()[obj_id])
+
+    def __contains__(self, obj_id):
+        return obj_id in self._smap._get_index()
+
+    def __iter__(self):
+        return iter(self._smap._get_index())
+
+    def __len__(self):
+        return len(self._smap._get_index())
+
+
+class _IntegerSymbolMapBySymbol(Mapping):
+    """The bySymbol view (symbol -> object weakref) of an IntegerSymbolMap"""
+
+    __slots__ = ('_smap',)
+
+    def __init__(self, smap):
+        self._smap = smap
+
+    def __getitem__(self, symbol):
+        ref = self._smap._lookup_ref(symbol)
+        if ref is None:
+            raise KeyError(symbol)
+        return ref
+
+    def __contains__(self, symbol):
+        return self._smap._lookup(symbol) is not None
+
+    def __iter__(self):
+        smap = self._smap
+        for prefix in smap._prefixes:
+            for i in xrange(len(smap._numbered[prefix])):
+                yield prefix + str(i)
+        for symbol in smap._symbols:
+            yield symbol
+
+    def __len__(self):
+        return len(self._smap)
+
+
+class IntegerSymbolMap(SymbolMap):
+    """
+    A symbol map for numbered symbols (e.g., 'v0', 'v1', ..., 'c0',
+    ...), like the symbols used by the NL writer.
+
+    The objects that share a symbol prefix are stored in a list, and
+    the symbol of an object is the prefix followed by the position of
+    the object in the list.  The symbol strings (and the index from
+    object ids to symbols) are only created when they are requested.
+    Like SymbolMap, the map holds weakrefs to the objects (note that
+    the weakref of an object is shared, so adding the same objects to
+    a new map does not create new weakrefs).  The byObject and
+    bySymbol attributes are read-only mapping views with the contents
+    of the corresponding SymbolMap dictionaries.
+
+    Symbols that are not numbered (e.g., symbols added with
+    addSymbol()) are also supported, but they are stored in a
+    dictionary.
+    """
+
+    def __init__(self):
+        #
+        # _prefixes: the list of numbered symbol prefixes
+        # _numbered: prefix -> list of object weakrefs
+        # _symbols:  string -> object weakref (for other symbols)
+        # _index:    id -> symbol code (see _symbol()), built on demand
+        # aliases:   string -> object weakref
+        #
+        self._prefixes = []
+        self._numbered = {}
+        self._symbols = {}
+        self._index = None
+        self.aliases = {}
+
+    @property
+    def byObject(self):
+        return _IntegerSymbolMapByObject(self)
+
+    @property
+    def bySymbol(self):
+        return _IntegerSymbolMapBySymbol(self)
+
+    def __len__(self):
+        return sum(len(objs) for objs in self._numbered.values()) \
+            + len(self._symbols)
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = {}
+            for n, prefix in enumerate(self._prefixes):
+                self._update_index(n, 0)
+            for symbol, ref in iteritems(self._symbols):
+                self._index[id(ref())] = symbol
+            # (the symbols of objects that no longer exist)
+            self._index.pop(id(None), None)
+        return self._index
+
+    def _update_index(self, n, start):
+        # The symbol code for the i-th object with the n-th prefix
+        # is (i << 8) + n
+        refs = self._numbered[self._prefixes[n]]
+        self._index.update(zip(
+            [id(ref()) for ref in refs[start:]],
+            xrange((start << 8) + n, (len(refs) << 8) + n, 256)))
+        self._index.pop(id(None), None)
+
+    def _symbol(self, code):
+        if isinstance(code, string_types):
+            return code
+        return self._prefixes[code & 255] + str(code >> 8)
+
+    def _lookup_ref(self, symbol):
+        """Return the object weakref for a symbol (or None)"""
+        ref = self._symbols.get(symbol, None)
+        if ref is not None:
+            return ref
+        prefix = symbol.rstrip('0123456789')
+        refs = self._numbered.get(prefix, None)
+        if refs is None or len(prefix) == len(symbol):
+            return None
+        digits = symbol[len(prefix):]
+        i = int(digits)
+        if i < len(refs) and str(i) == digits:
+            return refs[i]
+        return None
+
+    def _lookup(self, symbol):
+        """Return the object for a symbol (or None)"""
+        ref = self._lookup_ref(symbol)
+        return None if ref is None else ref()
+
+    def addNumberedSymbols(self, prefix, objs):
+        """
+        Add symbols for the objects in an iterable.  The objects are
+        numbered after the objects that were already added with the same
+        prefix (i.e., their symbols are prefix0, prefix1, ...).
+        """
+        if not prefix or prefix[-1].isdigit():
+            raise ValueError("Invalid symbol prefix '%s': numbered symbol "
+                             "prefixes cannot be empty or end with a digit"
+                             % (prefix,))
+        if prefix in self._numbered:
+            n = self._prefixes.index(prefix)
+        else:
+            n = len(self._prefixes)
+            if n == 256:
+                raise ValueError("An IntegerSymbolMap supports at most 256 "
+                                 "symbol prefixes")
+            self._prefixes.append(prefix)
+            self._numbered[prefix] = []
+        numbered = self._numbered[prefix]
+        start = len(numbered)
+        numbered.extend(map(weakref_ref, objs))
+        if self._index is not None:
+            self._update_index(n, start)
+
+    def numberedObjects(self, prefix):
+        """
+        Return a list with the objects numbered with a prefix (the
+        object with symbol prefix+str(i) is at position i, and is None
+        if it no longer exists).
+        """
+        return [ref() for ref in self._numbered.get(prefix, ())]
+
+    def hasNumberedSymbols(self, numbered):
+        """
+        Return True if the symbols in this map are exactly the numbered
+        symbols of an iterable of (prefix, objects) tuples (in the order
+        the prefixes were added).  Aliases are not compared.
+        """
+        if self._symbols:
+            return False
+        n = 0
+        for prefix, objs in numbered:
+            if n == len(self._prefixes) or self._prefixes[n] != prefix:
+                return False
+            refs = self._numbered[prefix]
+            if len(refs) != len(objs):
+                return False
+            for ref, obj in zip(refs, objs):
+                if ref() is not obj:
+                    return False
+            n += 1
+        return n == len(self._prefixes)
+
+    def addSymbol(self, obj, symb):
+        self._symbols[symb] = weakref_ref(obj)
+        if self._index is not None:
+            self._index[id(obj)] = symb
+
+    def addSymbols(self, obj_symbol_tuples):
+        """
+        Add (object, symbol) tuples from an iterable object.
+
+        This method assumes that symbol names will not conflict.
+        """
+        for obj, symb in obj_symbol_tuples:
+            self.addSymbol(obj, symb)
+
+    def createSymbol(self, obj, labeler, *args):
+        """
+        Create a symbol for an object with a given labeler.  No
+        error checking is done to ensure that the generated symbol
+        name is unique.
+        """
+        symb = labeler(obj)
+        self.addSymbol(obj, symb)
+        return symb
+
+    def createSymbols(self, objs, labeler, *args):
+        """
+        Create a symbol for iterable objects with a given labeler.  No
+        error checking is done to ensure that the generated symbol
+        names are unique.
+        """
+        self.addSymbols([(obj,labeler(obj)) for obj in objs])
+
+    def getSymbol(self, obj, labeler=None, *args):
+        """
+        Return the symbol for an object.  If it has not already been cached
+        in the symbol map, then create it.
+        """
+        index = self._get_index()
+        if id(obj) in index:
+            return self._symbol(index[id(obj)])
+        if labeler is None:
+            raise RuntimeError("Object %s is not in the symbol map. "
+                               "Cannot create a new symbol without "
+                               "a labeler." % obj.cname(True))
+        symb = labeler(obj)
+        other = self._lookup(symb)
+        if other is not None and other is not obj:
+            raise RuntimeError(
+                "Duplicate symbol '%s' already associated with "
+                "component '%s' (conflicting component: '%s')"
+                % (symb, other.cname(True), obj.cname(True)) )
+        self.addSymbol(obj, symb)
+        return symb
+
+    def getObject(self, symbol):
+        """
+        Return the object corresponding to a symbol
+        """
+        obj = self._lookup(symbol)
+        if obj is not None:
+            return obj
+        elif symbol in self.aliases:
+            return self.aliases[symbol]()
+        else:
+            return SymbolMap.UnknownSymbol
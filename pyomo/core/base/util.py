@@ -11,7 +11,7 @@
 # Utility functions
 #
 
-__all__ = ['summation', 'dot_product', 'sequence', 'prod']
+__all__ = ['summation', 'dot_product', 'sequence', 'prod', 'quicksum']
 
 import pyomo.core.base.var
 import inspect
@@ -19,6 +19,9 @@ from six.moves import xrange
 from functools import reduce
 import operator
 
+from pyomo.core.base import expr_common as common
+from pyomo.core.base.numvalue import native_numeric_types
+
 
 def prod(factors):
     """
@@ -27,6 +30,219 @@ def prod(factors):
     return reduce(operator.mul, factors, 1)
 
 
+try:
+    from sys import getrefcount
+    _getrefcount_available = True
+except ImportError:
+    _getrefcount_available = False
+
+
+class _LinearTerm(tuple):
+    """A (coefficient, variable) term generated by summation()"""
+    __slots__ = ()
+
+
+def _unreferenced_term_count():
+    # The reference count that _coopr3_quicksum() sees for a term that
+    # is held only by its loop variable (e.g., a term created by a
+    # generator expression).
+    for term in (object() for i in xrange(1)):
+        return getrefcount(term)
+
+if _getrefcount_available:
+    _UNREFERENCED_TERM_COUNT = _unreferenced_term_count()
+
+
+def _coopr3_quicksum(terms, linear=()):
+    from pyomo.core.base.expr_coopr3 import _SumExpression, \
+        _ProductExpression
+    _VarData = pyomo.core.base.var._VarData
+    _GeneralVarData = pyomo.core.base.var._GeneralVarData
+
+    args = []
+    coef = []
+    const = 0
+    for term in terms:
+        term_class = term.__class__
+        if term_class is _GeneralVarData:
+            args.append(term)
+            coef.append(1)
+            continue
+        elif term_class in native_numeric_types:
+            const += term
+            continue
+        elif term_class is _LinearTerm:
+            coef.append(term[0])
+            args.append(term[1])
+            continue
+        elif term_class is _ProductExpression:
+            if not term._denominator and len(term._numerator) == 1 \
+               and term._coef.__class__ in native_numeric_types:
+                var = term._numerator[0]
+                if var.__class__ is _GeneralVarData \
+                   or isinstance(var, _VarData):
+                    args.append(var)
+                    coef.append(term._coef)
+                    continue
+        elif isinstance(term, _VarData):
+            args.append(term)
+            coef.append(1)
+            continue
+        elif term_class is not _SumExpression:
+            if term.is_indexed():
+                raise TypeError(
+                    "Argument for quicksum() is an indexed numeric "
+                    "value specified without an index: %s" % (term.cname(),))
+
+        # Any other term becomes an argument of the sum.  As in
+        # generate_expression(), an expression that is referenced
+        # elsewhere is cloned so that the expression trees do not
+        # share subexpressions.
+        if _getrefcount_available and term.is_expression() and \
+           getrefcount(term) > _UNREFERENCED_TERM_COUNT:
+            term = term.clone()
+        if term.__class__ is _SumExpression and \
+           term._const.__class__ in native_numeric_types:
+            args.extend(term._args)
+            coef.extend(term._coef)
+            const += term._const
+        else:
+            args.append(term)
+            coef.append(1)
+
+    for c, var in linear:
+        args.append(var)
+        coef.append(c)
+    if not args:
+        return const
+    if const == 0 and len(args) == 1 and coef[0] == 1:
+        return args[0]
+    ans = _SumExpression()
+    ans._args = args
+    ans._coef = coef
+    ans._const = const
+    return ans
+
+
+def _pyomo4_quicksum(terms, linear=()):
+    from pyomo.core.base.expr_pyomo4 import _LinearExpression
+    _VarData = pyomo.core.base.var._VarData
+    _GeneralVarData = pyomo.core.base.var._GeneralVarData
+
+    args = []
+    coef = {}
+    const = 0
+    rest = 0
+
+    def leaf(value):
+        return value.__class__ in native_numeric_types \
+            or not value.is_expression()
+
+    def add_term(var, c):
+        var_id = id(var)
+        if var_id in coef:
+            coef[var_id] += c
+        else:
+            args.append(var)
+            coef[var_id] = c
+
+    for term in terms:
+        term_class = term.__class__
+        if term_class is _GeneralVarData:
+            add_term(term, 1)
+        elif term_class in native_numeric_types:
+            const += term
+        elif term_class is _LinearTerm:
+            add_term(term[1], term[0])
+        elif term_class is _LinearExpression and leaf(term._const) and \
+             all(leaf(term._coef[id(var)]) for var in term._args):
+            for var in term._args:
+                add_term(var, term._coef[id(var)])
+            const += term._const
+        elif isinstance(term, _VarData):
+            add_term(term, 1)
+        else:
+            # the linear expression is a single node that collects
+            # the linear terms in order; the rest is summed normally
+            rest = rest + term
+
+    for c, var in linear:
+        add_term(var, c)
+    if not args:
+        return const + rest
+    ans = _LinearExpression()
+    ans._args = args
+    ans._coef = coef
+    ans._const = const
+    if rest.__class__ in native_numeric_types and rest == 0:
+        return ans
+    return ans + rest
+
+
+def quicksum(terms, linear=()):
+    """
+    Sum a sequence (or generator) of terms.
+
+    This is equivalent to sum(terms), except that the linear terms
+    (variables, numbers, and products of a number with a variable) are
+    appended directly to a single linear sum expression instead of
+    passing each term through the expression generation system.  This
+    builds the sum of n linear terms in O(n) without creating
+    intermediate sum expressions, e.g.:
+
+        quicksum(c[i]*x[i] for i in model.I)
+
+    The terms keep their order in the resulting expression (in pyomo4
+    mode, the linear terms are collected into a single linear
+    expression node that precedes the nonlinear terms).
+
+    The optional linear argument is a sequence of (coefficient, variable)
+    pairs (with numeric coefficients) to add to the sum without forming
+    the product expressions at all.  It is read after terms is consumed,
+    and the pairs follow the terms.
+    """
+    if common.mode is common.Mode.coopr3_trees:
+        return _coopr3_quicksum(terms, linear)
+    else:
+        return _pyomo4_quicksum(terms, linear)
+
+
+def _summation_terms(args, denom, index):
+    # Generate the terms of summation().  Products of numbers with a
+    # single variable are generated as (coefficient, variable) pairs
+    # instead of product expressions.
+    _VarData = pyomo.core.base.var._VarData
+    for i in index:
+        if not denom:
+            coef = 1
+            var = None
+            for arg in args:
+                factor = arg[i]
+                if factor.__class__ in native_numeric_types:
+                    coef *= factor
+                elif var is None and isinstance(factor, _VarData):
+                    var = factor
+                else:
+                    break
+            else:
+                if var is None:
+                    yield coef
+                elif coef != 0:
+                    # (0*var is the constant 0, as in generate_expression)
+                    yield _LinearTerm((coef, var))
+                continue
+        yield _summation_term(args, denom, i)
+
+
+def _summation_term(args, denom, i):
+    item = 1
+    for arg in args:
+        item *= arg[i]
+    for arg in denom:
+        item /= arg[i]
+    return item
+
+
 def summation(*args, **kwds):
     """
     A utility function to compute a generalized dot product.  The following examples illustrate
@@ -68,23 +284,11 @@ def summation(*args, **kwds):
                 raise ValueError("Error executing summation(): The last denom argument value must be a variable or expression object if no 'index' option is specified")
         index = iarg.index_set()
 
-    ans = 0
-    num_index = range(0,len(args))
-    denom_index = range(0,len(denom))
     #
-    # Iterate through all indices
+    # Iterate through all indices, generating the product of the
+    # arguments (divided by the denominator terms)
     #
-    for i in index:
-        #
-        # Iterate through all arguments
-        #
-        item = 1
-        for j in num_index:
-            item *= args[j][i]
-        for j in denom_index:
-            item /= denom[j][i]
-        ans += item
-    return ans
+    return quicksum(_summation_terms(args, denom, index))
 
 
 def dot_product(*args, **kwds):
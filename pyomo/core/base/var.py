@@ -10,6 +10,7 @@
 __all__ = ['Var', '_VarData', 'VarList']
 
 import logging
+from array import array
 from weakref import ref as weakref_ref
 
 from pyomo.core.base.numvalue import NumericValue, value, is_fixed
@@ -20,7 +21,18 @@ from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.sets import Set
 from pyomo.core.base.util import is_functor
 
-from six import iteritems, itervalues
+from six import iteritems, itervalues, PY3
+
+if PY3:
+    _int_types = (int,)
+else:
+    _int_types = (int, long)
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 
 logger = logging.getLogger('pyomo.core')
 
@@ -411,6 +423,391 @@ class _GeneralVarData(_VarData):
 
     free = unfix
 
+#
+# Compact variable storage.  The values and bounds of the variables in
+# a compact Var are stored in array('d') columns on the component, and
+# each variable data object is a thin view (a position in the columns).
+# The columns are read and written in bulk by Var.get_array() and
+# Var.set_array().
+#
+# A single byte per variable records how each field is stored (2 bits
+# each for the value, lb, and ub) and the fixed and stale flags.
+#
+_NONE, _FLOAT, _INT, _OBJECT = range(4)
+_VALUE, _LB, _UB = range(3)
+_FIXED = 1 << 6
+_STALE = 1 << 7
+# Integers are stored in the float columns when they can be represented
+# exactly
+_MAX_EXACT_INT = 2**53
+
+_inf = float('inf')
+#
+# The attributes supported by Var.get_array() and Var.set_array(),
+# with their storage fields and the array values that represent None
+#
+_ARRAY_FIELDS = {'value': _VALUE, 'lb': _LB, 'ub': _UB, 'fixed': None}
+_ARRAY_MISSING = {'value': float('nan'), 'lb': -_inf, 'ub': _inf}
+
+def _array_value(val, domain):
+    """
+    Validate a value read from an array and map it to the value stored
+    in a variable with the given domain.  NaN is mapped to None, and
+    floats with integer values are mapped to ints if the domain
+    requires them.
+    """
+    if val != val or val is None:
+        return None
+    if val in domain:
+        return val
+    if val.__class__ is float and val.is_integer() and int(val) in domain:
+        return int(val)
+    raise ValueError("Numeric value `%s` (%s) is not in domain %s"
+                     % (val, type(val), domain))
+
+class _CompactVarStorage(object):
+    """
+    The component-level storage for the data of a compact Var.
+
+    Public Class Attributes:
+        columns     The value, lb, and ub columns (array('d')).
+        flags       A bytearray with the field kinds and the fixed and
+                        stale flags of each variable.
+        objects     A dict {(field, position): value} for values that
+                        are not floats or integers (e.g., bounds that
+                        are Params).
+        domain      The domain shared by most variables.
+        domains     A dict {position: domain} for variables whose
+                        domain differs from the shared domain.
+        positions   A cached tuple (order, positions), where positions
+                        is a NumPy array with the position of each index
+                        in order (see Var.index_order()).
+        free        A list of the positions released by deleted
+                        variables, which are reused by extend(1).
+
+    Note that the storage is not a memory optimization.  Each variable
+    still has a data object (72 bytes) and a position (a 24-byte int),
+    as expressions, suffixes and symbol maps refer to the variables
+    by identity.  For 1M variables this measured 214 bytes per
+    variable (vs. 188 for a regular Var) when all the variables share
+    the same initial value and bounds, and 206 bytes (vs. 262) when
+    they hold distinct float values and bounds.
+    """
+
+    def __init__(self, domain):
+        self.columns = (array('d'), array('d'), array('d'))
+        self.flags = bytearray()
+        self.objects = {}
+        self.domain = domain
+        self.domains = {}
+        self.positions = None
+        self.free = []
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['positions'] = None
+        return state
+
+    def __len__(self):
+        return len(self.flags)
+
+    def extend(self, n):
+        """Add n (stale, unbounded) variables; return the first position"""
+        if n == 1 and self.free:
+            return self.free.pop()
+        first = len(self.flags)
+        zeros = array('d', [0.0]) * n
+        for column in self.columns:
+            column.extend(zeros)
+        self.flags.extend(bytearray([_STALE]) * n)
+        return first
+
+    def release(self, pos):
+        """Clear the variable at pos and make the position reusable"""
+        flags = self.flags[pos]
+        for field in (_VALUE, _LB, _UB):
+            if (flags >> 2*field) & 3 == _OBJECT:
+                del self.objects[field, pos]
+        self.domains.pop(pos, None)
+        self.flags[pos] = _STALE
+        self.free.append(pos)
+
+    def get(self, field, pos):
+        kind = (self.flags[pos] >> 2*field) & 3
+        if kind == _FLOAT:
+            return self.columns[field][pos]
+        elif kind == _NONE:
+            return None
+        elif kind == _INT:
+            return int(self.columns[field][pos])
+        return self.objects[field, pos]
+
+    def _kind(self, val):
+        if val.__class__ is float:
+            return _FLOAT
+        elif val is None:
+            return _NONE
+        elif val.__class__ in _int_types \
+                and -_MAX_EXACT_INT <= val <= _MAX_EXACT_INT:
+            return _INT
+        return _OBJECT
+
+    def set(self, field, pos, val):
+        flags = self.flags[pos]
+        if (flags >> 2*field) & 3 == _OBJECT:
+            del self.objects[field, pos]
+        kind = self._kind(val)
+        if kind == _OBJECT:
+            self.objects[field, pos] = val
+        elif kind != _NONE:
+            self.columns[field][pos] = val
+        self.flags[pos] = (flags & ~(3 << 2*field)) | (kind << 2*field)
+
+    def fill(self, field, first, n, val):
+        """Set the field of the n variables starting at first to val"""
+        last = first + n
+        if self.objects:
+            for pos in range(first, last):
+                self.objects.pop((field, pos), None)
+        kind = self._kind(val)
+        if kind == _OBJECT:
+            for pos in range(first, last):
+                self.objects[field, pos] = val
+        elif kind != _NONE:
+            self.columns[field][first:last] = array('d', [val]) * n
+        mask = ~(3 << 2*field)
+        self._translate(first, last, bytearray(
+            (b & mask) | (kind << 2*field) for b in range(256)))
+
+    def set_flag(self, flag, pos, val):
+        if val:
+            self.flags[pos] |= flag
+        else:
+            self.flags[pos] &= ~flag & 0xFF
+
+    def fill_flag(self, flag, first, n, val):
+        """Set (or clear) a flag for the n variables starting at first"""
+        if val:
+            table = bytearray(b | flag for b in range(256))
+        else:
+            table = bytearray(b & ~flag for b in range(256))
+        self._translate(first, first + n, table)
+
+    def _translate(self, first, last, table):
+        self.flags[first:last] = self.flags[first:last].translate(table)
+
+    #
+    # NumPy views of the columns and flags.  Note that the views must
+    # not outlive the methods that use them (the arrays cannot be
+    # extended while a view exists).
+    #
+
+    def get_array(self, field, positions, missing):
+        """Return a NumPy array with the field at the given positions"""
+        if not len(positions):
+            return numpy.zeros(0)
+        ans = numpy.frombuffer(self.columns[field], dtype=float)[positions]
+        kinds = (numpy.frombuffer(self.flags, dtype=numpy.uint8)[positions]
+                 >> 2*field) & 3
+        ans[kinds == _NONE] = missing
+        for k in numpy.flatnonzero(kinds == _OBJECT):
+            ans[k] = value(self.objects[field, positions[k]])
+        return ans
+
+    def set_array(self, field, positions, vals, kinds):
+        """
+        Store the values (with the given field kinds) at the given
+        positions.  Storing variable values clears the stale flags.
+        """
+        if not len(positions):
+            return
+        flags = numpy.frombuffer(self.flags, dtype=numpy.uint8)
+        old = flags[positions]
+        if self.objects:
+            for pos in positions[((old >> 2*field) & 3) == _OBJECT]:
+                del self.objects[field, pos]
+        numpy.frombuffer(self.columns[field], dtype=float)[positions] = vals
+        mask = ~(3 << 2*field) & 0xFF
+        if field == _VALUE:
+            mask &= ~_STALE
+        flags[positions] = (old & mask) | (kinds << 2*field)
+
+    def get_flag_array(self, flag, positions):
+        if not len(positions):
+            return numpy.zeros(0, dtype=bool)
+        flags = numpy.frombuffer(self.flags, dtype=numpy.uint8)
+        return (flags[positions] & flag).astype(bool)
+
+    def set_flag_array(self, flag, positions, vals):
+        if not len(positions):
+            return
+        flags = numpy.frombuffer(self.flags, dtype=numpy.uint8)
+        old = flags[positions]
+        flags[positions] = numpy.where(vals, old | flag, old & ~flag & 0xFF)
+
+class _CompactVarData(_VarData):
+    """
+    This class defines the data for a single variable in a compact Var.
+
+    The data object is a view of a position in the owning component's
+    _CompactVarStorage, and provides the same interface as
+    _GeneralVarData.
+
+    Constructor Arguments:
+        pos         The position of this variable in the storage.
+        component   The Var object that owns this data.
+    """
+
+    __slots__ = ('_pos',)
+
+    def __init__(self, pos, component=None):
+        self._component = weakref_ref(component) if (component is not None) \
+                          else None
+        self._pos = pos
+
+    def __getstate__(self):
+        state = super(_CompactVarData, self).__getstate__()
+        for i in _CompactVarData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    def _storage(self):
+        """Return the storage of the owning component."""
+        if self._component is None:
+            raise RuntimeError(
+                "The variable at position %s of a compact Var was deleted "
+                "from its component (or the component was cleared), and "
+                "its data is no longer available" % (self._pos,))
+        return self._component()._store
+
+    def cname(self, *args, **kwds):
+        self._storage()
+        return super(_CompactVarData, self).cname(*args, **kwds)
+
+    @property
+    def value(self):
+        """Return the value for this variable."""
+        return self._storage().get(_VALUE, self._pos)
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable."""
+        self._storage().set(_VALUE, self._pos, val)
+
+    @property
+    def domain(self):
+        """Return the domain for this variable."""
+        store = self._storage()
+        return store.domains.get(self._pos, store.domain)
+    @domain.setter
+    def domain(self, domain):
+        """Set the domain for this variable."""
+        if hasattr(domain, 'bounds'):
+            store = self._storage()
+            if domain is store.domain:
+                store.domains.pop(self._pos, None)
+            else:
+                store.domains[self._pos] = domain
+        else:
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of one of %s, or an object that declares a method "
+                "for bounds (like a Pyomo Set). Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain, (RealSet, IntegerSet, BooleanSet)))
+
+    @property
+    def lb(self):
+        """Return the lower bound for this variable."""
+        store = self._storage()
+        dlb, _ = store.domains.get(self._pos, store.domain).bounds()
+        lb = store.get(_LB, self._pos)
+        if lb is None:
+            return dlb
+        elif dlb is None:
+            return value(lb)
+        return max(value(lb), dlb)
+    @lb.setter
+    def lb(self, val):
+        raise AttributeError("Assignment not allowed. Use the setlb method")
+
+    @property
+    def ub(self):
+        """Return the upper bound for this variable."""
+        store = self._storage()
+        _, dub = store.domains.get(self._pos, store.domain).bounds()
+        ub = store.get(_UB, self._pos)
+        if ub is None:
+            return dub
+        elif dub is None:
+            return value(ub)
+        return min(value(ub), dub)
+    @ub.setter
+    def ub(self, val):
+        raise AttributeError("Assignment not allowed. Use the setub method")
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return bool(self._storage().flags[self._pos] & _FIXED)
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._storage().set_flag(_FIXED, self._pos, val)
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return bool(self._storage().flags[self._pos] & _STALE)
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._storage().set_flag(_STALE, self._pos, val)
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._storage().set(_LB, self._pos, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable lower "
+                "bound - legal types must be fixed expressions or variables."
+                % (type(val),))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._storage().set(_UB, self._pos, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable upper "
+                "bound - legal types are fixed expressions or variables."
+                "parameters"
+                % (type(val),))
+
+    def fix(self, *val):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if len(val) == 1:
+            self.value = val[0]
+        elif len(val) > 1:
+            raise TypeError("fix expected at most 1 arguments, got %d" % (len(val)))
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
 class Var(IndexedComponent):
     """
     A numeric variable, which may be defined over an index.
@@ -424,6 +821,18 @@ class Var(IndexedComponent):
                         existing model data
         rule        A function for declaring variables.
         dense       An option to specify that the variables are declared densely.
+        lazy        If True, then the variables are not declared densely:
+                        the data for an index (and the initialize,
+                        bounds and domain rules for it) is only
+                        constructed when the index is first accessed.
+                        Iterating over the Var only returns the
+                        variables that have been accessed.
+        compact     If True, the values, bounds, and flags of the variables
+                        in an indexed Var are stored in arrays on the
+                        component (see _CompactVarStorage), which
+                        get_array() and set_array() access in bulk.
+                        This does not reduce the memory used by the
+                        Var.
     """
 
     def __new__(cls, *args, **kwds):
@@ -444,6 +853,9 @@ class Var(IndexedComponent):
         domain = kwd.pop('domain', domain)
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
+        if kwd.pop('lazy', False):
+            self._dense = False
+        compact = kwd.pop('compact', False)
 
         #
         # Initialize the base class
@@ -480,6 +892,18 @@ class Var(IndexedComponent):
             self._bounds_init_value = bounds
         elif bounds is not None:
             raise ValueError("Variable 'bounds' keyword must be a tuple or function")
+        #
+        # Compact storage is only used for indexed variables
+        #
+        self._store = None
+        if compact and self.is_indexed():
+            self._store = _CompactVarStorage(self._domain_init_value)
+
+    def _new_data(self):
+        """Create a variable data object (not yet added to _data)."""
+        if self._store is None:
+            return _GeneralVarData(self._domain_init_value, component=self)
+        return _CompactVarData(self._store.extend(1), self)
 
     def flag_as_stale(self):
         """
@@ -509,6 +933,148 @@ class Var(IndexedComponent):
         for index, new_value in iteritems(new_values):
             self[index].set_value(new_value, valid)
 
+    def _array_positions(self):
+        """
+        Return a NumPy array with the storage position of each index in
+        index_order() (for compact Vars).
+        """
+        order = self.index_order()
+        cache = self._store.positions
+        if cache is None or cache[0] is not order:
+            data = self._data
+            positions = numpy.fromiter((data[ndx]._pos for ndx in order),
+                                       dtype=numpy.intp, count=len(order))
+            cache = self._store.positions = (order, positions)
+        return cache[1]
+
+    def get_array(self, attr='value'):
+        """
+        Return the values of an attribute ('value', 'lb', 'ub' or
+        'fixed') of the variables, ordered as index_order().
+
+        The result is a NumPy array if NumPy is available, and a list
+        otherwise.  Undefined values are returned as NaN, and missing
+        bounds as -inf and inf.
+        """
+        if attr not in _ARRAY_FIELDS:
+            raise ValueError("Unknown Var attribute '%s': expected one of "
+                             "%s" % (attr, sorted(_ARRAY_FIELDS)))
+        field = _ARRAY_FIELDS[attr]
+        if self._store is not None and numpy_available:
+            store = self._store
+            positions = self._array_positions()
+            if field is None:
+                return store.get_flag_array(_FIXED, positions)
+            ans = store.get_array(
+                field, positions, _ARRAY_MISSING[attr])
+            if field == _VALUE:
+                return ans
+            # Apply the domain bounds
+            bound = store.domain.bounds()[field == _UB]
+            if bound is not None:
+                ans = (numpy.minimum if field == _UB else numpy.maximum)(
+                    ans, bound)
+            if store.domains:
+                order = self.index_order()
+                for k in numpy.flatnonzero(
+                        numpy.in1d(positions, list(store.domains))):
+                    ans[k] = getattr(self._data[order[k]], attr)
+                    if ans[k] != ans[k]:
+                        ans[k] = _ARRAY_MISSING[attr]
+            return ans
+
+        data = self._data
+        ans = [getattr(data[ndx], attr) for ndx in self.index_order()]
+        if field is None:
+            return numpy.array(ans, dtype=bool) if numpy_available else ans
+        missing = _ARRAY_MISSING[attr]
+        ans = [missing if val is None else val for val in ans]
+        return numpy.array(ans, dtype=float) if numpy_available else ans
+
+    def set_array(self, values, attr='value', valid=False):
+        """
+        Set an attribute ('value', 'lb', 'ub' or 'fixed') of the
+        variables from a NumPy array (or any iterable) ordered as
+        index_order().
+
+        NaN values, -inf lower bounds and inf upper bounds are stored
+        as None.  The default behavior is to validate the values using
+        the variable domains.  Floats with integer values are stored
+        as ints in variables with integer domains.
+        """
+        if attr not in _ARRAY_FIELDS:
+            raise ValueError("Unknown Var attribute '%s': expected one of "
+                             "%s" % (attr, sorted(_ARRAY_FIELDS)))
+        field = _ARRAY_FIELDS[attr]
+        order = self.index_order()
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        if len(values) != len(order):
+            raise ValueError(
+                "Cannot set the %s of Var '%s' from %d values: "
+                "expected %d values" % (attr, self.cname(True), len(values),
+                                         len(order)))
+
+        if self._store is not None and numpy_available:
+            if self._set_compact_array(values, field, valid):
+                return
+
+        data = self._data
+        if numpy_available and values.__class__ is numpy.ndarray:
+            # convert to native types
+            values = values.tolist()
+        if field is None:
+            for ndx, val in zip(order, values):
+                data[ndx].fixed = bool(val)
+        elif field == _VALUE:
+            if valid:
+                for ndx, val in zip(order, values):
+                    data[ndx].set_value(None if val != val else val, True)
+            else:
+                for ndx, val in zip(order, values):
+                    vardata = data[ndx]
+                    vardata.set_value(_array_value(val, vardata.domain), True)
+        else:
+            missing = _ARRAY_MISSING[attr]
+            for ndx, val in zip(order, values):
+                if val == missing or val != val:
+                    val = None
+                if field == _LB:
+                    data[ndx].setlb(val)
+                else:
+                    data[ndx].setub(val)
+
+    def _set_compact_array(self, values, field, valid):
+        """
+        Store values in bulk in the compact storage.  Returns False if
+        the values are not numeric (and must be set one at a time).
+        """
+        store = self._store
+        positions = self._array_positions()
+        if field is None:
+            store.set_flag_array(_FIXED, positions,
+                                 numpy.asarray(values, dtype=bool))
+            return True
+        try:
+            vals = numpy.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            return False
+        nan = numpy.isnan(vals)
+        if field != _VALUE:
+            nan |= (vals == (_inf if field == _UB else -_inf))
+        kinds = numpy.where(nan, _NONE, _FLOAT).astype(numpy.uint8)
+        if field == _VALUE and not valid and store.domain is not Reals:
+            if store.domains:
+                # Validate the variables with their own domains
+                return False
+            # Each distinct value only needs to be validated once
+            domain = store.domain
+            ints = [ val for val in numpy.unique(vals[~nan]).tolist()
+                     if _array_value(val, domain).__class__ is not float ]
+            if ints:
+                kinds[numpy.in1d(vals, ints)] = _INT
+        store.set_array(field, positions, vals, kinds)
+        return True
     def __setitem__(self, ndx, val):
         """
         Define the setitem operation:
@@ -562,13 +1128,28 @@ class Var(IndexedComponent):
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
-            # 30% slower
+            # 30% slower.  The data objects are collected in a plain
+            # dict so that self._data is updated (and its revision
+            # incremented) once.
             self_weakref = weakref_ref(self)
-            for ndx in self._index:
-                cdata = _GeneralVarData(domain=self._domain_init_value,
-                                        component=None)
-                cdata._component = self_weakref
-                self._data[ndx] = cdata
+            _data = {}
+            if self._store is None:
+                for ndx in self._index:
+                    cdata = _GeneralVarData(domain=self._domain_init_value,
+                                            component=None)
+                    cdata._component = self_weakref
+                    _data[ndx] = cdata
+                self._data.update(_data)
+            else:
+                first = pos = self._store.extend(len(self._index))
+                for ndx in self._index:
+                    cdata = _CompactVarData(pos)
+                    cdata._component = self_weakref
+                    _data[ndx] = cdata
+                    pos += 1
+                self._data.update(_data)
+                self._initialize_members(self._index, first)
+                return
             self._initialize_members(self._index)
 
     def add(self, index):
@@ -583,13 +1164,18 @@ class Var(IndexedComponent):
     #
     def _default(self, idx):
         """Returns the default component data value."""
-        vardata = self._data[idx] = _GeneralVarData(self._domain_init_value,
-                                                    component=self)
+        vardata = self._data[idx] = self._new_data()
         self._initialize_members([idx])
         return vardata
 
-    def _initialize_members(self, init_set):
-        """Initialize variable data for all indices in a set."""
+    def _initialize_members(self, init_set, first=None):
+        """
+        Initialize variable data for all indices in a set.
+
+        For compact Vars, first is the storage position of the first
+        index in init_set when init_set occupies consecutive positions
+        (which allows the values and bounds to be set in bulk).
+        """
         #
         # Initialize domains
         #
@@ -656,6 +1242,13 @@ class Var(IndexedComponent):
                     val = self._value_init_value[key]
                     vardata = self._data[key]
                     vardata.set_value(val)
+            elif first is not None and self._domain_init_rule is None:
+                val = value(self._value_init_value)
+                store = self._store
+                n = len(init_set)
+                if n and self._data[next(iter(init_set))]._valid_value(val):
+                    store.fill(_VALUE, first, n, val)
+                    store.fill_flag(_STALE, first, n, False)
             else:
                 val = value(self._value_init_value)
                 for key in init_set:
@@ -687,6 +1280,10 @@ class Var(IndexedComponent):
             # Initialize bounds with a value
             #
             (lb, ub) = self._bounds_init_value
+            if first is not None and is_fixed(lb) and is_fixed(ub):
+                self._store.fill(_LB, first, len(init_set), lb)
+                self._store.fill(_UB, first, len(init_set), ub)
+                return
             for key in init_set:
                 vardata = self._data[key]
                 vardata.setlb(lb)
@@ -898,6 +1495,26 @@ class IndexedVar(Var):
 
     free=unfix
 
+    def __delitem__(self, index):
+        if self._store is None:
+            raise TypeError(
+                "Cannot delete index %s of Var '%s': only compact Vars "
+                "support deleting variables" % (index, self.cname(True)))
+        vardata = self._data.pop(index)
+        # The storage position is reused by the next variable, so the
+        # deleted data object can no longer refer to it
+        self._store.release(vardata._pos)
+        vardata._component = None
+
+    def clear(self):
+        """Clear the data in this component"""
+        if self._store is not None:
+            # The old data objects can no longer refer to the storage
+            for vardata in itervalues(self._data):
+                vardata._component = None
+            self._store = _CompactVarStorage(self._domain_init_value)
+        IndexedComponent.clear(self)
+
 class VarList(IndexedVar):
     """
     Variable-length indexed variable objects used to construct Pyomo models.
@@ -919,9 +1536,7 @@ class VarList(IndexedVar):
         """Add a variable to this list."""
         self._nvars += 1
         self._index.add(self._nvars)
-        vardata = self._data[self._nvars] = \
-            _GeneralVarData(domain=self._domain_init_value,
-                            component=self)
+        vardata = self._data[self._nvars] = self._new_data()
         self._initialize_members([self._nvars])
         return vardata
 
@@ -14,6 +14,7 @@ from weakref import ref as weakref_ref
 import collections
 
 from pyomo.core.base.set_types import Any
+from pyomo.core.base.indexed_component import _ComponentDataDict
 from pyomo.core.base.var import (IndexedVar,
                                  _VarData)
 from pyomo.core.base.constraint import (IndexedConstraint,
@@ -36,7 +37,7 @@ class ComponentDict(collections.MutableMapping):
 
     def __init__(self, interface_datatype, *args):
         self._interface_datatype = interface_datatype
-        self._data = {}
+        self._data = _ComponentDataDict()
         if len(args) > 0:
             if len(args) > 1:
                 raise TypeError(
@@ -14,6 +14,7 @@ from weakref import ref as weakref_ref
 import collections
 
 from pyomo.core.base.set_types import Any
+from pyomo.core.base.component import _StructureRevision
 from pyomo.core.base.var import (IndexedVar,
                                  _VarData)
 from pyomo.core.base.constraint import (IndexedConstraint,
@@ -95,6 +96,8 @@ class ComponentList(collections.MutableSequence):
                 # * see __delitem__ for explanation
                 self._data[i]._component = None
                 self._data[i] = item
+                # (the list has no revision of its own)
+                _StructureRevision.value += 1
                 return
             # see note about allowing components to live in more than
             # one container
@@ -122,6 +125,7 @@ class ComponentList(collections.MutableSequence):
                 if hasattr(self, "_active"):
                     self._active |= getattr(item, '_active', True)
                 self._data.insert(i, item)
+                _StructureRevision.value += 1
                 return
             # see note about allowing components to live in more than
             # one container
@@ -152,6 +156,7 @@ class ComponentList(collections.MutableSequence):
         obj = self._data[i]
         obj._component = None
         del self._data[i]
+        _StructureRevision.value += 1
 
     def __getitem__(self, i): return self._data[i]
     def __len__(self): return self._data.__len__()
@@ -203,11 +208,13 @@ class ComponentList(collections.MutableSequence):
         data = self._data
         for i in range(n//2):
             data[i], data[n-i-1] = data[n-i-1], data[i]
+        _StructureRevision.value += 1
 
     # The default implementation is slow
     def clear(self):
         'S.clear() -> None -- remove all items from S'
         self._data.clear()
+        _StructureRevision.value += 1
 
 #
 # ComponentList needs to come before IndexedComponent
@@ -0,0 +1,162 @@
+
+# parse_table_datacmds.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ASTERISK COLON COLONEQ COMMA DATA END EQ EXPORT FILENAME IMPORT INCLUDE LBRACE LBRACKET LOAD LPAREN NAMESPACE NONWORD PARAM QUOTEDSTRING RBRACE RBRACKET RPAREN SEMICOLON SET STORE STRING TABLE TR WORD WORDWITHEQBRACE WORDWITHINDEX WORDWITHLPAREN WORDWITHSQUOTEDINDEXexpr : statements\n            | statements : statements statement\n                  | statement\n                  | statements NAMESPACE WORD LBRACE statements RBRACE\n                  | NAMESPACE WORD LBRACE statements RBRACE statement : SET WORD COLONEQ setdecl SEMICOLON\n                 | SET WORD COLONEQ SEMICOLON\n                 | SET WORD COLON items COLONEQ setdecl SEMICOLON\n                 | SET WORD COLON items COLONEQ SEMICOLON\n                 | SET WORDWITHINDEX COLONEQ setdecl SEMICOLON\n                 | SET WORDWITHINDEX COLONEQ SEMICOLON\n                 | SET WORDWITHSQUOTEDINDEX COLONEQ setdecl SEMICOLON\n                 | SET WORDWITHSQUOTEDINDEX COLONEQ SEMICOLON\n                 | PARAM items COLONEQ paramdecl SEMICOLON\n                 | LOAD loaddecl SEMICOLON\n                 | STORE loaddecl SEMICOLON\n                 | IMPORT loaddecl SEMICOLON\n                 | EXPORT loaddecl SEMICOLON\n                 | TABLE tabledecl SEMICOLON\n                 | INCLUDE WORD SEMICOLON\n                 | INCLUDE QUOTEDSTRING SEMICOLON\n                 | DATA SEMICOLON\n                 | END SEMICOLON\n    setdecl : itemsparamdecl : itemsloaddecl : filename load_options\n                  | filename\n                  | filename load_options COLON WORD EQ bracket_indices variable_options\n                  | filename COLON WORD EQ bracket_indices variable_options\n                  | filename load_options COLON bracket_indices variable_options\n                  | filename COLON bracket_indices variable_options\n                  | filename load_options COLON variable_options\n                  | filename COLON variable_options\n                  | WORD load_options\n                  | WORD\n                  | WORD load_options COLON WORD EQ bracket_indices variable_options\n                  | WORD COLON WORD EQ bracket_indices variable_options\n                  | WORD load_options COLON bracket_indices variable_options\n                  | WORD COLON bracket_indices variable_options\n                  | WORD load_options COLON variable_options\n                  | WORD COLON variable_options\n    tabledecl : load_options table_indices unlabeled_table_values COLONEQ paramdecl\n                 | load_options table_indices labeled_table_values COLON table_labels COLONEQ paramdecl\n                 | WORD COLONEQ paramdecl\n    unlabeled_table_values : unlabeled_table_value unlabeled_table_values\n                              | unlabeled_table_value\n                              |\n    unlabeled_table_value : WORDWITHLPAREN WORD index_list RPAREN EQ LBRACE WORD RBRACE\n                             | WORDWITHLPAREN WORD RPAREN EQ LBRACE WORD RBRACE\n                             | WORDWITHLPAREN RPAREN EQ LBRACE WORD RBRACE\n    labeled_table_values : labeled_table_value labeled_table_values\n                            | labeled_table_value\n                            |\n    labeled_table_value : WORDWITHLPAREN WORD index_list RPAREN\n                           | WORDWITHLPAREN WORD RPAREN\n                           | WORDWITHLPAREN RPAREN\n    table_indices : WORDWITHEQBRACE WORD index_list RBRACE table_indices\n                     | WORDWITHEQBRACE WORD RBRACE table_indices\n                     | WORDWITHEQBRACE WORD index_list RBRACE\n                     | WORDWITHEQBRACE WORD RBRACE\n                     |\n    table_labels : WORD table_labels\n                    | WORD\n                    | \n    load_options : option load_options\n                      | option\n                      |\n    option : WORD EQ WORD\n              | WORD EQ STRING\n              | WORD EQ QUOTEDSTRING\n              | WORD EQ PARAM\n              | WORD EQ SET\n    variable_options : variable variable_options\n                        | variable\n    variable : WORD\n                | option\n    bracket_indices : LBRACKET WORD index_list RBRACKET\n                       | LBRACKET WORD RBRACKET\n    index_list : COMMA WORD index_list\n                  | COMMA ASTERISK index_list\n                  | COMMA WORD\n                  | COMMA ASTERISK\n    set_template : LPAREN WORD index_list RPAREN\n                | LPAREN ASTERISK index_list RPAREN\n                | LPAREN WORD RPAREN\n                | LPAREN ASTERISK RPAREN\n    param_template : LBRACKET WORD index_list RBRACKET\n                | LBRACKET ASTERISK index_list RBRACKET\n                | LBRACKET WORD RBRACKET\n                | LBRACKET ASTERISK RBRACKET\n    \n    items : items WORD\n          | items WORDWITHINDEX\n          | items WORDWITHSQUOTEDINDEX\n          | items NONWORD\n          | items STRING\n          | items QUOTEDSTRING\n          | items COMMA\n          | items COLON\n          | items LBRACE\n          | items RBRACE\n          | items LBRACKET\n          | items RBRACKET\n          | items TR\n          | items LPAREN\n          | items RPAREN\n          | items ASTERISK\n          | items set_template\n          | items param_template\n          | WORD\n          | WORDWITHINDEX\n          | WORDWITHSQUOTEDINDEX\n          | NONWORD\n          | STRING\n          | QUOTEDSTRING\n          | COMMA\n          | COLON\n          | LBRACE\n          | RBRACE\n          | LBRACKET\n          | RBRACKET\n          | TR\n          | LPAREN\n          | RPAREN\n          | ASTERISK\n          | set_template\n          | param_template\n    filename : WORD\n                | STRING\n                | QUOTEDSTRING\n                | FILENAME\n                | WORD COLON FILENAME\n    '
+    
+_lr_action_items = {'QUOTEDSTRING':([2,6,7,10,12,13,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,118,119,127,129,130,132,135,152,160,163,167,170,171,172,174,185,190,216,],[20,20,20,31,55,20,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,75,-111,-121,31,31,31,31,-97,-102,31,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,31,141,75,75,-91,-90,-87,-86,75,141,141,31,-89,-88,-85,-84,31,141,141,31,]),'LBRACKET':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,60,62,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,104,112,118,119,127,129,130,132,135,152,160,163,167,170,171,172,174,185,190,216,],[32,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,76,-111,-121,109,109,32,32,32,32,-97,-102,32,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,32,109,109,76,76,-91,-90,-87,-86,76,109,109,32,-89,-88,-85,-84,32,109,109,32,]),'COLON':([10,11,17,18,19,20,22,24,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,53,59,61,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,99,111,118,119,127,129,130,132,135,137,138,139,140,141,143,145,163,167,170,171,172,174,176,179,182,201,203,207,208,216,219,220,224,231,],[38,-68,60,-129,62,-130,-131,65,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,83,-111,-121,-62,-67,104,112,38,38,38,38,-97,-102,38,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,38,-54,-66,-132,83,83,-91,-90,-87,-86,83,-73,-69,-70,-72,-71,175,-53,38,-89,-88,-85,-84,38,-57,-52,-61,-56,-57,-59,-60,38,-55,-56,-58,-55,]),'EXPORT':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[2,2,-4,-3,-23,-24,-19,-18,-16,2,-20,-21,-22,-17,2,-8,-12,-14,2,2,-7,-11,-13,-6,-15,-5,-10,-9,]),'DATA':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[3,3,-4,-3,-23,-24,-19,-18,-16,3,-20,-21,-22,-17,3,-8,-12,-14,3,3,-7,-11,-13,-6,-15,-5,-10,-9,]),'RBRACE':([5,10,15,23,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,63,64,65,66,67,68,69,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,98,100,101,102,117,118,119,121,123,124,127,129,130,132,135,147,148,162,163,164,165,166,167,168,169,170,171,172,173,174,183,184,194,195,196,214,216,228,234,237,],[-4,34,-3,-23,-24,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,79,-111,-121,-19,34,34,34,34,-18,-16,-97,-102,34,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,34,-20,-21,-22,-17,-8,79,79,-12,-14,166,-91,-90,-87,-86,79,182,184,-7,34,-11,-13,-6,-89,-82,-83,-88,-85,-84,-15,34,208,-5,-10,-80,-81,-9,34,233,236,238,]),'SET':([0,1,5,15,23,29,63,68,69,70,95,98,100,101,102,103,117,121,123,124,148,152,160,162,164,165,166,173,184,185,190,194,214,],[4,4,-4,-3,-23,-24,-19,-18,-16,4,137,-20,-21,-22,-17,4,-8,-12,-14,4,4,137,137,-7,-11,-13,-6,-15,-5,137,137,-10,-9,]),'WORD':([2,4,6,7,9,10,11,12,13,16,17,18,19,20,22,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,53,60,62,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,106,107,109,110,111,112,113,114,118,119,126,127,129,130,132,135,137,138,139,140,141,144,149,150,152,153,157,158,160,163,167,170,171,172,174,175,178,181,185,187,189,190,192,198,209,211,212,216,217,229,235,],[17,24,17,17,30,35,50,54,17,57,58,-129,58,-130,-131,-115,72,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,74,-124,-118,80,-111,-121,58,105,113,35,35,35,35,-97,72,35,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,74,-106,-100,-93,-103,35,138,147,149,-76,-77,153,155,153,-132,157,-76,153,80,80,168,-91,-90,-87,-86,80,-73,-69,-70,-72,-71,177,-76,153,138,-76,-76,153,138,35,-89,-88,-85,-84,35,198,204,206,138,153,-79,138,153,198,153,-78,153,35,228,234,237,]),'SEMICOLON':([3,8,17,18,19,20,21,22,27,28,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,52,53,54,55,56,59,61,64,66,67,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,105,106,108,110,111,113,115,116,118,120,122,127,129,130,132,134,135,136,137,138,139,140,141,149,151,153,154,156,157,159,161,163,167,170,171,172,186,191,193,197,210,213,225,226,227,],[23,29,-36,-129,-28,-130,63,-131,68,69,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,-111,-121,98,-67,100,101,102,-35,-27,117,121,123,-97,-102,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,-66,-76,-77,-42,-75,-132,-76,-34,162,-25,164,165,-91,-90,-87,-86,173,-26,-45,-73,-69,-70,-72,-71,-76,-41,-76,-40,-74,-76,-33,-32,194,-89,-88,-85,-84,-39,-31,214,-43,-38,-30,-37,-29,-44,]),'TR':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,216,],[37,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,82,-111,-121,37,37,37,37,-97,-102,37,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,37,82,82,-91,-90,-87,-86,82,37,-89,-88,-85,-84,37,37,]),'FILENAME':([2,6,7,13,60,],[22,22,22,22,111,]),'COMMA':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,147,155,163,167,168,169,170,171,172,174,177,204,206,216,],[40,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,85,-111,-121,40,40,40,40,126,126,126,126,-97,-102,40,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,40,85,85,-91,-90,-87,-86,85,126,126,40,-89,126,126,-88,-85,-84,40,126,126,126,40,]),'WORDWITHSQUOTEDINDEX':([4,10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,216,],[26,39,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,84,-111,-121,39,39,39,39,-97,-102,39,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,39,84,84,-91,-90,-87,-86,84,39,-89,-88,-85,-84,39,39,]),'IMPORT':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[6,6,-4,-3,-23,-24,-19,-18,-16,6,-20,-21,-22,-17,6,-8,-12,-14,6,6,-7,-11,-13,-6,-15,-5,-10,-9,]),'$end':([0,1,5,14,15,23,29,63,68,69,98,100,101,102,117,121,123,162,164,165,166,173,184,194,214,],[-2,-1,-4,0,-3,-23,-24,-19,-18,-16,-20,-21,-22,-17,-8,-12,-14,-7,-11,-13,-6,-15,-5,-10,-9,]),'LOAD':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[7,7,-4,-3,-23,-24,-19,-18,-16,7,-20,-21,-22,-17,7,-8,-12,-14,7,7,-7,-11,-13,-6,-15,-5,-10,-9,]),'NONWORD':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,216,],[41,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,86,-111,-121,41,41,41,41,-97,-102,41,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,41,86,86,-91,-90,-87,-86,86,41,-89,-88,-85,-84,41,41,]),'END':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[8,8,-4,-3,-23,-24,-19,-18,-16,8,-20,-21,-22,-17,8,-8,-12,-14,8,8,-7,-11,-13,-6,-15,-5,-10,-9,]),'STRING':([2,6,7,10,13,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,118,119,127,129,130,132,135,152,160,163,167,170,171,172,174,185,190,216,],[18,18,18,42,18,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,87,-111,-121,42,42,42,42,-97,-102,42,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,42,139,87,87,-91,-90,-87,-86,87,139,139,42,-89,-88,-85,-84,42,139,139,42,]),'ASTERISK':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,126,127,129,130,132,135,163,167,170,171,172,174,216,],[43,-115,71,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,73,-124,-118,88,-111,-121,43,43,43,43,-97,71,43,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,73,-106,-100,-93,-103,43,88,88,169,-91,-90,-87,-86,88,43,-89,-88,-85,-84,43,43,]),'NAMESPACE':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[9,16,-4,-3,-23,-24,-19,-18,-16,9,-20,-21,-22,-17,9,-8,-12,-14,16,16,-7,-11,-13,-6,-15,-5,-10,-9,]),'PARAM':([0,1,5,15,23,29,63,68,69,70,95,98,100,101,102,103,117,121,123,124,148,152,160,162,164,165,166,173,184,185,190,194,214,],[10,10,-4,-3,-23,-24,-19,-18,-16,10,140,-20,-21,-22,-17,10,-8,-12,-14,10,10,140,140,-7,-11,-13,-6,-15,-5,140,140,-10,-9,]),'LPAREN':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,216,],[44,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,89,-111,-121,44,44,44,44,-97,-102,44,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,44,89,89,-91,-90,-87,-86,89,44,-89,-88,-85,-84,44,44,]),'TABLE':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[11,11,-4,-3,-23,-24,-19,-18,-16,11,-20,-21,-22,-17,11,-8,-12,-14,11,11,-7,-11,-13,-6,-15,-5,-10,-9,]),'RPAREN':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,131,132,133,135,144,163,167,168,169,170,171,172,174,177,178,181,195,196,202,204,206,216,221,223,],[45,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,90,-111,-121,45,45,45,45,130,132,-97,-102,45,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,45,90,90,-91,-90,-87,171,-86,172,90,176,45,-89,-82,-83,-88,-85,-84,45,201,203,205,-80,-81,219,220,222,45,231,232,]),'INCLUDE':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[12,12,-4,-3,-23,-24,-19,-18,-16,12,-20,-21,-22,-17,12,-8,-12,-14,12,12,-7,-11,-13,-6,-15,-5,-10,-9,]),'EQ':([50,58,105,113,149,153,157,176,201,205,219,222,232,],[95,95,152,160,185,95,190,200,218,200,230,218,230,]),'STORE':([0,1,5,15,23,29,63,68,69,70,98,100,101,102,103,117,121,123,124,148,162,164,165,166,173,184,194,214,],[13,13,-4,-3,-23,-24,-19,-18,-16,13,-20,-21,-22,-17,13,-8,-12,-14,13,13,-7,-11,-13,-6,-15,-5,-10,-9,]),'LBRACE':([10,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,57,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,200,216,218,230,],[46,70,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,91,-111,-121,103,46,46,46,46,-97,-102,46,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,46,91,91,-91,-90,-87,-86,91,46,-89,-88,-85,-84,46,217,46,229,235,]),'WORDWITHLPAREN':([11,51,53,96,99,137,138,139,140,141,145,146,176,182,201,203,207,208,219,220,224,231,233,236,238,],[-68,-62,-67,144,-66,-73,-69,-70,-72,-71,178,181,-57,-61,-56,-57,-59,-60,-55,-56,-58,-55,-51,-50,-49,]),'WORDWITHINDEX':([4,10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,127,129,130,132,135,163,167,170,171,172,174,216,],[25,48,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,92,-111,-121,48,48,48,48,-97,-102,48,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,48,92,92,-91,-90,-87,-86,92,48,-89,-88,-85,-84,48,48,]),'WORDWITHEQBRACE':([11,51,53,99,137,138,139,140,141,182,208,],[-68,97,-67,-66,-73,-69,-70,-72,-71,97,97,]),'COLONEQ':([11,24,25,26,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,96,99,119,127,129,130,132,137,138,139,140,141,142,146,167,170,171,172,175,180,182,198,199,207,208,215,224,233,236,238,],[-68,64,66,67,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,77,-111,-121,94,-62,-67,-97,-102,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,-48,-66,163,-91,-90,-87,-86,-73,-69,-70,-72,-71,174,-47,-89,-88,-85,-84,-65,-46,-61,-64,216,-59,-60,-63,-58,-51,-50,-49,]),'RBRACKET':([10,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,64,65,66,67,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,118,119,125,127,128,129,130,132,135,155,163,167,168,169,170,171,172,174,188,195,196,216,],[49,-115,-120,-126,-119,-110,-127,-122,-117,-112,-116,-113,-114,-125,-123,-124,-118,93,-111,-121,49,49,49,49,127,129,-97,-102,49,-108,-101,-92,-109,-104,-99,-94,-98,-95,-96,-107,-105,-106,-100,-93,-103,49,93,93,167,-91,170,-90,-87,-86,93,189,49,-89,-82,-83,-88,-85,-84,49,211,-80,-81,49,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'setdecl':([64,66,67,163,],[116,120,122,193,]),'statements':([0,70,103,],[1,124,148,]),'table_indices':([51,182,208,],[96,207,224,]),'labeled_table_values':([96,145,],[143,179,]),'tabledecl':([11,],[52,]),'paramdecl':([77,94,174,216,],[134,136,197,227,]),'set_template':([10,47,64,65,66,67,77,94,118,119,135,163,174,216,],[33,78,33,33,33,33,33,33,78,78,78,33,33,33,]),'table_labels':([175,198,],[199,215,]),'labeled_table_value':([96,145,],[145,145,]),'param_template':([10,47,64,65,66,67,77,94,118,119,135,163,174,216,],[36,81,36,36,36,36,36,36,81,81,81,36,36,36,]),'filename':([2,6,7,13,],[19,19,19,19,]),'unlabeled_table_value':([96,146,],[146,146,]),'statement':([0,1,70,103,124,148,],[5,15,5,5,15,15,]),'option':([11,17,19,53,60,62,104,107,110,112,114,150,158,187,192,209,212,],[53,53,53,53,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'unlabeled_table_values':([96,146,],[142,180,]),'load_options':([11,17,19,53,],[51,59,61,99,]),'index_list':([71,72,73,74,147,155,168,169,177,204,206,],[125,128,131,133,183,188,195,196,202,221,223,]),'variable':([60,62,104,107,110,112,114,150,158,187,192,209,212,],[110,110,110,110,110,110,110,110,110,110,110,110,110,]),'expr':([0,],[14,]),'bracket_indices':([60,62,104,112,152,160,185,190,],[107,114,150,158,187,192,209,212,]),'variable_options':([60,62,104,107,110,112,114,150,158,187,192,209,212,],[108,115,151,154,156,159,161,186,191,210,213,225,226,]),'items':([10,64,65,66,67,77,94,163,174,216,],[47,118,119,118,118,135,135,118,135,135,]),'loaddecl':([2,6,7,13,],[21,27,28,56,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expr","S'",1,None,None,None),
+  ('expr -> statements','expr',1,'p_expr','parse_datacmds.py',174),
+  ('expr -> <empty>','expr',0,'p_expr','parse_datacmds.py',175),
+  ('statements -> statements statement','statements',2,'p_statements','parse_datacmds.py',189),
+  ('statements -> statement','statements',1,'p_statements','parse_datacmds.py',190),
+  ('statements -> statements NAMESPACE WORD LBRACE statements RBRACE','statements',6,'p_statements','parse_datacmds.py',191),
+  ('statements -> NAMESPACE WORD LBRACE statements RBRACE','statements',5,'p_statements','parse_datacmds.py',192),
+  ('statement -> SET WORD COLONEQ setdecl SEMICOLON','statement',5,'p_statement','parse_datacmds.py',214),
+  ('statement -> SET WORD COLONEQ SEMICOLON','statement',4,'p_statement','parse_datacmds.py',215),
+  ('statement -> SET WORD COLON items COLONEQ setdecl SEMICOLON','statement',7,'p_statement','parse_datacmds.py',216),
+  ('statement -> SET WORD COLON items COLONEQ SEMICOLON','statement',6,'p_statement','parse_datacmds.py',217),
+  ('statement -> SET WORDWITHINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','parse_datacmds.py',218),
+  ('statement -> SET WORDWITHINDEX COLONEQ SEMICOLON','statement',4,'p_statement','parse_datacmds.py',219),
+  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ setdecl SEMICOLON','statement',5,'p_statement','parse_datacmds.py',220),
+  ('statement -> SET WORDWITHSQUOTEDINDEX COLONEQ SEMICOLON','statement',4,'p_statement','parse_datacmds.py',221),
+  ('statement -> PARAM items COLONEQ paramdecl SEMICOLON','statement',5,'p_statement','parse_datacmds.py',222),
+  ('statement -> LOAD loaddecl SEMICOLON','statement',3,'p_statement','parse_datacmds.py',223),
+  ('statement -> STORE loaddecl SEMICOLON','statement',3,'p_statement','parse_datacmds.py',224),
+  ('statement -> IMPORT loaddecl SEMICOLON','statement',3,'p_statement','parse_datacmds.py',225),
+  ('statement -> EXPORT loaddecl SEMICOLON','statement',3,'p_statement','parse_datacmds.py',226),
+  ('statement -> TABLE tabledecl SEMICOLON','statement',3,'p_statement','parse_datacmds.py',227),
+  ('statement -> INCLUDE WORD SEMICOLON','statement',3,'p_statement','parse_datacmds.py',228),
+  ('statement -> INCLUDE QUOTEDSTRING SEMICOLON','statement',3,'p_statement','parse_datacmds.py',229),
+  ('statement -> DATA SEMICOLON','statement',2,'p_statement','parse_datacmds.py',230),
+  ('statement -> END SEMICOLON','statement',2,'p_statement','parse_datacmds.py',231),
+  ('setdecl -> items','setdecl',1,'p_setdecl','parse_datacmds.py',256),
+  ('paramdecl -> items','paramdecl',1,'p_paramdecl','parse_datacmds.py',260),
+  ('loaddecl -> filename load_options','loaddecl',2,'p_loadtdecl','parse_datacmds.py',280),
+  ('loaddecl -> filename','loaddecl',1,'p_loadtdecl','parse_datacmds.py',281),
+  ('loaddecl -> filename load_options COLON WORD EQ bracket_indices variable_options','loaddecl',7,'p_loadtdecl','parse_datacmds.py',282),
+  ('loaddecl -> filename COLON WORD EQ bracket_indices variable_options','loaddecl',6,'p_loadtdecl','parse_datacmds.py',283),
+  ('loaddecl -> filename load_options COLON bracket_indices variable_options','loaddecl',5,'p_loadtdecl','parse_datacmds.py',284),
+  ('loaddecl -> filename COLON bracket_indices variable_options','loaddecl',4,'p_loadtdecl','parse_datacmds.py',285),
+  ('loaddecl -> filename load_options COLON variable_options','loaddecl',4,'p_loadtdecl','parse_datacmds.py',286),
+  ('loaddecl -> filename COLON variable_options','loaddecl',3,'p_loadtdecl','parse_datacmds.py',287),
+  ('loaddecl -> WORD load_options','loaddecl',2,'p_loadtdecl','parse_datacmds.py',288),
+  ('loaddecl -> WORD','loaddecl',1,'p_loadtdecl','parse_datacmds.py',289),
+  ('loaddecl -> WORD load_options COLON WORD EQ bracket_indices variable_options','loaddecl',7,'p_loadtdecl','parse_datacmds.py',290),
+  ('loaddecl -> WORD COLON WORD EQ bracket_indices variable_options','loaddecl',6,'p_loadtdecl','parse_datacmds.py',291),
+  ('loaddecl -> WORD load_options COLON bracket_indices variable_options','loaddecl',5,'p_loadtdecl','parse_datacmds.py',292),
+  ('loaddecl -> WORD COLON bracket_indices variable_options','loaddecl',4,'p_loadtdecl','parse_datacmds.py',293),
+  ('loaddecl -> WORD load_options COLON variable_options','loaddecl',4,'p_loadtdecl','parse_datacmds.py',294),
+  ('loaddecl -> WORD COLON variable_options','loaddecl',3,'p_loadtdecl','parse_datacmds.py',295),
+  ('tabledecl -> load_options table_indices unlabeled_table_values COLONEQ paramdecl','tabledecl',5,'p_tabledecl','parse_datacmds.py',323),
+  ('tabledecl -> load_options table_indices labeled_table_values COLON table_labels COLONEQ paramdecl','tabledecl',7,'p_tabledecl','parse_datacmds.py',324),
+  ('tabledecl -> WORD COLONEQ paramdecl','tabledecl',3,'p_tabledecl','parse_datacmds.py',325),
+  ('unlabeled_table_values -> unlabeled_table_value unlabeled_table_values','unlabeled_table_values',2,'p_unlabeled_table_values','parse_datacmds.py',348),
+  ('unlabeled_table_values -> unlabeled_table_value','unlabeled_table_values',1,'p_unlabeled_table_values','parse_datacmds.py',349),
+  ('unlabeled_table_values -> <empty>','unlabeled_table_values',0,'p_unlabeled_table_values','parse_datacmds.py',350),
+  ('unlabeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',8,'p_unlabeled_table_value','parse_datacmds.py',361),
+  ('unlabeled_table_value -> WORDWITHLPAREN WORD RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',7,'p_unlabeled_table_value','parse_datacmds.py',362),
+  ('unlabeled_table_value -> WORDWITHLPAREN RPAREN EQ LBRACE WORD RBRACE','unlabeled_table_value',6,'p_unlabeled_table_value','parse_datacmds.py',363),
+  ('labeled_table_values -> labeled_table_value labeled_table_values','labeled_table_values',2,'p_labeled_table_values','parse_datacmds.py',373),
+  ('labeled_table_values -> labeled_table_value','labeled_table_values',1,'p_labeled_table_values','parse_datacmds.py',374),
+  ('labeled_table_values -> <empty>','labeled_table_values',0,'p_labeled_table_values','parse_datacmds.py',375),
+  ('labeled_table_value -> WORDWITHLPAREN WORD index_list RPAREN','labeled_table_value',4,'p_labeled_table_value','parse_datacmds.py',386),
+  ('labeled_table_value -> WORDWITHLPAREN WORD RPAREN','labeled_table_value',3,'p_labeled_table_value','parse_datacmds.py',387),
+  ('labeled_table_value -> WORDWITHLPAREN RPAREN','labeled_table_value',2,'p_labeled_table_value','parse_datacmds.py',388),
+  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE table_indices','table_indices',5,'p_table_indices','parse_datacmds.py',398),
+  ('table_indices -> WORDWITHEQBRACE WORD RBRACE table_indices','table_indices',4,'p_table_indices','parse_datacmds.py',399),
+  ('table_indices -> WORDWITHEQBRACE WORD index_list RBRACE','table_indices',4,'p_table_indices','parse_datacmds.py',400),
+  ('table_indices -> WORDWITHEQBRACE WORD RBRACE','table_indices',3,'p_table_indices','parse_datacmds.py',401),
+  ('table_indices -> <empty>','table_indices',0,'p_table_indices','parse_datacmds.py',402),
+  ('table_labels -> WORD table_labels','table_labels',2,'p_table_labels','parse_datacmds.py',419),
+  ('table_labels -> WORD','table_labels',1,'p_table_labels','parse_datacmds.py',420),
+  ('table_labels -> <empty>','table_labels',0,'p_table_labels','parse_datacmds.py',421),
+  ('load_options -> option load_options','load_options',2,'p_load_options','parse_datacmds.py',432),
+  ('load_options -> option','load_options',1,'p_load_options','parse_datacmds.py',433),
+  ('load_options -> <empty>','load_options',0,'p_load_options','parse_datacmds.py',434),
+  ('option -> WORD EQ WORD','option',3,'p_option','parse_datacmds.py',445),
+  ('option -> WORD EQ STRING','option',3,'p_option','parse_datacmds.py',446),
+  ('option -> WORD EQ QUOTEDSTRING','option',3,'p_option','parse_datacmds.py',447),
+  ('option -> WORD EQ PARAM','option',3,'p_option','parse_datacmds.py',448),
+  ('option -> WORD EQ SET','option',3,'p_option','parse_datacmds.py',449),
+  ('variable_options -> variable variable_options','variable_options',2,'p_variable_options','parse_datacmds.py',454),
+  ('variable_options -> variable','variable_options',1,'p_variable_options','parse_datacmds.py',455),
+  ('variable -> WORD','variable',1,'p_variable','parse_datacmds.py',464),
+  ('variable -> option','variable',1,'p_variable','parse_datacmds.py',465),
+  ('bracket_indices -> LBRACKET WORD index_list RBRACKET','bracket_indices',4,'p_bracket_indices','parse_datacmds.py',473),
+  ('bracket_indices -> LBRACKET WORD RBRACKET','bracket_indices',3,'p_bracket_indices','parse_datacmds.py',474),
+  ('index_list -> COMMA WORD index_list','index_list',3,'p_index_list','parse_datacmds.py',483),
+  ('index_list -> COMMA ASTERISK index_list','index_list',3,'p_index_list','parse_datacmds.py',484),
+  ('index_list -> COMMA WORD','index_list',2,'p_index_list','parse_datacmds.py',485),
+  ('index_list -> COMMA ASTERISK','index_list',2,'p_index_list','parse_datacmds.py',486),
+  ('set_template -> LPAREN WORD index_list RPAREN','set_template',4,'p_set_template','parse_datacmds.py',495),
+  ('set_template -> LPAREN ASTERISK index_list RPAREN','set_template',4,'p_set_template','parse_datacmds.py',496),
+  ('set_template -> LPAREN WORD RPAREN','set_template',3,'p_set_template','parse_datacmds.py',497),
+  ('set_template -> LPAREN ASTERISK RPAREN','set_template',3,'p_set_template','parse_datacmds.py',498),
+  ('param_template -> LBRACKET WORD index_list RBRACKET','param_template',4,'p_param_template','parse_datacmds.py',506),
+  ('param_template -> LBRACKET ASTERISK index_list RBRACKET','param_template',4,'p_param_template','parse_datacmds.py',507),
+  ('param_template -> LBRACKET WORD RBRACKET','param_template',3,'p_param_template','parse_datacmds.py',508),
+  ('param_template -> LBRACKET ASTERISK RBRACKET','param_template',3,'p_param_template','parse_datacmds.py',509),
+  ('items -> items WORD','items',2,'p_items','parse_datacmds.py',520),
+  ('items -> items WORDWITHINDEX','items',2,'p_items','parse_datacmds.py',521),
+  ('items -> items WORDWITHSQUOTEDINDEX','items',2,'p_items','parse_datacmds.py',522),
+  ('items -> items NONWORD','items',2,'p_items','parse_datacmds.py',523),
+  ('items -> items STRING','items',2,'p_items','parse_datacmds.py',524),
+  ('items -> items QUOTEDSTRING','items',2,'p_items','parse_datacmds.py',525),
+  ('items -> items COMMA','items',2,'p_items','parse_datacmds.py',526),
+  ('items -> items COLON','items',2,'p_items','parse_datacmds.py',527),
+  ('items -> items LBRACE','items',2,'p_items','parse_datacmds.py',528),
+  ('items -> items RBRACE','items',2,'p_items','parse_datacmds.py',529),
+  ('items -> items LBRACKET','items',2,'p_items','parse_datacmds.py',530),
+  ('items -> items RBRACKET','items',2,'p_items','parse_datacmds.py',531),
+  ('items -> items TR','items',2,'p_items','parse_datacmds.py',532),
+  ('items -> items LPAREN','items',2,'p_items','parse_datacmds.py',533),
+  ('items -> items RPAREN','items',2,'p_items','parse_datacmds.py',534),
+  ('items -> items ASTERISK','items',2,'p_items','parse_datacmds.py',535),
+  ('items -> items set_template','items',2,'p_items','parse_datacmds.py',536),
+  ('items -> items param_template','items',2,'p_items','parse_datacmds.py',537),
+  ('items -> WORD','items',1,'p_items','parse_datacmds.py',538),
+  ('items -> WORDWITHINDEX','items',1,'p_items','parse_datacmds.py',539),
+  ('items -> WORDWITHSQUOTEDINDEX','items',1,'p_items','parse_datacmds.py',540),
+  ('items -> NONWORD','items',1,'p_items','parse_datacmds.py',541),
+  ('items -> STRING','items',1,'p_items','parse_datacmds.py',542),
+  ('items -> QUOTEDSTRING','items',1,'p_items','parse_datacmds.py',543),
+  ('items -> COMMA','items',1,'p_items','parse_datacmds.py',544),
+  ('items -> COLON','items',1,'p_items','parse_datacmds.py',545),
+  ('items -> LBRACE','items',1,'p_items','parse_datacmds.py',546),
+  ('items -> RBRACE','items',1,'p_items','parse_datacmds.py',547),
+  ('items -> LBRACKET','items',1,'p_items','parse_datacmds.py',548),
+  ('items -> RBRACKET','items',1,'p_items','parse_datacmds.py',549),
+  ('items -> TR','items',1,'p_items','parse_datacmds.py',550),
+  ('items -> LPAREN','items',1,'p_items','parse_datacmds.py',551),
+  ('items -> RPAREN','items',1,'p_items','parse_datacmds.py',552),
+  ('items -> ASTERISK','items',1,'p_items','parse_datacmds.py',553),
+  ('items -> set_template','items',1,'p_items','parse_datacmds.py',554),
+  ('items -> param_template','items',1,'p_items','parse_datacmds.py',555),
+  ('filename -> WORD','filename',1,'p_filename','parse_datacmds.py',577),
+  ('filename -> STRING','filename',1,'p_filename','parse_datacmds.py',578),
+  ('filename -> QUOTEDSTRING','filename',1,'p_filename','parse_datacmds.py',579),
+  ('filename -> FILENAME','filename',1,'p_filename','parse_datacmds.py',580),
+  ('filename -> WORD COLON FILENAME','filename',3,'p_filename','parse_datacmds.py',581),
+]
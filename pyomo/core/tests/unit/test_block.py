@@ -13,6 +13,7 @@
 import os
 import sys
 import six
+import time
 
 from copy import deepcopy
 from os.path import abspath, dirname, join
@@ -1529,6 +1530,143 @@ class TestBlock(unittest.TestCase):
         )
 
 
+    def test_clone_share_structure(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3,1,2], ordered=True)
+        m.J = Set(initialize=[1,2])
+        m.p = Param(m.I, m.J, initialize=lambda m,i,j: i*j)
+        m.q = Param(m.I, mutable=True, initialize=1)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m,i: m.q[i]*m.x[i] >= m.p[i,1])
+        m.o = Objective(expr=sum(m.p[i,2]*m.x[i] for i in m.I))
+        m.b = Block()
+        m.b.y = Var()
+        m.b.e = Expression(expr=sin(m.x[1]) + m.b.y)
+
+        n = m.clone(share_structure=True)
+        # set members and immutable Param values are shared
+        self.assertIsNot(n.I, m.I)
+        self.assertIs(n.I.value, m.I.value)
+        self.assertIs(n.I.order_dict, m.I.order_dict)
+        self.assertIs(n.J.value, m.J.value)
+        self.assertIsNot(n.p, m.p)
+        self.assertIs(n.p._data, m.p._data)
+        self.assertIs(n.p.parent_block(), n)
+        # mutable Params and Vars are copied
+        self.assertIsNot(n.q[1], m.q[1])
+        self.assertIs(n.q[1].parent_component(), n.q)
+        n.q[1] = 5
+        self.assertEqual(value(m.q[1]), 1)
+        self.assertIsNot(n.x[1], m.x[1])
+        self.assertEqual(list(n.I), [3,1,2])
+        self.assertEqual(n.p[3,2], 6)
+        # expressions are remapped onto the copies
+        self.assertEqual(
+            sorted(id(x) for x in identify_variables(n.c[2].body)),
+            [id(n.x[2])] )
+        self.assertEqual(
+            sorted(id(x) for x in identify_variables(n.o.expr)),
+            sorted(id(n.x[i]) for i in n.I) )
+        self.assertEqual(
+            sorted(id(x) for x in identify_variables(n.b.e.expr)),
+            sorted(id(x) for x in (n.x[1], n.b.y)) )
+        self.assertEqual(str(n.c[2].body), str(m.c[2].body))
+
+    def test_clone_share_structure_sorted_set(self):
+        m = ConcreteModel()
+        m.S = Set(initialize=[1,3], ordered=Set.SortedOrder)
+        m.S.add(2)
+        n = m.clone(share_structure=True)
+        self.assertIs(n.S.value, m.S.value)
+        # sorting the clone does not change the shared containers
+        self.assertEqual(n.S.ord(3), 3)
+        self.assertEqual(m.S.value, [1,3,2])
+        self.assertEqual(m.S.ord(3), 3)
+        self.assertEqual(list(m.S), [1,2,3])
+        self.assertEqual(list(n.S), [1,2,3])
+
+    def test_clone_subblock_share_structure(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.b = Block()
+        m.b.y = Var()
+        m.b.c = Constraint(expr=exp(m.x) + m.b.y >= 0)
+        m.b.d = Constraint(expr=exp(m.x) >= 1)
+
+        nb = m.b.clone(share_structure=True)
+        self.assertIsNone(nb.parent_block())
+        # subexpressions that only reference components outside the
+        # block are shared
+        self.assertIsNot(nb.c.body, m.b.c.body)
+        self.assertIs(nb.c.body._args[0], m.b.c.body._args[0])
+        self.assertIs(nb.c.body._args[1], nb.y)
+        self.assertIs(nb.d.body, m.b.d.body)
+        # ... but not with a regular clone
+        nb = m.b.clone()
+        self.assertIsNot(nb.d.body, m.b.d.body)
+        self.assertIs(
+            list(identify_variables(nb.d.body))[0], m.x)
+
+
+    def test_component_data_cache(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], dense=False)
+        m.c = Constraint([1,2], rule=lambda m,i: m.x[i] >= 0)
+        m.b = Block([1,2])
+        m.b[1].d = Constraint(expr=m.x[1] <= 1)
+        m.b[2].d = Constraint(expr=m.x[2] <= 1)
+
+        def _names(**kwds):
+            return [c.cname(True) for c in
+                    m.component_data_objects(Constraint, **kwds)]
+
+        self.assertEqual(_names(), ['c[1]', 'c[2]', 'b[1].d', 'b[2].d'])
+        # the list is cached...
+        self.assertIs(m._component_data_list(Constraint, None, True, None),
+                      m._component_data_list(Constraint, None, True, None))
+        # ... and updated when the model changes
+        m.c[2].deactivate()
+        self.assertEqual(_names(active=True), ['c[1]', 'b[1].d', 'b[2].d'])
+        self.assertEqual(_names(active=False, descend_into=False), [])
+        m.c.deactivate()
+        self.assertEqual(_names(active=False, descend_into=False),
+                         ['c[1]', 'c[2]'])
+        m.c.activate()
+        m.b[1].deactivate()
+        self.assertEqual(_names(active=True), ['c[1]', 'c[2]', 'b[2].d'])
+        m.b[1].activate()
+        m.c.add(3, m.x[3] >= 0)
+        self.assertEqual(_names(active=True),
+                         ['c[1]', 'c[2]', 'c[3]', 'b[1].d', 'b[2].d'])
+        del m.c[1]
+        m.c.add(4, m.x[1] >= 0)
+        self.assertEqual(_names(descend_into=False), ['c[2]', 'c[3]', 'c[4]'])
+        # direct changes to the data of a component are seen, too, even
+        # when the number of data objects does not change
+        del m.c._data[4]
+        m.c.add(5, m.x[1] >= 1)
+        self.assertEqual(_names(descend_into=False), ['c[2]', 'c[3]', 'c[5]'])
+        m.b[2].e = Constraint(expr=m.x[3] <= 1)
+        m.del_component(m.c)
+        self.assertEqual(_names(), ['b[1].d', 'b[2].d', 'b[2].e'])
+        m.b[2].b = Block()
+        m.b[2].b.d = Constraint(expr=m.x[3] <= 2)
+        self.assertEqual(_names(), ['b[1].d', 'b[2].d', 'b[2].e', 'b[2].b.d'])
+        # sparse components add data on access
+        self.assertEqual(len(list(m.component_data_objects(Var))), 3)
+        m.x[2]
+        self.assertEqual(len(list(m.component_data_objects(Var))), 3)
+        m.y = Var([1,2], dense=False)
+        self.assertEqual(len(list(m.component_data_objects(Var))), 3)
+        m.y[1].value = 1
+        self.assertEqual(len(list(m.component_data_objects(Var))), 4)
+        # the cache is not cloned
+        n = m.clone()
+        self.assertNotIn('_component_data_cache', n.__dict__)
+        self.assertEqual(
+            [c.cname(True) for c in n.component_data_objects(Constraint)],
+            ['b[1].d', 'b[2].d', 'b[2].e', 'b[2].b.d'])
+
     def Xtest_display(self):
         self.block.A = RangeSet(1,4)
         self.block.x = Var(self.block.A, bounds=(-1,1))
@@ -1663,5 +1801,55 @@ class TestBlock(unittest.TestCase):
         self.instance.display(join(currdir,"solve1.out"))
         self.assertFileEqualsBaseline(join(currdir,"solve1.out"),join(currdir,"solve1.txt"))
 
+
+@unittest.category('performance', include_in_all=False)
+class TestBlockPerformance(unittest.TestCase):
+    """
+    Time block cloning (a full deepcopy and clone(share_structure=True))
+    and repeated component_data_objects() walks.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_clone(self):
+        N = 500
+        m = ConcreteModel()
+        m.I = Set(initialize=range(N), ordered=True)
+        m.J = Set(initialize=range(N))
+        m.c = Param(m.I, m.J, initialize=lambda m,i,j: i*j+1)
+        m.d = Param(m.I, initialize=lambda m,i: i)
+        m.x = Var(m.I, m.J, within=NonNegativeReals)
+        m.supply = Constraint(m.I, rule=lambda m,i:
+                              summation(m.x, index=[(i,j) for j in m.J])
+                              <= m.d[i]+1)
+        m.o = Objective(expr=summation(m.c, m.x))
+        for share in (False, True):
+            start = time.time()
+            m.clone(share_structure=share)
+            seconds = time.time() - start
+            self.recordTestData('share_structure=%s seconds' % share,
+                                seconds)
+            print("clone(share_structure=%s): %.3f s" % (share, seconds))
+    def test_component_data_objects(self):
+        m = ConcreteModel()
+        def b_rule(b, i):
+            b.x = Var(range(50))
+            b.c = Constraint(range(50), rule=lambda b,j: b.x[j] >= j)
+            def bb_rule(bb, k):
+                bb.y = Var(range(20))
+                bb.d = Constraint(range(20), rule=lambda bb,j: bb.y[j] >= j)
+            b.b = Block(range(5), rule=bb_rule)
+        m.b = Block(range(200), rule=b_rule)
+        n = 20
+        start = time.time()
+        for i in range(n):
+            for c in m.component_data_objects(Constraint, active=True):
+                pass
+        seconds = time.time() - start
+        self.recordTestData('component_data_objects seconds', seconds)
+        print("%d walks over %d constraints: %.3f s"
+              % (n, len(list(m.component_data_objects(Constraint))),
+                 seconds))
+
 if __name__ == "__main__":
     unittest.main()
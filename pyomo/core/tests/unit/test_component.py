@@ -10,11 +10,17 @@
 # Unit Tests for components
 #
 
+import time
+
 import pyutilib.th as unittest
 
 from pyomo.util import DeveloperError
 import pyomo.core.base._pyomo
 from pyomo.environ import *
+from pyomo.core.base.component import _cname_index_generator, \
+    _cname_index_strings
+from pyomo.core.base.label import CNameLabeler, TextLabeler, \
+    AlphaNumTextLabeler, cpxlp_label_from_name
 
 class TestComponent(unittest.TestCase):
 
@@ -361,7 +367,105 @@ class TestEnviron(unittest.TestCase):
     def test_sets(self):
         self.assertTrue(set(x[0] for x in pyomo.core.base._pyomo.predefined_sets()) >= set(['Reals', 'Integers', 'Boolean']))
 
-    
+
+class TestComponentNames(unittest.TestCase):
+
+    def setUp(self):
+        m = ConcreteModel()
+        m.b = Block()
+        m.b.x = Var([1,2,3])
+        m.b.y = Var(['a,b', "c'd", 'e f'], [1,2])
+        m.z = Var()
+        self.m = m
+
+    def test_index_strings(self):
+        indices = [1, 'a', 'a,b', "c'd", 'c\\d', (1,'a b'), (2,"x'y")]
+        self.assertEqual(_cname_index_strings(indices),
+                         [_cname_index_generator(i) for i in indices])
+        self.assertEqual(_cname_index_strings(range(3)),
+                         ['[0]', '[1]', '[2]'])
+
+    def test_labelers(self):
+        m = self.m
+        for labeler in (CNameLabeler(), TextLabeler(), AlphaNumTextLabeler()):
+            for obj in [m.z, m.b.x, m.b] + list(m.b.x.values()) \
+                    + list(m.b.y.values()):
+                name = obj.cname(True)
+                if labeler.translate is not None:
+                    name = labeler.translate(name)
+                self.assertEqual(labeler(obj), name)
+        self.assertEqual(TextLabeler()(m.b.y['e f',2]), "b_y(e_f_2)")
+        self.assertEqual(CNameLabeler()(m.b.y["c'd",1]), "b.y['c\\'d',1]")
+        buf = {}
+        self.assertEqual(m.b.y['a,b',2].cname(True, buf), "b.y['a,b',2]")
+        self.assertEqual(buf[id(m.b.y['a,b',1])], "b.y['a,b',1]")
+        self.assertEqual(m.b.x[3].cname(False, buf), "x[3]")
+
+    def test_name_cache(self):
+        m = self.m
+        names = m.b._component_data_names(m.b.x, True)
+        self.assertEqual(names[id(m.b.x[2])], 'b.x[2]')
+        self.assertIs(m.b._component_data_names(m.b.x, True), names)
+        labels = m.b._component_data_names(m.b.x, True, cpxlp_label_from_name)
+        self.assertEqual(labels[id(m.b.x[2])], 'b_x(2)')
+        self.assertIs(
+            m.b._component_data_names(m.b.x, True, cpxlp_label_from_name),
+            labels )
+        self.assertEqual(
+            m.b._component_data_names(m.b.x, False)[id(m.b.x[2])], 'x[2]')
+
+    def test_name_cache_invalidation(self):
+        m = self.m
+        self.assertEqual(TextLabeler()(m.b.x[1]), 'b_x(1)')
+        # rename the component
+        m.b.x.name = 'w'
+        self.assertEqual(TextLabeler()(m.b.x[1]), 'b_w(1)')
+        # rename the parent block
+        m.b.name = 'c'
+        self.assertEqual(CNameLabeler()(m.b.x[1]), 'c.w[1]')
+        m.b.name = 'b'
+        m.b.x.name = 'x'
+        # move the component to another block
+        x = m.b.x
+        m.b.del_component(x)
+        m.q = Block()
+        m.q.v = x
+        self.assertEqual(TextLabeler()(x[1]), 'q_v(1)')
+        self.assertEqual(x[1].cname(True, {}), 'q.v[1]')
+        # add component data
+        m.l = VarList()
+        m.l.add()
+        self.assertEqual(TextLabeler()(m.l[1]), 'l(1)')
+        m.l.add()
+        self.assertEqual(TextLabeler()(m.l[2]), 'l(2)')
+        # cloned models do not share the cache
+        i = m.clone()
+        self.assertFalse('_cname_cache' in i.q.__dict__)
+        self.assertEqual(TextLabeler()(i.q.v[3]), 'q_v(3)')
+
+
+@unittest.category('performance', include_in_all=False)
+class TestComponentNamesPerformance(unittest.TestCase):
+    """
+    Time the generation of symbolic labels for the variables in a
+    model over repeated (e.g., re-solve) writes.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_text_labeler(self):
+        m = ConcreteModel()
+        m.x = Var(RangeSet(200000))
+        m.y = Var(RangeSet(100), RangeSet(1000))
+        objs = list(m.x.values()) + list(m.y.values())
+        for i in range(3):
+            start = time.time()
+            labeler = TextLabeler()
+            for obj in objs:
+                labeler(obj)
+            seconds = time.time() - start
+            self.recordTestData('write %d seconds' % (i+1,), seconds)
+            print("write %d: %.2f s" % (i+1, seconds))
 
 
 if __name__ == "__main__":
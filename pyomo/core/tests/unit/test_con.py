@@ -16,6 +16,7 @@
 import logging
 import sys
 import os
+import time
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
@@ -1293,5 +1294,115 @@ class MiscConTests(unittest.TestCase):
             pass
         #
 
+class TestLazyCon(unittest.TestCase):
+
+    def _model(self, calls):
+        def c_rule(m, i):
+            calls.append(i)
+            if i % 2:
+                return Constraint.Skip
+            return m.x[i] >= i
+        m = ConcreteModel()
+        m.I = RangeSet(6)
+        m.x = Var(m.I, lazy=True)
+        m.c = Constraint(m.I, rule=c_rule, lazy=True)
+        return m
+
+    def test_access(self):
+        calls = []
+        m = self._model(calls)
+        self.assertEqual(calls, [])
+        self.assertEqual(len(m.c._data), 0)
+        self.assertEqual(len(m.x._data), 0)
+        self.assertIs(m.c[4].body, m.x[4])
+        self.assertEqual(calls, [4])
+        self.assertEqual(sorted(m.x._data), [4])
+        # rule results (including skipped indices) are memoized
+        self.assertIs(m.c[4], m.c[4])
+        self.assertFalse(3 in m.c)
+        self.assertFalse(3 in m.c)
+        self.assertRaises(KeyError, m.c.__getitem__, 3)
+        self.assertTrue(2 in m.c)
+        self.assertFalse(7 in m.c)
+        self.assertEqual(calls, [4, 3, 2])
+
+    def test_iteration(self):
+        calls = []
+        m = self._model(calls)
+        m.c[4]
+        self.assertEqual(len(m.c), 3)
+        self.assertEqual(calls, [4, 1, 2, 3, 5, 6])
+        self.assertEqual(m.c.keys(), [2, 4, 6])
+        self.assertIs(m.c._lazy, None)
+        self.assertEqual(len(calls), 6)
+
+        calls = []
+        m = self._model(calls)
+        self.assertEqual(
+            [c.cname(True) for c in m.component_data_objects(Constraint)],
+            ['c[2]', 'c[4]', 'c[6]'])
+        self.assertEqual(len(calls), 6)
+        # the Var is only populated with the variables that were used
+        self.assertEqual(sorted(m.x.keys()), [2, 4, 6])
+
+    def test_add_and_deactivate(self):
+        calls = []
+        m = self._model(calls)
+        m.c.add(1, m.x[1] <= 5)
+        self.assertEqual(m.c[1].upper, 5)
+        self.assertEqual(calls, [])
+        m.c.deactivate()
+        self.assertEqual(sorted(c.active for c in m.c.values()),
+                         [False]*4)
+        self.assertEqual(len(calls), 5)
+
+    def test_clone(self):
+        calls = []
+        m = self._model(calls)
+        m.c[2]
+        n = m.clone()
+        self.assertEqual(n.c._lazy, set([2]))
+        self.assertEqual(len(n.c), 3)
+        self.assertIs(n.c[6].body, n.x[6])
+        self.assertEqual(len(m.c._lazy), 1)
+
+
+@unittest.category('performance', include_in_all=False)
+class TestConstraintPerformance(unittest.TestCase):
+    """
+    Compare the construction time of a sparse model (where most
+    constraint indices are skipped, and most variables are unused) with
+    and without lazy construction.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_lazy_construction(self):
+        n = 300
+        for lazy in (False, True):
+            start = time.time()
+            m = ConcreteModel()
+            m.N = RangeSet(n)
+            m.x = Var(m.N, m.N, lazy=lazy, bounds=(0, 1))
+            def c_rule(m, i, j):
+                if (i + j) % 10:
+                    return Constraint.Skip
+                return m.x[i,j] + m.x[j,i] <= 1
+            m.c = Constraint(m.N, m.N, rule=c_rule, lazy=lazy)
+            construct_time = time.time() - start
+            start = time.time()
+            m.o = Objective(expr=summation(m.x, index=[(i, i)
+                                                       for i in m.N]))
+            len(list(m.component_data_objects(Constraint)))
+            use_time = time.time() - start
+            label = 'lazy' if lazy else 'default'
+            self.recordTestData(label + ' construct seconds',
+                                construct_time)
+            self.recordTestData(label + ' use seconds', use_time)
+            self.recordTestData(label + ' variables', len(m.x))
+            print("%s: %.2f s construct, %.2f s use, %d variables"
+                  % (label, construct_time, use_time, len(m.x)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,169 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for the expression construction profiler
+#
+
+import sys
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base import expr_common, expr as EXPR
+from pyomo.core.base import expr_coopr3, expr_pyomo4
+from pyomo.core.base.expr_profiler import expression_profiler
+
+from six import StringIO
+
+def _create_instance(model, **kwds):
+    # return the instance and the text printed while creating it
+    out = StringIO()
+    stdout = sys.stdout
+    sys.stdout = out
+    try:
+        instance = model.create_instance(**kwds)
+    finally:
+        sys.stdout = stdout
+    return instance, out.getvalue()
+
+def _abstract_model():
+    model = AbstractModel()
+    model.I = RangeSet(1, 10)
+    model.x = Var(model.I)
+    def c_rule(model, i):
+        e = model.x[i] + 2*model.x[1]
+        return e + model.x[2] >= 1
+    model.c = Constraint(model.I, rule=c_rule)
+    def b_rule(b):
+        b.y = Var()
+        b.d = Constraint(expr=b.y >= 0)
+    model.b = Block(rule=b_rule)
+    return model
+
+class TestExpressionProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        disable_expression_profiling()
+        EXPR.set_expression_tree_format(expr_common._default_mode)
+
+    def test_disabled_restores_originals(self):
+        originals = ( expr_coopr3._ExpressionBase.__dict__['__init__'],
+                      expr_pyomo4._ExpressionBase.__dict__['__init__'],
+                      expr_coopr3.clone_expression,
+                      expr_pyomo4.clone_expression,
+                      EXPR.clone_expression )
+        self.assertFalse(expression_profiling_enabled())
+        enable_expression_profiling()
+        self.assertTrue(expression_profiling_enabled())
+        self.assertIsNot(expr_coopr3.clone_expression, originals[2])
+        self.assertIsNot(EXPR.clone_expression, originals[4])
+        # enabling twice does not stack the hooks
+        enable_expression_profiling()
+        disable_expression_profiling()
+        self.assertFalse(expression_profiling_enabled())
+        self.assertEqual(
+            ( expr_coopr3._ExpressionBase.__dict__['__init__'],
+              expr_pyomo4._ExpressionBase.__dict__['__init__'],
+              expr_coopr3.clone_expression,
+              expr_pyomo4.clone_expression,
+              EXPR.clone_expression ),
+            originals )
+
+    def test_counters(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        enable_expression_profiling()
+        e = sin(m.x)
+        self.assertEqual(expression_profiler.nodes, 1)
+        self.assertEqual(expression_profiler.clones, 0)
+        EXPR.clone_expression(e)
+        self.assertEqual(expression_profiler.clones, 1)
+        self.assertEqual(expression_profiler.nodes, 2)
+        # variables are not cloned
+        EXPR.clone_expression(m.x)
+        self.assertEqual(expression_profiler.clones, 1)
+        disable_expression_profiling()
+        sin(m.y)
+        EXPR.clone_expression(e)
+        self.assertEqual(expression_profiler.nodes, 2)
+        self.assertEqual(expression_profiler.clones, 1)
+        enable_expression_profiling(reset=False)
+        self.assertEqual(expression_profiler.nodes, 2)
+        enable_expression_profiling()
+        self.assertEqual(expression_profiler.nodes, 0)
+
+    def test_pyomo4_counters(self):
+        EXPR.set_expression_tree_format(expr_common.Mode.pyomo4_trees)
+        m = ConcreteModel()
+        m.x = Var()
+        enable_expression_profiling()
+        e = m.x**2
+        f = e + 1
+        self.assertEqual(expression_profiler.nodes, 2)
+        EXPR.clone_expression(f)
+        self.assertEqual(expression_profiler.clones, 2)
+        self.assertEqual(expression_profiler.nodes, 4)
+
+    def test_component_records(self):
+        enable_expression_profiling()
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.c = Constraint(rule=lambda m: m.x[1] + m.x[2] >= 0)
+        # expressions passed directly are generated before construction
+        m.d = Constraint(expr=m.x[1] + m.x[2] >= 0)
+        names = [(r.name, r.depth, r.ctype, r.size)
+                 for r in expression_profiler.components]
+        self.assertEqual(names, [('x_index', 0, 'Set', 1),
+                                 ('x', 0, 'Var', 2),
+                                 ('c', 0, 'Constraint', 1),
+                                 ('d', 0, 'Constraint', 1)])
+        self.assertEqual(
+            [r.nodes for r in expression_profiler.components],
+            [0, 0, 2, 0])
+
+    def test_create_instance_report(self):
+        model = _abstract_model()
+        instance, output = _create_instance(model, report_timing=True)
+        self.assertNotIn('Expression construction profile', output)
+
+        enable_expression_profiling()
+        instance, output = _create_instance(model, report_timing=True)
+        self.assertIn('Expression construction profile', output)
+        self.assertEqual(
+            [(r.name, r.depth) for r in expression_profiler.components],
+            [('I', 0), ('x', 0), ('c', 0), ('b', 0),
+             ('b.y', 1), ('b.d', 1)] )
+        c, b = expression_profiler.components[2:4]
+        self.assertEqual(c.size, 10)
+        self.assertTrue(c.nodes > 0)
+        self.assertEqual(c.nodes + b.nodes, expression_profiler.nodes)
+        # the table lists each component and the totals
+        for line in ('c          Constraint', '  b.d', '[Total]'):
+            self.assertIn(line, output)
+        self.assertEqual(len(instance.c), 10)
+
+    def test_report(self):
+        enable_expression_profiling()
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint(expr=m.x + 1 >= 0)
+        out = StringIO()
+        expression_profiler.report(ostream=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].strip(), 'Expression construction profile:')
+        self.assertEqual(lines[1].split(),
+                         ['Component', 'Type', 'Indices', 'Seconds',
+                          'Nodes', 'Clones'])
+        self.assertEqual(lines[3].split()[:3], ['x', 'Var', '1'])
+        self.assertEqual(lines[4].split()[:3], ['c', 'Constraint', '1'])
+        self.assertEqual(lines[-1].split()[0], '[Total]')
+
+if __name__ == "__main__":
+    unittest.main()
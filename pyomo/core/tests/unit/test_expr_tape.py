@@ -0,0 +1,228 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for compiled expression tapes
+#
+
+import time
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base.expr import Expr_if
+from pyomo.core.base import expr_tape
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+def _model():
+    m = ConcreteModel()
+    m.I = RangeSet(1, 4)
+    m.x = Var(m.I, initialize=lambda m, i: 0.5*i)
+    m.y = Var(initialize=-1.5)
+    m.p = Param(mutable=True, initialize=3)
+    m.q = Param(initialize=2)
+    m.e = Expression(expr=m.x[1]*m.x[2])
+    return m
+
+class TestCompiledExpression(unittest.TestCase):
+
+    def _expressions(self, m):
+        return [
+            sum(m.q*m.x[i] for i in m.I) + 5,
+            m.p*m.x[1]*m.x[2]/(m.x[3] + 1) - m.y,
+            m.x[1]**2 + m.x[2]**m.p + 2**m.x[3],
+            sin(m.x[1]) + exp(m.x[2]) - log(m.x[3]) + sqrt(m.x[4]),
+            abs(m.y) + cos(m.y)*tan(m.x[1]) + log10(m.x[4]),
+            3*m.e + m.e**2,
+            Expr_if(IF=m.y <= 0, THEN=m.x[1], ELSE=log(m.y)),
+            m.x[1] - m.x[2] >= m.y,
+            m.x[1] == 2*m.x[2],
+            m.x[1] / (m.y*m.p),
+            ]
+
+    def test_evaluate(self):
+        m = _model()
+        for e in self._expressions(m):
+            c = compile_expression(e)
+            self.assertEqual(c(), value(e))
+            self.assertEqual(c.evaluate(), value(e))
+        # the values of the slots are read on every evaluation
+        exprs = self._expressions(m)
+        tapes = [compile_expression(e) for e in exprs]
+        m.x[1] = 1.25
+        m.y = 0.5
+        m.p = 7
+        m.x[3].fix(4)
+        for e, c in zip(exprs, tapes):
+            self.assertEqual(c(), value(e))
+
+    def test_slots(self):
+        m = _model()
+        c = compile_expression(m.p*m.x[2] + m.q*m.x[1] + m.x[2]**2)
+        self.assertEqual(c.slots, (m.p, m.x[2], m.x[1]))
+        self.assertEqual(c.slot_values(), [3, 1.0, 0.5])
+        self.assertEqual(c.evaluate([1, 2, 3]), 1*2 + 2*3 + 2**2)
+        self.assertRaises(ValueError, c.evaluate, [1, 2])
+        m.x[1].value = None
+        self.assertRaises(ValueError, c)
+        # constant expressions have no slots
+        c = compile_expression(m.q*3)
+        self.assertEqual(c.slots, ())
+        self.assertEqual(c(), 6)
+
+    def test_tape(self):
+        m = _model()
+        c = compile_expression(2*m.x[1] + 3*m.x[2] + 1)
+        self.assertEqual(c.tape, [(expr_tape._SLOT, 0),
+                                  (expr_tape._SLOT, 1),
+                                  (expr_tape._SUM, ((2, 3), 1))])
+
+    def test_constant_folding(self):
+        m = _model()
+        # named expressions of immutable parameters are not simplified
+        # when the expression is generated
+        m.z = Expression(expr=3*m.q)
+        m.w = Expression(expr=m.q - 2)
+        folded = compile_expression(2*exp(m.z))
+        self.assertEqual(folded.tape, [(expr_tape._CONST, 2*exp(6))])
+        c = compile_expression(m.x[1] + m.z*exp(m.z))
+        self.assertEqual(c.tape, [(expr_tape._SLOT, 0),
+                                  (expr_tape._CONST, 6*exp(6)),
+                                  (expr_tape._SUM, ((1, 1), 0))])
+        self.assertEqual(c(), 0.5 + 6*exp(6))
+        # the errors of constant subexpressions are raised when the
+        # tape is evaluated
+        c = compile_expression(m.x[1] + log(m.w))
+        self.assertEqual(c.tape[-2][0], expr_tape._FCN)
+        self.assertRaises(ValueError, c)
+        # only the branch of a constant condition is compiled
+        c = compile_expression(Expr_if(IF=m.w >= 0, THEN=m.x[1],
+                                       ELSE=log(m.y)))
+        self.assertEqual(c.tape, [(expr_tape._SLOT, 0)])
+        self.assertEqual(c.slots, (m.x[1],))
+        # the tape is still recompiled if a folded named expression
+        # is changed
+        m.z.set_value(m.p)
+        self.assertFalse(folded.is_valid())
+        self.assertEqual(folded(), 2*exp(3))
+        self.assertEqual(folded.slots, (m.p,))
+
+    def test_invalidation(self):
+        m = _model()
+        m.c = Constraint(expr=m.e + m.x[3] <= 10)
+        m.o = Objective(expr=m.x[1] + m.x[2])
+        con = compile_expression(m.c)
+        obj = compile_expression(m.o)
+        named = compile_expression(m.e)
+        self.assertEqual(con(), value(m.c.body))
+        self.assertEqual(obj(), value(m.o))
+        self.assertEqual(named(), value(m.e))
+        self.assertTrue(con.is_valid())
+
+        # changing a named expression invalidates all the tapes that
+        # inline it
+        m.e.set_value(m.x[4]**2)
+        self.assertFalse(con.is_valid())
+        self.assertFalse(named.is_valid())
+        self.assertEqual(con(), 2.0**2 + 1.5)
+        self.assertEqual(named(), 4)
+        self.assertEqual(con.slots, (m.x[4], m.x[3]))
+
+        m.c.set_value(m.x[1] >= 0)
+        self.assertFalse(con.is_valid())
+        self.assertEqual(con(), 0.5)
+        m.o.expr = 5*m.y
+        self.assertEqual(obj(), -7.5)
+
+        # in-place operations on compiled expressions clone them
+        e = m.x[1] + m.x[2]
+        c = compile_expression(e)
+        e += m.x[3]
+        self.assertEqual(c(), 1.5)
+        c.invalidate()
+        self.assertFalse(c.is_valid())
+        self.assertEqual(c(), 1.5)
+
+    def test_not_compiled(self):
+        m = _model()
+        m.f = ExternalFunction(library='nonexistent.so', function='f')
+        c = compile_expression(m.x[1] + m.f(m.x[2]))
+        self.assertEqual(c.tape[1][0], expr_tape._NODE)
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_evaluate_batch(self):
+        m = _model()
+        for e in self._expressions(m):
+            c = compile_expression(e)
+            points = []
+            expected = []
+            for k in range(5):
+                values = [0.25*(k+1) + 0.1*j
+                          for j in range(len(c.slots))]
+                points.append(values)
+                expected.append(c.evaluate(values))
+            result = c.evaluate_batch(numpy.array(points))
+            self.assertEqual(result.shape, (5,))
+            for r, v in zip(result, expected):
+                self.assertAlmostEqual(float(r), float(v))
+        c = compile_expression(m.q*3 + m.x[1])
+        self.assertEqual(list(c.evaluate_batch([[1], [2]])), [7, 8])
+        self.assertRaises(ValueError, c.evaluate_batch, [1, 2])
+        self.assertRaises(ValueError, c.evaluate_batch, [[1, 2]])
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_evaluate_batch_not_compiled(self):
+        m = _model()
+        m.f = ExternalFunction(library='nonexistent.so', function='f')
+        c = compile_expression(m.x[1] + m.f(m.x[2]))
+        self.assertRaises(TypeError, c.evaluate_batch, [[1]])
+
+@unittest.category('performance', include_in_all=False)
+class TestCompiledExpressionPerformance(unittest.TestCase):
+    """
+    Compare value() with compiled tape evaluation (and batched
+    evaluation) of a nonlinear expression.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_evaluate(self):
+        m = ConcreteModel()
+        m.I = RangeSet(100)
+        m.x = Var(m.I, initialize=lambda m, i: 0.01*i)
+        m.p = Param(mutable=True, initialize=2)
+        e = sum(m.p*m.x[i]**2 + sin(m.x[i])*exp(m.x[i]) for i in m.I)
+        c = compile_expression(e)
+        n = 1000
+        start = time.time()
+        for i in range(n):
+            value(e)
+        value_time = time.time() - start
+        start = time.time()
+        for i in range(n):
+            c()
+        tape_time = time.time() - start
+        self.recordTestData('value() seconds', value_time)
+        self.recordTestData('tape seconds', tape_time)
+        print("%d evaluations: %.3f s with value(), %.3f s compiled"
+              % (n, value_time, tape_time))
+        if numpy_available:
+            points = numpy.tile(numpy.array(c.slot_values()), (n, 1))
+            start = time.time()
+            c.evaluate_batch(points)
+            batch_time = time.time() - start
+            self.recordTestData('batch seconds', batch_time)
+            print("%d evaluations: %.3f s batched" % (n, batch_time))
+
+if __name__ == "__main__":
+    unittest.main()
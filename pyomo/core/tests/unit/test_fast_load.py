@@ -0,0 +1,248 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for loading .sol file values directly into a model
+#
+
+import os
+import time
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+import pyutilib.misc
+import pyutilib.services
+
+import pyomo.opt
+from pyomo.opt import (ProblemFormat,
+                       ResultsFormat,
+                       ReaderFactory,
+                       TerminationCondition)
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.util.plugin import alias
+from pyomo.environ import *
+
+def _write_sol(nl_file, sol_file):
+    """
+    Write a .sol file for an NL file: variable i has the value i+0.5,
+    constraint i has the dual -i, and the suffixes 'rc' (variables) and
+    'sstatus' (constraints) are set for the first symbol.
+    """
+    with open(nl_file) as f:
+        f.readline()
+        n, m = [int(t) for t in f.readline().split()[:2]]
+    with open(sol_file, 'w') as f:
+        f.write("Test Solver: Optimal\n\nOptions\n3\n1\n1\n0\n")
+        f.write("%d\n%d\n%d\n%d\n" % (m, m, n, n))
+        for i in range(m):
+            f.write("%r\n" % (-float(i),))
+        for i in range(n):
+            f.write("%r\n" % (i + 0.5,))
+        f.write("objno 0 0\n")
+        f.write("suffix 4 1 3 0 0\nrc\n0 2.5\n")
+        f.write("suffix 1 1 8 0 0\nsstatus\n0 3\n")
+
+class SolLoadTestSolver(SystemCallSolver):
+    """
+    A solver that writes the .sol file created by _write_sol().
+    """
+
+    alias('_sol_load_test')
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_sol_load_test'
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.nl]
+        self._valid_result_formats = {ProblemFormat.nl: [ResultsFormat.sol]}
+        self.set_problem_format(ProblemFormat.nl)
+        self._capabilities = pyutilib.misc.Options()
+        self._capabilities.linear = True
+
+    def _default_results_format(self, prob_format):
+        return ResultsFormat.sol
+
+    def executable(self):
+        return 'none'
+
+    def create_command_line(self, executable, problem_files):
+        self._results_file = self._soln_file = \
+            pyutilib.services.TempfileManager.create_tempfile(suffix='.sol')
+        return pyutilib.misc.Bunch(cmd=[executable], log_file=None, env=None)
+
+    def _execute_command(self, command):
+        _write_sol(self._problem_files[0], self._soln_file)
+        return 0, ""
+
+def _perf_rule(m, i):
+    return m.x[i] >= i
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(0, 10))
+    m.y = Var()
+    m.y.fix(7)
+    m.o = Objective(expr=summation(m.x) + m.y)
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.d = Constraint(expr=m.x[2] + m.x[3] <= 4)
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.rc = Suffix(direction=Suffix.IMPORT)
+    m.sstatus = Suffix(direction=Suffix.IMPORT)
+    return m
+
+class TestFastLoad(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+        if os.path.exists(currdir+'fast_load.nl'):
+            os.remove(currdir+'fast_load.nl')
+        if os.path.exists(currdir+'fast_load.sol'):
+            os.remove(currdir+'fast_load.sol')
+
+    def _read(self, m, values_only):
+        fname, smap_id = m.write(currdir+'fast_load.nl')
+        _write_sol(fname, currdir+'fast_load.sol')
+        with ReaderFactory("sol") as reader:
+            results = reader(currdir+'fast_load.sol',
+                             suffixes=['dual', 'rc', 'sstatus'],
+                             values_only=values_only)
+        results._smap_id = smap_id
+        return results
+
+    def _load(self, m, values_only, **kwds):
+        results = self._read(m, values_only)
+        m.solutions.load_from(results, **kwds)
+        return results
+
+    def _values(self, m):
+        return (dict((v.cname(True), (v.value, v.stale))
+                     for v in m.component_data_objects(Var)),
+                dict((c.cname(True), m.dual.get(c))
+                     for c in m.component_data_objects(Constraint)),
+                dict((k.cname(True), v) for k, v in m.rc.items()),
+                dict((k.cname(True), v) for k, v in m.sstatus.items()))
+
+    def test_load_values(self):
+        m = _model()
+        self._load(m, False)
+        n = _model()
+        n.rc[n.x[3]] = 4
+        results = self._load(n, True)
+        self.assertEqual(self._values(n), self._values(m))
+        self.assertEqual(n.x[1].value, 0.5)
+        self.assertEqual(n.y.value, 7)
+        self.assertEqual(n.dual[n.d], -1)
+        self.assertEqual(n.rc[n.x[1]], 2.5)
+        self.assertNotIn(n.x[3], n.rc)
+        self.assertEqual(n.sstatus[n.c], 3)
+        self.assertEqual(len(n.solutions), 0)
+        self.assertEqual(len(n.solutions.symbol_map), 0)
+        self.assertIsNone(results._sol_values)
+
+    def test_load_options(self):
+        for values_only in (False, True):
+            # variables without a value get the default value
+            m = _model()
+            results = self._read(m, values_only)
+            if values_only:
+                results._sol_values.x = results._sol_values.x[:2]
+            else:
+                del results.solution(0).variable['v2']
+            m.solutions.load_from(results, default_variable_value=-1)
+            self.assertEqual([m.x[i].value for i in m.x], [0.5, 1.5, -1])
+            # values of variables fixed after the write
+            def _fixed(**kwds):
+                m = _model()
+                results = self._read(m, values_only)
+                m.x[1].fix(0.5)
+                m.x[2].fix(0)
+                m.solutions.load_from(results, **kwds)
+                return m
+            self.assertEqual(_fixed().x[2].value, 0)
+            self.assertRaises(TypeError, _fixed, ignore_fixed_vars=False)
+            m = _fixed(ignore_fixed_vars=False,
+                       allow_consistent_values_for_fixed_vars=True)
+            self.assertEqual([m.x[i].value for i in m.x], [0.5, 0, 2.5])
+        # values read with values_only=True cannot be stored
+        m = _model()
+        results = self._read(m, True)
+        self.assertRaises(ValueError, m.solutions.load_from, results,
+                          select=None)
+
+    def test_solve(self):
+        opt = SolverFactory('_sol_load_test')
+        m = _model()
+        opt.solve(m)
+        n = _model()
+        results = opt.solve(n, fast_load=True)
+        self.assertEqual(n.x[3].value, 2.5)
+        self.assertEqual(self._values(n), self._values(m))
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertEqual(len(results.solution), 0)
+        self.assertEqual(len(n.solutions.symbol_map), 0)
+
+    def test_solve_load_solutions_false(self):
+        # the values are returned in the results
+        opt = SolverFactory('_sol_load_test')
+        m = _model()
+        results = opt.solve(m, fast_load=True, load_solutions=False)
+        self.assertIsNone(m.x[1].value)
+        self.assertEqual(results.solution.variable['v0']['Value'], 0.5)
+        m.solutions.load_from(results)
+        self.assertEqual(m.x[1].value, 0.5)
+
+    def test_solve_select_none(self):
+        # the values are stored as a solution that is not selected
+        opt = SolverFactory('_sol_load_test')
+        m = _model()
+        opt.solve(m, fast_load=True, select=None)
+        self.assertIsNone(m.x[1].value)
+        self.assertEqual(len(m.solutions), 1)
+        m.solutions.select(0)
+        self.assertEqual(m.x[1].value, 0.5)
+
+@unittest.category('performance', include_in_all=False)
+class TestFastLoadPerformance(unittest.TestCase):
+    """
+    Compare the time to read and load a .sol file for a model with
+    100000 variables, with and without fast_load.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def tearDown(self):
+        for ext in ('.nl', '.sol'):
+            if os.path.exists(currdir+'fast_load'+ext):
+                os.remove(currdir+'fast_load'+ext)
+
+    def test_load(self):
+        N = 100000
+        m = ConcreteModel()
+        m.I = RangeSet(N)
+        m.x = Var(m.I, bounds=(0, N))
+        m.o = Objective(expr=summation(m.x))
+        m.c = Constraint(m.I, rule=_perf_rule)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        for values_only in (False, True):
+            fname, smap_id = m.write(currdir+'fast_load.nl')
+            _write_sol(fname, currdir+'fast_load.sol')
+            start = time.time()
+            with ReaderFactory("sol") as reader:
+                results = reader(currdir+'fast_load.sol',
+                                 suffixes=['dual'],
+                                 values_only=values_only)
+            results._smap_id = smap_id
+            m.solutions.load_from(results)
+            seconds = time.time() - start
+            label = 'fast_load' if values_only else 'load_from'
+            self.recordTestData(label + ' seconds', seconds)
+            print("%s: %.2f s" % (label, seconds))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -243,5 +243,27 @@ class TestComponentSlices(unittest.TestCase):
         self.assertRaises( TypeError, _slicer.next )
 
 
+class TestIndexOrder(unittest.TestCase):
+
+    def test_index_order(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint([1,2,3], noruleinit=True)
+        m.c.add(1, m.x >= 1)
+        m.c.add(2, m.x >= 2)
+        self.assertEqual(m.c.index_order(), (1,2))
+        self.assertIs(m.c.index_order(), m.c.index_order())
+        # the keys change, but the number of data objects does not
+        del m.c[1]
+        m.c.add(3, m.x >= 3)
+        self.assertEqual(m.c.index_order(), (2,3))
+        # changes made directly to the data dictionary are seen, too
+        m.c._data[1] = m.c._data.pop(2)
+        self.assertEqual(sorted(m.c.index_order()), [1,3])
+        revision = m.c._data.revision
+        m.c._data.setdefault(4, m.c._data[1])
+        self.assertNotEqual(m.c._data.revision, revision)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,262 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for the binary instance archive
+#
+
+import os
+import time
+import pickle
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.base.instance_archive import _ArchiveWriter
+
+from six import BytesIO
+
+def _z_bounds(m, j):
+    return (None, j)
+
+def _c_rule(m, i):
+    return sum(m.x[i, j] for j in m.J) <= m.q*m.y
+
+def _f_rule(m, j):
+    return m.z[j]**2
+
+def _perf_rule(m, i):
+    return 2*m.x[i] + 3*m.x[(i % len(m.I)) + 1] <= 4
+
+def _model():
+    m = ConcreteModel()
+    m.I = Set(initialize=['a', 'b', 'c'])
+    m.J = RangeSet(3)
+    m.p = Param(m.I, initialize={'a': 1, 'b': 2.5, 'c': -1}, mutable=True)
+    m.q = Param(initialize=4)
+    m.x = Var(m.I, m.J, bounds=(0, 10), initialize=1.5)
+    m.y = Var(within=Binary)
+    m.y.fix(1)
+    m.z = Var(m.J, bounds=_z_bounds)
+    m.z[2].value = 7
+    m.e = Expression(expr=m.x['a', 1]*m.z[1])
+    m.f = Expression(m.J, rule=_f_rule)
+    m.o = Objective(expr=sum(m.p[i]*m.x[i, j] for i in m.I for j in m.J)
+                    + m.e, sense=maximize)
+    m.c = Constraint(m.I, rule=_c_rule)
+    m.d = Constraint(expr=(0, sin(m.z[1]) + m.z[2]**2/m.z[3], 5))
+    m.c['b'].deactivate()
+    m.b = Block()
+    m.b.w = Var([1, 2], initialize={1: 3, 2: 4})
+    m.b.c = Constraint(expr=m.b.w[1] + m.x['c', 3] == 2)
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.rc = Suffix(direction=Suffix.EXPORT)
+    m.rc[m.x['a', 1]] = 2.5
+    return m
+
+def _nl(m):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, 'instance_archive.nl')
+        m.write(fname, io_options={'symbolic_solver_labels': True})
+        with open(fname) as f:
+            return f.read()
+    finally:
+        # (the symbolic labels are written to .row and .col files)
+        shutil.rmtree(tmpdir)
+
+class TestInstanceArchive(unittest.TestCase):
+
+    def _check(self, m, n):
+        self.assertIsNot(m, n)
+        self.assertEqual(sorted(n.I), ['a', 'b', 'c'])
+        self.assertEqual(list(n.J), [1, 2, 3])
+        self.assertEqual(n.p['b'].value, 2.5)
+        self.assertEqual(n.q.value, 4)
+        for idx in m.x:
+            self.assertEqual(n.x[idx].value, m.x[idx].value)
+            self.assertEqual(n.x[idx].bounds, m.x[idx].bounds)
+            self.assertIs(n.x[idx].parent_component(), n.x)
+            self.assertIs(n.x[idx].domain, n.x['a', 1].domain)
+        self.assertEqual(n.x['a', 1].domain.name, 'Reals')
+        self.assertEqual(n.y.domain.name, 'Binary')
+        self.assertTrue(n.y.fixed)
+        self.assertFalse(n.x['a', 1].fixed)
+        self.assertEqual(n.z[1].value, None)
+        self.assertEqual(n.z[2].value, 7)
+        self.assertEqual(n.z[3].bounds, (None, 3))
+        self.assertEqual(n.b.w[2].value, 4)
+        self.assertIs(n.b.w[1].parent_block(), n.b)
+        self.assertFalse(n.c['b'].active)
+        self.assertTrue(n.c['a'].active)
+        self.assertIs(n.c['a'].parent_component(), n.c)
+        self.assertEqual(n.o.sense, maximize)
+        # the expressions refer to the loaded variables
+        self.assertEqual(str(n.c['a'].body), str(m.c['a'].body))
+        self.assertEqual(str(n.d.body), str(m.d.body))
+        self.assertIs(n.c['a'].body._args[0], n.x['a', 1])
+        self.assertIs(n.e.expr._numerator[0], n.x['a', 1])
+        self.assertIs(n.f[2].expr._args[0], n.z[2])
+        m.z[1].value = n.z[1].value = 0.5
+        self.assertEqual(value(n.o), value(m.o))
+        m.z[1].value = n.z[1].value = None
+        self.assertEqual(n.rc[n.x['a', 1]], 2.5)
+        self.assertEqual(_nl(n), _nl(m))
+
+    def test_dumps_loads(self):
+        m = _model()
+        data = dumps_instance(m)
+        self.assertIsInstance(data, bytes)
+        self._check(m, loads_instance(data))
+        # the archive does not modify the instance
+        self.assertIs(m.x['a', 1].parent_component(), m.x)
+        self._check(m, loads_instance(dumps_instance(m)))
+
+    def test_file(self):
+        m = _model()
+        fd, fname = tempfile.mkstemp(suffix='.pyar')
+        os.close(fd)
+        try:
+            dump_instance(m, fname)
+            self._check(m, load_instance(fname))
+            self._check(m, load_instance(fname, use_mmap=False))
+            with open(fname, 'rb') as f:
+                self._check(m, load_instance(f))
+        finally:
+            os.remove(fname)
+
+    def test_stream(self):
+        m = _model()
+        ostream = BytesIO()
+        dump_instance(m, ostream)
+        self._check(m, load_instance(BytesIO(ostream.getvalue())))
+
+    def test_modify_loaded(self):
+        m = _model()
+        n = loads_instance(dumps_instance(m))
+        n.x['a', 1].value = 9
+        n.x['b', 2].setub(20)
+        self.assertEqual(m.x['a', 1].value, 1.5)
+        self.assertEqual(m.x['b', 2].ub, 10)
+        n.c['b'].activate()
+        n.add_component('g', Constraint(expr=n.x['a', 2] >= 1))
+        self.assertEqual(value(n.c['a'].body), 12)
+        self.assertEqual(len(list(n.component_data_objects(Constraint,
+                                                           active=True))),
+                         6)
+        n.del_component(n.g)
+
+    def test_columns(self):
+        m = ConcreteModel()
+        m.x = Var(range(4), initialize={0: 1.5, 1: None, 2: 2.5, 3: None})
+        m.y = Var(range(3), initialize={0: 1, 1: 2, 2: 3})
+        m.z = Var(range(3), initialize={0: True, 1: False, 2: True})
+        m.w = Var(range(2), within=Any, initialize={0: 2**40, 1: 'a'})
+        writer = _ArchiveWriter()
+        writer.write(m, BytesIO())
+        for code, layout in enumerate(writer.layouts):
+            self.assertEqual([name for name, desc in layout],
+                             ['_component', '_domain', '_lb', '_ub',
+                              '_value', 'fixed', 'stale'])
+        self.assertEqual(writer.encode_column([1.5, 2.5])[0], 2)
+        self.assertEqual(writer.encode_column([1.5, None])[0], 3)
+        self.assertEqual(writer.encode_column([1, 2])[0], 4)
+        self.assertEqual(writer.encode_column([True, False])[0], 5)
+        self.assertEqual(writer.encode_column([2**40, 1])[0], 0)
+        self.assertEqual(writer.encode_column([None, None])[0], 1)
+        n = loads_instance(dumps_instance(m))
+        for name in 'xyzw':
+            mv, nv = getattr(m, name), getattr(n, name)
+            for i in mv:
+                self.assertEqual(type(nv[i].value), type(mv[i].value))
+                self.assertEqual(nv[i].value, mv[i].value)
+
+    def test_pickled_classes(self):
+        m = _model()
+        writer = _ArchiveWriter()
+        writer.write(m, BytesIO())
+        classes = set(cls.__name__ for cls in writer.classes)
+        # data objects with a __dict__ or custom __setstate__ are
+        # pickled normally
+        self.assertNotIn('_BlockData', classes)
+        self.assertNotIn('_GeneralExpressionData', classes)
+        self.assertNotIn('SimpleVar', classes)
+        for name in ('_GeneralVarData', '_GeneralConstraintData',
+                     '_ParamData', '_SumExpression',
+                     '_ProductExpression'):
+            self.assertIn(name, classes)
+
+    def test_key(self):
+        m = _model()
+        ostream = BytesIO()
+        dump_instance(m, ostream)
+        self.assertIs(load_instance_key(BytesIO(ostream.getvalue())), None)
+        key = ('m', (('model.py', 10, 1.5),))
+        data = dumps_instance(m, key=key)
+        self.assertEqual(load_instance_key(BytesIO(data)), key)
+        self._check(m, loads_instance(data))
+        fd, fname = tempfile.mkstemp(suffix='.pyar')
+        os.close(fd)
+        try:
+            dump_instance(m, fname, key=key)
+            self.assertEqual(load_instance_key(fname), key)
+            self._check(m, load_instance(fname))
+        finally:
+            os.remove(fname)
+        self.assertRaises(ValueError, load_instance_key,
+                          BytesIO(pickle.dumps(ConcreteModel())))
+
+    def test_not_an_archive(self):
+        self.assertRaises(ValueError, loads_instance,
+                          pickle.dumps(ConcreteModel()))
+
+@unittest.category('performance', include_in_all=False)
+class TestInstanceArchivePerformance(unittest.TestCase):
+    """
+    Compare pickle with the instance archive for a model with 100000
+    variables and linear constraints.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_dump_load(self):
+        N = 100000
+        m = ConcreteModel()
+        m.I = RangeSet(N)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1.5)
+        m.c = Constraint(m.I, rule=_perf_rule)
+        try:
+            import cPickle as fast_pickle
+        except ImportError:
+            fast_pickle = pickle
+        start = time.time()
+        data = fast_pickle.dumps(m, 2)
+        pickle_dump = time.time() - start
+        start = time.time()
+        fast_pickle.loads(data)
+        pickle_load = time.time() - start
+        pickle_size = len(data)
+        start = time.time()
+        data = dumps_instance(m)
+        archive_dump = time.time() - start
+        start = time.time()
+        loads_instance(data)
+        archive_load = time.time() - start
+        self.recordTestData('pickle dump seconds', pickle_dump)
+        self.recordTestData('pickle load seconds', pickle_load)
+        self.recordTestData('archive dump seconds', archive_dump)
+        self.recordTestData('archive load seconds', archive_load)
+        print("pickle:  dump %.2f s, load %.2f s, %d bytes"
+              % (pickle_dump, pickle_load, pickle_size))
+        print("archive: dump %.2f s, load %.2f s, %d bytes"
+              % (archive_dump, archive_load, len(data)))
+
+if __name__ == "__main__":
+    unittest.main()
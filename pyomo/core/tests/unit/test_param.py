@@ -1203,6 +1203,31 @@ class MiscParamTests(unittest.TestCase):
         #except ValueError:
             #pass
 
+    def test_get_set_array(self):
+        model = ConcreteModel()
+        model.A = Set(initialize=[3,1,2], ordered=True)
+        model.p = Param(model.A, mutable=True, default=2)
+        model.p[1] = 7
+        self.assertEqual(model.p.index_order(), (3,1,2))
+        self.assertEqual(list(model.p.get_array()), [2, 7, 2])
+        model.p.set_array([4, 5, float('nan')])
+        self.assertEqual(model.p[3].value, 4)
+        self.assertEqual(model.p[1].value, 5)
+        self.assertIs(model.p[2].value, None)
+        model.p.set_array(iter([1, 2, 3]), check=False)
+        self.assertEqual(model.p.extract_values(), {3:1, 1:2, 2:3})
+        self.assertRaises(ValueError, model.p.set_array, [1, 2])
+
+        model.q = Param(model.A, initialize={1:1, 2:2})
+        self.assertEqual(model.q.index_order(), (1,2))
+        self.assertEqual(list(model.q.get_array()), [1, 2])
+        self.assertRaises(RuntimeError, model.q.set_array, [1, 2])
+
+        model.r = Param(mutable=True, initialize=3)
+        self.assertEqual(list(model.r.get_array()), [3])
+        model.r.set_array([5], check=False)
+        self.assertEqual(model.r.value, 5)
+
 
 def createNonIndexedParamMethod(func, init_xy, new_xy, tol=1e-10):
 
@@ -23,10 +23,13 @@
 # SetArgs2              Testing arguments for arrays of sets
 # Misc                  Misc tests
 # SetIO                 Testing Set IO formats
+# OrderedSetAccess      Testing ord/next/prev and slicing of ordered sets
+# SparseProduct         Testing the SparseSetProduct class
 #
 
 import itertools
 import os
+import time
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
@@ -3014,5 +3017,252 @@ class NestedSetOperations(unittest.TestCase):
         self.assertEqual(sorted(inst.product3),
                          sorted(prod3))
 
+
+class OrderedSetAccess(unittest.TestCase):
+
+    def _test_walk(self, s, members):
+        self.assertEqual(list(s), members)
+        for i, val in enumerate(members):
+            self.assertEqual(s.ord(val), i+1)
+            self.assertEqual(s[i+1], val)
+            if i+1 < len(members):
+                self.assertEqual(s.next(val), members[i+1])
+            else:
+                self.assertRaises(IndexError, s.next, val)
+            if i > 0:
+                self.assertEqual(s.prev(val), members[i-1])
+            else:
+                self.assertRaises(IndexError, s.prev, val)
+            self.assertEqual(s.nextw(val, 2), members[(i+2) % len(members)])
+            self.assertEqual(s.prevw(val, 2), members[(i-2) % len(members)])
+        self.assertEqual(s.next(members[0], len(members)-1), members[-1])
+        self.assertRaises(IndexError, s.prev, members[1], 3)
+        self.assertRaises(KeyError, s.ord, 'missing')
+        self.assertRaises(KeyError, s.next, 'missing')
+        self.assertRaises(KeyError, s.nextw, 'missing')
+
+    def test_insertion_order(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=[5, 'a', 2, 'b', 1], ordered=True)
+        self._test_walk(m.s, [5, 'a', 2, 'b', 1])
+        m.s.add(0)
+        self._test_walk(m.s, [5, 'a', 2, 'b', 1, 0])
+        m.s.remove('a')
+        self._test_walk(m.s, [5, 2, 'b', 1, 0])
+
+    def test_sorted_order(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=[5, 3, 1], ordered=Set.SortedOrder)
+        self._test_walk(m.s, [1, 3, 5])
+        # appending members in order does not re-sort the set
+        m.s.add(7)
+        self.assertEqual(m.s._is_sorted, 1)
+        m.s.add(2)
+        self.assertEqual(m.s._is_sorted, 2)
+        self._test_walk(m.s, [1, 2, 3, 5, 7])
+        m.t = Set(initialize=['aa', 'c', 'bbb'],
+                  ordered=lambda x: len(x))
+        self._test_walk(m.t, ['c', 'aa', 'bbb'])
+        m.t.add('dddd')
+        self.assertEqual(m.t._is_sorted, 1)
+
+    def test_bulk_construction(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=range(10), ordered=Set.SortedOrder)
+        self.assertEqual(m.s._is_sorted, 1)
+        self.assertEqual(m.s.bounds(), (0, 9))
+        self._test_walk(m.s, list(range(10)))
+        m.t = Set(initialize=[3, 'b', 2], within=m.s | Set(initialize=['b']),
+                  ordered=True)
+        self.assertEqual(list(m.t), [3, 'b', 2])
+        self.assertEqual(m.t.bounds(), None)
+        u = Set(initialize=[1, 2, 20], within=m.s)
+        self.assertRaises(ValueError, m.add_component, 'u', u)
+        # duplicate values are added (with a warning) one at a time
+        m.w = Set(initialize=[1, 2, 1], ordered=True)
+        self.assertEqual(list(m.w), [1, 2])
+        m.x = Set(initialize=[(1,2), (3,4)], ordered=True)
+        self.assertEqual(m.x.dimen, 2)
+        self._test_walk(m.x, [(1,2), (3,4)])
+        m.y = Set(initialize=[3,1,2], filter=lambda m, i: i > 1)
+        self.assertEqual(m.y.value, set([2, 3]))
+        self.assertEqual(m.y.bounds(), (2, 3))
+
+    @unittest.skipIf(not _has_numpy, "Numpy is not installed")
+    def test_numpy_construction(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=numpy.arange(5), ordered=Set.SortedOrder)
+        self._test_walk(m.s, [0, 1, 2, 3, 4])
+        self.assertIs(type(m.s.first()), int)
+        m.t = Set(initialize=numpy.array([[1, 2], [3, 4]]), ordered=True)
+        self.assertEqual(m.t.dimen, 2)
+        self._test_walk(m.t, [(1, 2), (3, 4)])
+
+    def test_rangeset(self):
+        m = ConcreteModel()
+        m.r = RangeSet(2, 10, 2)
+        self._test_walk(m.r, [2, 4, 6, 8, 10])
+        m.q = RangeSet(0, 1, 0.25)
+        self._test_walk(m.q, [0, 0.25, 0.5, 0.75, 1])
+        m.f = RangeSet(1, 10, filter=lambda m, i: i % 3 == 0)
+        self.assertEqual(m.f.ord(6), 2)
+        self.assertEqual(m.f.next(6), 9)
+        self.assertEqual(m.f.prevw(3), 9)
+
+    def test_slices(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=[1, 2, 3, 4, 5], ordered=True)
+        m.r = RangeSet(5)
+        for s in (m.s, m.r):
+            v = s[1:4]
+            self.assertEqual(len(v), 3)
+            self.assertEqual(list(v), [2, 3, 4])
+            self.assertEqual(list(reversed(v)), [4, 3, 2])
+            self.assertEqual((v.first(), v.last(), v[2], v[-3]), (2, 4, 3, 2))
+            self.assertRaises(IndexError, v.__getitem__, 4)
+            self.assertRaises(IndexError, v.__getitem__, 0)
+            self.assertTrue(3 in v)
+            self.assertFalse(5 in v)
+            self.assertFalse('a' in v)
+            v = s[::-2]
+            self.assertEqual(list(v), [5, 3, 1])
+            self.assertEqual([x in v for x in (1, 2, 3, 4, 5)],
+                             [True, False, True, False, True])
+            self.assertEqual(list(s[3:]), [4, 5])
+            self.assertEqual(list(s[10:]), [])
+        # slices are views of the set members
+        self.assertIs(m.s[1:4]._set, m.s)
+
+
+class SparseProduct(unittest.TestCase):
+
+    def test_filter(self):
+        m = ConcreteModel()
+        m.A = RangeSet(4)
+        m.B = Set(initialize=['a', 'b', 'c'], ordered=True)
+        m.S = SparseSetProduct(m.A, m.B, [7, 8],
+                               filter=lambda m, i, j, k: i % 2 == 0 and k == 8)
+        members = [(i, j, 8) for i in (2, 4) for j in ('a', 'b', 'c')]
+        self.assertEqual(list(m.S), members)
+        self.assertEqual(len(m.S), 6)
+        self.assertEqual(m.S.dimen, 3)
+        for idx in itertools.product(m.A, m.B, [7, 8]):
+            self.assertEqual(idx in m.S, idx in members)
+        for idx in ((2, 'z', 8), (2, 'a'), (2, 'a', 8, 1), 2, 'a', None):
+            self.assertFalse(idx in m.S)
+        # the set stores integer codes, not tuples
+        self.assertEqual(list(m.S._codes), [7, 9, 11, 19, 21, 23])
+        self.assertEqual(m.S._decode(19), (4, 'a', 8))
+
+    def test_initialize(self):
+        m = ConcreteModel()
+        m.A = RangeSet(3)
+        m.B = Set(initialize=['a', 'b'], ordered=True)
+        m.S = SparseSetProduct(m.A, m.B,
+                               initialize=[(3, 'a'), (1, 'b'), (3, 'a')])
+        self.assertEqual(list(m.S), [(1, 'b'), (3, 'a')])
+        m.T = SparseSetProduct(m.A, m.B,
+                               initialize=lambda m: [(2, 'b'), (1, 'a')],
+                               filter=lambda m, i, j: i > 1)
+        self.assertEqual(list(m.T), [(2, 'b')])
+        m.U = SparseSetProduct(m.A, m.B)
+        self.assertEqual(list(m.U), list(itertools.product(m.A, m.B)))
+        self.assertRaises(ValueError, m.add_component, 'V',
+                          SparseSetProduct(m.A, m.B, initialize=[(4, 'a')]))
+        self.assertRaises(ValueError, SparseSetProduct, m.A, m.A*m.B)
+        self.assertRaises(TypeError, SparseSetProduct, m.A)
+
+    def test_abstract(self):
+        model = AbstractModel()
+        model.A = Set(initialize=[1, 2, 3])
+        model.S = SparseSetProduct(model.A, model.A,
+                                   filter=lambda m, i, j: i < j)
+        self.assertRaises(RuntimeError, list, model.S)
+        instance = model.create_instance()
+        self.assertEqual(sorted(instance.S), [(1, 2), (1, 3), (2, 3)])
+
+    def test_indexed_component(self):
+        m = ConcreteModel()
+        m.A = RangeSet(10)
+        m.S = SparseSetProduct(m.A, m.A, m.A,
+                               filter=lambda m, i, j, k: i == j == k)
+        m.x = Var(m.S, initialize=lambda m, i, j, k: i)
+        m.c = Constraint(m.S, rule=lambda m, i, j, k: m.x[i, j, k] >= 0)
+        self.assertEqual(len(m.x), 10)
+        self.assertEqual(len(m.c), 10)
+        self.assertEqual(m.x[3, 3, 3].value, 3)
+        self.assertRaises(KeyError, m.x.__getitem__, (1, 2, 3))
+        i = m.clone()
+        self.assertEqual(list(i.S), list(m.S))
+        self.assertEqual(i.x[4, 4, 4].value, 4)
+
+
+@unittest.category('performance', include_in_all=False)
+class OrderedSetPerformance(unittest.TestCase):
+    """
+    Time the construction of a 100k element time horizon set, and a
+    walk over the set with next() (as done in constraint rules).
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_walk(self):
+        n = 100000
+        m = ConcreteModel()
+        start = time.time()
+        m.T = Set(initialize=[0.5*i for i in range(n)],
+                  ordered=Set.SortedOrder)
+        seconds = time.time() - start
+        self.recordTestData('construct seconds', seconds)
+        print("construct: %.3f s" % (seconds,))
+        start = time.time()
+        for t in m.T[1:-1]:
+            m.T.next(t)
+            m.T.prev(t)
+        seconds = time.time() - start
+        self.recordTestData('walk seconds', seconds)
+        print("walk: %.3f s" % (seconds,))
+
+
+@unittest.category('performance', include_in_all=False)
+class SparseProductPerformance(unittest.TestCase):
+    """
+    Compare the memory used by (and membership tests in) a Set of
+    tuples and a SparseSetProduct with 1% of a 4-dimensional product
+    of 40 element sets.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def _rss(self):
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    @unittest.skipIf(not os.path.exists('/proc/self/statm'),
+                     "Memory usage is not available")
+    def test_memory(self):
+        m = ConcreteModel()
+        m.A = RangeSet(40)
+        members = [idx for idx in itertools.product(m.A, m.A, m.A, m.A)
+                   if hash(idx) % 100 == 0]
+        for name in ('SparseSetProduct', 'Set'):
+            rss = self._rss()
+            if name == 'Set':
+                m.S = Set(initialize=members, dimen=4)
+            else:
+                m.S = SparseSetProduct(m.A, m.A, m.A, m.A,
+                                       initialize=members)
+            size = float(self._rss() - rss) / len(members)
+            start = time.time()
+            for idx in members:
+                idx in m.S
+            seconds = time.time() - start
+            self.recordTestData(name + ' bytes/member', size)
+            self.recordTestData(name + ' membership seconds', seconds)
+            print("%s: %.1f bytes/member, %.3f s for %d membership tests"
+                  % (name, size, seconds, len(members)))
+            m.del_component(m.S)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,8 +11,11 @@
 #
 
 from six import StringIO
+import gc
 import os
+import time
 import pyutilib.th as unittest
+import pyutilib.services
 from pyomo.environ import *
 
 
@@ -121,5 +124,179 @@ class Test(unittest.TestCase):
         self.assertEqual( id(smap.getObject('X')), id(self.instance.x) )
         self.assertEqual( id(smap.getObject('y')), id(SymbolMap.UnknownSymbol) )
 
+
+class TestIntegerSymbolMap(unittest.TestCase):
+
+    def setUp(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3])
+        model.o = Objective(expr=model.x[1])
+        model.c = Constraint(expr=model.x[2] >= 1)
+        self.instance = model
+
+    def tearDown(self):
+        self.instance = None
+
+    def test_numbered(self):
+        m = self.instance
+        smap = IntegerSymbolMap()
+        smap.addNumberedSymbols('v', [m.x[3], m.x[1]])
+        smap.addNumberedSymbols('c', [m.c])
+        smap.addNumberedSymbols('v', [m.x[2]])
+        self.assertEqual(list(smap.bySymbol), ['v0', 'v1', 'v2', 'c0'])
+        self.assertEqual(len(smap.bySymbol), 4)
+        self.assertIs(smap.bySymbol['v1'](), m.x[1])
+        self.assertIs(smap.getObject('v2'), m.x[2])
+        self.assertIs(smap.getObject('c0'), m.c)
+        self.assertEqual(smap.numberedObjects('v'), [m.x[3], m.x[1], m.x[2]])
+        self.assertEqual(smap.numberedObjects('x'), [])
+        for symbol in ('v3', 'v01', 'c', 'x0', '0'):
+            self.assertFalse(symbol in smap.bySymbol)
+            self.assertIs(smap.getObject(symbol), SymbolMap.UnknownSymbol)
+        self.assertRaises(KeyError, smap.bySymbol.__getitem__, 'v3')
+        self.assertEqual(smap.byObject[id(m.x[3])], 'v0')
+        self.assertEqual(smap.getSymbol(m.x[2]), 'v2')
+        self.assertFalse(id(m.o) in smap.byObject)
+        self.assertEqual(len(smap.byObject), 4)
+        # symbols added after the index is built are indexed, too
+        smap.addNumberedSymbols('o', [m.o])
+        self.assertEqual(smap.byObject[id(m.o)], 'o0')
+        self.assertEqual(dict(smap.byObject.items())[id(m.c)], 'c0')
+        self.assertRaises(ValueError, smap.addNumberedSymbols, 'x1', [])
+        self.assertRaises(ValueError, smap.addNumberedSymbols, '', [])
+
+    def test_symbols_and_aliases(self):
+        m = self.instance
+        smap = IntegerSymbolMap()
+        smap.addNumberedSymbols('v', [m.x[1]])
+        smap.addSymbol(m.x[2], 'x2')
+        self.assertEqual(smap.getSymbol(m.x[3], TextLabeler()), 'x(3)')
+        self.assertEqual(set(smap.bySymbol), set(['v0', 'x2', 'x(3)']))
+        self.assertEqual(smap.byObject[id(m.x[2])], 'x2')
+        self.assertIs(smap.getObject('x(3)'), m.x[3])
+        smap.alias(m.o, '__default_objective__')
+        self.assertIs(smap.getObject('__default_objective__'), m.o)
+        class FOO(object):
+            def __call__(self, *args):
+                return 'v0'
+        self.assertRaises(RuntimeError, smap.getSymbol, m.c, FOO())
+        self.assertRaises(RuntimeError, smap.getSymbol, m.c)
+
+    def test_has_numbered_symbols(self):
+        m = self.instance
+        smap = IntegerSymbolMap()
+        smap.addNumberedSymbols('v', [m.x[1], m.x[2]])
+        smap.addNumberedSymbols('c', [m.c])
+        smap.alias(m.o, 'obj')
+        self.assertTrue(smap.hasNumberedSymbols(
+            [('v', [m.x[1], m.x[2]]), ('c', [m.c])]))
+        self.assertFalse(smap.hasNumberedSymbols(
+            [('v', [m.x[2], m.x[1]]), ('c', [m.c])]))
+        self.assertFalse(smap.hasNumberedSymbols(
+            [('v', [m.x[1]]), ('c', [m.c])]))
+        self.assertFalse(smap.hasNumberedSymbols(
+            [('c', [m.c]), ('v', [m.x[1], m.x[2]])]))
+        self.assertFalse(smap.hasNumberedSymbols([('v', [m.x[1], m.x[2]])]))
+        smap.addSymbol(m.x[3], 'x3')
+        self.assertFalse(smap.hasNumberedSymbols(
+            [('v', [m.x[1], m.x[2]]), ('c', [m.c])]))
+
+    def test_weakrefs(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.y = Var()
+        smap = IntegerSymbolMap()
+        smap.addNumberedSymbols('v', [m.x[1], m.x[2]])
+        smap.addSymbol(m.y, 'y')
+        self.assertEqual(len(smap.byObject), 3)
+        m.del_component(m.x)
+        m.del_component(m.y)
+        gc.collect()
+        # the map does not keep the objects alive
+        self.assertEqual(smap.numberedObjects('v'), [None, None])
+        self.assertIs(smap.getObject('v1'), SymbolMap.UnknownSymbol)
+        self.assertIs(smap.getObject('y'), SymbolMap.UnknownSymbol)
+        self.assertIs(smap.bySymbol['v0'](), None)
+        smap._index = None
+        self.assertEqual(len(smap.byObject), 0)
+
+    def test_nl_writer(self):
+        m = self.instance
+        m.x[1].value = 1
+        pyutilib.services.TempfileManager.push()
+        try:
+            fname = pyutilib.services.TempfileManager.\
+                    create_tempfile(suffix='.nl')
+            fname, smap_id = m.write(fname)
+            smap = m.solutions.symbol_map[smap_id]
+            self.assertIsInstance(smap, IntegerSymbolMap)
+            self.assertEqual(set(smap.bySymbol), set(['v0', 'v1', 'c0', 'o0']))
+            self.assertIs(smap.getObject('__default_objective__'), m.o)
+            # each pending write has its own symbol map
+            fname, smap_id2 = m.write(fname)
+            self.assertNotEqual(smap_id, smap_id2)
+            self.assertEqual(len(m.solutions.symbol_map), 2)
+            m.solutions.delete_symbol_map(smap_id)
+            self.assertIn(smap_id2, m.solutions.symbol_map)
+            m.solutions.delete_symbol_map(smap_id2)
+            # the symbol map is reused when the symbols do not change
+            # (and the last map is no longer registered)
+            fname, smap_id3 = m.write(fname)
+            self.assertEqual(smap_id2, smap_id3)
+            smap_id = smap_id3
+            m.solutions.delete_symbol_map(smap_id)
+            # ... but not after a model change, even with the same symbols
+            m.p = Param(initialize=1)
+            fname, smap_id2 = m.write(fname)
+            self.assertNotEqual(smap_id, smap_id2)
+            # fixing a variable changes the symbols
+            m.x[2].fix(1)
+            fname, smap_id3 = m.write(fname)
+            self.assertNotEqual(smap_id2, smap_id3)
+            self.assertEqual(set(m.solutions.symbol_map[smap_id3].bySymbol),
+                             set(['v0', 'c0', 'o0']))
+        finally:
+            pyutilib.services.TempfileManager.pop(remove=True)
+
+
+@unittest.category('performance', include_in_all=False)
+class TestSymbolMapPerformance(unittest.TestCase):
+    """
+    Compare the time to build (and the memory used by) a SymbolMap and
+    an IntegerSymbolMap with one million numbered symbols.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def _rss(self):
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    @unittest.skipIf(not os.path.exists('/proc/self/statm'),
+                     "Memory usage is not available")
+    def test_numbered_symbols(self):
+        n = 1000000
+        m = ConcreteModel()
+        m.x = Var(RangeSet(n))
+        objs = list(m.x.values())
+        for cls in (SymbolMap, IntegerSymbolMap):
+            gc.collect()
+            rss = self._rss()
+            start = time.time()
+            smap = cls()
+            if cls is SymbolMap:
+                smap.addSymbols([(obj, "v%d" % i)
+                                 for i, obj in enumerate(objs)])
+            else:
+                smap.addNumberedSymbols('v', objs)
+            seconds = time.time() - start
+            size = float(self._rss() - rss) / n
+            label = cls.__name__
+            self.recordTestData(label + ' seconds', seconds)
+            self.recordTestData(label + ' bytes/symbol', size)
+            print("%s: %.2f s, %.1f bytes/symbol" % (label, seconds, size))
+            smap = None
+
+
 if __name__ == "__main__":
     unittest.main()
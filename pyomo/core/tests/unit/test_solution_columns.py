@@ -0,0 +1,201 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for loading columnar solutions (SymbolColumns) into a model
+#
+
+import os
+import time
+import pickle
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+
+from pyomo.opt import (SolverResults,
+                       SolverStatus,
+                       SolutionStatus,
+                       SymbolColumns,
+                       NumberedSymbols)
+from pyomo.environ import *
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(0, 10))
+    m.y = Var()
+    m.y.fix(7)
+    m.z = Var(initialize=5)
+    m.o = Objective(expr=summation(m.x) + m.y + m.z)
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    m.d = Constraint(expr=m.x[2] + m.x[3] <= 4)
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.rc = Suffix(direction=Suffix.IMPORT)
+    return m
+
+def _results(m, fname, smap_id, compact):
+    """
+    Create the results for a problem file: the variable with symbol
+    number i has the value i+0.5 and the reduced cost -i, the
+    constraint with symbol number i has the dual i.  The variable z is
+    not in the solution.
+    """
+    smap = m.solutions.symbol_map[smap_id]
+    results = SolverResults()
+    results.solver.status = SolverStatus.ok
+    soln = results.solution.add()
+    soln.status = SolutionStatus.optimal
+    z = getattr(m, 'z', None)
+    for symbol in sorted(smap.bySymbol):
+        obj = smap.bySymbol[symbol]()
+        i = int(''.join(ch for ch in symbol if ch.isdigit()) or 0)
+        ctype = obj.parent_component().type()
+        if ctype is Var:
+            if obj is not z:
+                soln.variable[symbol] = {'Value': i + 0.5, 'Rc': -i}
+        elif ctype is Constraint:
+            soln.constraint[symbol] = {'Dual': float(i)}
+    if compact:
+        soln.compact()
+    results._smap_id = smap_id
+    return results
+
+class TestSolutionColumns(unittest.TestCase):
+
+    def tearDown(self):
+        for ext in ('.lp', '.nl'):
+            if os.path.exists(currdir+'solution_columns'+ext):
+                os.remove(currdir+'solution_columns'+ext)
+
+    def _load(self, m, ext, compact, **kwds):
+        fname, smap_id = m.write(currdir+'solution_columns'+ext)
+        results = _results(m, fname, smap_id, compact)
+        m.solutions.load_from(results, **kwds)
+        return results
+
+    def _values(self, m):
+        return (dict((v.cname(True), (v.value, v.stale))
+                     for v in m.component_data_objects(Var)),
+                dict((k.cname(True), v) for k, v in m.dual.items()),
+                dict((k.cname(True), v) for k, v in m.rc.items()))
+
+    def _compare(self, ext, **kwds):
+        m = _model()
+        self._load(m, ext, False, **kwds)
+        n = _model()
+        self._load(n, ext, True, **kwds)
+        self.assertEqual(self._values(n), self._values(m))
+        self.assertEqual(n.y.value, 7)
+        self.assertNotIn(n.y, n.rc)
+        self.assertEqual(len(n.dual), 2)
+        return n
+
+    def test_load_lp(self):
+        n = self._compare('.lp')
+        self.assertEqual(n.x[1].value, self._values(n)[0]['x[1]'][0])
+        self.assertEqual(n.z.value, 5)
+        self.assertTrue(n.z.stale)
+
+    def test_load_nl(self):
+        n = self._compare('.nl')
+        # the variables in an NL file have numbered symbols
+        m = _model()
+        fname, smap_id = m.write(currdir+'solution_columns.nl')
+        results = _results(m, fname, smap_id, False)
+        smap = m.solutions.symbol_map[smap_id]
+        soln = results.solution(0)
+        nan = float('nan')
+        values = []
+        while 'v%d' % len(values) in smap.bySymbol:
+            entry = soln.variable.get('v%d' % len(values), {})
+            values.append(entry.get('Value', nan))
+        soln.variable = SymbolColumns(NumberedSymbols('v', len(values)),
+                                      {'Value': values})
+        m.solutions.load_from(results)
+        self.assertEqual(self._values(m)[0], self._values(n)[0])
+
+    def test_default_variable_value(self):
+        n = self._compare('.lp', default_variable_value=-1)
+        self.assertEqual(n.z.value, -1)
+        self.assertFalse(n.z.stale)
+        self.assertNotEqual(n.x[1].value, -1)
+
+    def test_store_to(self):
+        m = _model()
+        self._load(m, '.lp', False)
+        n = _model()
+        self._load(n, '.lp', True)
+        expected = SolverResults()
+        m.solutions.store_to(expected)
+        results = SolverResults()
+        n.solutions.store_to(results)
+        self.assertEqual(str(results), str(expected))
+
+    def test_getstate(self):
+        # the columns are stored as entries when a model is pickled
+        m = _model()
+        self._load(m, '.lp', False)
+        n = _model()
+        self._load(n, '.lp', True)
+        self.assertEqual(len(n.solutions[0]._columns), 2)
+        state = n.solutions.__getstate__()
+        self.assertEqual(len(n.solutions[0]._columns), 0)
+        self.assertEqual(state['solutions'][0]['entry'],
+                         m.solutions.__getstate__()['solutions'][0]['entry'])
+
+    def test_missing_symbol(self):
+        m = _model()
+        fname, smap_id = m.write(currdir+'solution_columns.lp')
+        results = _results(m, fname, smap_id, False)
+        soln = results.solution(0)
+        soln.variable['x100'] = {'Value': 1}
+        soln.compact()
+        m.solutions.load_from(results, delete_symbol_map=False)
+        objs = m.solutions[0]._columns['variable'][0]
+        self.assertEqual(sum(1 for obj in objs if obj is None), 1)
+        self.assertRaises(RuntimeError, m.solutions.add_solution,
+                          results.solution(0), smap_id,
+                          ignore_missing_symbols=False)
+
+@unittest.category('performance', include_in_all=False)
+class TestSolutionColumnsPerformance(unittest.TestCase):
+    """
+    Compare the size of pickled results and the time to load them into
+    a model with 100000 variables, with and without columnar solutions.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def tearDown(self):
+        if os.path.exists(currdir+'solution_columns.lp'):
+            os.remove(currdir+'solution_columns.lp')
+
+    def test_load(self):
+        N = 100000
+        m = ConcreteModel()
+        m.I = RangeSet(N)
+        m.x = Var(m.I, bounds=(0, N))
+        m.o = Objective(expr=summation(m.x))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= i)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        for compact in (False, True):
+            fname, smap_id = m.write(currdir+'solution_columns.lp')
+            results = _results(m, fname, smap_id, compact)
+            start = time.time()
+            data = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+            results = pickle.loads(data)
+            results._smap_id = smap_id
+            m.solutions.load_from(results)
+            seconds = time.time() - start
+            label = 'columns' if compact else 'dicts'
+            self.recordTestData(label + ' pickle bytes', len(data))
+            self.recordTestData(label + ' seconds', seconds)
+            print("%s: %d bytes, %.2f s" % (label, len(data), seconds))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,12 +11,15 @@
 #
 
 import os
+import time
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
 import pyutilib.th as unittest
 
 from pyomo.environ import *
+from pyomo.core.base import expr_common, expr as EXPR
+from pyomo.repn import generate_canonical_repn
 
 def obj_rule(model):
     return sum(model.x[a] + model.y[a] for a in model.A)
@@ -146,5 +149,163 @@ class Test(unittest.TestCase):
         self.assertEqual(list(sequence(1,10,3)), [1,4,7,10])
 
 
+class TestQuicksum(unittest.TestCase):
+
+    def tearDown(self):
+        EXPR.set_expression_tree_format(expr_common._default_mode)
+
+    def _model(self):
+        model = ConcreteModel()
+        model.A = RangeSet(1, 5)
+        model.c = Param(model.A, initialize=lambda m, i: 2*i)
+        model.p = Param(model.A, initialize=lambda m, i: i, mutable=True)
+        model.x = Var(model.A, initialize=1)
+        model.y = Var(model.A, initialize=2)
+        return model
+
+    def test_linear_sum(self):
+        model = self._model()
+        e = quicksum(model.c[i]*model.x[i] for i in model.A)
+        self.assertIs(type(e), EXPR._SumExpression)
+        self.assertEqual(e._args, [model.x[i] for i in model.A])
+        self.assertEqual(e._coef, [2, 4, 6, 8, 10])
+        self.assertEqual(e._const, 0)
+        self.assertEqual(str(e), str(sum(model.c[i]*model.x[i]
+                                         for i in model.A)))
+
+        e = quicksum([model.x[1], 3, model.x[2] + model.y[2], 4*model.y[1]])
+        self.assertEqual(e._args, [model.x[1], model.x[2], model.y[2],
+                                   model.y[1]])
+        self.assertEqual(e._coef, [1, 1, 1, 4])
+        self.assertEqual(e._const, 3)
+        self.assertEqual(value(e), 1 + 3 + 1 + 2 + 8)
+
+    def test_degenerate(self):
+        model = self._model()
+        self.assertEqual(quicksum([]), 0)
+        self.assertEqual(quicksum([1, 2.5]), 3.5)
+        self.assertIs(quicksum([model.x[1]]), model.x[1])
+        self.assertRaises(TypeError, quicksum, [model.x])
+
+    def test_nonlinear_terms(self):
+        model = self._model()
+        e = quicksum(model.x[i]*model.y[i] + model.p[i]*model.x[i]
+                     for i in model.A)
+        self.assertEqual(value(e), sum(value(model.x[i]*model.y[i] +
+                                             model.p[i]*model.x[i])
+                                       for i in model.A))
+        self.assertEqual(e.polynomial_degree(), 2)
+        # shared subexpressions are cloned, as they are by sum()
+        f = model.x[1]*model.y[1]
+        e = quicksum([model.x[2], f, f, 2])
+        self.assertEqual(len(e._args), 3)
+        self.assertIsNot(e._args[1], e._args[2])
+        self.assertEqual(value(e), 1 + 2 + 2 + 2)
+        self.assertEqual(str(f), "x[1] * y[1]")
+
+    def test_no_clones(self):
+        model = self._model()
+        count = EXPR.generate_expression.clone_counter
+        quicksum(model.x[i]*model.y[i] for i in model.A)
+        quicksum(model.c[i]*model.x[i] for i in model.A)
+        self.assertEqual(EXPR.generate_expression.clone_counter, count)
+
+    def test_linear_pairs(self):
+        model = self._model()
+        e = quicksum([model.x[1]*model.y[1], 1],
+                     linear=[(2, model.x[2]), (3.5, model.y[2])])
+        # the pairs follow the terms
+        self.assertEqual(e._args[1:], [model.x[2], model.y[2]])
+        self.assertEqual(e._coef, [1, 2, 3.5])
+        self.assertEqual(e._const, 1)
+        self.assertEqual(value(e), 2 + 1 + 2 + 7)
+
+    def test_term_order(self):
+        # the terms keep their order, as they do with sum()
+        model = self._model()
+        terms = lambda: [model.x[1], model.x[2]*model.y[2], 3*model.y[1],
+                         model.p[3], model.x[4]]
+        self.assertEqual(str(quicksum(terms())), str(sum(terms())))
+        # linear and nonlinear terms of summation() are interleaved
+        w = {1: 2, 2: model.y[2], 3: 4}
+        e = summation(w, model.x, index=[1, 2, 3])
+        self.assertEqual(str(e), str(sum(w[i]*model.x[i] for i in w)))
+        self.assertIs(e._args[0], model.x[1])
+        self.assertIs(e._args[2], model.x[3])
+
+    def test_summation(self):
+        model = self._model()
+        e = summation(model.c, model.x)
+        self.assertIs(type(e), EXPR._SumExpression)
+        self.assertEqual(e._args, [model.x[i] for i in model.A])
+        self.assertEqual(e._coef, [2, 4, 6, 8, 10])
+        e = summation(model.c, model.x, model.y)
+        self.assertEqual(e.polynomial_degree(), 2)
+        self.assertEqual(value(e), 2*(2+4+6+8+10))
+        self.assertEqual(summation(model.c, denom=model.c, index=[1,2]), 2)
+        # terms with a zero coefficient are dropped
+        model.z = Param(model.A, initialize=lambda m, i: i % 2)
+        e = summation(model.z, model.x)
+        self.assertEqual(e._args, [model.x[1], model.x[3], model.x[5]])
+
+    def test_pyomo4_trees(self):
+        EXPR.set_expression_tree_format(expr_common.Mode.pyomo4_trees)
+        model = self._model()
+        e = quicksum(model.c[i]*model.x[i] for i in model.A)
+        self.assertIs(type(e), EXPR._LinearExpression)
+        self.assertEqual(e._args, [model.x[i] for i in model.A])
+        self.assertEqual([e._coef[id(v)] for v in e._args], [2, 4, 6, 8, 10])
+        e = quicksum([model.x[1], 2*model.x[1], model.p[2]*model.x[2], 5,
+                      model.x[1]*model.y[1]])
+        self.assertEqual(value(e), 1 + 2 + 2 + 5 + 2)
+        e = quicksum([1, model.x[1]*model.y[1]])
+        self.assertEqual(value(e), 3)
+        # the canonical repn reads the linear expression directly
+        model.x[3].fix(4)
+        e = quicksum([model.p[1]*model.x[1], model.x[2], model.x[3], 1])
+        repn = generate_canonical_repn(e)
+        self.assertEqual(repn.variables, (model.x[1], model.x[2]))
+        self.assertEqual(repn.linear, (1, 1))
+        self.assertEqual(repn.constant, 5)
+
+
+@unittest.category('performance', include_in_all=False)
+class TestQuicksumPerformance(unittest.TestCase):
+    """
+    Compare the time to build (and generate the canonical repn of) a
+    large linear sum with sum() and quicksum().
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def _benchmark(self, nterms):
+        from pyomo.repn import generate_canonical_repn
+        model = ConcreteModel()
+        model.A = RangeSet(nterms)
+        model.c = Param(model.A, initialize=lambda m, i: i % 7 + 1)
+        model.x = Var(model.A)
+        for label, builder in (
+                ('sum', lambda: sum(model.c[i]*model.x[i] for i in model.A)),
+                ('quicksum', lambda: quicksum(model.c[i]*model.x[i]
+                                              for i in model.A)),
+                ('summation', lambda: summation(model.c, model.x))):
+            start = time.time()
+            e = builder()
+            build_time = time.time() - start
+            start = time.time()
+            generate_canonical_repn(e)
+            repn_time = time.time() - start
+            self.recordTestData('%s build seconds' % (label), build_time)
+            self.recordTestData('%s repn seconds' % (label), repn_time)
+            print("%d terms, %s: %.2f s to build, %.2f s for the "
+                  "canonical repn" % (nterms, label, build_time, repn_time))
+
+    def test_100k_terms(self):
+        self._benchmark(100000)
+
+    def test_1M_terms(self):
+        self._benchmark(1000000)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,10 @@
 # TestArrayVar                Class for testing array of variables
 #
 
+import gc
 import os
+import pickle
+import time
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
@@ -22,6 +25,12 @@ import pyutilib.th as unittest
 from pyomo.core.base import IntegerSet
 from pyomo.environ import *
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 class PyomoModel(unittest.TestCase):
 
     def setUp(self):
@@ -1279,5 +1288,308 @@ class MiscVarTests(unittest.TestCase):
         self.assertTrue( newIdx in model.x )
 
 
+class TestCompactVar(unittest.TestCase):
+
+    def test_values(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3,4], compact=True, initialize={1:1.5, 2:2, 3:None})
+        self.assertEqual(m.x[1].value, 1.5)
+        self.assertIs(type(m.x[2].value), int)
+        self.assertIs(m.x[3].value, None)
+        self.assertTrue(m.x[4].stale)
+        self.assertFalse(m.x[1].stale)
+        m.x[4] = 10**20
+        self.assertEqual(m.x[4].value, 10**20)
+        m.x[4].value = 'a'
+        self.assertEqual(m.x[4].value, 'a')
+        m.x[4].value = 0.25
+        self.assertEqual(m.x[4].value, 0.25)
+        m.x[1].stale = True
+        self.assertTrue(m.x[1].stale)
+        self.assertFalse(m.x[1].fixed)
+        m.x[1].fix(3)
+        self.assertTrue(m.x[1].fixed)
+        self.assertEqual(m.x[1].value, 3)
+        m.x[1].unfix()
+        self.assertFalse(m.x[1].fixed)
+        self.assertTrue(m.x[1].stale)
+
+    def test_bulk_initialization(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        m.x = Var(m.I, compact=True, initialize=2, bounds=(0, 4.5))
+        for v in m.x.values():
+            self.assertEqual(v.value, 2)
+            self.assertFalse(v.stale)
+            self.assertEqual(v.lb, 0)
+            self.assertEqual(v.ub, 4.5)
+        try:
+            m.y = Var(m.I, compact=True, within=NonNegativeReals,
+                      initialize=-1)
+            self.fail("expected ValueError")
+        except ValueError:
+            pass
+
+    def test_bounds_and_domains(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=5)
+        m.x = Var([1,2,3], compact=True, bounds=(None, m.p),
+                  within=NonNegativeReals)
+        self.assertEqual(m.x[1].lb, 0)
+        self.assertEqual(m.x[1].ub, 5)
+        m.p = 7
+        self.assertEqual(m.x[2].ub, 7)
+        m.x[2].setlb(-3)
+        self.assertEqual(m.x[2].lb, 0)
+        m.x[2].domain = Reals
+        self.assertEqual(m.x[2].lb, -3)
+        self.assertIs(m.x[1].domain, NonNegativeReals)
+        m.x[3].domain = Binary
+        self.assertEqual(m.x[3].ub, 1)
+        self.assertTrue(m.x[3].is_binary())
+        self.assertRaises(ValueError, setattr, m.x[3], 'domain', 1)
+        self.assertRaises(ValueError, m.x[1].setub, m.x[2])
+        m.x[3].domain = NonNegativeReals
+        self.assertEqual(list(m.x._store.domains.values()), [Reals])
+
+        m.y = Var([1,2], compact=True, within=lambda m, i: Binary \
+                      if i == 1 else Integers)
+        self.assertIs(m.y[1].domain, Binary)
+        self.assertIs(m.y[2].domain, Integers)
+
+    def test_sparse_and_varlist(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], compact=True, dense=False, initialize=4)
+        self.assertEqual(len(m.x), 0)
+        self.assertEqual(m.x[2].value, 4)
+        m.x[3] = 5
+        self.assertEqual(sorted(m.x.get_values().items()), [(2, 4), (3, 5)])
+        m.y = VarList(compact=True, bounds=(1, 2))
+        m.y.add()
+        m.y.add()
+        self.assertEqual(len(m.y), 2)
+        self.assertEqual(m.y[2].ub, 2)
+        self.assertEqual(len(m.y._store), 2)
+
+    def test_delete(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], compact=True, dense=False)
+        m.p = Param(initialize=0, mutable=True)
+        m.x[1] = 1
+        m.x[2].setlb(m.p)
+        m.x[2].domain = Integers
+        m.x[2].fix(2)
+        x2 = m.x[2]
+        del m.x[2]
+        self.assertEqual(sorted(m.x.keys()), [1])
+        self.assertIs(x2.parent_component(), None)
+        self.assertEqual(m.x._store.objects, {})
+        self.assertEqual(m.x._store.domains, {})
+        # the position is reused by the next variable
+        self.assertIs(m.x[3].value, None)
+        self.assertIs(m.x[3].lb, None)
+        self.assertIs(m.x[3].domain, Reals)
+        self.assertFalse(m.x[3].fixed)
+        self.assertTrue(m.x[3].stale)
+        self.assertEqual(len(m.x._store), 2)
+        self.assertEqual(m.x[1].value, 1)
+        self.assertRaises(KeyError, m.x.__delitem__, 2)
+        # the deleted data is no longer available
+        self.assertRaises(RuntimeError, getattr, x2, 'value')
+        self.assertRaises(RuntimeError, setattr, x2, 'value', 7)
+        self.assertRaises(RuntimeError, x2.cname)
+        self.assertRaises(RuntimeError, str, m.x[1] + x2)
+        # ... and variables are only deleted from compact Vars
+        m.y = Var([1,2])
+        self.assertRaises(TypeError, m.y.__delitem__, 1)
+        self.assertEqual(len(m.y), 2)
+
+    def test_clear(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], compact=True, initialize=1)
+        x2 = m.x[2]
+        m.x.clear()
+        self.assertEqual(len(m.x), 0)
+        self.assertEqual(len(m.x._store), 0)
+        m.x._constructed = False
+        m.x.construct()
+        self.assertEqual(m.x[2].value, 1)
+        self.assertIsNot(m.x[2], x2)
+        self.assertRaises(RuntimeError, setattr, x2, 'value', 7)
+        self.assertEqual(m.x[2].value, 1)
+
+    def test_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], compact=True, initialize={1:1, 2:2.5},
+                  bounds=(0, 3))
+        m.x[2].fix()
+        m.o = Objective(expr=m.x[1] + m.x[2])
+        for n in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(n.x._store, m.x._store)
+            self.assertEqual(n.x[1].value, 1)
+            self.assertEqual(n.x[2].value, 2.5)
+            self.assertTrue(n.x[2].fixed)
+            self.assertEqual(n.x[1].ub, 3)
+            self.assertEqual(value(n.o), 3.5)
+            n.x[1].value = 0
+            self.assertEqual(m.x[1].value, 1)
+
+    def test_get_set_array(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3,4], compact=True, initialize={1:1, 2:2},
+                  bounds=(0, 3), within=Integers)
+        self.assertEqual(m.x.index_order(), (1,2,3,4))
+        self.assertEqual(list(m.x.get_array('lb')), [0]*4)
+        m.x.set_array([1, 2, float('nan'), 4])
+        self.assertEqual([type(v.value) for v in m.x.values()],
+                         [int, int, type(None), int])
+
+    def test_simple_var_not_compact(self):
+        m = ConcreteModel()
+        m.x = Var(compact=True, initialize=1)
+        self.assertIs(m.x._store, None)
+        self.assertEqual(m.x.value, 1)
+
+
+class TestVarArrays(unittest.TestCase):
+
+    def _test_get_set(self, compact):
+        m = ConcreteModel()
+        m.I = Set(initialize=[4,2,3,1], ordered=True)
+        m.x = Var(m.I, compact=compact, bounds=(0, None),
+                  within=Integers, initialize={4:4, 2:2, 3:3})
+        self.assertEqual(m.x.index_order(), (4,2,3,1))
+        self.assertIs(m.x.index_order(), m.x.index_order())
+        nan = float('nan')
+        inf = float('inf')
+
+        self.assertEqual(list(m.x.get_array())[:3], [4, 2, 3])
+        self.assertNotEqual(m.x.get_array()[3], m.x.get_array()[3])
+        self.assertEqual(list(m.x.get_array('lb')), [0]*4)
+        self.assertEqual(list(m.x.get_array('ub')), [inf]*4)
+        self.assertEqual(list(m.x.get_array('fixed')), [False]*4)
+        self.assertRaises(ValueError, m.x.get_array, 'domain')
+
+        m.x[1].stale = True
+        m.x.set_array([1.0, 2, nan, 5])
+        self.assertEqual([m.x[i].value for i in m.I], [1, 2, None, 5])
+        self.assertIs(type(m.x[4].value), int)
+        self.assertFalse(m.x[1].stale)
+        self.assertRaises(ValueError, m.x.set_array, [0.5]*4)
+        self.assertRaises(ValueError, m.x.set_array, [1]*3)
+        m.x.set_array([0.5]*4, valid=True)
+        self.assertEqual(m.x[2].value, 0.5)
+
+        m.x.set_array([-1, -inf, 2.5, -2], 'lb')
+        m.x.set_array(iter([3, inf, 6, 7]), 'ub')
+        self.assertEqual(m.x[4].bounds, (-1, 3))
+        self.assertEqual(m.x[2].bounds, (None, None))
+        self.assertEqual(list(m.x.get_array('lb')), [-1, -inf, 2.5, -2])
+        m.x[4].domain = NonNegativeReals
+        m.x[2].domain = NonPositiveReals
+        self.assertEqual(list(m.x.get_array('lb')), [0, -inf, 2.5, -2])
+        self.assertEqual(list(m.x.get_array('ub')), [3, 0, 6, 7])
+
+        m.x.set_array([True, False, 1, 0], 'fixed')
+        self.assertEqual([m.x[i].fixed for i in m.I],
+                         [True, False, True, False])
+        self.assertEqual(list(m.x.get_array('fixed')),
+                         [True, False, True, False])
+
+        # the index order is regenerated when indices are added
+        m.y = Var(m.I, compact=compact, dense=False)
+        self.assertEqual(m.y.index_order(), ())
+        m.y[3] = 1
+        m.y[1] = 2
+        self.assertEqual(m.y.index_order(), (3,1))
+        self.assertEqual(list(m.y.get_array()), [1, 2])
+        m.y.set_array([5, 6])
+        self.assertEqual(m.y[1].value, 6)
+
+        m.z = Var(initialize=2)
+        self.assertEqual(m.z.index_order(), (None,))
+        m.z.set_array([3])
+        self.assertEqual(list(m.z.get_array()), [3])
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_get_set_numpy(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        for compact in (False, True):
+            m.del_component('x')
+            m.x = Var(m.I, compact=compact, initialize=1)
+            self.assertIsInstance(m.x.get_array(), numpy.ndarray)
+            m.x.set_array(numpy.arange(5.0))
+            self.assertEqual(m.x[5].value, 4)
+            self.assertIs(type(m.x[5].value), float)
+            m.x.set_array(numpy.array([True]*5), 'fixed')
+            self.assertTrue(m.x[3].fixed)
+            self.assertEqual(m.x.get_array('fixed').dtype, bool)
+
+    def test_get_set(self):
+        self._test_get_set(False)
+
+    def test_get_set_compact(self):
+        self._test_get_set(True)
+
+
+@unittest.category('performance', include_in_all=False)
+class TestVarPerformance(unittest.TestCase):
+    """
+    Compare the memory used by (and the construction time of) a Var
+    with one million indices with and without compact storage.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def _rss(self):
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    @unittest.skipIf(not os.path.exists('/proc/self/statm'),
+                     "Memory usage is not available")
+    def test_memory(self):
+        n = 1000000
+        for compact in (False, True):
+            m = ConcreteModel()
+            m.I = RangeSet(n)
+            gc.collect()
+            rss = self._rss()
+            start = time.time()
+            m.x = Var(m.I, compact=compact,
+                      bounds=lambda m, i: (-0.5*i, 0.5*i),
+                      initialize=lambda m, i: 0.25*i)
+            seconds = time.time() - start
+            gc.collect()
+            size = float(self._rss() - rss) / n
+            label = 'compact' if compact else 'default'
+            self.recordTestData(label + ' bytes/var', size)
+            self.recordTestData(label + ' seconds', seconds)
+            print("%s: %.1f bytes/var, %.2f s" % (label, size, seconds))
+            m = None
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_set_values(self):
+        n = 1000000
+        for compact in (False, True):
+            m = ConcreteModel()
+            m.I = RangeSet(n)
+            m.x = Var(m.I, compact=compact)
+            values = numpy.arange(n, dtype=float)
+            label = 'compact' if compact else 'default'
+            start = time.time()
+            m.x.set_values(dict(zip(m.x.index_order(), values.tolist())))
+            m.x.get_values()
+            dict_time = time.time() - start
+            start = time.time()
+            m.x.set_array(values)
+            m.x.get_array()
+            array_time = time.time() - start
+            self.recordTestData(label + ' dict seconds', dict_time)
+            self.recordTestData(label + ' array seconds', array_time)
+            print("%s: set+get %.2f s with dicts, %.2f s with arrays"
+                  % (label, dict_time, array_time))
+
+
 if __name__ == "__main__":
     unittest.main()
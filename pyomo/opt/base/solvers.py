@@ -347,6 +347,7 @@ class OptSolver(Plugin):
         # These are ephimeral options that can be set by the user during
         # the call to solve, but will be reset to defaults if not given
         self._load_solutions = True
+        self._fast_load = False
         self._select_index = 0
         self._report_timing = False
         self._suffixes = []
@@ -550,6 +551,11 @@ class OptSolver(Plugin):
             initial_time = time.time()
 
             self._presolve(*args, **kwds)
+            # values are only loaded directly into a model (and
+            # cannot be stored as a solution that is not selected)
+            if (_model is None) or (not self._load_solutions) or \
+               (self._select_index != 0):
+                self._fast_load = False
 
             presolve_completion_time = time.time()
 
@@ -620,6 +626,7 @@ class OptSolver(Plugin):
         self._soln_file               = kwds.pop("solnfile", None)
         self._select_index            = kwds.pop("select", 0)
         self._load_solutions          = kwds.pop("load_solutions", True)
+        self._fast_load               = kwds.pop("fast_load", False)
         self._timelimit               = kwds.pop("timelimit", None)
         self._report_timing           = kwds.pop("report_timing", False)
         self._tee                     = kwds.pop("tee", False)
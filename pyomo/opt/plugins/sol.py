@@ -23,7 +23,25 @@ from pyomo.opt import (SolverResults,
                        SolverStatus,
                        TerminationCondition)
 
-from six.moves import xrange
+from six.moves import xrange, cStringIO
+
+def _parse_values(block, count):
+    """
+    Parse a block of lines with one number per line.
+    """
+    nlines = block.count('\n')
+    if len(block) and block[-1] != '\n':
+        nlines += 1
+    if nlines != count:
+        raise ValueError("expected %d lines of values, but found %d"
+                         % (count, nlines))
+    # this is faster than numpy.fromstring(), which also silently
+    # ignores text that follows a number
+    values = list(map(float, block.split()))
+    if len(values) != count:
+        raise ValueError("expected %d values, but found %d"
+                         % (count, len(values)))
+    return values
 
 class ResultsReader_sol(results.AbstractResultsReader):
     """
@@ -38,13 +56,21 @@ class ResultsReader_sol(results.AbstractResultsReader):
         if not name is None:
             self.name = name
 
-    def __call__(self, filename, res=None, soln=None, suffixes=[]):
+    def __call__(self, filename, res=None, soln=None, suffixes=[],
+                 values_only=False):
         """
         Parse a *.sol file
+
+        If values_only is True, the variable values, the constraint
+        duals and the suffixes are not added to the solution.  They
+        are stored in the _sol_values attribute of the results as
+        lists in the order of the numbered symbols ('v0', 'v1', ...,
+        'c0', ...), and are loaded directly into a model by
+        ModelSolutions.load_from().
         """
         try:
             with open(filename,"r") as f:
-                return self._load(f, res, soln, suffixes)
+                return self._load(f, res, soln, suffixes, values_only)
         except ValueError as e:
             with open(filename,"r") as f:
                 fdata = f.read()
@@ -53,7 +79,7 @@ class ResultsReader_sol(results.AbstractResultsReader):
                 "SOL File Output:\n%s"
                 % (filename, str(e), fdata))
 
-    def _load(self, fin, res, soln, suffixes):
+    def _load(self, fin, res, soln, suffixes, values_only=False):
 
         if res is None:
             res = SolverResults()
@@ -86,18 +112,19 @@ class ResultsReader_sol(results.AbstractResultsReader):
             raise ValueError("no Options line found")
         n = z[nopts + 3] # variables
         m = z[nopts + 1] # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
+        #
+        # The constraint duals and the variable values are parsed in
+        # bulk. They are followed by the objno line and the suffixes,
+        # which are read from the remainder of the file.
+        #
+        data = fin.read()
+        end = ('\n'+data).find('\nobjno')
+        if end < 0:
+            end = len(data)
+        values = _parse_values(data[:end], m + n)
+        y = values[:m]
+        x = values[m:]
+        fin = cStringIO(data[end:])
         objno = [0,0]
         line = fin.readline()
         if line:                    # WEH - when is this true?
@@ -167,14 +194,17 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
             soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
             soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
-                for i in xrange(0,len(y)):
-                    soln_constraint["c"+str(i)] = {"Dual" : y[i]}
+            if values_only:
+                res._sol_values = pyutilib.misc.Bunch(x=x, y=y, suffixes=[])
+            else:
+                i = 0
+                for var_value in x:
+                    soln_variable["v"+str(i)] = {"Value" : var_value}
+                    i = i + 1
+                if any(re.match(suf,"dual") for suf in suffixes):
+                    for i in xrange(0,len(y)):
+                        soln_constraint["c"+str(i)] = {"Dual" : y[i]}
 
             ### Read suffixes ###
             line = fin.readline()
@@ -209,7 +239,18 @@ class ResultsReader_sol(results.AbstractResultsReader):
                     # this information can be obtained from the solver documentation
                     for n in xrange(tabline):
                         fin.readline()
-                    if kind == 0: # Var
+                    if values_only:
+                        # (name, kind, symbol numbers, values)
+                        indices = []
+                        suffix_values = []
+                        for cnt in xrange(nvalues):
+                            suf_line = fin.readline().split()
+                            indices.append(int(suf_line[0]))
+                            suffix_values.append(
+                                convert_function(suf_line[1]))
+                        res._sol_values.suffixes.append(
+                            (suffix_name, kind, indices, suffix_values))
+                    elif kind == 0: # Var
                         for cnt in xrange(nvalues):
                             suf_line = fin.readline().split()
                             soln_variable["v"+suf_line[0]][suffix_name] = \
@@ -12,5 +12,8 @@ from pyomo.opt.results.container import *
 import pyomo.opt.results.problem
 from pyomo.opt.results.solver import SolverStatus, TerminationCondition
 from pyomo.opt.results.problem import ProblemSense
-from pyomo.opt.results.solution import SolutionStatus, Solution
+from pyomo.opt.results.solution import (SolutionStatus,
+                                         Solution,
+                                         SymbolColumns,
+                                         NumberedSymbols)
 from pyomo.opt.results.results_ import SolverResults
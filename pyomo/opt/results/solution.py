@@ -7,13 +7,18 @@
 #  This software is distributed under the BSD License.
 #  _________________________________________________________________________
 
-__all__ = ['SolutionStatus', 'Solution']
+__all__ = ['SolutionStatus', 'Solution', 'SymbolColumns', 'NumberedSymbols']
 
 import math
+from array import array
 try:
     from collections import OrderedDict
 except:
     from ordereddict import OrderedDict
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
 from six import iterkeys, advance_iterator, itervalues, iteritems
 from six.moves import xrange
 from pyutilib.misc import Bunch
@@ -21,6 +26,12 @@ from pyutilib.enum import Enum
 from pyutilib.math import as_number
 from pyomo.opt.results.container import *
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 default_print_options = Bunch(schema=False,
                               sparse=True,
                               num_solutions=None,
@@ -57,6 +68,240 @@ except:
     numlist = (float, int)
 
 
+class NumberedSymbols(Sequence):
+    """
+    The sequence of symbols prefix0, prefix1, ..., prefix<n-1>, which
+    is stored (and pickled) as the prefix and the length.
+    """
+
+    def __init__(self, prefix, n):
+        self.prefix = prefix
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("NumberedSymbols index out of range")
+        return self.prefix + str(i)
+
+    def __iter__(self):
+        prefix = self.prefix
+        for i in xrange(self.n):
+            yield prefix + str(i)
+
+    def index(self, symbol):
+        if isinstance(symbol, basestring) and \
+           symbol.startswith(self.prefix):
+            i = symbol[len(self.prefix):]
+            if i.isdigit() and (i == '0' or i[0] != '0') and \
+               int(i) < self.n:
+                return int(i)
+        raise ValueError("%s is not in NumberedSymbols" % (symbol,))
+
+    def __contains__(self, symbol):
+        try:
+            self.index(symbol)
+        except ValueError:
+            return False
+        return True
+
+
+def _nan_column(n):
+    if numpy_available:
+        column = numpy.empty(n)
+        column.fill(numpy.nan)
+        return column
+    return array('d', [float('nan')]) * n
+
+
+class _SymbolEntry(Mapping):
+    """
+    A read-only dictionary view of the values for one symbol in a
+    SymbolColumns object.
+    """
+
+    __slots__ = ('_data', '_i')
+
+    def __init__(self, data, i):
+        self._data = data
+        self._i = i
+
+    def __getitem__(self, name):
+        val = self._data.columns[name][self._i]
+        if val != val:
+            raise KeyError(name)
+        if name in self._data._integer:
+            return int(val)
+        return float(val)
+
+    def __iter__(self):
+        i = self._i
+        for name, column in iteritems(self._data.columns):
+            val = column[i]
+            if val == val:
+                yield name
+
+    def __len__(self):
+        return sum(1 for name in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class SymbolColumns(Mapping):
+    """
+    A map from symbols to dictionaries of values that is stored as
+    columns: the values of each attribute (e.g., 'Value', 'Rc',
+    'Dual') are stored in an array with one element per symbol, where
+    NaN indicates that the symbol has no value for the attribute.
+    This is a compact alternative to the dictionaries of dictionaries
+    in the variable and constraint maps of a Solution object (see
+    Solution.compact()).
+
+    The map is read-only, and the items are read-only dictionary
+    views of the values for a symbol.  The columns are NumPy arrays
+    if NumPy is available.
+    """
+
+    def __init__(self, symbols, columns=None):
+        self.symbols = symbols
+        self.columns = OrderedDict()
+        self._integer = set()
+        self._position = None
+        if columns is not None:
+            for name, values in iteritems(columns):
+                self.add_column(name, values)
+
+    def add_column(self, name, values, indices=None, integer=False):
+        """
+        Add a column of values.  If indices is None, then values has
+        one element per symbol.  Otherwise, values[j] is the value for
+        the symbol at position indices[j].  If integer is True, then
+        the values are returned as integers.
+        """
+        n = len(self.symbols)
+        if indices is None:
+            if len(values) != n:
+                raise ValueError(
+                    "Column '%s' has %d values for %d symbols"
+                    % (name, len(values), n))
+            if numpy_available:
+                column = numpy.array(values, dtype=float)
+            else:
+                column = array('d', values)
+        else:
+            column = _nan_column(n)
+            for i, val in zip(indices, values):
+                column[i] = val
+        self.columns[name] = column
+        if integer:
+            self._integer.add(name)
+        else:
+            self._integer.discard(name)
+
+    def column(self, name):
+        """
+        Return the values in a column as a list, with NaN for the
+        symbols that have no value.
+        """
+        values = self.columns[name].tolist()
+        if name in self._integer:
+            values = [val if val != val else int(val) for val in values]
+        return values
+
+    def position(self, symbol):
+        """
+        Return the position of a symbol, or raise KeyError.
+        """
+        if isinstance(self.symbols, NumberedSymbols):
+            try:
+                return self.symbols.index(symbol)
+            except ValueError:
+                raise KeyError(symbol)
+        if self._position is None:
+            self._position = dict((symb, i) for i, symb
+                                  in enumerate(self.symbols))
+        return self._position[symbol]
+
+    def entry(self, i):
+        """
+        Return the dictionary view for the symbol at position i.
+        """
+        return _SymbolEntry(self, i)
+
+    def todict(self):
+        """
+        Return a dictionary of dictionaries with the values.
+        """
+        return dict((symbol, dict(_SymbolEntry(self, i)))
+                    for i, symbol in enumerate(self.symbols))
+
+    def __getitem__(self, symbol):
+        return _SymbolEntry(self, self.position(symbol))
+
+    def __contains__(self, symbol):
+        try:
+            self.position(symbol)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __repr__(self):
+        return repr(self.todict())
+
+    def __getstate__(self):
+        symbols = self.symbols
+        if not isinstance(symbols, NumberedSymbols):
+            # one string pickles much faster than a list of strings
+            symbols = '\n'.join(symbols)
+        return (symbols, self.columns, self._integer)
+
+    def __setstate__(self, state):
+        symbols, self.columns, self._integer = state
+        if not isinstance(symbols, NumberedSymbols):
+            symbols = symbols.split('\n') if symbols else []
+        self.symbols = symbols
+        self._position = None
+
+
+def _compact_entries(entries):
+    """
+    Return a SymbolColumns object with the values in a dictionary of
+    dictionaries, or None if the dictionary has keys that are not
+    strings or values that are not numbers.
+    """
+    symbols = list(entries)
+    data = OrderedDict()
+    for i, symbol in enumerate(symbols):
+        if not isinstance(symbol, basestring) or '\n' in symbol:
+            return None
+        for name, val in iteritems(entries[symbol]):
+            if type(val) not in numlist:
+                return None
+            column = data.get(name)
+            if column is None:
+                column = data[name] = ([], [])
+            column[0].append(i)
+            column[1].append(val)
+    columns = SymbolColumns(symbols)
+    for name, (indices, values) in iteritems(data):
+        integer = all(type(val) in intlist for val in values)
+        if len(indices) == len(symbols):
+            indices = None
+        columns.add_column(name, values, indices=indices, integer=integer)
+    return columns
+
+
 class Solution(MapContainer):
 
     def __init__(self):
@@ -93,6 +338,32 @@ class Solution(MapContainer):
             self.objective = tmp_
         MapContainer.load(self, repn)
 
+    def compact(self):
+        """
+        Store the variable and constraint maps as SymbolColumns
+        objects.  A map is not changed if it has keys that are not
+        strings or values that are not numbers.
+        """
+        for name in ('variable', 'constraint'):
+            entries = getattr(self, name)
+            if type(entries) is dict and len(entries):
+                columns = _compact_entries(entries)
+                if columns is not None:
+                    setattr(self, name, columns)
+
+    def _repn_(self, option):
+        tmp = MapContainer._repn_(self, option)
+        if tmp is ignore:
+            return tmp
+        for key in ('Variable', 'Constraint'):
+            rep = tmp.get(key, None)
+            if isinstance(rep, SymbolColumns):
+                tmp[key] = rep.todict()
+            elif type(rep) is dict and \
+                 isinstance(rep.get('value', None), SymbolColumns):
+                rep['value'] = rep['value'].todict()
+        return tmp
+
     def pprint(self, ostream, option, from_list=False, prefix="", repn=None):
         #
         # the following is specialized logic for handling variable and
@@ -104,7 +375,7 @@ class Solution(MapContainer):
             if not key in repn or key == 'Problem':
                 continue
             item = dict.__getitem__(self,key)
-            if not type(item.value) is dict:
+            if not isinstance(item.value, (dict, SymbolColumns)):
                 #
                 # Do a normal print
                 #
@@ -7,12 +7,16 @@
 #  This software is distributed under the BSD License.
 #  _________________________________________________________________________
 
-__all__ = ['SystemCallSolver']
+__all__ = ['SystemCallSolver', 'SolverSession']
 
 import os
 import sys
 import time
 import logging
+import threading
+import subprocess
+
+from six.moves import queue
 
 import pyutilib.misc
 from pyutilib.common import ApplicationError, WindowsError
@@ -43,6 +47,8 @@ class SystemCallSolver(OptSolver):
         # broadly useful for reporting, and in cases where
         # a solver plugin may not report execution time.
         self._last_solve_time = None
+        # the active SolverSession (see session())
+        self._session = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -124,10 +130,27 @@ class SystemCallSolver(OptSolver):
 
     def create_command_line(self,executable,problem_files):
         """
-        Create the command line that is executed.
+        Create the command line that is executed.  Solvers that can
+        be run interactively also define the 'session' entry of the
+        command, which is used within a SolverSession.
         """
         raise NotImplementedError       #pragma:nocover
 
+    def session(self):
+        """
+        Return a SolverSession for this solver.  Within the session,
+        solves reuse a single interactive solver process:
+
+            opt = SolverFactory('cbc')
+            with opt.session():
+                for instance in instances:
+                    opt.solve(instance)
+
+        Solvers that cannot be run interactively start a new
+        process for each solve, as they do outside a session.
+        """
+        return SolverSession(self)
+
     def process_logfile(self):
         """
         Process the logfile for information about the optimization process.
@@ -238,7 +261,13 @@ class SystemCallSolver(OptSolver):
                 print("Solver problem files: %s" % str(self._problem_files))
 
         sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
+        if (self._session is not None) and \
+           (self._command.get('session') is not None):
+            start_time = time.time()
+            self._rc, self._log = self._session.execute(self._command)
+            self._last_solve_time = time.time() - start_time
+        else:
+            self._rc, self._log = self._execute_command(self._command)
         sys.stdout.flush()
         return Bunch(rc=self._rc, log=self._log)
 
@@ -337,15 +366,26 @@ class SystemCallSolver(OptSolver):
             # information, but perhaps also in a results file.
             # For now, if there is a single solution, then we assume that
             # the results file is going to add more data to it.
+            #
+            # With fast_load, the readers that support it return the
+            # solution values as arrays that are loaded directly
+            # into the model (see ModelSolutions.load_from).
+            #
+            kwds = {}
+            if self._fast_load and \
+               (self._results_format is ResultsFormat.sol):
+                kwds['values_only'] = True
             if len(results.solution) == 1:
                 results = self._results_reader(self._results_file,
                                                res=results,
                                                soln=results.solution(0),
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             else:
                 results = self._results_reader(self._results_file,
                                                res=results,
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             results_reader_completion_time = time.time()
             if self._report_timing is True:
                 print("Results reader time=%0.2f seconds"
@@ -365,3 +405,191 @@ class SystemCallSolver(OptSolver):
             formats.
         """
         return ResultsFormat.soln
+
+
+def _read_output(stream, output):
+    """
+    Copy the output of a solver process into a queue, ending with
+    None when the process closes its output.
+    """
+    while True:
+        chunk = os.read(stream.fileno(), 4096)
+        if not chunk:
+            output.put(None)
+            return
+        if not isinstance(chunk, str):
+            chunk = chunk.decode('utf-8', 'replace')
+        output.put(chunk)
+
+class SolverSession(object):
+    """
+    An interactive solver process that is reused by the solves of a
+    SystemCallSolver.  Sessions are created by
+    SystemCallSolver.session() and are used as context managers; the
+    solver process is terminated when the context exits.
+
+    A solver supports sessions by adding a 'session' Bunch to the
+    command returned by create_command_line(), with the entries:
+
+        cmd       The command that starts the interactive solver
+        env       The environment of the solver process (or None)
+        prompt    The text that the solver prints when it is ready
+                  to read the next command
+        settings  The commands that set the solver options
+        script    The commands that solve the problem files and
+                  write the solution files
+
+    The commands are written to the standard input of the solver,
+    one per line, and the solver output is read up to the prompt that
+    follows the last command.  Solver options persist in an
+    interactive solver, so the solver process is restarted whenever
+    the command or the settings change between solves.
+    """
+
+    def __init__(self, solver):
+        self._solver = solver
+        self._process = None
+        self._output = None
+        self._cmd = None
+        self._settings = None
+
+    def __enter__(self):
+        if self._solver._session is not None:
+            raise RuntimeError(
+                "A session is already open for solver %s"
+                % (self._solver.name))
+        self._solver._session = self
+        return self
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+
+    @property
+    def pid(self):
+        """ The process id of the solver, or None if it is not running """
+        if self._process is None:
+            return None
+        return self._process.pid
+
+    def close(self):
+        """
+        Terminate the solver process and end the session.
+        """
+        self._stop()
+        if self._solver._session is self:
+            self._solver._session = None
+
+    def execute(self, command):
+        """
+        Run the session script of a command, starting the solver
+        process if necessary.  Returns the return code and the solver
+        output of the script.
+        """
+        session = command.session
+        if (self._process is not None) and \
+           ((self._cmd != session.cmd) or \
+            (self._settings != session.settings)):
+            self._stop()
+        if self._process is None:
+            self._start(session)
+        return self._send(session.script,
+                          session.prompt,
+                          self._solver._timelimit,
+                          self._solver._tee)
+
+    def _start(self, session):
+        if __debug__ and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starting solver session %s", session.cmd)
+        try:
+            self._process = subprocess.Popen(session.cmd,
+                                             stdin=subprocess.PIPE,
+                                             stdout=subprocess.PIPE,
+                                             stderr=subprocess.STDOUT,
+                                             env=session.env,
+                                             bufsize=0)
+        except (OSError, WindowsError):
+            err = sys.exc_info()[1]
+            msg = 'Could not execute the command: %s\tError message: %s'
+            raise ApplicationError(msg % (session.cmd, err))
+        self._output = queue.Queue()
+        reader = threading.Thread(target=_read_output,
+                                  args=(self._process.stdout, self._output))
+        reader.daemon = True
+        reader.start()
+        self._cmd = list(session.cmd)
+        self._settings = list(session.settings)
+        # the solver prints a prompt on startup and after each setting
+        rc, log = self._send(self._settings, session.prompt, None, False,
+                             prompts=len(self._settings)+1)
+        if self._process is None:
+            raise ApplicationError(
+                "Solver session %s terminated during startup (rc=%s):\n%s"
+                % (session.cmd, rc, log))
+
+    def _stop(self):
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        self._process.stdin.close()
+        self._process = None
+        self._output = None
+
+    def _next_output(self, timelimit):
+        """
+        Return the next chunk of solver output, or None if the solver
+        closed its output or the time limit passed.
+        """
+        while True:
+            if timelimit is None:
+                # a timeout keeps the wait interruptible
+                timeout = 1
+            else:
+                timeout = max(0, timelimit - time.time())
+            try:
+                return self._output.get(timeout=timeout)
+            except queue.Empty:
+                if timelimit is not None:
+                    return None
+
+    def _send(self, lines, prompt, timelimit, tee, prompts=None):
+        """
+        Write commands to the solver and read its output up to the
+        prompt that follows the last command.  If the solver exits or
+        exceeds the time limit, the solver process is stopped and its
+        return code is returned.
+        """
+        if prompts is None:
+            prompts = len(lines)
+        if len(lines):
+            try:
+                self._process.stdin.write(
+                    ('\n'.join(lines)+'\n').encode('utf-8'))
+                self._process.stdin.flush()
+            except (IOError, OSError):
+                # the solver exited, the output is read below
+                pass
+        if timelimit is not None:
+            timelimit += time.time()
+        log = ''
+        pos = 0
+        while prompts:
+            i = log.find(prompt, pos)
+            if i >= 0:
+                pos = i + len(prompt)
+                prompts -= 1
+                continue
+            pos = max(pos, len(log) - len(prompt) + 1)
+            chunk = self._next_output(timelimit)
+            if chunk is None:
+                # the solver exited or exceeded the time limit
+                if self._process.poll() is None:
+                    self._process.kill()
+                rc = self._process.wait()
+                self._stop()
+                return rc, log
+            if tee:
+                sys.stdout.write(chunk)
+            log += chunk
+        return 0, log
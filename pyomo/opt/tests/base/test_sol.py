@@ -105,5 +105,48 @@ class Test(unittest.TestCase):
             with self.assertRaises(ValueError):
                 soln = reader(currdir+"bad_objnoline.sol")
 
+    def test_values_only(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            soln = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+            fast = reader(currdir+"test4_sol.sol", suffixes=["dual"],
+                          values_only=True)
+            self.assertEqual(fast.solver.termination_condition,
+                             soln.solver.termination_condition)
+            self.assertEqual(len(fast.solution.variable), 0)
+            self.assertEqual(len(fast.solution.constraint), 0)
+            values = fast._sol_values
+            self.assertEqual(len(values.x), 32)
+            self.assertEqual(len(values.y), 24)
+            for i, val in enumerate(values.x):
+                self.assertEqual(val,
+                                 soln.solution.variable["v%d" % i]["Value"])
+            for i, val in enumerate(values.y):
+                self.assertEqual(val,
+                                 soln.solution.constraint["c%d" % i]["Dual"])
+            self.assertEqual(values.suffixes, [])
+
+    def test_values_only_suffixes(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            soln = reader(currdir+"conopt_optimal.sol",
+                          suffixes=["sstatus"], values_only=True)
+            self.assertEqual(soln._sol_values.suffixes,
+                             [('sstatus', 0, [0], [1]),
+                              ('sstatus', 1, [0], [3])])
+
+    def test_bad_values(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            with open(currdir+"conopt_optimal.sol") as f:
+                data = f.read()
+            # a missing value
+            with open(currdir+"test_sol.txt", "w") as f:
+                f.write(data.replace("\n1\nobjno", "\nobjno"))
+            with self.assertRaises(ValueError):
+                reader(currdir+"test_sol.txt")
+            # an invalid value
+            with open(currdir+"test_sol.txt", "w") as f:
+                f.write(data.replace("\n1\nobjno", "\n1x\nobjno"))
+            with self.assertRaises(ValueError):
+                reader(currdir+"test_sol.txt")
+
 if __name__ == "__main__":
     unittest.main()
@@ -175,6 +175,99 @@ class Test(unittest.TestCase):
         self.assertEqual(self.soln.variable[4]["Value"],0.3)
         self.assertEqual(self.soln.variable[4]["Slack"],0.4)
 
+class TestSymbolColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.results = pyomo.opt.SolverResults()
+        self.soln = self.results.solution.add()
+        self.soln.variable['x1'] = {"Value": 1.5, "Rc": 2}
+        self.soln.variable['x2'] = {"Value": 3}
+        self.soln.variable['x3'] = {"Value": 0.25}
+        self.soln.constraint['c1'] = {"Dual": 4.0}
+
+    def tearDown(self):
+        del self.results
+
+    def test_columns(self):
+        columns = pyomo.opt.SymbolColumns(['a', 'b', 'c'])
+        columns.add_column('Value', [1, 2, 3.5])
+        columns.add_column('Sstatus', [2], indices=[1], integer=True)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(list(columns), ['a', 'b', 'c'])
+        self.assertIn('b', columns)
+        self.assertNotIn('d', columns)
+        self.assertEqual(dict(columns['a']), {'Value': 1.0})
+        self.assertEqual(dict(columns['b']), {'Value': 2.0, 'Sstatus': 2})
+        self.assertIs(type(columns['b']['Sstatus']), int)
+        self.assertIs(type(columns['b']['Value']), float)
+        self.assertRaises(KeyError, columns['a'].__getitem__, 'Sstatus')
+        self.assertRaises(KeyError, columns.__getitem__, 'd')
+        self.assertEqual(columns.position('c'), 2)
+        self.assertEqual(columns.column('Value'), [1.0, 2.0, 3.5])
+        self.assertEqual(columns.todict(),
+                         {'a': {'Value': 1.0},
+                          'b': {'Value': 2.0, 'Sstatus': 2},
+                          'c': {'Value': 3.5}})
+        self.assertRaises(ValueError, columns.add_column, 'Rc', [1, 2])
+
+    def test_numbered_symbols(self):
+        symbols = pyomo.opt.NumberedSymbols('v', 11)
+        self.assertEqual(len(symbols), 11)
+        self.assertEqual(symbols[10], 'v10')
+        self.assertEqual(symbols[-1], 'v10')
+        self.assertRaises(IndexError, symbols.__getitem__, 11)
+        self.assertEqual(list(symbols)[:2], ['v0', 'v1'])
+        self.assertEqual(symbols.index('v7'), 7)
+        for symbol in ('v11', 'v07', 'x1', 'v', 7):
+            self.assertNotIn(symbol, symbols)
+        columns = pyomo.opt.SymbolColumns(symbols)
+        columns.add_column('Value', range(11))
+        self.assertEqual(columns['v3']['Value'], 3)
+        self.assertNotIn('v11', columns)
+        columns = pickle.loads(pickle.dumps(columns))
+        self.assertIs(type(columns.symbols), pyomo.opt.NumberedSymbols)
+        self.assertEqual(columns['v10']['Value'], 10)
+
+    def test_compact(self):
+        before = str(self.results)
+        self.soln.compact()
+        variable = self.soln.variable
+        self.assertIs(type(variable), pyomo.opt.SymbolColumns)
+        self.assertIs(type(self.soln.constraint), pyomo.opt.SymbolColumns)
+        self.assertEqual(sorted(variable), ['x1', 'x2', 'x3'])
+        self.assertEqual(dict(variable['x1']), {"Value": 1.5, "Rc": 2})
+        self.assertIs(type(variable['x1']['Rc']), int)
+        self.assertEqual(dict(variable['x2']), {"Value": 3})
+        self.assertEqual(self.soln.constraint['c1']['Dual'], 4.0)
+        self.assertEqual(str(self.results), before)
+
+    def test_compact_skip(self):
+        # maps with non-string keys or non-numeric values are unchanged
+        self.soln.variable[1] = {"Value": 0}
+        self.soln.constraint['c2'] = {"Status": "basic"}
+        self.soln.compact()
+        self.assertIs(type(self.soln.variable), dict)
+        self.assertIs(type(self.soln.constraint), dict)
+
+    def test_pickle(self):
+        expected = str(pickle.loads(pickle.dumps(self.results)))
+        self.soln.compact()
+        results = pickle.loads(pickle.dumps(self.results))
+        self.assertEqual(results.solution[0].variable.todict(),
+                         self.soln.variable.todict())
+        self.assertEqual(str(results), expected)
+
+    def test_write_json(self):
+        with pyutilib.services.TempfileManager.push():
+            expected = pyutilib.services.TempfileManager.create_tempfile(
+                suffix='.jsn')
+            self.results.write(filename=expected, format='json')
+            self.soln.compact()
+            output = pyutilib.services.TempfileManager.create_tempfile(
+                suffix='.jsn')
+            self.results.write(filename=output, format='json')
+            self.assertMatchesJsonBaseline(output, expected, delete=False)
+
 if __name__ == "__main__":
     import pyutilib.misc
     #sys.settrace(pyutilib.misc.traceit)
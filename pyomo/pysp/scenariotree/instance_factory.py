@@ -24,6 +24,9 @@ from pyomo.core import (Block,
                         IPyomoScriptModifyInstance,
                         DataPortal)
 from pyomo.core.base.block import _BlockData
+from pyomo.core.base.instance_archive import (dump_instance,
+                                              load_instance,
+                                              load_instance_key)
 from pyomo.util.plugin import ExtensionPoint
 from pyomo.pysp.phutils import _OLD_OUTPUT
 from pyomo.pysp.util.misc import load_external_module
@@ -487,6 +490,48 @@ class ScenarioTreeInstanceFactory(object):
     def data_directory(self):
         return self._data_directory
 
+    def _instance_cache_key(self,
+                            scenario_name,
+                            scenario_tree,
+                            compile_instance):
+        """
+        Return the key that is stored with a cached scenario instance
+        and checked before it is loaded: the files the instance is
+        built from (the model and scenario tree files and the data
+        files of the scenario) with their size and modification time,
+        the nodes of the scenario and whether the instance is
+        compiled. Models and scenario trees that are passed in as
+        objects are not checked.
+        """
+        scenario = scenario_tree.get_scenario(scenario_name)
+        node_name_list = [n._name for n in scenario._node_list]
+        filenames = [self._model_filename, self._scenario_tree_filename]
+        if (self._model_callback is None) and \
+           (self._model_object is not None):
+            if scenario_tree._scenario_based_data:
+                scenario_data_filename = \
+                    os.path.join(self.data_directory(), str(scenario_name))
+                filenames.append(scenario_data_filename+".dat")
+                filenames.append(scenario_data_filename+".yaml")
+            else:
+                for node_name in node_name_list:
+                    filenames.append(
+                        os.path.join(self.data_directory(),
+                                     str(node_name)+".dat"))
+        files = []
+        for filename in filenames:
+            if filename is None:
+                continue
+            if os.path.exists(filename):
+                stat = os.stat(filename)
+                files.append((filename, stat.st_size, stat.st_mtime))
+            else:
+                files.append((filename, None, None))
+        return (str(scenario_name),
+                tuple(node_name_list),
+                bool(compile_instance),
+                tuple(files))
+
     #
     # construct a scenario instance - just like it sounds!
     #
@@ -496,12 +541,43 @@ class ScenarioTreeInstanceFactory(object):
                                     profile_memory=False,
                                     output_instance_construction_time=False,
                                     compile_instance=False,
-                                    verbose=False):
+                                    verbose=False,
+                                    instance_cache_directory=None):
         assert not self._closed
         if not scenario_tree.contains_scenario(scenario_name):
             raise ValueError("ScenarioTree does not contain scenario "
                              "with name %s." % (scenario_name))
 
+        # Instances are cached as binary archives named after the
+        # scenario (and whether the instance is compiled). A cached
+        # instance is only loaded if the key stored with it matches
+        # the current files (see _instance_cache_key), otherwise the
+        # instance is rebuilt and the cache file replaced.
+        cache_filename = None
+        if instance_cache_directory is not None:
+            cache_filename = os.path.join(
+                instance_cache_directory,
+                str(scenario_name) +
+                (".compiled.pyar" if compile_instance else ".pyar"))
+            cache_key = self._instance_cache_key(scenario_name,
+                                                 scenario_tree,
+                                                 compile_instance)
+            if os.path.exists(cache_filename):
+                try:
+                    cache_valid = \
+                        (load_instance_key(cache_filename) == cache_key)
+                except Exception:
+                    cache_valid = False
+                if cache_valid:
+                    if verbose:
+                        print("Loading instance for scenario=%s from "
+                              "cache file=%s"
+                              % (scenario_name, cache_filename))
+                    return load_instance(cache_filename)
+                if verbose:
+                    print("Cache file=%s for scenario=%s is out of date"
+                          % (cache_filename, scenario_name))
+
         scenario = scenario_tree.get_scenario(scenario_name)
         node_name_list = [n._name for n in scenario._node_list]
 
@@ -618,7 +694,7 @@ class ScenarioTreeInstanceFactory(object):
                          instance=scenario_instance)
 
             if compile_instance:
-                from pyomo.repn.beta.matrix import \
+                from pyomo.repn.matrix import \
                     compile_block_linear_constraints
                 compile_block_linear_constraints(
                     scenario_instance,
@@ -630,6 +706,29 @@ class ScenarioTreeInstanceFactory(object):
                          % (scenario_name))
             raise
 
+        if cache_filename is not None:
+            if verbose:
+                print("Saving instance for scenario=%s to cache file=%s"
+                      % (scenario_name, cache_filename))
+            # write to a temporary file in the cache directory and
+            # rename it, so that an interrupted write (or another
+            # process reading the cache) never sees a partial archive
+            fd, tmp_filename = tempfile.mkstemp(
+                dir=instance_cache_directory,
+                prefix=os.path.basename(cache_filename)+".",
+                suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as ostream:
+                    dump_instance(scenario_instance, ostream, key=cache_key)
+                if os.name == 'nt' and os.path.exists(cache_filename):
+                    # os.rename does not replace files on Windows
+                    os.remove(cache_filename)
+                os.rename(tmp_filename, cache_filename)
+            except:
+                if os.path.exists(tmp_filename):
+                    os.remove(tmp_filename)
+                raise
+
         return scenario_instance
 
     def construct_instances_for_scenario_tree(
@@ -638,7 +737,8 @@ class ScenarioTreeInstanceFactory(object):
             profile_memory=False,
             output_instance_construction_time=False,
             compile_scenario_instances=False,
-            verbose=False):
+            verbose=False,
+            instance_cache_directory=None):
         assert not self._closed
 
         if scenario_tree._scenario_based_data:
@@ -669,7 +769,8 @@ class ScenarioTreeInstanceFactory(object):
                         profile_memory=profile_memory,
                         output_instance_construction_time=output_instance_construction_time,
                         compile_instance=compile_scenario_instances,
-                        verbose=verbose)
+                        verbose=verbose,
+                        instance_cache_directory=instance_cache_directory)
 
             scenario_instances[scenario._name] = scenario_instance
             assert scenario_instance.name == scenario._name
@@ -9,6 +9,7 @@
 import os
 import sys
 import shutil
+import tempfile
 from os.path import join, dirname, abspath, exists
 
 import pyutilib.th as unittest
@@ -18,6 +19,7 @@ from pyomo.pysp.scenariotree.instance_factory import \
 from pyomo.pysp.scenariotree.tree_structure_model import \
     CreateAbstractScenarioTreeModel
 from pyomo.pysp.util.misc import load_external_module
+from pyomo.core.base.instance_archive import load_instance_key
 
 has_yaml = False
 try:
@@ -398,6 +400,113 @@ class Test(unittest.TestCase):
         self.assertEqual(factory._closed, True)
         self.assertEqual(len(factory._archives), 0)
 
+    def test_instance_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            with ScenarioTreeInstanceFactory(
+                    model=join(testdatadir,
+                               "reference_test_model.py"),
+                    scenario_tree=join(testdatadir,
+                                       "reference_test_scenario_tree.dat")) \
+                    as factory:
+                scenario_tree = factory.generate_scenario_tree()
+                instances = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(sorted(os.listdir(cache_dir)),
+                                 ['s1.pyar', 's2.pyar', 's3.pyar'])
+                instances["s2"].x.value = 5
+                cached = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(len(cached), 3)
+                for name in ("s1", "s2", "s3"):
+                    self.assertIsNot(cached[name], instances[name])
+                    self.assertEqual(cached[name].name, name)
+                    self.assertEqual(cached[name].p(),
+                                     instances[name].p())
+                self.assertEqual(cached["s2"].x.value, None)
+                self.assertIs(cached["s1"].c.body, cached["s1"].x)
+                # compiled instances are cached separately
+                compiled = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    compile_scenario_instances=True,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(sorted(os.listdir(cache_dir)),
+                                 ['s1.compiled.pyar', 's1.pyar',
+                                  's2.compiled.pyar', 's2.pyar',
+                                  's3.compiled.pyar', 's3.pyar'])
+                self.assertTrue(hasattr(
+                    compiled["s1"], "_PySP_compiled_linear_constraints"))
+                self.assertFalse(hasattr(
+                    cached["s1"], "_PySP_compiled_linear_constraints"))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_instance_cache_invalidation(self):
+        tmpdir = tempfile.mkdtemp()
+        cache_dir = join(tmpdir, "cache")
+        os.mkdir(cache_dir)
+        try:
+            # the model is copied under a name that is not imported
+            # by other tests
+            shutil.copy(join(testdatadir, "reference_test_model.py"),
+                        join(tmpdir, "cache_test_model.py"))
+            for name in ("reference_test_scenario_tree.dat",
+                         "s1.dat", "s2.dat", "s3.dat"):
+                shutil.copy(join(testdatadir, name), tmpdir)
+            with ScenarioTreeInstanceFactory(
+                    model=join(tmpdir, "cache_test_model.py"),
+                    scenario_tree=join(tmpdir,
+                                       "reference_test_scenario_tree.dat")) \
+                    as factory:
+                scenario_tree = factory.generate_scenario_tree()
+                instances = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(instances["s2"].p(), 2.0)
+                # the archive is renamed into place
+                self.assertEqual(sorted(os.listdir(cache_dir)),
+                                 ['s1.pyar', 's2.pyar', 's3.pyar'])
+                # a changed data file rebuilds the instance
+                with open(join(tmpdir, "s2.dat"), "w") as f:
+                    f.write("param p := 20.0;\n")
+                mtime = os.path.getmtime(join(tmpdir, "s2.dat"))
+                os.utime(join(tmpdir, "s2.dat"), (mtime+10, mtime+10))
+                cached = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(cached["s1"].p(), 1.0)
+                self.assertEqual(cached["s2"].p(), 20.0)
+                self.assertEqual(sorted(os.listdir(cache_dir)),
+                                 ['s1.pyar', 's2.pyar', 's3.pyar'])
+                cached = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(cached["s2"].p(), 20.0)
+                # as does a changed model file (or an unreadable
+                # cache file)
+                mtime = os.path.getmtime(
+                    join(tmpdir, "cache_test_model.py"))
+                os.utime(join(tmpdir, "cache_test_model.py"),
+                         (mtime+10, mtime+10))
+                with open(join(cache_dir, "s3.pyar"), "wb") as f:
+                    f.write(b"not an archive")
+                key = factory._instance_cache_key("s1", scenario_tree, False)
+                self.assertNotEqual(
+                    load_instance_key(join(cache_dir, "s1.pyar")), key)
+                cached = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache_directory=cache_dir)
+                self.assertEqual(cached["s3"].p(), 3.0)
+                self.assertEqual(
+                    load_instance_key(join(cache_dir, "s1.pyar")), key)
+                self.assertEqual(sorted(os.listdir(cache_dir)),
+                                 ['s1.pyar', 's2.pyar', 's3.pyar'])
+        finally:
+            sys.modules.pop("cache_test_model", None)
+            shutil.rmtree(tmpdir)
+
 Test = unittest.category('smoke','nightly','expensive')(Test)
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ PluginGlobals.add_env("pyomo")
 
 from pyomo.repn.canonical_repn import *
 from pyomo.repn.ampl_repn import *
+from pyomo.repn.compiled_repn import *
+from pyomo.repn.matrix import *
 
 import pyomo.repn.compute_canonical_repn
 import pyomo.repn.collect
@@ -21,7 +21,8 @@ from pyomo.core.base.numvalue import (NumericConstant,
                                       is_fixed)
 from pyomo.core.base import external
 from pyomo.repn.canonical_repn import (collect_linear_canonical_repn,
-                                       generate_canonical_repn)
+                                       generate_canonical_repn,
+                                       LinearCanonicalRepn)
 import pyomo.core.base.expr_common
 
 import six
@@ -731,6 +732,21 @@ def _generate_ampl_repn(exp):
 def generate_ampl_repn(exp, idMap=None):
     if idMap is None:
         idMap = {}
+    if isinstance(exp, LinearCanonicalRepn):
+        # e.g., a MatrixConstraint row; use its coefficients
+        # directly rather than generating the body expression
+        repn = AmplRepn()
+        repn._nonlinear_vars = tuple()
+        constant = exp.constant
+        if constant is not None:
+            repn._constant = value(constant)
+        if exp.variables is None:
+            repn._linear_vars = tuple()
+            repn._linear_terms_coef = tuple()
+        else:
+            repn._linear_vars = tuple(exp.variables)
+            repn._linear_terms_coef = tuple(exp.coefficients)
+        return repn
     degree = exp.polynomial_degree()
     if (degree is None) or (degree > 1):
         repn = _generate_ampl_repn(exp)
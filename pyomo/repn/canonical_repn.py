@@ -19,6 +19,7 @@ import copy
 from pyomo.core.base import Model, value
 from pyomo.core.base import param
 from pyomo.core.base import expr
+from pyomo.core.base import expr_coopr3
 from pyomo.core.base.numvalue import native_numeric_types
 from pyomo.core.base.expression import (_ExpressionData,
                                         _GeneralExpressionData,
@@ -27,11 +28,11 @@ from pyomo.core.base.expression import (_ExpressionData,
 from pyomo.core.base.connector import _ConnectorValue, SimpleConnector, Connector
 from pyomo.core.base.var import SimpleVar, Var, _GeneralVarData, _VarData
 
-from pyomo.core.base.expr_pyomo4 import TreeWalkerHelper
+from pyomo.core.base.expr_pyomo4 import TreeWalkerHelper, _LinearExpression
 
 import six
 from six import iterkeys, itervalues, iteritems, StringIO
-from six.moves import xrange, reduce
+from six.moves import xrange, reduce, zip
 
 using_py3 = six.PY3
 
@@ -799,44 +800,109 @@ def collect_linear_canonical_repn(exp, idMap, compute_values=True):
                               (type(exp).__name__, str(exp)) )
     return coef, varmap
 
+def collect_linear_var_sum(exp, idMap, compute_values=True):
+    """
+    Collect a sum whose arguments are all variables (e.g., the sums
+    generated by quicksum()) without the recursion through the linear
+    collectors.  The sum is either a coopr3 _SumExpression or a pyomo4
+    _LinearExpression.  Returns (coef, varmap) as
+    collect_linear_canonical_repn() does, or None if the sum has other
+    arguments or no free variables.
+    """
+    for arg in exp._args:
+        if arg.__class__ is not _GeneralVarData \
+           and not isinstance(arg, _VarData):
+            return None
+
+    if exp.__class__ is _LinearExpression:
+        # the coefficients are keyed by id() and may be parameters
+        _coef = exp._coef
+        if compute_values:
+            terms = [(arg, value(_coef[id(arg)])) for arg in exp._args]
+            const = value(exp._const)
+        else:
+            terms = [(arg, _coef[id(arg)]) for arg in exp._args]
+            const = exp._const
+    else:
+        terms = zip(exp._args, exp._coef)
+        const = exp._const
+
+    idMap.setdefault(None, {})
+    ids = idMap[None]
+    coef = { None : const }
+    varmap = {}
+    for arg, arg_coef in terms:
+        if arg.fixed:
+            if compute_values:
+                coef[None] += arg_coef * value(arg)
+            else:
+                coef[None] += arg_coef * arg
+            continue
+        id_ = id(arg)
+        if id_ in ids:
+            key = ids[id_]
+        else:
+            key = len(idMap) - 1
+            ids[id_] = key
+            idMap[key] = arg
+        varmap[key] = arg
+        if key in coef:
+            coef[key] += arg_coef
+        else:
+            coef[key] = arg_coef
+    if not varmap:
+        return None
+    return coef, varmap
+
 #########################################################################
 #########################################################################
 #### ROUTINES OPERATING ON BOTH LINEAR AND GENERAL CANONICAL REPNS  #####
 #########################################################################
 #########################################################################
 
-def coopr3_generate_canonical_repn(exp, idMap=None, compute_values=True):
-    degree = exp.polynomial_degree()
+def _linear_canonical_repn(coef, varmap):
+    # varmap is a map from the variable id() to a _VarData.
+    # coef is a map from the variable id() to its coefficient.
+    ans = CompiledLinearCanonicalRepn()
+    if None in coef:
+        val = coef.pop(None)
+        if type(val) not in [int,float] or val != 0.0:
+            ans.constant = val
+
+    # the six module is inefficient in terms of wrapping iterkeys
+    # and itervalues, in the context of Python 2.7. use the native
+    # dictionary methods where possible.
+    if using_py3:
+        ans.linear = tuple( itervalues(coef) )
+        ans.variables = tuple(varmap[var_hash] for var_hash in iterkeys(coef) )
+    else:
+        ans.linear = tuple( coef.itervalues() )
+        ans.variables = tuple(varmap[var_hash] for var_hash in coef.iterkeys() )
+    return ans
 
+def coopr3_generate_canonical_repn(exp, idMap=None, compute_values=True):
     if idMap is None:
         idMap = {}
     idMap.setdefault(None, {})
 
+    if exp.__class__ is expr_coopr3._SumExpression:
+        # A very common special case: flat sums of variables (e.g.,
+        # generated by quicksum()) do not need the degree check or the
+        # recursion through the linear collectors.
+        collected = collect_linear_var_sum(exp, idMap, compute_values)
+        if collected is not None:
+            return _linear_canonical_repn(*collected)
+
+    degree = exp.polynomial_degree()
+
     if degree == 0:
         ans = CompiledLinearCanonicalRepn()
         ans.constant = value(exp)
         return ans
 
     elif degree == 1:
-        # varmap is a map from the variable id() to a _VarData.
-        # coef is a map from the variable id() to its coefficient.
         coef, varmap = collect_linear_canonical_repn(exp, idMap, compute_values)
-        ans = CompiledLinearCanonicalRepn()
-        if None in coef:
-            val = coef.pop(None)
-            if type(val) not in [int,float] or val != 0.0:
-                ans.constant = val
-
-        # the six module is inefficient in terms of wrapping iterkeys
-        # and itervalues, in the context of Python 2.7. use the native
-        # dictionary methods where possible.
-        if using_py3:
-            ans.linear = tuple( itervalues(coef) )
-            ans.variables = tuple(varmap[var_hash] for var_hash in iterkeys(coef) )
-        else:
-            ans.linear = tuple( coef.itervalues() )
-            ans.variables = tuple(varmap[var_hash] for var_hash in coef.iterkeys() )
-        return ans
+        return _linear_canonical_repn(coef, varmap)
 
     # **Py3k: degree > 1 comparision will error if degree is None
     elif degree and degree > 1:
@@ -857,6 +923,12 @@ _stack = [[0,0,0,0,0,pyomo4_CompiledLinearCanonicalRepn()]]
 def pyomo4_generate_canonical_repn(exp, idMap=None, compute_values=True):
     # A **very** special case
     if TreeWalkerHelper.typeList.get(exp.__class__,0) == 4: # _LinearExpression:
+        # flat sums of variables (e.g., generated by quicksum())
+        collected = collect_linear_var_sum(
+            exp, {} if idMap is None else idMap, compute_values)
+        if collected is not None:
+            return _linear_canonical_repn(*collected)
+
         ans = CompiledLinearCanonicalRepn()
 
         # old format
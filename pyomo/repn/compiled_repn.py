@@ -0,0 +1,384 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+
+from __future__ import division
+
+__all__ = ('compile_block_linear_repn', 'BlockLinearRepn')
+
+import array
+import logging
+
+from pyomo.core.base import (Constraint,
+                             ComponentMap,
+                             SortComponents)
+from pyomo.core.base.numvalue import (value,
+                                      native_numeric_types)
+from pyomo.core.base.var import _GeneralVarData, _VarData
+from pyomo.core.base import expr_coopr3
+from pyomo.repn.canonical_repn import (generate_canonical_repn,
+                                       LinearCanonicalRepn)
+
+from six.moves import xrange, zip
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+logger = logging.getLogger('pyomo.core')
+
+_inf = float('inf')
+_SumExpression = expr_coopr3._SumExpression
+_ProductExpression = expr_coopr3._ProductExpression
+
+#
+# Collect the linear terms of a constraint body into the (var, coef)
+# list terms.  Returns the constant part of the body, or None if the
+# body is not linear.
+#
+# Sums of variables and of products of fixed terms with a single
+# variable (the overwhelmingly common shapes for LP rows) are handled
+# inline; everything else falls back on generate_canonical_repn.
+#
+def _collect_linear_terms(exp, terms, idMap):
+
+    if (exp.__class__ is _GeneralVarData) or isinstance(exp, _VarData):
+        if exp.fixed:
+            return value(exp)
+        terms.append((exp, 1))
+        return 0
+
+    if exp.__class__ is not _SumExpression:
+        return _collect_canonical_terms(exp, 1, terms, idMap)
+
+    constant = value(exp._const)
+    for arg, coef in zip(exp._args, exp._coef):
+        arg_class = arg.__class__
+        if arg_class in native_numeric_types:
+            constant += coef * arg
+        elif (arg_class is _GeneralVarData) or isinstance(arg, _VarData):
+            if arg.fixed:
+                constant += coef * value(arg)
+            else:
+                terms.append((arg, coef))
+        elif (arg_class is _ProductExpression) and \
+             (not arg._denominator):
+            var = None
+            multiplier = coef * arg._coef
+            for subexp in arg._numerator:
+                if subexp.__class__ in native_numeric_types:
+                    multiplier *= subexp
+                elif ((subexp.__class__ is _GeneralVarData) or \
+                      isinstance(subexp, _VarData)) and \
+                     (not subexp.fixed):
+                    if var is not None:
+                        # bilinear (or worse)
+                        return None
+                    var = subexp
+                elif subexp.is_fixed():
+                    multiplier *= value(subexp)
+                else:
+                    break
+            else:
+                if var is None:
+                    constant += multiplier
+                else:
+                    terms.append((var, multiplier))
+                continue
+            arg_constant = _collect_canonical_terms(arg, coef, terms, idMap)
+            if arg_constant is None:
+                return None
+            constant += arg_constant
+        else:
+            arg_constant = _collect_canonical_terms(arg, coef, terms, idMap)
+            if arg_constant is None:
+                return None
+            constant += arg_constant
+    return constant
+
+def _collect_canonical_terms(exp, multiplier, terms, idMap):
+    repn = generate_canonical_repn(exp, idMap=idMap)
+    if not isinstance(repn, LinearCanonicalRepn):
+        return None
+    if repn.variables is not None:
+        terms.extend((var, multiplier * coef)
+                     for var, coef in zip(repn.variables, repn.linear))
+    if repn.constant is None:
+        return 0
+    return multiplier * value(repn.constant)
+
+def _as_array(data):
+    """Convert an array.array to a NumPy array (without copying) if
+    NumPy is available."""
+    if not numpy_available:
+        return data
+    if len(data) == 0:
+        return numpy.empty(0, dtype=data.typecode)
+    return numpy.frombuffer(data, dtype=data.typecode)
+
+class _CompiledLinearRowRepn(LinearCanonicalRepn):
+    """
+    A LinearCanonicalRepn view of a single row stored in a
+    BlockLinearRepn.
+    """
+
+    __slots__ = ('_compiled', '_row')
+
+    def __init__(self, compiled, row):
+        self._compiled = compiled
+        self._row = row
+
+    @property
+    def variables(self):
+        """A tuple of variables comprising the constraint body."""
+        compiled = self._compiled
+        start, stop = compiled.row_ptr[self._row], \
+                      compiled.row_ptr[self._row+1]
+        if start == stop:
+            return None
+        variables = compiled.variables
+        col_index = compiled.col_index
+        return tuple(variables[col_index[p]] for p in xrange(start, stop))
+
+    @property
+    def coefficients(self):
+        """A tuple of coefficients associated with the variables."""
+        compiled = self._compiled
+        start, stop = compiled.row_ptr[self._row], \
+                      compiled.row_ptr[self._row+1]
+        if start == stop:
+            return None
+        coefficients = compiled.coefficients
+        return tuple(float(coefficients[p]) for p in xrange(start, stop))
+
+    # for backwards compatibility
+    linear=coefficients
+
+    @property
+    def constant(self):
+        """The constant value associated with the constraint body."""
+        constant = self._compiled.constant[self._row]
+        if constant == 0:
+            return None
+        return float(constant)
+
+    def __str__(self):
+        return "CompiledLinearCanonical{ row %s of %s }" \
+            % (self._row, self._compiled.constraints[self._row].cname(True))
+
+class BlockLinearRepn(object):
+    """
+    The linear constraint rows of a block stored in compressed sparse
+    row (CSR) format.
+
+    Public attributes:
+        constraints     A list of the constraint data objects, one
+                            for each row
+        variables       A list of the variable data objects, one for
+                            each column
+        row_ptr         An integer array of length nrows+1; the
+                            entries of row i are stored at positions
+                            row_ptr[i] through row_ptr[i+1]-1
+        col_index       An integer array holding the column of each
+                            nonzero
+        coefficients    A float array holding the value of each
+                            nonzero
+        constant        A float array holding the constant part of
+                            each row body
+        row_lower       A float array of row lower bounds with the
+                            constant moved to the right-hand side
+                            (-inf if the row has no lower bound)
+        row_upper       A float array of row upper bounds with the
+                            constant moved to the right-hand side
+                            (inf if the row has no upper bound)
+        nonlinear       A list of the active constraint data objects
+                            that were not compiled because their body
+                            is not linear
+
+    The array attributes are NumPy arrays if NumPy is available and
+    array.array objects otherwise.
+    """
+
+    def __init__(self,
+                 constraints,
+                 variables,
+                 row_ptr,
+                 col_index,
+                 coefficients,
+                 constant,
+                 row_lower,
+                 row_upper,
+                 nonlinear):
+        assert len(row_ptr) == len(constraints) + 1
+        assert len(col_index) == len(coefficients)
+        self.constraints = constraints
+        self.variables = variables
+        self.row_ptr = row_ptr
+        self.col_index = col_index
+        self.coefficients = coefficients
+        self.constant = constant
+        self.row_lower = row_lower
+        self.row_upper = row_upper
+        self.nonlinear = nonlinear
+        self._row_of = dict((id(cdata), i)
+                            for i, cdata in enumerate(constraints))
+
+    @property
+    def nrows(self):
+        """The number of compiled rows."""
+        return len(self.constraints)
+
+    @property
+    def ncols(self):
+        """The number of variables referenced by the compiled rows."""
+        return len(self.variables)
+
+    @property
+    def nnz(self):
+        """The number of stored nonzeros."""
+        return len(self.col_index)
+
+    def __len__(self):
+        return len(self.constraints)
+
+    def __contains__(self, constraint_data):
+        return id(constraint_data) in self._row_of
+
+    def __getitem__(self, constraint_data):
+        """Return the LinearCanonicalRepn view of a compiled
+        constraint."""
+        try:
+            return _CompiledLinearRowRepn(
+                self, self._row_of[id(constraint_data)])
+        except KeyError:
+            raise KeyError("Constraint '%s' was not compiled into this "
+                           "BlockLinearRepn" % (constraint_data.cname(True)))
+
+    def row(self, i):
+        """Return the LinearCanonicalRepn view of row i."""
+        if (i < 0) or (i >= len(self.constraints)):
+            raise IndexError("Row index %s out of range" % (i))
+        return _CompiledLinearRowRepn(self, i)
+
+    def store_canonical_repn(self):
+        """
+        Store the LinearCanonicalRepn view of each compiled row in the
+        _canonical_repn map of the block that owns the constraint, so
+        that writers relying on the preprocessed canonical
+        representation use the compiled rows.
+        """
+        for i, cdata in enumerate(self.constraints):
+            block = cdata.parent_block()
+            if not hasattr(block, '_canonical_repn'):
+                block._canonical_repn = ComponentMap()
+            block._canonical_repn[cdata] = _CompiledLinearRowRepn(self, i)
+
+def compile_block_linear_repn(block,
+                              descend_into=True,
+                              sort=False,
+                              active=True):
+    """
+    Compile the linear constraints on a block into a BlockLinearRepn
+    holding CSR arrays (row pointers, column indices, coefficients)
+    along with the row bounds, in a single pass over the constraint
+    bodies.  Constraints whose body is not linear are not compiled;
+    they are collected on the 'nonlinear' attribute of the result.
+
+    Required:
+        block           The block whose constraints are compiled
+
+    Optional:
+        descend_into    Compile constraints on sub-blocks (default True)
+        sort            Passed to component_data_objects to control
+                            the row order (default False)
+        active          Only compile active constraints (default True)
+    """
+    if sort is True:
+        sort = SortComponents.deterministic
+
+    constraints = []
+    nonlinear = []
+    variables = []
+    var_column = {}
+    idMap = {}
+
+    row_ptr = array.array('l', [0])
+    col_index = array.array('l')
+    coefficients = array.array('d')
+    constant_array = array.array('d')
+    row_lower = array.array('d')
+    row_upper = array.array('d')
+
+    for cdata in block.component_data_objects(Constraint,
+                                              active=active,
+                                              sort=sort,
+                                              descend_into=descend_into):
+
+        terms = []
+        if isinstance(cdata, LinearCanonicalRepn):
+            constant = cdata.constant
+            if cdata.variables is not None:
+                terms.extend(zip(cdata.variables, cdata.coefficients))
+        else:
+            body = cdata.body
+            if body is None:
+                raise ValueError("No expression has been defined for "
+                                 "the body of constraint %s"
+                                 % (cdata.cname(True)))
+            try:
+                constant = _collect_linear_terms(body, terms, idMap)
+            except Exception:
+                logger.error("exception compiling the linear "
+                             "representation of constraint %s"
+                             % (cdata.cname(True)))
+                raise
+            if constant is None:
+                nonlinear.append(cdata)
+                continue
+        if constant is None:
+            constant = 0
+
+        # merge duplicate variables within the row
+        row_position = {}
+        row_start = len(col_index)
+        for var, coef in terms:
+            var_id = id(var)
+            column = var_column.get(var_id)
+            if column is None:
+                column = var_column[var_id] = len(variables)
+                variables.append(var)
+            position = row_position.get(column)
+            if position is None:
+                row_position[column] = len(col_index)
+                col_index.append(column)
+                coefficients.append(coef)
+            else:
+                coefficients[position] += coef
+        row_ptr.append(len(col_index))
+        assert row_ptr[-1] - row_start == len(row_position)
+
+        constraints.append(cdata)
+        constant_array.append(constant)
+        lower = cdata.lower
+        upper = cdata.upper
+        row_lower.append(-_inf if lower is None else
+                         value(lower) - constant)
+        row_upper.append(_inf if upper is None else
+                         value(upper) - constant)
+
+    return BlockLinearRepn(constraints,
+                           variables,
+                           _as_array(row_ptr),
+                           _as_array(col_index),
+                           _as_array(coefficients),
+                           _as_array(constant_array),
+                           _as_array(row_lower),
+                           _as_array(row_upper),
+                           nonlinear)
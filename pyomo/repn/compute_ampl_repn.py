@@ -67,7 +67,7 @@ def preprocess_constraint(block,
                           idMap=None,
                           block_ampl_repn=None):
 
-    from pyomo.repn.beta.matrix import MatrixConstraint
+    from pyomo.repn.matrix import MatrixConstraint
     if isinstance(constraint, MatrixConstraint):
         return
 
@@ -65,7 +65,7 @@ def preprocess_constraint(block,
                           idMap=None,
                           block_canonical_repn=None):
 
-    from pyomo.repn.beta.matrix import MatrixConstraint
+    from pyomo.repn.matrix import MatrixConstraint
     if isinstance(constraint, MatrixConstraint):
         return
 
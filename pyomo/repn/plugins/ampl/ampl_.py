@@ -17,7 +17,10 @@ import itertools
 import logging
 import operator
 import os
+import struct
+import sys
 import time
+import weakref
 
 from pyutilib.misc import PauseGC
 from pyutilib.math import infinity
@@ -26,7 +29,8 @@ import pyomo.util.plugin
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import *
 from pyomo.core.base import *
-from pyomo.core.base import expr, external, SymbolMap, Block
+from pyomo.core.base import expr, external, IntegerSymbolMap, Block
+from pyomo.core.base.component import _StructureRevision
 import pyomo.core.base.expr_common
 from pyomo.core.base.var import Var
 from pyomo.core.base import _ExpressionData, Expression, SortComponents
@@ -35,8 +39,10 @@ from pyomo.core.base import var
 from pyomo.core.base import param
 from pyomo.core.base.suffix import active_export_suffix_generator
 from pyomo.repn.ampl_repn import generate_ampl_repn
+from pyomo.repn.canonical_repn import LinearCanonicalRepn
+from pyomo.repn.repn_cache import ampl_repn_cache
 
-from six import itervalues, iteritems
+from six import itervalues, iteritems, PY3
 from six.moves import xrange, zip
 
 _using_pyomo4_trees = False
@@ -155,6 +161,226 @@ class _Counter(object):
         self._id += 1
         return tmp
 
+#
+# The binary NL format uses native byte order. The "arith" field of
+# header line 6 tells ASL which byte order was used so that it can
+# detect (and swap) files read on a different architecture.
+#
+_native_arith = 1 if sys.byteorder == 'little' else 2
+_pack_int = struct.Struct('=i').pack
+_pack_int_int = struct.Struct('=ii').pack
+_pack_int_double = struct.Struct('=id').pack
+_pack_double = struct.Struct('=d').pack
+_max_int = 2**31 - 1
+if PY3:
+    def _to_bytes(s):
+        return s.encode('utf-8')
+else:
+    def _to_bytes(s):
+        return s
+
+class _BinaryTemplate(object):
+    """
+    The binary counterpart of an expression node template: formatting
+    it with the % operator packs the arguments (native ints and
+    doubles, as given by fmt) after a fixed prefix.
+    """
+
+    __slots__ = ('prefix', 'pack')
+
+    def __init__(self, prefix, fmt):
+        self.prefix = prefix
+        self.pack = struct.Struct('='+fmt).pack
+
+    def __mod__(self, args):
+        if args.__class__ is not tuple:
+            args = (args,)
+        return self.prefix + self.pack(*args)
+
+class _BinaryStringTemplate(object):
+    """
+    The binary counterpart of the string argument template "h%d:%s":
+    the length as a native int followed by the characters.
+    """
+
+    __slots__ = ()
+
+    def __mod__(self, args):
+        length, string = args
+        return b'h' + _pack_int(length) + _to_bytes(string)
+
+def _binary_op(opcode):
+    return b'o' + _pack_int(opcode)
+
+#
+# The binary versions of the expression node templates (NL comments are
+# not written to binary files)
+#
+_binary_op_string = {}
+if _using_pyomo4_trees:
+    _binary_op_string[expr._ProductExpression] = _binary_op(2)
+    _binary_op_string[expr._DivisionExpression] = _binary_op(3)
+else:
+    _binary_op_string[expr._ProductExpression] = (_binary_op(2),
+                                                  _binary_op(3))
+_binary_op_string[external._ExternalFunctionExpression] = \
+    (_BinaryTemplate(b'f', 'ii'), _BinaryStringTemplate())
+for opname in _intrinsic_function_operators:
+    _binary_op_string[opname] = \
+        _binary_op(int(_intrinsic_function_operators[opname][1:]))
+_binary_op_string[expr.Expr_if] = _binary_op(35)
+_binary_op_string[expr._InequalityExpression] = (_binary_op(21),
+                                                 _binary_op(22),
+                                                 _binary_op(23))
+_binary_op_string[expr._EqualityExpression] = _binary_op(24)
+_binary_op_string[var._VarData] = _BinaryTemplate(b'v', 'i')
+_binary_op_string[param._ParamData] = _BinaryTemplate(b'n', 'd')
+_binary_op_string[NumericConstant] = _BinaryTemplate(b'n', 'd')
+_binary_op_string[expr._SumExpression] = \
+    (_BinaryTemplate(_binary_op(54), 'i'),
+     _binary_op(0),
+     _BinaryTemplate(_binary_op(2) + b'n', 'd'))
+if _using_pyomo4_trees:
+    _binary_op_string[expr._LinearExpression] = \
+        _binary_op_string[expr._SumExpression]
+    _binary_op_string[expr._NegationExpression] = _binary_op(16)
+del opname
+
+#
+# Segment records. The text and binary functions take the same
+# arguments; the binary functions return the key character followed by
+# the packed values (strings are written as their length followed by
+# their characters).
+#
+
+def _binary_segment(key, values=(), name=None):
+    record = _to_bytes(key) + b''.join(_pack_int(v) for v in values)
+    if name is not None:
+        name = _to_bytes(name)
+        record += _pack_int(len(name)) + name
+    return record
+
+def _text_int_double_records(pairs):
+    return "".join("%d %r\n" % pair for pair in pairs)
+
+def _binary_int_double_records(pairs):
+    return b''.join(_pack_int_double(i, x) for i, x in pairs)
+
+def _binary_int_int_records(pairs):
+    return b''.join(_pack_int_int(i, int(x)) for i, x in pairs)
+
+def _text_bound(kind, *values):
+    return "%d" % (kind) + "".join(" %r" % (x,) for x in values) + "\n"
+
+def _binary_bound(kind, *values):
+    return _to_bytes("%d" % (kind)) + \
+        b''.join(_pack_double(x) for x in values)
+
+def _text_complementarity_bound(kind, vid):
+    return "5 {0} {1}\n".format(kind, vid)
+
+def _binary_complementarity_bound(kind, vid):
+    return b'5' + _pack_int_int(kind, vid)
+
+def _J_segment_entries(wrapped_ampl_repn, ampl_var_id):
+    """Return the (column, coefficient) entries of the "J" segment
+    of a constraint row."""
+    linear_dict = dict((var_ID, coef)
+                       for var_ID, coef in
+                       zip(wrapped_ampl_repn._linear_vars,
+                           wrapped_ampl_repn.repn._linear_terms_coef))
+    entries = [(ampl_var_id[con_var], linear_dict[con_var])
+               for con_var in sorted(linear_dict.keys())]
+    if len(wrapped_ampl_repn._nonlinear_vars):
+        nl_con_vars = sorted(
+            set(wrapped_ampl_repn._nonlinear_vars).difference(
+                wrapped_ampl_repn._linear_vars))
+        entries.extend((ampl_var_id[con_var], 0)
+                       for con_var in nl_con_vars)
+    return entries
+
+def _J_segment_text(nc, wrapped_ampl_repn, ampl_var_id):
+    """Return the text of the "J" segment for constraint row nc."""
+    entries = _J_segment_entries(wrapped_ampl_repn, ampl_var_id)
+    if not entries:
+        return ""
+    return "J%d %d\n" % (nc, len(entries)) + \
+        _text_int_double_records(entries)
+
+def _J_segment_binary(nc, wrapped_ampl_repn, ampl_var_id):
+    """Return the binary "J" segment for constraint row nc."""
+    entries = _J_segment_entries(wrapped_ampl_repn, ampl_var_id)
+    if not entries:
+        return b""
+    return _binary_segment('J', (nc, len(entries))) + \
+        _binary_int_double_records(entries)
+
+#
+# State shared with the worker processes that build the "C" and "J"
+# segment text when the parallel_workers io_option is used. The pool
+# is forked after this is set, so the workers inherit the model and
+# the writer's variable and constraint numbering without having to
+# pickle any of it. Only the segment text is sent back.
+#
+_parallel_state = None
+
+#
+# The model revision (see _model_revision()) and symbol map of the last
+# NL file written for each model.  The symbol map is returned again when
+# a model that has not changed is rewritten with the same symbols and
+# the map is no longer registered with the model (which preserves the
+# symbol index the map may have built on demand).
+#
+_last_symbol_maps = weakref.WeakKeyDictionary()
+
+def _model_revision(model):
+    """
+    Return a key that changes when components are added to, removed
+    from, activated or deactivated in the model (see _StructureRevision),
+    or when the data of its Var, Objective or Constraint components
+    change.
+    """
+    return (_StructureRevision.value,) + tuple(
+        (id(comp._data), getattr(comp._data, 'revision', len(comp._data)))
+        for comp in model.component_objects((Var, Objective, Constraint),
+                                            descend_into=True))
+
+class _TextCollector(object):
+    """A minimal output stream that collects the strings written to
+    it."""
+
+    def __init__(self):
+        self.parts = []
+        self.write = self.parts.append
+        self.writelines = self.parts.extend
+
+def _nonlinear_expression_chunk(chunk):
+    writer, nonlinear_exprs, constraint_repns = _parallel_state
+    start, stop = chunk
+    writer._OUTPUT = collector = _TextCollector()
+    join = (b"" if writer._binary else "").join
+    result = []
+    for i in xrange(start, stop):
+        writer._print_nonlinear_terms_NL(nonlinear_exprs[i])
+        result.append(join(collector.parts))
+        del collector.parts[:]
+    return result
+
+def _J_segment_chunk(chunk):
+    writer, nonlinear_exprs, constraint_repns = _parallel_state
+    start, stop = chunk
+    ampl_var_id = writer.ampl_var_id
+    if writer._binary:
+        return b"".join(_J_segment_binary(nc,
+                                          constraint_repns[nc],
+                                          ampl_var_id)
+                        for nc in xrange(start, stop))
+    return "".join(_J_segment_text(nc, constraint_repns[nc], ampl_var_id)
+                   for nc in xrange(start, stop))
+
+def _chunk_ranges(n, chunk_size):
+    return [(i, min(i+chunk_size, n)) for i in xrange(0, n, chunk_size)]
+
 class ModelSOS(object):
 
     class AmplSuffix(object):
@@ -248,6 +474,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._ampl_obj_id = {}
         self._OUTPUT = None
         self._varID_map = None
+        self._binary = False
+        self._nl_comments = False
+        self._parallel_workers = 0
+        self._parallel_chunk_size = 1000
+        self._worker_pool = None
         AbstractProblemWriter.__init__(self, ProblemFormat.nl)
 
     def __call__(self,
@@ -300,6 +531,27 @@ class ProblemWriter_nl(AbstractProblemWriter):
         include_all_variable_bounds = \
             io_options.pop("include_all_variable_bounds", False)
 
+        # Write the binary ('b' format) variant of the NL file
+        # rather than the text ('g' format) variant. The binary
+        # format is smaller and faster for ASL to read, but it is
+        # not human readable (no nl comments are written).
+        binary = io_options.pop("binary", False)
+
+        # The number of worker processes used to build the text of
+        # the nonlinear constraint expressions ("C" segments) and the
+        # Jacobian ("J" segments). The constraints are split into
+        # chunks of parallel_chunk_size rows and the results are
+        # joined in row order, so the file is identical to the one
+        # written serially. The default (0) writes everything in
+        # this process. Requires a platform that supports fork.
+        parallel_workers = io_options.pop("parallel_workers", 0)
+        parallel_chunk_size = io_options.pop("parallel_chunk_size", 1000)
+
+        # The maximum number of representations kept in the repn cache
+        # of each block (see pyomo.repn.repn_cache); None uses
+        # RepnCache.default_capacity.
+        repn_cache_capacity = io_options.pop("repn_cache_capacity", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_nl passed unrecognized io_options:\n\t" +
@@ -311,46 +563,70 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # Generate the operator strings templates. The value of
         # symbolic_solver_labels determines whether or not to
         # include "nl comments" (the equivalent AMPL functionality
-        # is "option nl_comments 1").
-        self._op_string = {}
-        for optype in _op_template:
-            template_str = _op_template[optype]
-            comment_str = _op_comment[optype]
-            if type(template_str) is tuple:
-                op_strings = []
-                for i in xrange(len(template_str)):
-                    if symbolic_solver_labels:
-                        op_strings.append(template_str[i].format(C=comment_str[i]))
-                    else:
-                        op_strings.append(template_str[i].format(C=""))
-                self._op_string[optype] = tuple(op_strings)
-            else:
-                if symbolic_solver_labels:
-                    self._op_string[optype] = template_str.format(C=comment_str)
+        # is "option nl_comments 1"). Binary files have no comments.
+        nl_comments = symbolic_solver_labels and (not binary)
+        if binary:
+            self._op_string = dict(_binary_op_string)
+        else:
+            self._op_string = {}
+            for optype in _op_template:
+                template_str = _op_template[optype]
+                comment_str = _op_comment[optype]
+                if type(template_str) is tuple:
+                    op_strings = []
+                    for i in xrange(len(template_str)):
+                        if nl_comments:
+                            op_strings.append(template_str[i].format(C=comment_str[i]))
+                        else:
+                            op_strings.append(template_str[i].format(C=""))
+                    self._op_string[optype] = tuple(op_strings)
                 else:
-                    self._op_string[optype] = template_str.format(C="")
+                    if nl_comments:
+                        self._op_string[optype] = template_str.format(C=comment_str)
+                    else:
+                        self._op_string[optype] = template_str.format(C="")
 
         # making these attributes so they do not need to be
         # passed into _print_nonlinear_terms_NL
         self._symbolic_solver_labels = symbolic_solver_labels
+        self._nl_comments = nl_comments
         self._output_fixed_variable_bounds = output_fixed_variable_bounds
+        self._binary = binary
+        if parallel_workers and (not hasattr(os, 'fork')):
+            logger.warning(
+                "ProblemWriter_nl: the parallel_workers option requires "
+                "a platform that supports fork; writing serially.")
+            parallel_workers = 0
+        if parallel_chunk_size < 1:
+            raise ValueError(
+                "ProblemWriter_nl: parallel_chunk_size must be a "
+                "positive integer (got %s)" % (parallel_chunk_size,))
+        self._parallel_workers = parallel_workers
+        self._parallel_chunk_size = parallel_chunk_size
         # Speeds up calling cname on every component when
         # writing .row and .col files (when symbolic_solver_labels is True)
         self._name_labeler = NameLabeler()
 
         # Pause the GC for the duration of this method
         with PauseGC() as pgc:
-            with open(filename,"w") as f:
+            with open(filename,"wb" if binary else "w") as f:
                 self._OUTPUT = f
-                symbol_map = self._print_model_NL(
-                    model,
-                    solver_capability,
-                    show_section_timing=show_section_timing,
-                    skip_trivial_constraints=skip_trivial_constraints,
-                    file_determinism=file_determinism,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                try:
+                    symbol_map = self._print_model_NL(
+                        model,
+                        solver_capability,
+                        show_section_timing=show_section_timing,
+                        skip_trivial_constraints=skip_trivial_constraints,
+                        file_determinism=file_determinism,
+                        include_all_variable_bounds=include_all_variable_bounds,
+                        repn_cache_capacity=repn_cache_capacity)
+                finally:
+                    self._close_worker_pool()
 
         self._symbolic_solver_labels = False
+        self._nl_comments = False
+        self._binary = False
+        self._parallel_workers = 0
         self._output_fixed_variable_bounds = False
         self._name_labeler = None
 
@@ -359,6 +635,28 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._op_string = None
         return filename, symbol_map
 
+    def _open_worker_pool(self, nonlinear_exprs, constraint_repns):
+        global _parallel_state
+        import multiprocessing
+        _parallel_state = (self, nonlinear_exprs, constraint_repns)
+        try:
+            if PY3:
+                self._worker_pool = multiprocessing.get_context('fork').Pool(
+                    self._parallel_workers)
+            else:
+                self._worker_pool = multiprocessing.Pool(
+                    self._parallel_workers)
+        finally:
+            # the workers have their own copy of the state
+            _parallel_state = None
+        return self._worker_pool
+
+    def _close_worker_pool(self):
+        if self._worker_pool is not None:
+            self._worker_pool.terminate()
+            self._worker_pool.join()
+            self._worker_pool = None
+
     def _get_bound(self, exp):
         if exp is None:
             return None
@@ -495,7 +793,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     OUTPUT.write(self._op_string[NumericConstant]
                                  % (exp._coef))
                 if len(exp._numerator) == 0:
-                    OUTPUT.write("n1\n")
+                    OUTPUT.write(self._op_string[NumericConstant] % (1))
                 # print out the numerator
                 child_counter = 0
                 max_count = len(exp._numerator)-1
@@ -542,7 +840,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             elif exp_type is external._ExternalFunctionExpression:
                 fun_str, string_arg_str = \
                     self._op_string[external._ExternalFunctionExpression]
-                if not self._symbolic_solver_labels:
+                if not self._nl_comments:
                     OUTPUT.write(fun_str
                                  % (self.external_byFcn[exp._fcn._function][1],
                                     len(exp._args)))
@@ -611,7 +909,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
         elif isinstance(exp,var._VarData) and (not exp.is_fixed()):
             #(self._output_fixed_variable_bounds or
-            if not self._symbolic_solver_labels:
+            if not self._nl_comments:
                 OUTPUT.write(self._op_string[var._VarData]
                              % (self.ampl_var_id[self._varID_map[id(exp)]]))
             else:
@@ -634,10 +932,19 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         show_section_timing=False,
                         skip_trivial_constraints=False,
                         file_determinism=1,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        repn_cache_capacity=None):
 
         output_fixed_variable_bounds = self._output_fixed_variable_bounds
         symbolic_solver_labels = self._symbolic_solver_labels
+        nl_comments = self._nl_comments
+        binary = self._binary
+        if binary:
+            bound_record = _binary_bound
+            complementarity_record = _binary_complementarity_bound
+        else:
+            bound_record = _text_bound
+            complementarity_record = _text_complementarity_bound
 
         sorter = SortComponents.unsorted
         if file_determinism >= 1:
@@ -656,8 +963,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
         overall_timer = StopWatch()
         subsection_timer = StopWatch()
 
-        # create the symbol_map
-        symbol_map = SymbolMap()
+        # the symbol_map is created once the objectives, constraints
+        # and variables are numbered
+        numbered_objectives = []
 
         name_labeler = self._name_labeler
 
@@ -747,6 +1055,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if not hasattr(block,'_ampl_repn'):
                 block._ampl_repn = ComponentMap()
             block_ampl_repn = block._ampl_repn
+            block_repn_cache = ampl_repn_cache(block, repn_cache_capacity)
 
             for active_objective in block.component_data_objects(Objective,
                                                                  active=True,
@@ -754,7 +1063,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                                                  descend_into=False):
 
                 if gen_obj_ampl_repn:
-                    ampl_repn = generate_ampl_repn(active_objective.expr)
+                    ampl_repn = block_repn_cache.get(active_objective,
+                                                     active_objective.expr)
                     block_ampl_repn[active_objective] = ampl_repn
                 else:
                     ampl_repn = block_ampl_repn[active_objective]
@@ -773,7 +1083,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 obj_ID = trivial_labeler(active_objective)
                 Objectives_dict[obj_ID] = (active_objective, wrapped_ampl_repn)
                 self_ampl_obj_id[obj_ID] = n_objs
-                symbol_map.addSymbols([(active_objective, "o%d"%n_objs)])
+                numbered_objectives.append(active_objective)
 
                 n_objs += 1
                 if ampl_repn.is_nonlinear():
@@ -787,8 +1097,6 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 "The NL writer has detected multiple active objective functions "
                 "on model %s, but currently only handles a single objective."
                 % (model.cname(True)))
-        elif n_objs == 1:
-            symbol_map.alias(symbol_map.bySymbol["o0"](),"__default_objective__")
 
         if show_section_timing:
             subsection_timer.report("Generate objective representation")
@@ -823,6 +1131,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if not hasattr(block,'_ampl_repn'):
                 block._ampl_repn = ComponentMap()
             block_ampl_repn = block._ampl_repn
+            block_repn_cache = ampl_repn_cache(block, repn_cache_capacity)
+            block_repn_cache.prune()
 
             # Initializing the constraint dictionary
             for constraint_data in block.component_data_objects(Constraint,
@@ -830,8 +1140,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                                                 sort=sorter,
                                                                 descend_into=False):
 
-                if gen_con_ampl_repn:
-                    ampl_repn = generate_ampl_repn(constraint_data.body)
+                if isinstance(constraint_data, LinearCanonicalRepn):
+                    ampl_repn = generate_ampl_repn(constraint_data)
+                elif gen_con_ampl_repn:
+                    ampl_repn = block_repn_cache.get(constraint_data,
+                                                     constraint_data.body)
                     block_ampl_repn[constraint_data] = ampl_repn
                 else:
                     ampl_repn = block_ampl_repn[constraint_data]
@@ -880,7 +1193,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 if not _type is None:
                     _vid = self_varID_map[_vid]+1
                     constraint_bounds_dict[con_ID] = \
-                        "5 {0} {1}\n".format(_type, _vid)
+                        complementarity_record(_type, _vid)
                     if _type == 1 or _type == 2:
                         n_single_sided_ineq += 1
                     elif _type == 3:
@@ -895,17 +1208,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if L == U:
                         if L is None:
                             # No constraint on body
-                            constraint_bounds_dict[con_ID] = "3\n"
+                            constraint_bounds_dict[con_ID] = bound_record(3)
                             n_unbounded += 1
                         else:
                             constraint_bounds_dict[con_ID] = \
-                                "4 %r\n" % (L-offset)
+                                bound_record(4, L-offset)
                             n_equals += 1
                     elif L is None:
-                        constraint_bounds_dict[con_ID] = "1 %r\n" % (U-offset)
+                        constraint_bounds_dict[con_ID] = bound_record(1, U-offset)
                         n_single_sided_ineq += 1
                     elif U is None:
-                        constraint_bounds_dict[con_ID] = "2 %r\n" % (L-offset)
+                        constraint_bounds_dict[con_ID] = bound_record(2, L-offset)
                         n_single_sided_ineq += 1
                     elif (L > U):
                         msg = 'Constraint {0}: lower bound greater than upper' \
@@ -913,7 +1226,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         raise ValueError(msg.format(con_ID, str(L), str(U)))
                     else:
                         constraint_bounds_dict[con_ID] = \
-                            "0 %r %r\n" % (L-offset, U-offset)
+                            bound_record(0, L-offset, U-offset)
                         # double sided inequality
                         # both are not none and they are valid
                         n_ranges += 1
@@ -937,10 +1250,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self_ampl_con_id.update(
             (con_ID,row_id) for row_id,con_ID in \
             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list)))
-        # populate the symbol_map
-        symbol_map.addSymbols(
-            [(Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
-             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))])
+        numbered_constraints = [
+            Constraints_dict[con_ID][0] for con_ID in \
+            itertools.chain(nonlin_con_order_list,lin_con_order_list)]
 
         if show_section_timing:
             subsection_timer.report("Generate constraint representations")
@@ -1040,9 +1352,31 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # create the ampl variable column ids
         self_ampl_var_id.update((var_ID,column_id)
                                 for column_id,var_ID in enumerate(full_var_list))
-        # populate the symbol_map
-        symbol_map.addSymbols([(Vars_dict[var_ID],"v%d"%column_id)
-                               for column_id,var_ID in enumerate(full_var_list)])
+        numbered = (('o', numbered_objectives),
+                    ('c', numbered_constraints),
+                    ('v', [Vars_dict[var_ID] for var_ID in full_var_list]))
+        # create the symbol_map (or reuse the symbol map of the last
+        # write if the model has not changed and the symbols match).
+        # Symbol maps are registered with the model by id, so a map
+        # is only reused once it is no longer registered (i.e., the
+        # results of the last write have been loaded).
+        revision = _model_revision(model)
+        last = _last_symbol_maps.get(model, None)
+        registered = getattr(getattr(model, 'solutions', None),
+                             'symbol_map', None)
+        if last is not None and last[0] == revision and \
+           (registered is not None) and \
+           (id(last[1]) not in registered) and \
+           last[1].hasNumberedSymbols(numbered):
+            symbol_map = last[1]
+        else:
+            symbol_map = IntegerSymbolMap()
+            for prefix, objs in numbered:
+                symbol_map.addNumberedSymbols(prefix, objs)
+            if n_objs == 1:
+                symbol_map.alias(numbered_objectives[0],
+                                 "__default_objective__")
+            _last_symbol_maps[model] = (revision, symbol_map)
 
         if show_section_timing:
             subsection_timer.report("Partition variable types")
@@ -1115,13 +1449,30 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # Print Header
         #
+        # The header lines are text in both the text and binary
+        # formats
+        #
+        if binary:
+            write_header = lambda line: OUTPUT.write(_to_bytes(line))
+            def write_segment(key, values=(), comment=None):
+                OUTPUT.write(_binary_segment(key, values))
+        else:
+            write_header = OUTPUT.write
+            def write_segment(key, values=(), comment=None):
+                OUTPUT.write(key + " ".join("%d" % v for v in values))
+                if nl_comments and (comment is not None):
+                    OUTPUT.write("\t#" + comment)
+                OUTPUT.write("\n")
+        #
         # LINE 1
         #
-        OUTPUT.write("g3 1 1 0\t# problem {0}\n".format(model.cname()))
+        write_header("{0}3 1 1 0\t# problem {1}\n".format(
+            'b' if binary else 'g',
+            model.cname()))
         #
         # LINE 2
         #
-        OUTPUT.write(" {0} {1} {2} {3} {4} \t# vars, constraints, "
+        write_header(" {0} {1} {2} {3} {4} \t# vars, constraints, "
                      "objectives, ranges, eqns\n" .format(
                          len(full_var_list),
                          n_single_sided_ineq + n_ranges+n_equals+n_unbounded,
@@ -1131,7 +1482,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 3
         #
-        OUTPUT.write(" {0} {1} {2} {3} {4} {5}\t# nonlinear constrs, "
+        write_header(" {0} {1} {2} {3} {4} {5}\t# nonlinear constrs, "
                      "objs; ccons: lin, nonlin, nd, nzlb\n".format(
                          n_nonlinear_constraints,
                          n_nonlinear_objs,
@@ -1142,11 +1493,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 4
         #
-        OUTPUT.write(" 0 0\t# network constraints: nonlinear, linear\n")
+        write_header(" 0 0\t# network constraints: nonlinear, linear\n")
         #
         # LINE 5
         #
-        OUTPUT.write(" {0} {1} {2} \t# nonlinear vars in constraints, "
+        write_header(" {0} {1} {2} \t# nonlinear vars in constraints, "
                      "objectives, both\n".format(
                          idx_nl_con,
                          idx_nl_obj,
@@ -1155,15 +1506,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 6
         #
-        OUTPUT.write(" 0 {0} 0 1\t# linear network variables; functions; "
-                     "arith, flags\n".format(len(self.external_byFcn)))
+        write_header(" 0 {0} {1} 1\t# linear network variables; functions; "
+                     "arith, flags\n".format(
+                         len(self.external_byFcn),
+                         _native_arith if binary else 0))
         #
         # LINE 7
         #
         n_int_nonlinear_b = len(Discrete_Nonlinear_Vars_in_Objs_and_Constraints)
         n_int_nonlinear_c = len(ConNonlinearVarsInt)
         n_int_nonlinear_o = len(ObjNonlinearVarsInt)
-        OUTPUT.write(" {0} {1} {2} {3} {4} \t# discrete variables: binary, "
+        write_header(" {0} {1} {2} {3} {4} \t# discrete variables: binary, "
                      "integer, nonlinear (b,c,o)\n".format(
                          len(LinearVarsBool),
                          len(LinearVarsInt),
@@ -1174,17 +1527,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # LINE 8
         #
         # objective info computed above
-        OUTPUT.write(" {0} {1} \t# nonzeros in Jacobian, obj. gradient\n".format(
+        write_header(" {0} {1} \t# nonzeros in Jacobian, obj. gradient\n".format(
             nnz_grad_constraints,
             len(ObjVars)))
         #
         # LINE 9
         #
-        OUTPUT.write(" 0 0\t# max name lengths: constraints, variables\n")
+        write_header(" 0 0\t# max name lengths: constraints, variables\n")
         #
         # LINE 10
         #
-        OUTPUT.write(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n")
+        write_header(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n")
 
 #        end_time = time.clock()
 #        print (end_time - start_time)
@@ -1198,7 +1551,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         for fcn, fid in sorted(itervalues(self.external_byFcn),
                                key=operator.itemgetter(1)):
-            OUTPUT.write("F%d 1 -1 %s\n" % (fid, fcn._function))
+            if binary:
+                OUTPUT.write(_binary_segment('F', (fid, 1, -1), fcn._function))
+            else:
+                OUTPUT.write("F%d 1 -1 %s\n" % (fid, fcn._function))
 
         #
         # "S" lines
@@ -1228,6 +1584,19 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # Translate the rest of the Pyomo Suffix components
         suffix_header_line = "S{0} {1} {2}\n"
         suffix_line = "{0} {1!r}\n"
+        def write_suffix(kind, name, entries):
+            # entries are the (index, value) pairs in the order written
+            if binary:
+                OUTPUT.write(_binary_segment('S', (kind, len(entries)), name))
+                if kind & 4:
+                    OUTPUT.write(_binary_int_double_records(entries))
+                else:
+                    OUTPUT.write(_binary_int_int_records(entries))
+            else:
+                OUTPUT.write(suffix_header_line.format(kind,
+                                                       len(entries),
+                                                       name))
+                OUTPUT.writelines(suffix_line.format(*_l) for _l in entries)
         var_tag = 0
         con_tag = 1
         obj_tag = 2
@@ -1240,11 +1609,18 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if not ('sosno' in suffix_dict):
             # We still need to write out the SOSConstraint suffixes
             # even though these may have not been "declared" on the model
-            s_lines = var_sosno_suffix.genfilelines()
-            len_s_lines = len(s_lines)
-            if len_s_lines > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'sosno'))
-                OUTPUT.writelines(s_lines)
+            if binary:
+                entries = [(idx, val) for idx, val in
+                           zip(var_sosno_suffix.ids, var_sosno_suffix.vals)
+                           if val != 0]
+                if len(entries) > 0:
+                    write_suffix(var_tag, 'sosno', entries)
+            else:
+                s_lines = var_sosno_suffix.genfilelines()
+                len_s_lines = len(s_lines)
+                if len_s_lines > 0:
+                    OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'sosno'))
+                    OUTPUT.writelines(s_lines)
         else:
             # I am choosing not to allow a user to mix the use of the Pyomo
             # SOSConstraint component and manual sosno declarations within
@@ -1267,11 +1643,18 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if not ('ref' in suffix_dict):
             # We still need to write out the SOSConstraint suffixes
             # even though these may have not been "declared" on the model
-            s_lines = var_ref_suffix.genfilelines()
-            len_s_lines = len(s_lines)
-            if len_s_lines > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'ref'))
-                OUTPUT.writelines(s_lines)
+            if binary:
+                entries = [(idx, val) for idx, val in
+                           zip(var_ref_suffix.ids, var_ref_suffix.vals)
+                           if val != 0]
+                if len(entries) > 0:
+                    write_suffix(var_tag, 'ref', entries)
+            else:
+                s_lines = var_ref_suffix.genfilelines()
+                len_s_lines = len(s_lines)
+                if len_s_lines > 0:
+                    OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'ref'))
+                    OUTPUT.writelines(s_lines)
         else:
             # see reason (1) in the paragraph above for why we raise this
             # exception (replacing sosno with ref).
@@ -1330,28 +1713,19 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
             ################## vars
             if len(var_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag | float_tag,
-                                                       len(var_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(var_s_lines,
-                                                   key=operator.itemgetter(0)))
+                write_suffix(var_tag | float_tag,
+                             suffix_name,
+                             sorted(var_s_lines, key=operator.itemgetter(0)))
             ################## constraints
             if len(con_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(con_tag | float_tag,
-                                                       len(con_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(con_s_lines,
-                                                   key=operator.itemgetter(0)))
+                write_suffix(con_tag | float_tag,
+                             suffix_name,
+                             sorted(con_s_lines, key=operator.itemgetter(0)))
             ################## objectives
             if len(obj_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(obj_tag | float_tag,
-                                                       len(obj_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(obj_s_lines,
-                                                   key=operator.itemgetter(0)))
+                write_suffix(obj_tag | float_tag,
+                             suffix_name,
+                             sorted(obj_s_lines, key=operator.itemgetter(0)))
             ################## problems (in this case the one problem)
             if len(mod_s_lines) > 0:
                 if len(mod_s_lines) > 1:
@@ -1359,12 +1733,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         "ProblemWriter_nl: Collected multiple values for Suffix %s "
                         "referencing model %s. This is likely a bug."
                         % (suffix_name, model.cname(True)))
-                OUTPUT.write(suffix_header_line.format(prob_tag | float_tag,
-                                                       len(mod_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(mod_s_lines,
-                                                   key=operator.itemgetter(0)))
+                write_suffix(prob_tag | float_tag,
+                             suffix_name,
+                             sorted(mod_s_lines, key=operator.itemgetter(0)))
 
         del modelSOS
 
@@ -1379,17 +1750,43 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if symbolic_solver_labels:
             rowf = open(rowfilename,'w')
 
+        nonlinear_expression_text = None
+        J_segment_text = None
+        if self._parallel_workers and len(Constraints_dict):
+            nonlinear_exprs = [
+                Constraints_dict[con_ID][1].repn._nonlinear_expr
+                for con_ID in nonlin_con_order_list]
+            constraint_repns = [
+                Constraints_dict[con_ID][1]
+                for con_ID in itertools.chain(nonlin_con_order_list,
+                                              lin_con_order_list)]
+            pool = self._open_worker_pool(nonlinear_exprs, constraint_repns)
+            chunk_size = self._parallel_chunk_size
+            nonlinear_expression_text = itertools.chain.from_iterable(
+                pool.imap(_nonlinear_expression_chunk,
+                          _chunk_ranges(len(nonlinear_exprs), chunk_size)))
+            # the J segments are built while the segments in between
+            # are written
+            J_segment_text = pool.imap(
+                _J_segment_chunk,
+                _chunk_ranges(len(constraint_repns), chunk_size))
+            del nonlinear_exprs
+            del constraint_repns
+
         cu = [0 for i in xrange(len(full_var_list))]
         for con_ID in nonlin_con_order_list:
             con_data, wrapped_ampl_repn = Constraints_dict[con_ID]
             row_id = self_ampl_con_id[con_ID]
-            OUTPUT.write("C%d" % (row_id))
+            lbl = None
             if symbolic_solver_labels:
                 lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-            self._print_nonlinear_terms_NL(wrapped_ampl_repn.repn._nonlinear_expr)
+            write_segment('C', (row_id,), lbl)
+            if nonlinear_expression_text is None:
+                self._print_nonlinear_terms_NL(
+                    wrapped_ampl_repn.repn._nonlinear_expr)
+            else:
+                OUTPUT.write(next(nonlinear_expression_text))
 
             for var_ID in set(wrapped_ampl_repn._linear_vars).union(
                     wrapped_ampl_repn._nonlinear_vars):
@@ -1401,13 +1798,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
             con_vars = set(wrapped_ampl_repn._linear_vars)
             for var_ID in con_vars:
                 cu[self_ampl_var_id[var_ID]] += 1
-            OUTPUT.write("C%d" % (row_id))
+            lbl = None
             if symbolic_solver_labels:
                 lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-            OUTPUT.write("n0\n")
+            write_segment('C', (row_id,), lbl)
+            OUTPUT.write(self._op_string[NumericConstant] % (0))
 
         if show_section_timing:
             subsection_timer.report("Write NL header and suffix lines")
@@ -1422,12 +1818,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if not obj.is_minimizing():
                 k = 1
 
-            OUTPUT.write("O%d %d" % (self_ampl_obj_id[obj_ID], k))
+            lbl = None
             if symbolic_solver_labels:
                 lbl = name_labeler(obj)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
+            write_segment('O', (self_ampl_obj_id[obj_ID], k), lbl)
 
             if wrapped_ampl_repn.repn.is_linear():
                 OUTPUT.write(self._op_string[NumericConstant]
@@ -1469,13 +1864,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         pass
 
             if len(s_lines) > 0:
-                OUTPUT.write("d%d" % (len(s_lines)))
-                if symbolic_solver_labels:
-                    OUTPUT.write("\t# dual initial guess")
-                OUTPUT.write("\n")
-                OUTPUT.writelines(suffix_line.format(*_l)
-                                  for _l in sorted(s_lines,
-                                                   key=operator.itemgetter(0)))
+                write_segment('d', (len(s_lines),), " dual initial guess")
+                s_lines.sort(key=operator.itemgetter(0))
+                if binary:
+                    OUTPUT.write(_binary_int_double_records(s_lines))
+                else:
+                    OUTPUT.writelines(suffix_line.format(*_l)
+                                      for _l in s_lines)
 
         #
         # "x" lines
@@ -1486,7 +1881,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         for ampl_var_id, var_ID in enumerate(full_var_list):
             var = Vars_dict[var_ID]
             if var.value is not None:
-                x_init_list.append("%d %r\n" % (ampl_var_id, var.value))
+                x_init_list.append((ampl_var_id, var.value))
             if var.fixed:
                 if not output_fixed_variable_bounds:
                     raise ValueError(
@@ -1512,21 +1907,21 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 if U is not None:
                     Uv = value(U)
                     if Lv == Uv:
-                        var_bound_list.append("4 %r\n" % (Lv))
+                        var_bound_list.append(bound_record(4, Lv))
                     else:
-                        var_bound_list.append("0 %r %r\n" % (Lv, Uv))
+                        var_bound_list.append(bound_record(0, Lv, Uv))
                 else:
-                    var_bound_list.append("2 %r\n" % (Lv))
+                    var_bound_list.append(bound_record(2, Lv))
             elif U is not None:
-                var_bound_list.append("1 %r\n" % (value(U)))
+                var_bound_list.append(bound_record(1, value(U)))
             else:
-                var_bound_list.append("3\n")
+                var_bound_list.append(bound_record(3))
 
-        OUTPUT.write("x%d" % (len(x_init_list)))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t# initial guess")
-        OUTPUT.write("\n")
-        OUTPUT.writelines(x_init_list)
+        write_segment('x', (len(x_init_list),), " initial guess")
+        if binary:
+            OUTPUT.write(_binary_int_double_records(x_init_list))
+        else:
+            OUTPUT.write(_text_int_double_records(x_init_list))
         del x_init_list
 
         if show_section_timing:
@@ -1536,11 +1931,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "r" lines
         #
-        OUTPUT.write("r")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d ranges (rhs's)"
-                         % (len(nonlin_con_order_list) + len(lin_con_order_list)))
-        OUTPUT.write("\n")
+        write_segment('r', (),
+                      "%d ranges (rhs's)"
+                      % (len(nonlin_con_order_list) + len(lin_con_order_list)))
         # *NOTE: This iteration follows the assignment of the ampl_con_id
         OUTPUT.writelines(constraint_bounds_dict[con_ID]
                           for con_ID in itertools.chain(nonlin_con_order_list,
@@ -1553,11 +1946,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "b" lines
         #
-        OUTPUT.write("b")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d bounds (on variables)"
-                         % (len(var_bound_list)))
-        OUTPUT.write("\n")
+        write_segment('b', (),
+                      "%d bounds (on variables)" % (len(var_bound_list)))
         OUTPUT.writelines(var_bound_list)
         del var_bound_list
 
@@ -1570,14 +1960,22 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         ktot = 0
         n1 = len(full_var_list) - 1
-        OUTPUT.write("k%d" % (n1))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#intermediate Jacobian column lengths")
-        OUTPUT.write("\n")
+        write_segment('k', (n1,), "intermediate Jacobian column lengths")
         ktot = 0
         for i in xrange(n1):
             ktot += cu[i]
-            OUTPUT.write("%d\n"%(ktot))
+            if binary:
+                # The column offsets are written as native ints; ASL
+                # builds that read them wider cannot be checked here,
+                # so refuse anything that would not fit
+                if ktot > _max_int:
+                    raise ValueError(
+                        "The Jacobian of model %s has too many nonzeros "
+                        "(%d) for the binary NL format; use the text "
+                        "format instead." % (model.cname(True), ktot))
+                OUTPUT.write(_pack_int(ktot))
+            else:
+                OUTPUT.write("%d\n"%(ktot))
         del cu
 
         if show_section_timing:
@@ -1587,47 +1985,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "J" lines
         #
-        for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
-                                                    lin_con_order_list)):
-            con_data, wrapped_ampl_repn = Constraints_dict[con_ID]
-            num_nonlinear_vars = len(wrapped_ampl_repn._nonlinear_vars)
-            num_linear_vars = len(wrapped_ampl_repn._linear_vars)
-            if num_nonlinear_vars == 0:
-                if num_linear_vars > 0:
-                    linear_dict = dict((var_ID, coef)
-                                       for var_ID, coef in
-                                       zip(wrapped_ampl_repn._linear_vars,
-                                           wrapped_ampl_repn.repn._linear_terms_coef))
-                    OUTPUT.write("J%d %d\n"%(nc, num_linear_vars))
-                    OUTPUT.writelines(
-                        "%d %r\n" % (self_ampl_var_id[con_var],
-                                     linear_dict[con_var])
-                        for con_var in sorted(linear_dict.keys()))
-            elif num_linear_vars == 0:
-                nl_con_vars = \
-                    sorted(wrapped_ampl_repn._nonlinear_vars)
-                OUTPUT.write("J%d %d\n"%(nc, num_nonlinear_vars))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
-            else:
-                con_vars = set(wrapped_ampl_repn._nonlinear_vars)
-                nl_con_vars = sorted(
-                    con_vars.difference(
-                        wrapped_ampl_repn._linear_vars))
-                con_vars.update(wrapped_ampl_repn._linear_vars)
-                linear_dict = dict(
-                    (var_ID, coef) for var_ID, coef in
-                    zip(wrapped_ampl_repn._linear_vars,
-                        wrapped_ampl_repn.repn._linear_terms_coef))
-                OUTPUT.write("J%d %d\n"%(nc, len(con_vars)))
-                OUTPUT.writelines(
-                    "%d %r\n" % (self_ampl_var_id[con_var],
-                                 linear_dict[con_var])
-                    for con_var in sorted(linear_dict.keys()))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
+        if J_segment_text is None:
+            J_segment = _J_segment_binary if binary else _J_segment_text
+            for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
+                                                        lin_con_order_list)):
+                con_data, wrapped_ampl_repn = Constraints_dict[con_ID]
+                OUTPUT.write(J_segment(nc,
+                                       wrapped_ampl_repn,
+                                       self_ampl_var_id))
+        else:
+            OUTPUT.writelines(J_segment_text)
+            self._close_worker_pool()
 
 
         if show_section_timing:
@@ -1650,11 +2018,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     grad_entries[self_ampl_var_id[obj_var]] = 0
             len_ge = len(grad_entries)
             if len_ge > 0:
-                OUTPUT.write("G%d %d\n" % (self_ampl_obj_id[obj_ID],
-                                           len_ge))
-                for var_ID in sorted(grad_entries.keys()):
-                    OUTPUT.write("%d %r\n" % (var_ID,
-                                              grad_entries[var_ID]))
+                write_segment('G', (self_ampl_obj_id[obj_ID], len_ge))
+                grad_entries = sorted(iteritems(grad_entries))
+                if binary:
+                    OUTPUT.write(_binary_int_double_records(grad_entries))
+                else:
+                    OUTPUT.write(_text_int_double_records(grad_entries))
 
         if show_section_timing:
             subsection_timer.report("Write G lines")
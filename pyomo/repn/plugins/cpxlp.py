@@ -32,9 +32,37 @@ from pyomo.core.base import \
 from pyomo.repn import (generate_canonical_repn,
                         canonical_degree,
                         LinearCanonicalRepn)
+from pyomo.repn.repn_cache import canonical_repn_cache
 
 logger = logging.getLogger('pyomo.core')
 
+class _BlockWriter(object):
+    """
+    A file-like wrapper that collects the strings passed to write()
+    and forwards them to the underlying stream in blocks of at least
+    block_size characters.
+    """
+
+    __slots__ = ('_ostream', '_block_size', '_buffer', '_size')
+
+    def __init__(self, ostream, block_size):
+        self._ostream = ostream
+        self._block_size = block_size
+        self._buffer = []
+        self._size = 0
+
+    def write(self, data):
+        self._buffer.append(data)
+        self._size += len(data)
+        if self._size >= self._block_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._ostream.write(''.join(self._buffer))
+            del self._buffer[:]
+            self._size = 0
+
 
 class ProblemWriter_cpxlp(AbstractProblemWriter):
 
@@ -52,6 +80,12 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         # dictionary of id(_VarData)->_VarData.
         self._referenced_variable_ids = {}
 
+        # whether the terms of each row are sorted by variable
+        # symbol. set for each call based on the file_determinism
+        # option, and (as above) stored at the object level to avoid
+        # additional method arguments.
+        self._sort_terms = True
+
         # Keven Hunter made a nice point about using %.16g in his attachment
         # to ticket #4319. I am adjusting this to %.17g as this mocks the
         # behavior of using %r (i.e., float('%r'%<number>) == <number>) with
@@ -114,6 +148,18 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         force_objective_constant = \
             io_options.pop("force_objective_constant", False)
 
+        # If nonzero, collect the output in memory and write it to
+        # the file in blocks of (at least) this many characters
+        # rather than issuing one write per term.
+        output_buffer_size = \
+            io_options.pop("output_buffer_size", 0)
+
+        # The maximum number of representations kept in the repn cache
+        # of each block (see pyomo.repn.repn_cache); None uses
+        # RepnCache.default_capacity.
+        repn_cache_capacity = \
+            io_options.pop("repn_cache_capacity", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_cpxlp passed unrecognized io_options:\n\t" +
@@ -132,6 +178,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         # clear the collection of referenced variables.
         self._referenced_variable_ids.clear()
 
+        # without any determinism requirement, write the terms of
+        # each row in the order they appear in the canonical repn
+        self._sort_terms = (file_determinism >= 1)
+
         if output_filename is None:
             output_filename = model.name + ".lp"
 
@@ -143,6 +193,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         # immediately anyway.
         with PauseGC() as pgc:
             with open(output_filename, "w") as output_file:
+                if output_buffer_size:
+                    output_file = _BlockWriter(output_file,
+                                               output_buffer_size)
                 symbol_map = self._print_model_LP(
                     model,
                     output_file,
@@ -154,7 +207,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     column_order=column_order,
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    repn_cache_capacity=repn_cache_capacity)
+                if output_buffer_size:
+                    output_file.flush()
 
         self._referenced_variable_ids.clear()
 
@@ -216,7 +272,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     sorted_names = [(variable_symbol_dictionary[id(variables[i])],
                                      coefficients[i])
                                     for i in xrange(0,len(coefficients))]
-                    sorted_names.sort()
+                    if self._sort_terms:
+                        sorted_names.sort()
                 else:
                     sorted_names = [(variables[i], coefficients[i])
                                     for i in xrange(0,len(coefficients))]
@@ -224,8 +281,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     sorted_names = [(variable_symbol_dictionary[id(var)], coef)
                                     for var, coef in sorted_names]
 
-                for name, coef in sorted_names:
-                    output_file.write(linear_coef_string_template % (coef, name))
+                # build the row in memory and write it in one call
+                output_file.write(
+                    ''.join([linear_coef_string_template % (coef, name)
+                             for name, coef in sorted_names]))
 
             elif not is_objective:
                 # If we made it to here we are outputing
@@ -247,7 +306,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 sorted_names = [(variable_symbol_dictionary[id(var_hashes[var_hash])],
                                  var_coefficient)
                                 for var_hash, var_coefficient in iteritems(x[1])]
-                sorted_names.sort()
+                if self._sort_terms:
+                    sorted_names.sort()
             else:
                 sorted_names = [(var_hashes[var_hash], var_coefficient)
                                 for var_hash, var_coefficient in iteritems(x[1])]
@@ -255,8 +315,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 sorted_names = [(variable_symbol_dictionary[id(var)], coef)
                                 for var, coef in sorted_names]
 
-            for name, coef in sorted_names:
-                output_file.write(linear_coef_string_template % (coef, name))
+            output_file.write(
+                ''.join([linear_coef_string_template % (coef, name)
+                         for name, coef in sorted_names]))
 
         #
         # Quadratic
@@ -402,7 +463,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         column_order=None,
                         skip_trivial_constraints=False,
                         force_objective_constant=False,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        repn_cache_capacity=None):
 
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
@@ -485,6 +547,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
             if not hasattr(block,'_canonical_repn'):
                 block._canonical_repn = ComponentMap()
             block_canonical_repn = block._canonical_repn
+            block_repn_cache = canonical_repn_cache(
+                block, repn_cache_capacity)
 
             for objective_data in block.component_data_objects(
                     Objective,
@@ -512,7 +576,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
                 if gen_obj_canonical_repn:
                     canonical_repn = \
-                        generate_canonical_repn(objective_data.expr)
+                        block_repn_cache.get(objective_data,
+                                             objective_data.expr)
                     block_canonical_repn[objective_data] = canonical_repn
                 else:
                     canonical_repn = block_canonical_repn[objective_data]
@@ -579,6 +644,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 if not hasattr(block,'_canonical_repn'):
                     block._canonical_repn = ComponentMap()
                 block_canonical_repn = block._canonical_repn
+                block_repn_cache = canonical_repn_cache(
+                    block, repn_cache_capacity)
+                block_repn_cache.prune()
 
                 for constraint_data in block.component_data_objects(
                         Constraint,
@@ -590,7 +658,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         canonical_repn = constraint_data
                     else:
                         if gen_con_canonical_repn:
-                            canonical_repn = generate_canonical_repn(constraint_data.body)
+                            canonical_repn = block_repn_cache.get(
+                                constraint_data, constraint_data.body)
                             block_canonical_repn[constraint_data] = canonical_repn
                         else:
                             canonical_repn = block_canonical_repn[constraint_data]
@@ -833,36 +902,36 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
             # bounds are 0 and +inf.  These bounds are in
             # conflict with Pyomo, which assumes -inf and +inf
             # (which we would argue is more rational).
-            output_file.write("   ")
+            # build the bound line in memory and write it in one call
             if (vardata_lb is not None) and (vardata_lb != -infinity):
                 if vardata_lb != 0:
-                    output_file.write(lb_string_template % vardata_lb)
+                    lb_string = lb_string_template % vardata_lb
                 else:
                     # Make it harder for -0 to show up in
                     # the output. This makes file diffing
                     # for test baselines slightly less
                     # annoying
-                    output_file.write(lb_string_template % 0)
+                    lb_string = lb_string_template % 0
             else:
-                output_file.write(" -inf <= ")
+                lb_string = " -inf <= "
             if name_to_output == "e":
                 raise ValueError(
                     "Attempting to write variable with name 'e' in a CPLEX LP "
                     "formatted file will cause a parse failure due to confusion with "
                     "numeric values expressed in scientific notation")
 
-            output_file.write(name_to_output)
             if (vardata_ub is not None) and (vardata_ub != infinity):
                 if vardata_ub != 0:
-                    output_file.write(ub_string_template % vardata_ub)
+                    ub_string = ub_string_template % vardata_ub
                 else:
                     # Make it harder for -0 to show up in
                     # the output. This makes file diffing
                     # for test baselines slightly less
                     # annoying
-                    output_file.write(ub_string_template % 0)
+                    ub_string = ub_string_template % 0
             else:
-                output_file.write(" <= +inf\n")
+                ub_string = " <= +inf\n"
+            output_file.write("   " + lb_string + name_to_output + ub_string)
 
         if len(integer_vars) > 0:
 
@@ -11,6 +11,7 @@
 # Problem Writer for (Free) MPS Format Files
 #
 
+import array
 import logging
 import math
 import operator
@@ -32,9 +33,83 @@ from pyomo.core.base import \
 from pyomo.repn import (generate_canonical_repn,
                         canonical_degree,
                         LinearCanonicalRepn)
+from pyomo.repn.repn_cache import canonical_repn_cache
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 
 logger = logging.getLogger('pyomo.core')
 
+class _COOMatrix(object):
+    """
+    The linear coefficients of the MPS rows accumulated in coordinate
+    (COO) format: parallel arrays of row indices, column indices and
+    values along with the list of row labels.
+
+    The entries are appended in row order. column_pointers() returns
+    a stable column-major permutation of the entries (so the entries
+    of a column stay in row order) and the position where each column
+    starts within it.
+    """
+
+    __slots__ = ('row_labels', 'rows', 'cols', 'values')
+
+    def __init__(self):
+        self.row_labels = []
+        self.rows = array.array('i')
+        self.cols = array.array('i')
+        self.values = array.array('d')
+
+    def add_row(self, label):
+        self.row_labels.append(label)
+        return len(self.row_labels) - 1
+
+    def __len__(self):
+        return len(self.values)
+
+    def column_pointers(self, ncols):
+        """
+        Return (permutation, col_ptr) where the entries of column j are
+        at positions permutation[col_ptr[j]:col_ptr[j+1]].
+        """
+        cols = self.cols
+        if numpy_available:
+            if len(cols):
+                cols = numpy.frombuffer(cols, dtype=numpy.intc)
+            else:
+                cols = numpy.empty(0, dtype=numpy.intc)
+            permutation = numpy.argsort(cols, kind='mergesort')
+            col_ptr = numpy.zeros(ncols+1, dtype=numpy.int_)
+            numpy.cumsum(numpy.bincount(cols, minlength=ncols),
+                         out=col_ptr[1:])
+            return permutation, col_ptr.tolist()
+        permutation = sorted(xrange(len(cols)), key=cols.__getitem__)
+        col_ptr = [0]*(ncols+1)
+        for j in cols:
+            col_ptr[j+1] += 1
+        for j in xrange(ncols):
+            col_ptr[j+1] += col_ptr[j]
+        return permutation, col_ptr
+
+    def column_entries(self, permutation, start, stop):
+        """Return the (row label, value) pairs at positions start
+        through stop-1 of the permutation."""
+        row_labels = self.row_labels
+        if numpy_available:
+            index = permutation[start:stop]
+            rows = numpy.frombuffer(self.rows, dtype=numpy.intc)[index]
+            values = numpy.frombuffer(self.values,
+                                      dtype=numpy.float64)[index]
+            return zip([row_labels[i] for i in rows.tolist()],
+                       values.tolist())
+        rows = self.rows
+        values = self.values
+        return [(row_labels[rows[p]], values[p])
+                for p in permutation[start:stop]]
+
 class ProblemWriter_mps(AbstractProblemWriter):
 
     pyomo.util.plugin.alias('mps', 'Generate the corresponding MPS file')
@@ -119,6 +194,12 @@ class ProblemWriter_mps(AbstractProblemWriter):
         skip_objective_sense = \
             io_options.pop("skip_objective_sense", False)
 
+        # The maximum number of representations kept in the repn cache
+        # of each block (see pyomo.repn.repn_cache); None uses
+        # RepnCache.default_capacity.
+        repn_cache_capacity = \
+            io_options.pop("repn_cache_capacity", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_mps passed unrecognized io_options:\n\t" +
@@ -160,7 +241,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
                     include_all_variable_bounds=include_all_variable_bounds,
-                    skip_objective_sense=skip_objective_sense)
+                    skip_objective_sense=skip_objective_sense,
+                    repn_cache_capacity=repn_cache_capacity)
 
         self._referenced_variable_ids.clear()
 
@@ -177,7 +259,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
             self,
             row_label,
             canonical_repn,
-            column_data,
+            coo_matrix,
             quadratic_data,
             variable_to_column):
 
@@ -188,6 +270,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
             var_hashes = canonical_repn[-1]
 
         constant = None
+        row_index = coo_matrix.add_row(row_label)
         #
         # Linear
         #
@@ -196,13 +279,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
             coefficients = canonical_repn.linear
             if coefficients is not None:
                 variables = canonical_repn.variables
-
-                # the 99% case is when the input instance is a linear
-                # canonical expression, so the exception should be rare.
-                for vardata, coef in zip(variables, coefficients):
-                    self._referenced_variable_ids[id(vardata)] = vardata
-                    column_data[variable_to_column[vardata]].append(
-                        (row_label, coef))
+                referenced_variable_ids = self._referenced_variable_ids
+                for vardata in variables:
+                    referenced_variable_ids[id(vardata)] = vardata
+                coo_matrix.rows.extend([row_index]*len(variables))
+                coo_matrix.cols.extend([variable_to_column[vardata]
+                                        for vardata in variables])
+                coo_matrix.values.extend(coefficients)
         else:
             if 0 in canonical_repn:
                 constant = canonical_repn[0][None]
@@ -210,8 +293,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 for var_hash, coef in iteritems(canonical_repn[1]):
                     vardata = var_hashes[var_hash]
                     self._referenced_variable_ids[id(vardata)] = vardata
-                    column_data[variable_to_column[vardata]].append(
-                        (row_label, coef))
+                    coo_matrix.rows.append(row_index)
+                    coo_matrix.cols.append(variable_to_column[vardata])
+                    coo_matrix.values.append(coef)
             #
             # Quadratic
             #
@@ -276,7 +360,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                          skip_trivial_constraints=False,
                          force_objective_constant=False,
                          include_all_variable_bounds=False,
-                         skip_objective_sense=False):
+                         skip_objective_sense=False,
+                         repn_cache_capacity=None):
 
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
@@ -329,11 +414,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
         if column_order is not None:
             variable_list.sort(key=lambda _x: column_order[_x])
 
-        # prepare to hold the sparse columns
+        # prepare to hold the sparse matrix
         variable_to_column = ComponentMap(
             (vardata, i) for i, vardata in enumerate(variable_list))
-        # add one position for ONE_VAR_CONSTANT
-        column_data = [[] for i in xrange(len(variable_list)+1)]
+        # the column after the last variable is ONE_VAR_CONSTANT
+        one_var_constant_column = len(variable_list)
+        one_var_constant_used = False
+        coo_matrix = _COOMatrix()
         quadobj_data = []
         quadmatrix_data = []
         # constraint rhs
@@ -362,6 +449,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
             if not hasattr(block,'_canonical_repn'):
                 block._canonical_repn = ComponentMap()
             block_canonical_repn = block._canonical_repn
+            block_repn_cache = canonical_repn_cache(
+                block, repn_cache_capacity)
             for objective_data in block.component_data_objects(
                     Objective,
                     active=True,
@@ -396,7 +485,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
 
                 if gen_obj_canonical_repn:
                     canonical_repn = \
-                        generate_canonical_repn(objective_data.expr)
+                        block_repn_cache.get(objective_data,
+                                             objective_data.expr)
                     block_canonical_repn[objective_data] = canonical_repn
                 else:
                     canonical_repn = block_canonical_repn[objective_data]
@@ -415,12 +505,15 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 constant = extract_variable_coefficients(
                     objective_label,
                     canonical_repn,
-                    column_data,
+                    coo_matrix,
                     quadobj_data,
                     variable_to_column)
                 if force_objective_constant or (constant != 0.0):
                     # ONE_VAR_CONSTANT
-                    column_data[-1].append((objective_label, constant))
+                    coo_matrix.rows.append(len(coo_matrix.row_labels)-1)
+                    coo_matrix.cols.append(one_var_constant_column)
+                    coo_matrix.values.append(constant)
+                    one_var_constant_used = True
 
         if numObj == 0:
             raise ValueError(
@@ -439,6 +532,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 if not hasattr(block,'_canonical_repn'):
                     block._canonical_repn = ComponentMap()
                 block_canonical_repn = block._canonical_repn
+                block_repn_cache = canonical_repn_cache(
+                    block, repn_cache_capacity)
+                block_repn_cache.prune()
 
                 for constraint_data in block.component_data_objects(
                         Constraint,
@@ -450,8 +546,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         canonical_repn = constraint_data
                     else:
                         if gen_con_canonical_repn:
-                            canonical_repn = generate_canonical_repn(
-                                constraint_data.body)
+                            canonical_repn = block_repn_cache.get(
+                                constraint_data, constraint_data.body)
                             block_canonical_repn[constraint_data] = canonical_repn
                         else:
                             canonical_repn = block_canonical_repn[constraint_data]
@@ -493,7 +589,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 offset = extract_variable_coefficients(
                     label,
                     canonical_repn,
-                    column_data,
+                    coo_matrix,
                     quadmatrix_data,
                     variable_to_column)
                 bound = constraint_data.lower
@@ -510,7 +606,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     offset = extract_variable_coefficients(
                         label,
                         canonical_repn,
-                        column_data,
+                        coo_matrix,
                         quadmatrix_data,
                         variable_to_column)
                     bound = constraint_data.lower
@@ -526,17 +622,20 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     offset = extract_variable_coefficients(
                         label,
                         canonical_repn,
-                        column_data,
+                        coo_matrix,
                         quadmatrix_data,
                         variable_to_column)
                     bound = constraint_data.upper
                     bound = self._get_bound(bound) - offset
                     rhs_data.append((label, bound))
 
-        if len(column_data[-1]) > 0:
+        if one_var_constant_used:
             # ONE_VAR_CONSTANT = 1
             output_file.write(" E  c_e_ONE_VAR_CONSTANT\n")
-            column_data[-1].append(("c_e_ONE_VAR_CONSTANT",1))
+            coo_matrix.rows.append(
+                coo_matrix.add_row("c_e_ONE_VAR_CONSTANT"))
+            coo_matrix.cols.append(one_var_constant_column)
+            coo_matrix.values.append(1)
             rhs_data.append(("c_e_ONE_VAR_CONSTANT",1))
 
         #
@@ -544,16 +643,18 @@ class ProblemWriter_mps(AbstractProblemWriter):
         #
         column_template = "     %s %s %"+self._precision_string+"\n"
         output_file.write("COLUMNS\n")
-        cnt = 0
-        for vardata in variable_list:
-            col_entries = column_data[variable_to_column[vardata]]
-            cnt += 1
-            if len(col_entries) > 0:
+        permutation, col_ptr = \
+            coo_matrix.column_pointers(one_var_constant_column+1)
+        column_entries = coo_matrix.column_entries
+        for column, vardata in enumerate(variable_list):
+            start, stop = col_ptr[column], col_ptr[column+1]
+            if start < stop:
                 var_label = variable_symbol_dictionary[id(vardata)]
-                for i, (row_label, coef) in enumerate(col_entries):
-                    output_file.write(column_template % (var_label,
-                                                         row_label,
-                                                         coef))
+                output_file.writelines(
+                    column_template % (var_label, row_label, coef)
+                    for row_label, coef in column_entries(permutation,
+                                                          start,
+                                                          stop))
             elif include_all_variable_bounds:
                 # the column is empty, so add a (0 * var)
                 # term to the objective
@@ -567,14 +668,16 @@ class ProblemWriter_mps(AbstractProblemWriter):
                                                      objective_label,
                                                      0))
 
-        assert cnt == len(column_data)-1
-        if len(column_data[-1]) > 0:
-            col_entries = column_data[-1]
+        if one_var_constant_used:
             var_label = "ONE_VAR_CONSTANT"
-            for i, (row_label, coef) in enumerate(col_entries):
-                output_file.write(column_template % (var_label,
-                                                     row_label,
-                                                     coef))
+            output_file.writelines(
+                column_template % (var_label, row_label, coef)
+                for row_label, coef in column_entries(
+                    permutation,
+                    col_ptr[one_var_constant_column],
+                    col_ptr[one_var_constant_column+1]))
+        del permutation
+        del col_ptr
 
         #
         # RHS section
@@ -0,0 +1,317 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+
+__all__ = ('RepnCache', 'canonical_repn_cache', 'ampl_repn_cache')
+
+import collections
+import functools
+import weakref
+
+from pyomo.core.base import expr_coopr3, expr_pyomo4
+from pyomo.core.base.numvalue import native_numeric_types
+from pyomo.core.base.param import _ParamData
+from pyomo.core.base.var import _VarData
+from pyomo.core.base.expression import _ExpressionData
+from pyomo.repn.canonical_repn import generate_canonical_repn
+from pyomo.repn.ampl_repn import generate_ampl_repn
+
+_coopr3_SumExpression = expr_coopr3._SumExpression
+_coopr3_ProductExpression = expr_coopr3._ProductExpression
+_pyomo4_LinearExpression = expr_pyomo4._LinearExpression
+
+# The state recorded for a variable that is not fixed
+_unfixed = object()
+
+def _node_key(node):
+    if node.__class__ in native_numeric_types:
+        return node
+    return id(node)
+
+# The kinds of nodes distinguished by _expression_state()
+_OTHER_LEAF = 0
+_VAR = 1
+_PARAM = 2
+_NAMED_EXPRESSION = 3
+_COOPR3_PRODUCT = 4
+_COOPR3_SUM = 5
+_PYOMO4_LINEAR = 6
+_OTHER_EXPRESSION = 7
+
+_node_kinds = {}
+
+def _node_kind(node_class, node):
+    if isinstance(node, _VarData):
+        kind = _VAR
+    elif isinstance(node, _ParamData):
+        kind = _PARAM
+    elif not node.is_expression():
+        kind = _OTHER_LEAF
+    elif isinstance(node, _ExpressionData):
+        kind = _NAMED_EXPRESSION
+    elif node_class is _coopr3_ProductExpression:
+        kind = _COOPR3_PRODUCT
+    elif node_class is _coopr3_SumExpression:
+        kind = _COOPR3_SUM
+    elif node_class is _pyomo4_LinearExpression:
+        kind = _PYOMO4_LINEAR
+    else:
+        kind = _OTHER_EXPRESSION
+    _node_kinds[node_class] = kind
+    return kind
+
+#
+# Walk an expression and record everything a representation generated
+# from it can depend on: the structure of the tree (the identity of
+# each node's arguments and its coefficients), the values of mutable
+# parameters, the fixed status (and, when fixed, the value) of
+# variables and the expression held by each named expression.  Two
+# calls return equal states as long as the tree has not been modified
+# in place and none of those values changed.  The nodes visited are
+# appended to the nodes list, which keeps them (and thus their ids)
+# alive for as long as the state is kept.
+#
+def _expression_state(exp, nodes=None):
+    state = []
+    append = state.append
+    stack = [exp]
+    pop = stack.pop
+    while stack:
+        exp = pop()
+        exp_class = exp.__class__
+        if exp_class in native_numeric_types:
+            continue
+        if nodes is not None:
+            nodes.append(exp)
+        kind = _node_kinds.get(exp_class)
+        if kind is None:
+            kind = _node_kind(exp_class, exp)
+        if kind is _VAR:
+            append(exp.value if exp.fixed else _unfixed)
+            continue
+        elif kind is _PARAM:
+            append(exp.value)
+            continue
+        elif kind is _OTHER_LEAF:
+            continue
+        elif kind is _COOPR3_PRODUCT:
+            append(exp._coef)
+            append(len(exp._numerator))
+            args = exp._numerator + exp._denominator
+        elif kind is _COOPR3_SUM:
+            append(exp._const)
+            append(tuple(exp._coef))
+            args = exp._args
+        elif kind is _NAMED_EXPRESSION:
+            if exp.expr is None:
+                append(None)
+                continue
+            args = (exp.expr,)
+        elif kind is _PYOMO4_LINEAR:
+            coef = exp._coef
+            args = list(exp._args)
+            args.extend(coef[id(arg)] for arg in exp._args)
+            args.append(exp._const)
+        else:
+            args = exp._args
+        append(tuple([_node_key(arg) for arg in args]))
+        stack.extend(args)
+    return state
+
+#
+# The weakref callback of a cache entry: remove the entry when its
+# component is garbage collected.
+#
+def _remove_entry(entries, key, ref):
+    entry = entries.get(key)
+    if (entry is not None) and (entry.component is ref):
+        del entries[key]
+
+class _RepnCacheEntry(object):
+
+    __slots__ = ('component', 'expr', 'nodes', 'state', 'repn')
+
+    def __init__(self, component, exp, repn, entries):
+        key = id(component)
+        self.component = weakref.ref(
+            component, functools.partial(_remove_entry, entries, key))
+        self.expr = exp
+        self.nodes = []
+        self.state = _expression_state(exp, self.nodes)
+        self.repn = repn
+
+    def is_current(self, exp):
+        return (exp is self.expr) and \
+            (_expression_state(exp) == self.state)
+
+class RepnCache(object):
+    """
+    A cache of the representations generated for the constraint and
+    objective data on a block.
+
+    Each entry records the expression the representation was generated
+    from along with its state: the structure of the expression tree,
+    the values of the mutable Param data and the fixed status (and
+    fixed values) of the Var data it contains, and the expressions held
+    by the named Expression data it contains.  An entry is reused as
+    long as the expression object and its state are unchanged, so
+    changes made to the tree in place (e.g., scaling a sum) are
+    detected as well; otherwise the representation is regenerated.
+
+    Entries hold weak references to their components and are dropped
+    when a component is garbage collected; prune() drops the entries
+    of components that were removed from the model or deactivated but
+    are still referenced elsewhere.  When a capacity is given, the
+    least recently used entries are evicted once the cache holds more
+    than capacity entries.  Since the writers visit the rows in the
+    same order on every write, a capacity smaller than the number of
+    rows on a block means that no representation is reused.
+
+    Constructor arguments:
+        generate        The function used to generate a representation
+                            from an expression
+        capacity        The maximum number of cached entries (default
+                            None, which does not limit the cache size)
+    """
+
+    # The capacity of the caches created by canonical_repn_cache() and
+    # ampl_repn_cache() (i.e., by the problem writers) unless the
+    # 'repn_cache_capacity' I/O option is given
+    default_capacity = 100000
+
+    def __init__(self, generate, capacity=None):
+        self._generate = generate
+        self.capacity = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self.set_capacity(capacity)
+
+    def __getstate__(self):
+        """
+        This method must be defined for deepcopy/pickling because this
+        class relies on Python ids.  Cached entries are not preserved.
+        """
+        return {'_generate': self._generate,
+                'capacity': self.capacity,
+                'hits': 0,
+                'misses': 0}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, component):
+        entry = self._entries.get(id(component))
+        return (entry is not None) and (entry.component() is component)
+
+    def set_capacity(self, capacity):
+        """
+        Change the maximum number of cached entries (None does not
+        limit the cache size), evicting the least recently used
+        entries if the cache holds more than capacity entries.
+        """
+        if (capacity is not None) and (capacity < 1):
+            raise ValueError("RepnCache capacity must be a positive "
+                             "integer or None (got %s)" % (capacity,))
+        self.capacity = capacity
+        if capacity is not None:
+            entries = self._entries
+            while len(entries) > capacity:
+                entries.popitem(last=False)
+
+    def get(self, component, exp):
+        """
+        Return the representation of the expression exp associated
+        with the constraint or objective data component, generating it
+        if it is not cached or the cached entry is out of date.
+        """
+        entries = self._entries
+        key = id(component)
+        entry = entries.pop(key, None)
+        if (entry is not None) and \
+           (entry.component() is component) and \
+           entry.is_current(exp):
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = _RepnCacheEntry(component,
+                                    exp,
+                                    self._generate(exp),
+                                    entries)
+            if self.capacity is not None:
+                while len(entries) >= self.capacity:
+                    entries.popitem(last=False)
+        # (re)insert at the most recently used position
+        entries[key] = entry
+        return entry.repn
+
+    def invalidate(self, component=None):
+        """
+        Remove the entry for a constraint or objective data object from
+        the cache, or clear the whole cache if no component is given.
+        """
+        if component is None:
+            self._entries.clear()
+        elif component in self:
+            del self._entries[id(component)]
+
+    def prune(self):
+        """
+        Remove the entries for components that are no longer attached
+        to a model or are no longer active.
+        """
+        stale = []
+        for key, entry in self._entries.items():
+            component = entry.component()
+            if (component is None) or \
+               (component.parent_component() is None) or \
+               (component.parent_block() is None) or \
+               (not component.active):
+                stale.append(key)
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+def _get_block_cache(block, name, generate, capacity):
+    cache = getattr(block, name, None)
+    if cache is None:
+        if capacity is None:
+            capacity = RepnCache.default_capacity
+        cache = RepnCache(generate, capacity=capacity)
+        setattr(block, name, cache)
+    elif (capacity is not None) and (capacity != cache.capacity):
+        cache.set_capacity(capacity)
+    return cache
+
+def canonical_repn_cache(block, capacity=None):
+    """
+    Get (or create) the RepnCache of canonical representations for a
+    block.  A new cache holds at most capacity entries
+    (RepnCache.default_capacity if capacity is None); the capacity of
+    an existing cache is changed if a capacity is given.
+    """
+    return _get_block_cache(block,
+                            '_canonical_repn_cache',
+                            generate_canonical_repn,
+                            capacity)
+
+def ampl_repn_cache(block, capacity=None):
+    """
+    Get (or create) the RepnCache of AMPL representations for a block.
+    A new cache holds at most capacity entries
+    (RepnCache.default_capacity if capacity is None); the capacity of
+    an existing cache is changed if a capacity is given.
+    """
+    return _get_block_cache(block,
+                            '_ampl_repn_cache',
+                            generate_ampl_repn,
+                            capacity)
@@ -0,0 +1,286 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the binary ('b' format) output of the NL writer
+#
+
+import os
+import struct
+import sys
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.environ import *
+from pyomo.core.base.expr import Expr_if
+
+from six.moves import xrange
+
+_int = struct.Struct('=i')
+_double = struct.Struct('=d')
+
+# the number of arguments of the fixed-arity operators the
+# NL writer generates (all others are binary)
+_unary_opcodes = set([13, 14, 15, 16, 34] + list(range(37, 54)))
+_bound_sizes = {'0': 2, '1': 1, '2': 1, '3': 0, '4': 1}
+
+def _text_records(text):
+    """Split the text NL body into (key, values) records."""
+    lines = text.splitlines()
+    records = []
+    for line in lines[10:]:
+        line = line.split('#', 1)[0]
+        if not line.strip():
+            continue
+        if line[0].isalpha():
+            fields = line[1:].split()
+            if line[0] in 'SF':
+                records.append((line[0],
+                                tuple(float(x) for x in fields[:-1]),
+                                fields[-1]))
+            else:
+                records.append((line[0], tuple(float(x) for x in fields)))
+        else:
+            records.append(('', tuple(float(x) for x in line.split())))
+    return lines[:10], records
+
+class _BinaryReader(object):
+    """Decode a binary NL body into the same records as
+    _text_records."""
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.records = []
+        header = []
+        for i in xrange(10):
+            end = data.index(b'\n', self.pos)
+            header.append(data[self.pos:end].decode('utf-8'))
+            self.pos = end + 1
+        self.header = header
+        self.n_vars, self.n_cons = [int(x) for x in header[1].split()[:2]]
+        while self.pos < len(data):
+            self._segment()
+
+    def _char(self):
+        c = self.data[self.pos:self.pos+1].decode('ascii')
+        self.pos += 1
+        return c
+
+    def _unpack(self, fmt):
+        value = fmt.unpack_from(self.data, self.pos)[0]
+        self.pos += fmt.size
+        return value
+
+    def _ints(self, n):
+        return tuple(float(self._unpack(_int)) for i in xrange(n))
+
+    def _string(self):
+        n = self._unpack(_int)
+        s = self.data[self.pos:self.pos+n].decode('utf-8')
+        self.pos += n
+        return s
+
+    def _segment(self):
+        key = self._char()
+        records = self.records
+        if key in 'CL':
+            records.append((key, self._ints(1)))
+            self._expr()
+        elif key == 'O':
+            records.append((key, self._ints(2)))
+            self._expr()
+        elif key in 'dx':
+            n, = self._ints(1)
+            records.append((key, (n,)))
+            for i in xrange(int(n)):
+                records.append(('', self._ints(1) + (self._unpack(_double),)))
+        elif key in 'JG':
+            header = self._ints(2)
+            records.append((key, header))
+            for i in xrange(int(header[1])):
+                records.append(('', self._ints(1) + (self._unpack(_double),)))
+        elif key == 'k':
+            n, = self._ints(1)
+            records.append((key, (n,)))
+            for i in xrange(int(n)):
+                records.append(('', self._ints(1)))
+        elif key in 'rb':
+            records.append((key, ()))
+            for i in xrange(self.n_cons if key == 'r' else self.n_vars):
+                t = self._char()
+                if t == '5':
+                    records.append(('', (5.0,) + self._ints(2)))
+                else:
+                    records.append(
+                        ('', (float(t),) + tuple(
+                            self._unpack(_double)
+                            for j in xrange(_bound_sizes[t]))))
+        elif key == 'S':
+            kind, n = self._ints(2)
+            records.append((key, (kind, n), self._string()))
+            for i in xrange(int(n)):
+                index = self._ints(1)
+                if int(kind) & 4:
+                    value = self._unpack(_double)
+                else:
+                    value = float(self._unpack(_int))
+                records.append(('', index + (value,)))
+        else:
+            raise ValueError("Unexpected segment %r" % (key))
+
+    def _expr(self):
+        node = self._char()
+        if node == 'n':
+            self.records.append(('n', (self._unpack(_double),)))
+        elif node == 'v':
+            self.records.append(('v', self._ints(1)))
+        elif node == 'o':
+            opcode = self._unpack(_int)
+            self.records.append(('o', (float(opcode),)))
+            if opcode == 54:
+                n, = self._ints(1)
+                self.records.append(('', (n,)))
+            elif opcode == 35:
+                n = 3
+            elif opcode in _unary_opcodes:
+                n = 1
+            else:
+                n = 2
+            for i in xrange(int(n)):
+                self._expr()
+        else:
+            raise ValueError("Unexpected expression node %r" % (node))
+
+class TestBinaryNL(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _write(self, model, **io_options):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.nl')
+        model.write(fname, format='nl', io_options=io_options)
+        with open(fname, 'rb') as f:
+            return f.read()
+
+    def _model(self):
+        model = ConcreteModel()
+        model.I = RangeSet(1, 5)
+        model.x = Var(model.I, bounds=(-1, 4), initialize=lambda m, i: i)
+        model.y = Var(within=Integers, bounds=(0, None))
+        model.z = Var()
+        model.z.fix(2.5)
+        model.obj = Objective(expr=sum(model.x[i]**2 for i in model.I) +
+                              sin(model.y) - model.z)
+        model.c1 = Constraint(expr=sum(i*model.x[i] for i in model.I) >= 1)
+        model.c2 = Constraint(expr=(0, model.x[1]*model.x[2] + model.y, 3))
+        model.c3 = Constraint(expr=exp(model.x[3]) + model.x[4]/model.x[5]
+                              == 2)
+        model.c4 = Constraint(expr=Expr_if(IF=model.x[1] <= 0,
+                                           THEN=model.x[2],
+                                           ELSE=-model.x[3]) <= 1.5)
+        model.dual = Suffix(direction=Suffix.EXPORT)
+        model.dual[model.c1] = 0.5
+        model.tag = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        model.tag[model.y] = 3
+        return model
+
+    def _check_equivalent(self, model, **io_options):
+        text = self._write(model, **io_options).decode('utf-8')
+        binary = self._write(model, binary=True, **io_options)
+        header, text_records = _text_records(text)
+        reader = _BinaryReader(binary)
+        self.assertEqual(reader.header[0][0], 'b')
+        self.assertEqual(reader.header[0][1:], header[0][1:])
+        for i in xrange(1, 10):
+            if i == 5:
+                continue
+            self.assertEqual(reader.header[i], header[i])
+        arith = int(reader.header[5].split()[2])
+        self.assertEqual(arith, 1 if sys.byteorder == 'little' else 2)
+        self.assertEqual(reader.records, text_records)
+
+    def test_binary_records_match_text(self):
+        self._check_equivalent(self._model())
+
+    def test_symbolic_solver_labels(self):
+        # nl comments are not written to binary files
+        model = self._model()
+        self._check_equivalent(model, symbolic_solver_labels=True)
+        self.assertEqual(self._write(model, binary=True),
+                         self._write(model, binary=True,
+                                     symbolic_solver_labels=True))
+
+    def test_binary_smaller(self):
+        model = ConcreteModel()
+        model.I = RangeSet(0, 199)
+        model.x = Var(model.I, bounds=(0, 1))
+        model.obj = Objective(expr=summation(model.x))
+        model.c = Constraint(model.I, rule=lambda m, i:
+                             sum(0.123456789*(j+1)*m.x[(i+j) % 200]
+                                 for j in xrange(10)) >= i/7.0)
+        text = self._write(model)
+        binary = self._write(model, binary=True)
+        self.assertTrue(len(binary) < len(text))
+        header, text_records = _text_records(text.decode('utf-8'))
+        self.assertEqual(_BinaryReader(binary).records, text_records)
+
+    @unittest.skipIf(sys.byteorder != 'little',
+                     "The fixture is written for little-endian hosts")
+    def test_fixture(self):
+        # the body of the binary file, spelled out record by record
+        # from the layout read by the ASL (see "Writing .nl Files")
+        model = ConcreteModel()
+        model.x = Var(bounds=(0, 4), initialize=1.0)
+        model.y = Var(bounds=(1, None))
+        model.o = Objective(expr=model.x**2 + 2*model.y)
+        model.c = Constraint(expr=model.x + 3*model.y <= 5)
+        i = lambda *args: struct.pack('<%di' % len(args), *args)
+        d = lambda *args: struct.pack('<%dd' % len(args), *args)
+        body = b''.join([
+            b'C', i(0),                         # C0
+            b'n', d(0),                         # n0
+            b'O', i(0, 0),                      # O0 0
+            b'o', i(5), b'v', i(0), b'n', d(2), # o5 v0 n2
+            b'x', i(1), i(0), d(1),             # x1 / 0 1.0
+            b'r',                               # r
+            b'1', d(5),                         # 1 5.0
+            b'b',                               # b
+            b'0', d(0, 4),                      # 0 0 4
+            b'2', d(1),                         # 2 1
+            b'k', i(1), i(1),                   # k1 / 1
+            b'J', i(0, 2), i(0), d(1), i(1), d(3),
+            b'G', i(0, 2), i(0), d(0), i(1), d(2)])
+        binary = self._write(model, binary=True)
+        header = self._write(model).split(b'\n')[:10]
+        header[0] = b'b' + header[0][1:]
+        header[5] = header[5].replace(b' 0 0 0 1', b' 0 0 1 1')
+        self.assertEqual(binary, b'\n'.join(header) + b'\n' + body)
+
+    def test_ipopt(self):
+        # solve the binary and text files with a real ASL solver
+        opt = SolverFactory('ipopt')
+        if not opt.available(exception_flag=False):
+            self.skipTest("ipopt is not available")
+        results = {}
+        for binary in (False, True):
+            model = ConcreteModel()
+            model.x = Var([1, 2, 3], bounds=(0, 4), initialize=1)
+            model.o = Objective(expr=(model.x[1] - 1.5)**2 +
+                                exp(model.x[2]) - model.x[3])
+            model.c = Constraint(expr=model.x[1] + 2*model.x[3] <= 5)
+            opt.solve(model, binary=binary)
+            results[binary] = [value(model.x[i]) for i in model.x]
+        self.assertAlmostEqual(results[True][0], 1.5, places=5)
+        for a, b in zip(results[False], results[True]):
+            self.assertAlmostEqual(a, b, places=6)
+
+if __name__ == "__main__":
+    unittest.main()
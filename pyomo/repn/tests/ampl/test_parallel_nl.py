@@ -0,0 +1,102 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the parallel construction of the NL writer "C" and "J" segments
+#
+
+import os
+import time
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.environ import *
+
+from six.moves import xrange
+
+def _generate_model(nrows):
+    model = ConcreteModel()
+    model.I = RangeSet(0, nrows-1)
+    model.x = Var(model.I, bounds=(0.1, 10), initialize=1)
+    model.obj = Objective(expr=sum(model.x[i]**2 for i in xrange(min(nrows, 5))))
+    def nl_rule(model, i):
+        j = (i+1) % nrows
+        return exp(model.x[i]) * model.x[j] + \
+            log(model.x[j]) / model.x[i] + 2*model.x[i] <= 10
+    model.nl = Constraint(model.I, rule=nl_rule)
+    def lin_rule(model, i):
+        return model.x[i] + 3*model.x[(i+2) % nrows] >= 1
+    model.lin = Constraint(model.I, rule=lin_rule)
+    return model
+
+@unittest.skipIf(not hasattr(os, 'fork'), "Requires fork")
+class TestParallelNL(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _write(self, model, **io_options):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.nl')
+        model.write(fname, format='nl', io_options=io_options)
+        with open(fname, 'rb') as f:
+            return f.read()
+
+    def test_identical_output(self):
+        model = _generate_model(25)
+        baseline = self._write(model)
+        for chunk_size in (1, 7, 1000):
+            self.assertEqual(self._write(model,
+                                         parallel_workers=2,
+                                         parallel_chunk_size=chunk_size),
+                             baseline)
+
+    def test_identical_output_options(self):
+        model = _generate_model(10)
+        for io_options in ({'symbolic_solver_labels': True},
+                           {'binary': True}):
+            self.assertEqual(self._write(model,
+                                         parallel_workers=3,
+                                         parallel_chunk_size=4,
+                                         **io_options),
+                             self._write(model, **io_options))
+
+    def test_bad_chunk_size(self):
+        model = _generate_model(2)
+        self.assertRaises(ValueError, self._write, model,
+                          parallel_workers=2, parallel_chunk_size=0)
+
+@unittest.category('performance', include_in_all=False)
+@unittest.skipIf(not hasattr(os, 'fork'), "Requires fork")
+class TestParallelNLPerformance(unittest.TestCase):
+    """
+    Report the NL write time of a nonlinear model with and without
+    worker processes.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def test_100k_rows(self):
+        model = _generate_model(100000)
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.nl')
+        for workers in (0, 2, 4):
+            start = time.time()
+            model.write(fname, format='nl',
+                        io_options={'parallel_workers': workers})
+            elapsed = time.time() - start
+            self.recordTestData('%d workers (s)' % (workers), elapsed)
+            print("NL writer, 100k nonlinear rows, %d workers: %.2f s"
+                  % (workers, elapsed))
+
+if __name__ == "__main__":
+    unittest.main()
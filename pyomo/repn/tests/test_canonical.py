@@ -642,6 +642,36 @@ class Test(unittest.TestCase):
         rep = generate_canonical_repn(Expr_if(IF=model.x**2, THEN=1.0, ELSE=-1.0))
         self.assertTrue(isinstance(rep, GeneralCanonicalRepn) == True)
         self.assertEqual(canonical_degree(rep), None)
+    def test_var_sum(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], initialize=2)
+        e = quicksum([2*m.x[1], 3*m.x[2], m.x[1], 1.5*m.x[3], 4])
+        idMap = {}
+        rep = generate_canonical_repn(e, idMap)
+        self.assertTrue(isinstance(rep, LinearCanonicalRepn))
+        self.assertEqual(rep.variables, (m.x[1], m.x[2], m.x[3]))
+        self.assertEqual(rep.linear, (3, 3, 1.5))
+        self.assertEqual(rep.constant, 4)
+        # the flat sum is collected exactly as the (recursive) linear
+        # collectors would
+        from pyomo.repn.canonical_repn import collect_linear_canonical_repn
+        coef, varmap = collect_linear_canonical_repn(e, {})
+        self.assertEqual(coef, {None: 4, 0: 3, 1: 3, 2: 1.5})
+        self.assertEqual(rep.variables,
+                         tuple(varmap[k] for k in coef if k is not None))
+        self.assertEqual(idMap[None], dict((id(m.x[i]), i-1)
+                                           for i in (1,2,3)))
+
+        m.x[2].fix()
+        rep = generate_canonical_repn(e)
+        self.assertEqual(rep.variables, (m.x[1], m.x[3]))
+        self.assertEqual(rep.linear, (3, 1.5))
+        self.assertEqual(rep.constant, 10)
+        m.x[1].fix()
+        m.x[3].fix()
+        rep = generate_canonical_repn(e)
+        self.assertEqual(rep.variables, None)
+        self.assertEqual(rep.constant, 19)
 
 if __name__ == "__main__":
     unittest.main()
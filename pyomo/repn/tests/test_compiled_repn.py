@@ -0,0 +1,146 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the block-level compiled linear representation
+#
+
+import pyutilib.th as unittest
+
+from pyomo.repn import *
+from pyomo.repn.compiled_repn import numpy_available
+from pyomo.environ import *
+
+from six.moves import range
+
+def linear_repn_to_dict(repn):
+    result = {}
+    if repn.variables is not None:
+        for i in range(len(repn.variables)):
+            result[id(repn.variables[i])] = repn.linear[i]
+    if repn.constant != None:
+        result[None] = repn.constant
+    return result
+
+class TestCompiledRepn(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(1,3)
+        m.p = Param(m.I, initialize=lambda m,i: 2*i)
+        m.q = Param(m.I, initialize=lambda m,i: i, mutable=True)
+        m.x = Var(m.I)
+        m.y = Var()
+        m.c1 = Constraint(expr=summation(m.p, m.x) + 1 >= 0)
+        m.c2 = Constraint(m.I, rule=lambda m,i: (-1, m.q[i]*m.x[i] - m.y, 5))
+        m.c3 = Constraint(expr=m.x[1]*m.y == 2)
+        m.b = Block()
+        m.b.c = Constraint(expr=2*(m.x[1] + m.y) + 3*m.x[1] <= 4)
+        return m
+
+    def test_csr_arrays(self):
+        m = self._model()
+        compiled = compile_block_linear_repn(m, sort=True)
+        self.assertEqual(compiled.nrows, 5)
+        self.assertEqual(compiled.ncols, 4)
+        self.assertEqual(compiled.nnz, 3 + 2*3 + 2)
+        self.assertEqual(list(compiled.row_ptr), [0, 3, 5, 7, 9, 11])
+        self.assertEqual([c.cname(True) for c in compiled.constraints],
+                         ['c1', 'c2[1]', 'c2[2]', 'c2[3]', 'b.c'])
+        self.assertEqual(compiled.nonlinear, [m.c3])
+        self.assertEqual(list(compiled.row_lower),
+                         [-1, -1, -1, -1, -float('inf')])
+        self.assertEqual(list(compiled.row_upper),
+                         [float('inf'), 5, 5, 5, 4])
+        self.assertEqual(list(compiled.constant), [1, 0, 0, 0, 0])
+        # the duplicate x[1] terms in b.c are merged
+        rows = [dict((id(compiled.variables[compiled.col_index[p]]),
+                      compiled.coefficients[p])
+                     for p in range(compiled.row_ptr[i],
+                                    compiled.row_ptr[i+1]))
+                for i in range(compiled.nrows)]
+        self.assertEqual(rows[0], {id(m.x[1]): 2, id(m.x[2]): 4,
+                                   id(m.x[3]): 6})
+        self.assertEqual(rows[2], {id(m.x[2]): 2, id(m.y): -1})
+        self.assertEqual(rows[4], {id(m.x[1]): 5, id(m.y): 2})
+
+    def test_numpy_arrays(self):
+        if not numpy_available:
+            self.skipTest("NumPy is not available")
+        import numpy
+        compiled = compile_block_linear_repn(self._model())
+        self.assertTrue(isinstance(compiled.row_ptr, numpy.ndarray))
+        self.assertTrue(isinstance(compiled.coefficients, numpy.ndarray))
+        self.assertEqual(compiled.coefficients.dtype, numpy.float64)
+
+    def test_fixed_variables(self):
+        m = self._model()
+        m.y.fix(3)
+        compiled = compile_block_linear_repn(m, sort=True)
+        # x[1]*y is linear once y is fixed
+        self.assertEqual(compiled.nonlinear, [])
+        self.assertEqual(list(compiled.row_ptr), [0, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(list(compiled.constant), [1, -3, -3, -3, 0, 6])
+        self.assertEqual(list(compiled.row_upper),
+                         [float('inf'), 8, 8, 8, 2, -2])
+        self.assertEqual(compiled.row(4).coefficients, (3,))
+
+    def test_fixed_variables_without_value(self):
+        m = self._model()
+        m.x[2].fix()
+        try:
+            generate_canonical_repn(m.c1.body)
+            self.fail("Expected ValueError")
+        except ValueError as e:
+            msg = str(e)
+        self.assertIn("x[2]", msg)
+        try:
+            compile_block_linear_repn(m)
+            self.fail("Expected ValueError")
+        except ValueError as e:
+            self.assertEqual(str(e), msg)
+        m = ConcreteModel()
+        m.z = Var()
+        m.c = Constraint(expr=m.z >= 1)
+        m.z.fix()
+        self.assertRaisesRegexp(ValueError, "No value for uninitialized "
+                                "NumericValue object z",
+                                compile_block_linear_repn, m)
+
+    def test_views_match_canonical_repn(self):
+        m = self._model()
+        compiled = compile_block_linear_repn(m)
+        for cdata in compiled.constraints:
+            repn = generate_canonical_repn(cdata.body)
+            view = compiled[cdata]
+            self.assertTrue(isinstance(view, LinearCanonicalRepn))
+            self.assertEqual(linear_repn_to_dict(view),
+                             linear_repn_to_dict(repn))
+        self.assertTrue(m.c1 in compiled)
+        self.assertFalse(m.c3 in compiled)
+        self.assertRaises(KeyError, compiled.__getitem__, m.c3)
+        self.assertRaises(IndexError, compiled.row, 5)
+
+    def test_store_canonical_repn(self):
+        m = self._model()
+        compiled = compile_block_linear_repn(m)
+        compiled.store_canonical_repn()
+        self.assertEqual(linear_repn_to_dict(m.b._canonical_repn[m.b.c]),
+                         {id(m.x[1]): 5, id(m.y): 2})
+        self.assertEqual(m._canonical_repn[m.c1].constant, 1)
+
+    def test_descend_into(self):
+        m = self._model()
+        compiled = compile_block_linear_repn(m, descend_into=False)
+        self.assertEqual(compiled.nrows, 4)
+        m.c1.deactivate()
+        compiled = compile_block_linear_repn(m, descend_into=False)
+        self.assertEqual(compiled.nrows, 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the buffered CPLEX LP writer options
+#
+
+import os
+import time
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.environ import *
+
+from six.moves import xrange
+
+def _generate_model(nrows, nterms=5):
+    model = ConcreteModel()
+    model.I = RangeSet(0, nrows+nterms-1)
+    model.x = Var(model.I, bounds=(0, 10))
+    model.obj = Objective(expr=sum(model.x[i] for i in xrange(nterms)))
+    def c_rule(model, i):
+        return sum((j+1)*model.x[i+j] for j in xrange(nterms)) >= i
+    model.c = Constraint(RangeSet(0, nrows-1), rule=c_rule)
+    return model
+
+class TestLPWriterBuffering(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _write(self, model, **io_options):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.lp')
+        model.write(fname, format='lp', io_options=io_options)
+        with open(fname) as f:
+            return f.read()
+
+    def test_buffered_output_identical(self):
+        model = _generate_model(50)
+        model.q = Constraint(expr=model.x[1]**2 + model.x[2] <= 4)
+        baseline = self._write(model)
+        for size in (1, 100, 1 << 20):
+            self.assertEqual(self._write(model, output_buffer_size=size),
+                             baseline)
+        self.assertEqual(self._write(model,
+                                     output_buffer_size=4096,
+                                     symbolic_solver_labels=True),
+                         self._write(model, symbolic_solver_labels=True))
+
+    def test_no_file_determinism(self):
+        model = _generate_model(50)
+        baseline = self._write(model, symbolic_solver_labels=True)
+        output = self._write(model,
+                             symbolic_solver_labels=True,
+                             file_determinism=0,
+                             output_buffer_size=4096)
+        self.assertEqual(sorted(output.splitlines()),
+                         sorted(baseline.splitlines()))
+
+@unittest.category('performance', include_in_all=False)
+class TestLPWriterPerformance(unittest.TestCase):
+    """
+    Report the LP writer throughput (MB/s) on generated models.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _benchmark(self, nrows):
+        model = _generate_model(nrows)
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.lp')
+        for label, io_options in (
+                ('default', {}),
+                ('buffered', {'output_buffer_size': 1 << 20}),
+                ('buffered, file_determinism=0',
+                 {'output_buffer_size': 1 << 20,
+                  'file_determinism': 0})):
+            start = time.time()
+            model.write(fname, format='lp', io_options=io_options)
+            elapsed = max(time.time() - start, 1e-9)
+            mbytes = os.path.getsize(fname) / 1.0e6
+            rate = mbytes / elapsed
+            self.recordTestData('%s MB/s' % (label), rate)
+            print("LP writer, %d rows, %s: %.1f MB in %.2f s (%.2f MB/s)"
+                  % (nrows, label, mbytes, elapsed, rate))
+
+    def test_10k_rows(self):
+        self._benchmark(10000)
+
+    def test_100k_rows(self):
+        self._benchmark(100000)
+
+    def test_1M_rows(self):
+        self._benchmark(1000000)
+
+if __name__ == "__main__":
+    unittest.main()
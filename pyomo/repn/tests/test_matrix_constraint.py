@@ -0,0 +1,172 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test MatrixConstraint components declared from sparse matrix data
+#
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.repn import LinearCanonicalRepn, generate_ampl_repn
+from pyomo.repn.matrix import (MatrixConstraint,
+                               _LinearMatrixConstraintData,
+                               numpy_available)
+from pyomo.environ import *
+
+try:
+    import scipy.sparse
+    scipy_available = True
+except ImportError:
+    scipy_available = False
+
+_inf = float('inf')
+
+A = [[1.5, 2.0, 0.0],
+     [0.0, 0.0, 3.0],
+     [4.0, 0.0, 5.0]]
+lb = [None, 1, 2]
+ub = [4, _inf, 2]
+
+class TestMatrixConstraint(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _check(self, m):
+        self.assertEqual(len(m.c), 3)
+        self.assertEqual((m.c.nrows, m.c.ncols, m.c.nnz), (3, 3, 5))
+        self.assertEqual(list(m.c._prows), [0, 2, 3, 5])
+        self.assertEqual(list(m.c._jcols), [0, 1, 2, 0, 2])
+        self.assertEqual(list(m.c._vals), [1.5, 2, 3, 4, 5])
+        c0, c1, c2 = m.c[0], m.c[1], m.c[2]
+        self.assertTrue(isinstance(c0, LinearCanonicalRepn))
+        self.assertEqual((c0.lower, c0.upper, c0.equality), (None, 4, False))
+        self.assertEqual((c1.lower, c1.upper, c1.equality), (1, None, False))
+        self.assertEqual((c2.lower, c2.upper, c2.equality), (2, 2, True))
+        self.assertEqual(c2.variables, (m.x[1], m.x[3]))
+        self.assertEqual(c2.coefficients, (4, 5))
+        self.assertEqual(c0(), 1.5*1 + 2*2)
+        self.assertEqual(c0.uslack(), 4 - 5.5)
+        self.assertEqual(c1.lslack(), 1 - 9)
+
+    def _model(self, A):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=lambda m, i: i)
+        m.c = MatrixConstraint.from_matrix(A, lb=lb, ub=ub,
+                                           x=[m.x[1], m.x[2], m.x[3]])
+        return m
+
+    def test_dense_lists(self):
+        self._check(self._model(A))
+
+    def test_numpy(self):
+        if not numpy_available:
+            self.skipTest("NumPy is not available")
+        import numpy
+        self._check(self._model(numpy.array(A, dtype=float)))
+
+    def test_scipy(self):
+        if not scipy_available:
+            self.skipTest("SciPy is not available")
+        self._check(self._model(scipy.sparse.coo_matrix(A)))
+
+    def test_scalar_bounds(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = MatrixConstraint.from_matrix([[1, 1], [1, -1]], lb=0,
+                                           x=[m.x[1], m.x[2]])
+        self.assertEqual([m.c[i].lower for i in m.c], [0, 0])
+        self.assertEqual([m.c[i].upper for i in m.c], [None, None])
+        # Python 2 longs are numbers, too
+        m.d = MatrixConstraint.from_matrix([[1, 1], [1, -1]],
+                                           ub=type(2**100)(3),
+                                           x=[m.x[1], m.x[2]])
+        self.assertEqual([m.d[i].upper for i in m.d], [3, 3])
+
+    def test_csr_constructor(self):
+        # the positional CSR constructor used by
+        # compile_block_linear_constraints
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=lambda m, i: i)
+        m.c = MatrixConstraint(3, 3, 5,
+                               [0, 2, 3, 5],
+                               [0, 1, 2, 0, 2],
+                               [1.5, 2, 3, 4, 5],
+                               [0, 4, 1, 0, 2, 2],
+                               [MatrixConstraint.UpperBound,
+                                MatrixConstraint.LowerBound,
+                                MatrixConstraint.Equality],
+                               [m.x[1], m.x[2], m.x[3]])
+        self._check(m)
+
+    def test_errors(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        from_matrix = MatrixConstraint.from_matrix
+        self.assertRaises(ValueError, from_matrix, A, x=[m.x[1]])
+        self.assertRaises(ValueError, from_matrix, A)
+        self.assertRaises(ValueError, from_matrix, [[1, 2], [1]],
+                          x=[m.x[1], m.x[2]])
+        self.assertRaises(ValueError, from_matrix, [[1, 2]],
+                          lb=[1, 2], x=[m.x[1], m.x[2]])
+        m.c = MatrixConstraint.from_matrix([[1, 2]], x=[m.x[1], m.x[2]])
+        self.assertRaises(NotImplementedError, m.c[0].set_value, m.x[1] >= 0)
+
+    def test_fixed_variables(self):
+        m = self._model(A)
+        m.x[1].fix(2)
+        self.assertEqual(m.c[2].variables, (m.x[3],))
+        self.assertEqual(m.c[2].constant, 8)
+        repn = generate_ampl_repn(m.c[2])
+        self.assertEqual(repn._linear_vars, (m.x[3],))
+        self.assertEqual(repn._linear_terms_coef, (5,))
+        self.assertEqual(repn._constant, 8)
+
+    def _write(self, model, fmt, **io_options):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.'+fmt)
+        model.write(fname, format=fmt, io_options=io_options)
+        with open(fname) as f:
+            return f.read()
+
+    def test_writers(self):
+        # the writers read the rows of a MatrixConstraint without
+        # generating a body expression, and write the same file as
+        # for the equivalent Constraint
+        def expression_model():
+            m = ConcreteModel()
+            m.x = Var([1, 2, 3], bounds=(0, 10))
+            m.o = Objective(expr=m.x[1] + m.x[2] + m.x[3])
+            def c_rule(m, i):
+                body = sum(A[i][j]*m.x[j+1] for j in range(3) if A[i][j])
+                if lb[i] == ub[i]:
+                    return body == lb[i]
+                return (lb[i], body, ub[i] if ub[i] != _inf else None)
+            m.c = Constraint([0, 1, 2], rule=c_rule)
+            return m
+        def matrix_model():
+            m = ConcreteModel()
+            m.x = Var([1, 2, 3], bounds=(0, 10))
+            m.o = Objective(expr=m.x[1] + m.x[2] + m.x[3])
+            m.c = MatrixConstraint.from_matrix(A, lb=lb, ub=ub,
+                                               x=[m.x[1], m.x[2], m.x[3]])
+            return m
+        body = _LinearMatrixConstraintData.body
+        def _no_body(self):
+            raise RuntimeError("body expression generated")
+        _LinearMatrixConstraintData.body = property(_no_body)
+        try:
+            for fmt in ('lp', 'mps', 'nl'):
+                self.assertEqual(self._write(matrix_model(), fmt),
+                                 self._write(expression_model(), fmt))
+        finally:
+            _LinearMatrixConstraintData.body = body
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the coordinate-format matrix assembly of the MPS writer
+#
+
+import os
+import time
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+import pyomo.repn.plugins.mps as mps_writer
+from pyomo.environ import *
+
+from six.moves import xrange
+
+def _generate_model(nrows, nterms=5):
+    model = ConcreteModel()
+    model.I = RangeSet(0, nrows+nterms-1)
+    model.x = Var(model.I, bounds=(0, 10))
+    model.obj = Objective(expr=sum(model.x[i] for i in xrange(nterms)) + 1)
+    def c_rule(model, i):
+        return sum((j+1)*model.x[i+j] for j in xrange(nterms)) >= i
+    model.c = Constraint(RangeSet(0, nrows-1), rule=c_rule)
+    return model
+
+class TestMPSWriterCOO(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+        mps_writer.numpy_available = self._numpy_available
+
+    def setUp(self):
+        self._numpy_available = mps_writer.numpy_available
+
+    def _write(self, model, **io_options):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.mps')
+        model.write(fname, format='mps', io_options=io_options)
+        with open(fname) as f:
+            return f.read()
+
+    def _model(self):
+        model = ConcreteModel()
+        model.I = RangeSet(1, 4)
+        model.x = Var(model.I, bounds=(0, 5))
+        model.y = Var(within=Integers)
+        model.unused = Var()
+        model.obj = Objective(expr=summation(model.x) + 3 + model.x[1]**2)
+        model.c = Constraint(model.I, rule=lambda m, i:
+                             (-i, m.x[i] + 2*m.x[(i % 4)+1] - m.y, 10))
+        model.e = Constraint(expr=model.y + model.x[4] == 4)
+        return model
+
+    def test_columns(self):
+        output = self._write(self._model(), symbolic_solver_labels=True)
+        columns = output.split("COLUMNS\n")[1].split("RHS\n")[0]
+        lines = columns.splitlines()
+        # the entries are grouped by column, in row order
+        self.assertEqual(lines[:5],
+                         ["     x(1) obj 1",
+                          "     x(1) r_l_c(1)_ 1",
+                          "     x(1) r_u_c(1)_ 1",
+                          "     x(1) r_l_c(4)_ 2",
+                          "     x(1) r_u_c(4)_ 2"])
+        self.assertEqual(lines[-2:],
+                         ["     ONE_VAR_CONSTANT obj 3",
+                          "     ONE_VAR_CONSTANT c_e_ONE_VAR_CONSTANT 1"])
+        # x: obj + 2 ranged rows (2 entries each), x[4]: e, y: c + e
+        self.assertEqual(len(lines), 4*5 + 1 + (4*2 + 1) + 2)
+
+    def test_without_numpy(self):
+        model = self._model()
+        for io_options in ({},
+                           {'include_all_variable_bounds': True},
+                           {'symbolic_solver_labels': True}):
+            mps_writer.numpy_available = self._numpy_available
+            baseline = self._write(model, **io_options)
+            mps_writer.numpy_available = False
+            self.assertEqual(self._write(model, **io_options), baseline)
+
+    def test_empty_matrix(self):
+        model = ConcreteModel()
+        model.x = Var()
+        model.obj = Objective(expr=1)
+        output = self._write(model)
+        self.assertTrue(
+            "COLUMNS\n     ONE_VAR_CONSTANT x2 1\n" in output)
+
+@unittest.category('performance', include_in_all=False)
+class TestMPSWriterPerformance(unittest.TestCase):
+    """
+    Report the MPS writer time on generated models.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _benchmark(self, nrows):
+        model = _generate_model(nrows)
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.mps')
+        start = time.time()
+        model.write(fname, format='mps')
+        elapsed = time.time() - start
+        mbytes = os.path.getsize(fname) / 1.0e6
+        self.recordTestData('time (s)', elapsed)
+        print("MPS writer, %d rows: %.1f MB in %.2f s"
+              % (nrows, mbytes, elapsed))
+
+    def test_100k_rows(self):
+        self._benchmark(100000)
+
+    def test_1M_rows(self):
+        self._benchmark(1000000)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Test the incremental repn cache
+#
+
+import os
+import gc
+import pickle
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.repn import generate_canonical_repn
+from pyomo.repn.repn_cache import (RepnCache,
+                                   canonical_repn_cache,
+                                   ampl_repn_cache)
+from pyomo.environ import *
+
+class TestRepnCache(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.p = Param([1,2], initialize={1:1, 2:2}, mutable=True)
+        m.e = Expression(expr=m.x[2])
+        m.c1 = Constraint(expr=m.p[1]*m.x[1] + m.x[2] >= 0)
+        m.c2 = Constraint(expr=m.p[2]*m.x[2] <= 1)
+        m.c3 = Constraint(expr=m.x[1] + m.e == 1)
+        m.o = Objective(expr=m.x[1] + m.x[2])
+        return m
+
+    def test_hit_and_param_invalidation(self):
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        repn1 = cache.get(m.c1, m.c1.body)
+        repn2 = cache.get(m.c2, m.c2.body)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertIs(cache.get(m.c1, m.c1.body), repn1)
+        self.assertIs(cache.get(m.c2, m.c2.body), repn2)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        # only the repn depending on p[1] is regenerated
+        m.p[1] = 5
+        repn1b = cache.get(m.c1, m.c1.body)
+        self.assertIsNot(repn1b, repn1)
+        self.assertEqual(sorted(repn1b.linear), [1, 5])
+        self.assertIs(cache.get(m.c2, m.c2.body), repn2)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+    def test_fixed_var_invalidation(self):
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        repn = cache.get(m.c1, m.c1.body)
+        m.x[2].fix(3)
+        repn = cache.get(m.c1, m.c1.body)
+        self.assertEqual(repn.constant, 3)
+        self.assertIs(cache.get(m.c1, m.c1.body), repn)
+        m.x[2].value = 4
+        repn = cache.get(m.c1, m.c1.body)
+        self.assertEqual(repn.constant, 4)
+        m.x[2].unfix()
+        repn = cache.get(m.c1, m.c1.body)
+        self.assertEqual(repn.constant, None)
+        self.assertEqual(cache.misses, 4)
+
+    def test_expression_invalidation(self):
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        repn = cache.get(m.c3, m.c3.body)
+        self.assertEqual(len(repn.variables), 2)
+        m.e.value = 2*m.x[1]
+        repn = cache.get(m.c3, m.c3.body)
+        self.assertEqual(repn.variables, (m.x[1],))
+        self.assertEqual(repn.linear, (3,))
+        # a new body expression is a cache miss
+        m.c2.set_value(m.x[1] <= 1)
+        repn = cache.get(m.c2, m.c2.body)
+        self.assertEqual(repn.variables, (m.x[1],))
+        self.assertEqual(cache.misses, 3)
+
+    def test_in_place_invalidation(self):
+        # the entire expression tree is checked, not only the identity
+        # of the body
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        body = m.c1.body
+        repn = cache.get(m.c1, body)
+        self.assertEqual(sorted(repn.linear), [1, 1])
+        body.scale(2)
+        repn = cache.get(m.c1, body)
+        self.assertEqual(sorted(repn.linear), [2, 2])
+        body._args.append(m.x[1])
+        body._coef.append(3)
+        repn = cache.get(m.c1, body)
+        self.assertEqual(sorted(repn.linear), [2, 5])
+        self.assertIs(cache.get(m.c1, body), repn)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_capacity(self):
+        m = self._model()
+        self.assertRaises(ValueError, RepnCache, generate_canonical_repn, 0)
+        cache = RepnCache(generate_canonical_repn, capacity=3)
+        cache.get(m.c1, m.c1.body)
+        cache.get(m.c2, m.c2.body)
+        cache.get(m.c3, m.c3.body)
+        cache.set_capacity(2)
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(m.c1 in cache)
+        cache.get(m.c1, m.c1.body)
+        cache.get(m.c2, m.c2.body)
+        cache.get(m.c1, m.c1.body)
+        cache.get(m.c3, m.c3.body)
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(m.c1 in cache)
+        self.assertFalse(m.c2 in cache)
+        self.assertTrue(m.c3 in cache)
+        cache.invalidate(m.c1)
+        self.assertFalse(m.c1 in cache)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_prune(self):
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        for c in (m.c1, m.c2, m.c3):
+            cache.get(c, c.body)
+        m.c2.deactivate()
+        m.del_component(m.c3)
+        self.assertEqual(cache.prune(), 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_deleted_components(self):
+        # entries do not keep their components alive
+        m = self._model()
+        cache = RepnCache(generate_canonical_repn)
+        for c in (m.c1, m.c2, m.c3):
+            cache.get(c, c.body)
+        m.del_component(m.c1)
+        gc.collect()
+        self.assertEqual(len(cache), 2)
+        c3 = m.c3
+        m.del_component(m.c3)
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(m.c2 in cache)
+        self.assertTrue(c3 in cache)
+        self.assertEqual(cache.prune(), 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_pickle_drops_entries(self):
+        m = self._model()
+        cache = canonical_repn_cache(m)
+        cache.get(m.c1, m.c1.body)
+        self.assertEqual(len(cache), 1)
+        i = pickle.loads(pickle.dumps(m))
+        self.assertEqual(len(i._canonical_repn_cache), 0)
+        self.assertEqual(len(m.clone()._canonical_repn_cache), 0)
+
+    def test_writers_use_cache(self):
+        m = self._model()
+        for fmt, get_cache in (('lp', canonical_repn_cache),
+                               ('mps', canonical_repn_cache),
+                               ('nl', ampl_repn_cache)):
+            fname = pyutilib.services.TempfileManager.create_tempfile(
+                suffix='.'+fmt)
+            cache = get_cache(m)
+            cache.invalidate()
+            cache.hits = cache.misses = 0
+            m.write(fname, format=fmt)
+            self.assertEqual(cache.misses, 4)
+            with open(fname) as f:
+                first = f.read()
+            m.write(fname, format=fmt)
+            self.assertEqual(cache.misses, 4)
+            self.assertEqual(cache.hits, 4)
+            with open(fname) as f:
+                self.assertEqual(f.read(), first)
+            m.p[2] = 7
+            m.write(fname, format=fmt)
+            self.assertEqual(cache.misses, 5)
+            with open(fname) as f:
+                self.assertNotEqual(f.read(), first)
+            m.p[2] = 2
+
+    def test_writer_capacity(self):
+        for fmt, get_cache in (('lp', canonical_repn_cache),
+                               ('mps', canonical_repn_cache),
+                               ('nl', ampl_repn_cache)):
+            fname = pyutilib.services.TempfileManager.create_tempfile(
+                suffix='.'+fmt)
+            m = self._model()
+            m.write(fname, format=fmt)
+            cache = get_cache(m)
+            self.assertEqual(cache.capacity, RepnCache.default_capacity)
+            self.assertEqual(len(cache), 4)
+            m.write(fname,
+                    format=fmt,
+                    io_options={'repn_cache_capacity': 2})
+            self.assertEqual(cache.capacity, 2)
+            self.assertEqual(len(cache), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,10 +27,12 @@ except:
 
 import pyutilib.services
 import pyutilib.pyro
-from pyutilib.pyro import using_pyro4
+from pyutilib.pyro import using_pyro4, TaskProcessingError
 import pyutilib.common
 from pyomo.util import pyomo_command
-from pyomo.opt.base import SolverFactory, ConverterError
+from pyomo.opt.base import ConverterError
+from pyomo.solvers.plugins.smanager.util import (solve_solver_task,
+                                                 SolverConstructionError)
 
 import six
 
@@ -49,69 +51,11 @@ class PyomoMIPWorker(pyutilib.pyro.TaskWorker):
             self._worker_shutdown = True
             return
 
-        time_start = time.time()
-        with pyutilib.services.TempfileManager.push():
-            #
-            # Construct the solver on this end, based on the input
-            # type stored in "data.opt".  This is slightly more
-            # complicated for asl-based solvers, whose real executable
-            # name is stored in data.solver_options["solver"].
-            #
-            with SolverFactory(data.opt) as opt:
-
-                if opt is None:
-                    self._worker_error = True
-                    return TaskProcessingError("Problem constructing solver `"
-                                               +data.opt+"'")
-
-                # here is where we should set any options required by
-                # the solver, available as specific attributes of the
-                # input data object.
-                solver_options = data.solver_options
-                del data.solver_options
-                for key,value in solver_options.items():
-                    setattr(opt.options,key,value)
-
-                problem_filename_suffix = os.path.split(data.filename)[1]
-                temp_problem_filename = \
-                    pyutilib.services.TempfileManager.\
-                    create_tempfile(suffix="."+problem_filename_suffix)
-
-                with open(temp_problem_filename, 'w') as f:
-                    f.write(data.file)
-
-                if data.warmstart_filename is not None:
-                    warmstart_filename_suffix = \
-                        os.path.split(data.warmstart_filename)[1]
-                    temp_warmstart_filename = \
-                        pyutilib.services.TempfileManager.\
-                        create_tempfile(suffix="."+warmstart_filename_suffix)
-                    with open(temp_warmstart_filename, 'w') as f:
-                        f.write(data.warmstart_file)
-                    assert opt.warm_start_capable()
-                    assert (('warmstart' in data.kwds) and \
-                            data.kwds['warmstart'])
-                    data.kwds['warmstart_file'] = temp_warmstart_filename
-
-                now = datetime.datetime.now()
-                if self._verbose:
-                    print(str(now) + ": Applying solver="+data.opt
-                          +" to solve problem="+temp_problem_filename)
-                    sys.stdout.flush()
-                results = opt.solve(temp_problem_filename,
-                                    **data.kwds)
-                assert results._smap_id is None
-                # NOTE: This results object contains solutions,
-                # because no model is provided (just a model file).
-                # Also, the results._smap_id value is None.
-
-        results.pyomo_solve_time = time.time()-time_start
-
-        now = datetime.datetime.now()
-        if self._verbose:
-            print(str(now) + ": Solve completed - number of solutions="
-                  +str(len(results.solution)))
-            sys.stdout.flush()
+        try:
+            results = solve_solver_task(data, verbose=self._verbose)
+        except SolverConstructionError:
+            self._worker_error = True
+            return TaskProcessingError(str(sys.exc_info()[1]))
 
         # PYTHON3 / PYRO4 Fix
         # The default serializer in Pyro4 is not pickle and does not
@@ -16,7 +16,7 @@ import os
 import sys
 from os.path import abspath, dirname
 
-from pyutilib.pyro import using_pyro4
+from pyutilib.pyro import using_pyro4, TaskProcessingError
 import pyutilib.th as unittest
 import pyutilib.services
 from pyutilib.misc import Options
@@ -99,6 +99,22 @@ class Test(unittest.TestCase):
         self.assertEqual(results._smap_id, None)
         os.remove(data['filename'])
 
+    def test_bad_solver(self):
+        data = Options()
+        data.suffixes = {}
+        data.solver_options = {}
+        data.warmstart_filename = None
+        data.filename = 't1.lp'
+        data['file'] = ''
+        data['opt'] = '_bad_solver_name_'
+        data.kwds = {}
+        self.worker._worker_error = False
+        results = self.worker.process(data)
+        self.assertIs(type(results), TaskProcessingError)
+        self.assertEqual(str(results),
+                         "Problem constructing solver `_bad_solver_name_'")
+        self.assertTrue(self.worker._worker_error)
+
 
 if __name__ == "__main__":
     unittest.main()
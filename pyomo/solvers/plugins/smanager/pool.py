@@ -0,0 +1,213 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+
+
+__all__ = []
+
+import traceback
+import multiprocessing
+from collections import deque
+
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
+
+import pyomo.util.plugin
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionHandle,
+                                        ActionStatus)
+from pyomo.opt.parallel.async_solver import AsynchronousSolverManager
+from pyomo.solvers.plugins.smanager.util import (create_solver_task,
+                                                 solve_solver_task,
+                                                 load_solver_results)
+
+from six.moves import queue
+
+def _pool_worker(ah_id, data):
+    """
+    Solve a task in a worker process.  Errors are returned (rather
+    than raised) so that the manager is always notified that the task
+    completed.
+    """
+    try:
+        return ah_id, True, solve_solver_task(data)
+    except:
+        return ah_id, False, traceback.format_exc()
+
+class SolverManager_Pool(AsynchronousSolverManager):
+
+    pyomo.util.plugin.alias(
+        'pool',
+        doc="Execute solvers in parallel using a pool of local processes")
+
+    def __init__(self, **kwds):
+        """
+        Constructor
+
+        Keyword Args:
+            num_workers: The number of worker processes. The default
+                is the number of CPUs.
+        """
+        self._num_workers = kwds.pop('num_workers', None)
+        # the Pyro options that PySP passes to every solver manager
+        kwds.pop('host', None)
+        kwds.pop('port', None)
+        self._pool = None
+        super(SolverManager_Pool, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_Pool, self).clear()
+        self.results = OrderedDict()
+        self._args = {}
+        self._opt_data = {}
+        self._pending = set()
+        # the ids of the tasks that completed, in the order the
+        # workers finished them (filled by the pool result thread)
+        self._completed = queue.Queue()
+        # completed tasks that have not been returned by wait_any()
+        self._unreported = deque()
+
+    @property
+    def num_workers(self):
+        if self._num_workers is None:
+            return multiprocessing.cpu_count()
+        return self._num_workers
+
+    def close(self):
+        """
+        Terminate the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._pending = set()
+
+    def deactivate(self):
+        self.close()
+        super(SolverManager_Pool, self).deactivate()
+
+    #
+    # Perform the queue operation. This method returns the
+    # ActionHandle, and the ActionHandle status indicates whether
+    # the queue was successful.
+    #
+    def _perform_queue(self, ah, *args, **kwds):
+
+        data, opt_data = create_solver_task(self, *args, **kwds)
+        self._args[ah.id] = args
+        self._opt_data[ah.id] = opt_data
+
+        # The pool is created on the first solve, so the workers fork
+        # with all of the solver plugins registered by then
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=self.num_workers)
+        self._pending.add(ah.id)
+        self._pool.apply_async(_pool_worker,
+                               (ah.id, data),
+                               callback=self._completed.put)
+        return ah
+
+    def _collect_results(self, block=True):
+        """
+        Process the completed tasks, waiting for one task to complete
+        if block is True and none are available.
+        """
+        while True:
+            try:
+                if block:
+                    # a timeout keeps the wait interruptible
+                    completed = self._completed.get(timeout=1)
+                else:
+                    completed = self._completed.get_nowait()
+            except queue.Empty:
+                if block and len(self._pending):
+                    continue
+                return
+            block = False
+            ah_id, ok, results = completed
+            self._pending.discard(ah_id)
+            self.queued_action_counter -= 1
+            ah = self.event_handle[ah_id]
+            args = self._args.pop(ah_id)
+            opt_data = self._opt_data.pop(ah_id)
+            if not ok:
+                ah.status = ActionStatus.error
+                raise RuntimeError(
+                    "Worker process reported an error for task with "
+                    "id=%s. Reason: \n%s" % (ah_id, results))
+            ah.status = ActionStatus.done
+            self.results[ah_id] = load_solver_results(results,
+                                                      args,
+                                                      opt_data)
+            self._unreported.append(ah_id)
+
+    def get_results(self, ah):
+        return self.results.pop(ah.id, None)
+
+    def wait_all(self, *args):
+        """
+        Wait for all actions to complete.  The arguments to this method
+        are expected to be ActionHandle objects or iterators that return
+        ActionHandle objects.  If no arguments are provided, then this
+        method will terminate after all queued actions are complete.
+        """
+        ahs = self._flatten(*args)
+        if len(ahs):
+            ahs = set(ah.id for ah in ahs)
+            while len(ahs.intersection(self._pending)):
+                self._collect_results()
+        else:
+            while len(self._pending):
+                self._collect_results()
+
+    def wait_any(self, *args):
+        """
+        Wait for any action (or any of the specified actions) to
+        complete, and return the corresponding ActionHandle.
+        """
+        ahs = self._flatten(*args)
+        self._collect_results(block=False)
+        if len(ahs):
+            while True:
+                for ah in ahs:
+                    if ah.id in self.results:
+                        if ah.id in self._unreported:
+                            self._unreported.remove(ah.id)
+                        return self.event_handle[ah.id]
+                if not len(ahs.intersection(
+                        self.event_handle[ah_id] for ah_id in self._pending)):
+                    raise ActionManagerError(
+                        "None of the action handles passed to wait_any "
+                        "are queued or have results available")
+                self._collect_results()
+        while not len(self._unreported):
+            if not len(self._pending):
+                return ActionHandle(
+                    error=True,
+                    explanation=("No queued evaluations available in "
+                                 "the 'pool' solver manager"))
+            self._collect_results()
+        return self.event_handle[self._unreported.popleft()]
+
+    def wait_for(self, ah):
+        """
+        Wait for the specified action to complete.
+        """
+        while ah.id not in self.results:
+            if ah.id not in self._pending:
+                raise ActionManagerError(
+                    "Action %s is not queued and has no results "
+                    "available" % (ah,))
+            self._collect_results()
+        return self.get_results(ah)
@@ -0,0 +1,248 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Utilities shared by the solver managers that ship problem files to
+# worker processes (pyro, pool).  The manager writes the problem file
+# locally and keeps the symbol map, the worker solves the problem
+# file, and the results are loaded into the model by the manager.
+#
+
+import os
+import sys
+import time
+import datetime
+
+import pyutilib.misc
+import pyutilib.services
+
+from pyomo.opt.base import OptSolver, SolverFactory, UnknownSolver
+from pyomo.opt.parallel.manager import ActionManagerError
+from pyomo.core.base import Block
+from pyomo.core.base.suffix import active_import_suffix_generator
+
+import six
+from six.moves import xrange
+
+def create_solver_task(manager, *args, **kwds):
+    """
+    Write the problem file for a solve and return the task data sent
+    to the worker, along with the data needed to load the results
+    into the model: (data, (smap_id, load_solutions, select_index,
+    default_variable_value)).
+    """
+    opt = kwds.pop('solver', kwds.pop('opt', None))
+    if opt is None:
+        raise ActionManagerError(
+            "No solver passed to %s, use keyword option 'solver'"
+            % (type(manager).__name__) )
+    deactivate_opt = False
+    if isinstance(opt, six.string_types):
+        deactivate_opt = True
+        opt = SolverFactory(opt, solver_io=kwds.pop('solver_io', None))
+
+    #
+    # The following block of code is taken from the OptSolver.solve()
+    # method, which we do not directly invoke with this interface
+    #
+
+    #
+    # If the inputs are models, then validate that they have been
+    # constructed! Collect suffix names to try and import from solution.
+    #
+    for arg in args:
+        if isinstance(arg, Block):
+            if not arg.is_constructed():
+                raise RuntimeError(
+                    "Attempting to solve model=%s with unconstructed "
+                    "component(s)" % (arg.name,) )
+
+            model_suffixes = list(name for (name,comp) \
+                                  in active_import_suffix_generator(arg))
+            if len(model_suffixes) > 0:
+                kwds_suffixes = kwds.setdefault('suffixes',[])
+                for name in model_suffixes:
+                    if name not in kwds_suffixes:
+                        kwds_suffixes.append(name)
+
+    #
+    # Handle ephemeral solvers options here. These
+    # will override whatever is currently in the options
+    # dictionary, but we will reset these options to
+    # their original value at the end of this method.
+    #
+    ephemeral_solver_options = {}
+    ephemeral_solver_options.update(kwds.pop('options', {}))
+    ephemeral_solver_options.update(
+        OptSolver._options_string_to_dict(kwds.pop('options_string', '')))
+
+    #
+    # Force pyomo.opt to ignore tests for availability, at least locally.
+    #
+    del_available = bool('available' not in kwds)
+    kwds['available'] = True
+    opt._presolve(*args, **kwds)
+    problem_file_string = None
+    with open(opt._problem_files[0], 'r') as f:
+        problem_file_string = f.read()
+
+    #
+    # Delete this option, to ensure that the remote worker does the check for
+    # availability.
+    #
+    if del_available:
+        del kwds['available']
+
+    #
+    # We can't pickle the options object itself - so extract a simple
+    # dictionary of solver options and re-construct it on the other end.
+    #
+    solver_options = {}
+    for key in opt.options:
+        solver_options[key]=opt.options[key]
+    solver_options.update(ephemeral_solver_options)
+
+    #
+    # NOTE: let the distributed node deal with the warm-start
+    # pick up the warm-start file, if available.
+    #
+    warm_start_file_string = None
+    warm_start_file_name = None
+    if hasattr(opt,  "_warm_start_solve"):
+        if opt._warm_start_solve  and \
+           (opt._warm_start_file_name is not None):
+            warm_start_file_name = opt._warm_start_file_name
+            with open(warm_start_file_name, 'r') as f:
+                warm_start_file_string = f.read()
+
+    data = pyutilib.misc.Bunch(opt=opt.type, \
+                               file=problem_file_string, \
+                               filename=opt._problem_files[0], \
+                               warmstart_file=warm_start_file_string, \
+                               warmstart_filename=warm_start_file_name, \
+                               kwds=kwds, \
+                               solver_options=solver_options, \
+                               suffixes=opt._suffixes)
+
+    opt_data = (opt._smap_id,
+                opt._load_solutions,
+                opt._select_index,
+                opt._default_variable_value)
+    if deactivate_opt:
+        opt.deactivate()
+
+    return data, opt_data
+
+class SolverConstructionError(ValueError):
+    """
+    Raised by solve_solver_task() when the solver named in the task
+    data cannot be constructed.
+    """
+
+def solve_solver_task(data, verbose=False):
+    """
+    Solve the problem file in the task data created by
+    create_solver_task() and return the results object.  Raises
+    SolverConstructionError if the solver cannot be constructed.
+    """
+    time_start = time.time()
+    with pyutilib.services.TempfileManager.push():
+        #
+        # Construct the solver on this end, based on the input
+        # type stored in "data.opt".  This is slightly more
+        # complicated for asl-based solvers, whose real executable
+        # name is stored in data.solver_options["solver"].
+        #
+        with SolverFactory(data.opt) as opt:
+
+            if (opt is None) or isinstance(opt, UnknownSolver):
+                raise SolverConstructionError("Problem constructing solver `"
+                                              +data.opt+"'")
+
+            # here is where we should set any options required by
+            # the solver, available as specific attributes of the
+            # input data object.
+            solver_options = data.solver_options
+            del data.solver_options
+            for key,value in solver_options.items():
+                setattr(opt.options,key,value)
+
+            problem_filename_suffix = os.path.split(data.filename)[1]
+            temp_problem_filename = \
+                pyutilib.services.TempfileManager.\
+                create_tempfile(suffix="."+problem_filename_suffix)
+
+            with open(temp_problem_filename, 'w') as f:
+                f.write(data.file)
+
+            if data.warmstart_filename is not None:
+                warmstart_filename_suffix = \
+                    os.path.split(data.warmstart_filename)[1]
+                temp_warmstart_filename = \
+                    pyutilib.services.TempfileManager.\
+                    create_tempfile(suffix="."+warmstart_filename_suffix)
+                with open(temp_warmstart_filename, 'w') as f:
+                    f.write(data.warmstart_file)
+                assert opt.warm_start_capable()
+                assert (('warmstart' in data.kwds) and \
+                        data.kwds['warmstart'])
+                data.kwds['warmstart_file'] = temp_warmstart_filename
+
+            now = datetime.datetime.now()
+            if verbose:
+                print(str(now) + ": Applying solver="+data.opt
+                      +" to solve problem="+temp_problem_filename)
+                sys.stdout.flush()
+            results = opt.solve(temp_problem_filename,
+                                **data.kwds)
+            assert results._smap_id is None
+            # NOTE: This results object contains solutions,
+            # because no model is provided (just a model file).
+            # Also, the results._smap_id value is None.
+
+    # Columnar solutions pickle compactly, and they are loaded into
+    # the model without creating a dictionary per symbol.
+    for i in xrange(len(results.solution)):
+        results.solution[i].compact()
+
+    results.pyomo_solve_time = time.time()-time_start
+
+    now = datetime.datetime.now()
+    if verbose:
+        print(str(now) + ": Solve completed - number of solutions="
+              +str(len(results.solution)))
+        sys.stdout.flush()
+
+    return results
+
+def load_solver_results(results, args, opt_data):
+    """
+    Tag the results returned by a worker with the symbol map of the
+    problem file and, if requested, load them into the model.
+    """
+    (smap_id,
+     load_solutions,
+     select_index,
+     default_variable_value) = opt_data
+
+    # Tag the results object with the symbol map id.
+    results._smap_id = smap_id
+
+    if isinstance(args[0], Block):
+        _model = args[0]
+        if load_solutions:
+            _model.solutions.load_from(
+                results,
+                select=select_index,
+                default_variable_value=default_variable_value)
+            results._smap_id = None
+            results.solution.clear()
+        else:
+            results._smap = _model.solutions.symbol_map[smap_id]
+            _model.solutions.delete_symbol_map(smap_id)
+    return results
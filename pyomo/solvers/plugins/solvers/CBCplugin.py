@@ -258,6 +258,7 @@ class CBCSHELL(SystemCallSolver):
         cmd = [ executable ]
         if self._timer:
             cmd.insert(0, self._timer)
+        session = None
         if self._problem_format == ProblemFormat.nl:
             cmd.append(problem_files[0])
             cmd.append('-AMPL')
@@ -292,7 +293,33 @@ class CBCSHELL(SystemCallSolver):
                         "-solve", 
                         "-solu", self._soln_file])
             cmd.extend(action_options)
-        return pyutilib.misc.Bunch(cmd=cmd, log_file=self._log_file, env=None)
+            #
+            # Define the commands for a solver session, which are the
+            # interactive form of the command line above. CBC reads
+            # a command per line after printing the 'Coin:' prompt.
+            #
+            settings = []
+            if self._timelimit is not None and self._timelimit > 0.0:
+                settings.append('sec '+str(self._timelimit))
+            if "debug" in self.options:
+                settings.append('log 5')
+            for key, val in _check_and_escape_options(self.options):
+                if val.strip() != '':
+                    settings.append(key+' '+val)
+            settings.append('printingOptions all')
+            session = pyutilib.misc.Bunch(
+                cmd=[executable],
+                env=None,
+                prompt='Coin:',
+                settings=settings,
+                script=['import '+problem_files[0],
+                        'solve',
+                        'solution '+self._soln_file] + \
+                       [opt[1:] for opt in action_options])
+        return pyutilib.misc.Bunch(cmd=cmd,
+                                   log_file=self._log_file,
+                                   env=None,
+                                   session=session)
 
     def process_logfile(self):
         """
@@ -12,6 +12,10 @@ import os
 import re
 import time
 import logging
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
 
 import pyutilib.services
 import pyutilib.common
@@ -34,6 +38,11 @@ try:
 except:
     basestring = unicode = str
 
+try:
+    from xml.etree.cElementTree import iterparse
+except ImportError:                         #pragma:nocover
+    from xml.etree.ElementTree import iterparse
+
 class CPLEX(OptSolver):
     """The CPLEX LP/MIP solver
     """
@@ -440,6 +449,84 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
             pass
         return results
 
+    def _process_soln_header(self, results, soln, header):
+        """
+        Process the attributes of the header element of a solution
+        file.
+        """
+        time_limit_exceeded = False
+        mip_problem=False
+        if "problemName" in header:
+            filename = header["problemName"]
+            results.problem.name = os.path.basename(filename)
+            if '.' in results.problem.name:
+                results.problem.name = results.problem.name.split('.')[0]
+            tINPUT=open(filename,"r")
+            for tline in tINPUT:
+                tline = tline.strip()
+                if tline == "":
+                    continue
+                tokens = re.split('[\t ]+',tline)
+                if tokens[0][0] in ['\\', '*']:
+                    continue
+                elif tokens[0] == "NAME":
+                    results.problem.name = tokens[1]
+                else:
+                    sense = tokens[0].lower()
+                    if sense in ['max','maximize']:
+                        results.problem.sense = ProblemSense.maximize
+                    if sense in ['min','minimize']:
+                        results.problem.sense = ProblemSense.minimize
+                break
+            tINPUT.close()
+        if "objectiveValue" in header:
+            soln.objective['__default_objective__']['Value'] = float(header["objectiveValue"])
+        if "solutionStatusValue" in header:
+            solution_status = int(header["solutionStatusValue"])
+            # solution status = 1 => optimal
+            # solution status = 3 => infeasible
+            if soln.status == SolutionStatus.unknown:
+                if solution_status == 1:
+                    soln.status = SolutionStatus.optimal
+                elif solution_status == 3:
+                    soln.status = SolutionStatus.infeasible
+                    soln.gap = None
+                else:
+                    # we are flagging anything with a solution status >= 4 as an error, to possibly
+                    # be over-ridden as we learn more about the status (e.g., due to time limit exceeded).
+                    soln.status = SolutionStatus.error
+                    soln.gap = None
+        if "solutionStatusString" in header:
+            solution_status = header["solutionStatusString"].strip()
+            if solution_status in ["optimal", "integer optimal solution", "integer optimal, tolerance"]:
+                soln.status = SolutionStatus.optimal
+                soln.gap = 0.0
+                results.problem.lower_bound = soln.objective['__default_objective__']['Value']
+                results.problem.upper_bound = soln.objective['__default_objective__']['Value']
+                if "integer" in solution_status:
+                    mip_problem=True
+            elif solution_status in ["infeasible"]:
+                soln.status = SolutionStatus.infeasible
+                soln.gap = None
+            elif solution_status in ["time limit exceeded"]:
+                # we need to know if the solution is primal feasible, and if it is, set the solution status accordingly.
+                # for now, just set the flag so we can trigger the logic when we see the primalFeasible keyword.
+                time_limit_exceeded = True
+        if ("primalFeasible" in header) and (time_limit_exceeded is True):
+            primal_feasible = int(header["primalFeasible"])
+            if primal_feasible == 1:
+                soln.status = SolutionStatus.feasible
+                if (results.problem.sense == ProblemSense.minimize):
+                    results.problem.upper_bound = soln.objective['__default_objective__']['Value']
+                else:
+                    results.problem.lower_bound = soln.objective['__default_objective__']['Value']
+            else:
+                soln.status = SolutionStatus.infeasible
+        if ("MIPNodes" in header) and mip_problem:
+            n = int(header["MIPNodes"])
+            results.solver.statistics.branch_and_bound.number_of_created_subproblems=n
+            results.solver.statistics.branch_and_bound.number_of_bounded_subproblems=n
+
     def process_soln_file(self,results):
 
         # the only suffixes that we extract from CPLEX are
@@ -487,160 +574,77 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
         soln = Solution()
         soln.objective['__default_objective__'] = {'Value':None}
 
-        # caching for efficiency
-        soln_variables = soln.variable
-        soln_constraints = soln.constraint
+        # The variable and constraint values are collected in lists
+        # and stored as SymbolColumns, with NaN for values that are
+        # missing in the solution file.  Only the requested suffixes
+        # are read.
+        nan = float('nan')
+        variable_names = []
+        variable_values = []
+        variable_rc = []
+        variable_lrc = []
+        variable_urc = []
+        constraint_names = []
+        constraint_duals = []
+        constraint_slacks = []
 
-        INPUT = open(self._soln_file, "r")
         results.problem.number_of_objectives=1
-        time_limit_exceeded = False
-        mip_problem=False
-        for line in INPUT:
-            line = line.strip()
-            line = line.lstrip('<?/')
-            line = line.rstrip('/>?')
-            tokens=line.split(' ')
-
-            if tokens[0] == "variable":
-                variable_name = None
-                variable_value = None
-                variable_reduced_cost = None
-                variable_status = None
-                for i in xrange(1,len(tokens)):
-                    field_name =  tokens[i].split('=')[0]
-                    field_value = tokens[i].split('=')[1].lstrip("\"").rstrip("\"")
-                    if field_name == "name":
-                        variable_name = field_value
-                    elif field_name == "value":
-                        variable_value = field_value
-                    elif (extract_reduced_costs is True) and (field_name == "reducedCost"):
-                        variable_reduced_cost = field_value
-                    elif (extract_reduced_costs is True) and (field_name == "status"):
-                        variable_status = field_value
-
+        #
+        # The solution file is parsed incrementally.  The attributes of
+        # an element are complete at its 'start' event, and the
+        # variables and constraints that have been processed are
+        # removed from their parent element, so the parsed tree does
+        # not grow with the size of the file.
+        #
+        parent = None
+        for event, elem in iterparse(self._soln_file, events=('start',)):
+            tag = elem.tag
+            if tag == "variable":
+                get = elem.get
+                variable_name = get("name")
                 # skip the "constant-one" variable, used to capture/retain objective offsets in the CPLEX LP format.
                 if variable_name != "ONE_VAR_CONSTANT":
-                    variable = soln_variables[variable_name] = {"Value" : float(variable_value)}
-                    if (variable_reduced_cost is not None) and (extract_reduced_costs is True):
-                        try:
-                            if extract_rc is True:
-                                variable["Rc"] = float(variable_reduced_cost)
+                    variable_names.append(variable_name)
+                    variable_values.append(float(get("value")))
+                    if extract_reduced_costs is True:
+                        variable_reduced_cost = get("reducedCost")
+                        variable_status = get("status")
+                        rc = lrc = urc = nan
+                        if variable_reduced_cost is not None:
+                            try:
+                                rc = float(variable_reduced_cost)
+                            except:
+                                raise ValueError("Unexpected reduced-cost value="+str(variable_reduced_cost)+" encountered for variable="+variable_name)
                             if variable_status is not None:
-                                if extract_lrc is True:
-                                    if variable_status == "LL":
-                                        variable["Lrc"] = float(variable_reduced_cost)
-                                    else:
-                                        variable["Lrc"] = 0.0
-                                if extract_urc is True:
-                                    if variable_status == "UL":
-                                        variable["Urc"] = float(variable_reduced_cost)
-                                    else:
-                                        variable["Urc"] = 0.0
-                        except:
-                            raise ValueError("Unexpected reduced-cost value="+str(variable_reduced_cost)+" encountered for variable="+variable_name)
-            elif (tokens[0] == "constraint") and ((extract_duals is True) or (extract_slacks is True)):
-                is_range = False
-                rlabel = None
-                rkey = None
-                for i in xrange(1,len(tokens)):
-                    field_name =  tokens[i].split('=')[0]
-                    field_value = tokens[i].split('=')[1].lstrip("\"").rstrip("\"")
-                    if field_name == "name":
-                        if field_value.startswith('c_'):
-                            constraint = soln_constraints[field_value] = {}
-                        elif field_value.startswith('r_l_'):
-                            is_range = True
-                            rlabel = field_value[4:]
-                            rkey = 0
-                        elif field_value.startswith('r_u_'):
-                            is_range = True
-                            rlabel = field_value[4:]
-                            rkey = 1
-                    elif (extract_duals is True) and (field_name == "dual"): # for LPs
-                        if is_range is False:
-                            constraint["Dual"] = float(field_value)
-                        else:
-                            range_duals.setdefault(rlabel,[0,0])[rkey] = float(field_value)
-                    elif (extract_slacks is True) and (field_name == "slack"): # for MIPs
-                        if is_range is False:
-                            constraint["Slack"] = float(field_value)
-                        else:
-                            range_slacks.setdefault(rlabel,[0,0])[rkey] = float(field_value)
-            elif tokens[0].startswith("problemName"):
-                filename = (tokens[0].split('=')[1].strip()).lstrip("\"").rstrip("\"")
-                results.problem.name = os.path.basename(filename)
-                if '.' in results.problem.name:
-                    results.problem.name = results.problem.name.split('.')[0]
-                tINPUT=open(filename,"r")
-                for tline in tINPUT:
-                    tline = tline.strip()
-                    if tline == "":
-                        continue
-                    tokens = re.split('[\t ]+',tline)
-                    if tokens[0][0] in ['\\', '*']:
-                        continue
-                    elif tokens[0] == "NAME":
-                        results.problem.name = tokens[1]
-                    else:
-                        sense = tokens[0].lower()
-                        if sense in ['max','maximize']:
-                            results.problem.sense = ProblemSense.maximize
-                        if sense in ['min','minimize']:
-                            results.problem.sense = ProblemSense.minimize
-                    break
-                tINPUT.close()
-
-            elif tokens[0].startswith("objectiveValue"):
-                objective_value = (tokens[0].split('=')[1].strip()).lstrip("\"").rstrip("\"")
-                soln.objective['__default_objective__']['Value'] = float(objective_value)
-            elif tokens[0].startswith("solutionStatusValue"):
-               pieces = tokens[0].split("=")
-               solution_status = eval(pieces[1])
-               # solution status = 1 => optimal
-               # solution status = 3 => infeasible
-               if soln.status == SolutionStatus.unknown:
-                  if solution_status == 1:
-                    soln.status = SolutionStatus.optimal
-                  elif solution_status == 3:
-                    soln.status = SolutionStatus.infeasible
-                    soln.gap = None
-                  else:
-                      # we are flagging anything with a solution status >= 4 as an error, to possibly
-                      # be over-ridden as we learn more about the status (e.g., due to time limit exceeded).
-                      soln.status = SolutionStatus.error
-                      soln.gap = None
-            elif tokens[0].startswith("solutionStatusString"):
-                solution_status = ((" ".join(tokens).split('=')[1]).strip()).lstrip("\"").rstrip("\"")
-                if solution_status in ["optimal", "integer optimal solution", "integer optimal, tolerance"]:
-                    soln.status = SolutionStatus.optimal
-                    soln.gap = 0.0
-                    results.problem.lower_bound = soln.objective['__default_objective__']['Value']
-                    results.problem.upper_bound = soln.objective['__default_objective__']['Value']
-                    if "integer" in solution_status:
-                        mip_problem=True
-                elif solution_status in ["infeasible"]:
-                    soln.status = SolutionStatus.infeasible
-                    soln.gap = None
-                elif solution_status in ["time limit exceeded"]:
-                    # we need to know if the solution is primal feasible, and if it is, set the solution status accordingly.
-                    # for now, just set the flag so we can trigger the logic when we see the primalFeasible keyword.
-                    time_limit_exceeded = True
-            elif tokens[0].startswith("MIPNodes"):
-                if mip_problem:
-                    n = eval(eval((" ".join(tokens).split('=')[1]).strip()).lstrip("\"").rstrip("\""))
-                    results.solver.statistics.branch_and_bound.number_of_created_subproblems=n
-                    results.solver.statistics.branch_and_bound.number_of_bounded_subproblems=n
-            elif tokens[0].startswith("primalFeasible") and (time_limit_exceeded is True):
-                primal_feasible = int(((" ".join(tokens).split('=')[1]).strip()).lstrip("\"").rstrip("\""))
-                if primal_feasible == 1:
-                    soln.status = SolutionStatus.feasible
-                    if (results.problem.sense == ProblemSense.minimize):
-                        results.problem.upper_bound = soln.objective['__default_objective__']['Value']
-                    else:
-                        results.problem.lower_bound = soln.objective['__default_objective__']['Value']
-                else:
-                    soln.status = SolutionStatus.infeasible
-
+                                lrc = rc if variable_status == "LL" else 0.0
+                                urc = rc if variable_status == "UL" else 0.0
+                        variable_rc.append(rc)
+                        variable_lrc.append(lrc)
+                        variable_urc.append(urc)
+                parent.clear()
+            elif tag == "constraint":
+                if (extract_duals is True) or (extract_slacks is True):
+                    get = elem.get
+                    name = get("name")
+                    dual = get("dual") if extract_duals else None # for LPs
+                    slack = get("slack") if extract_slacks else None # for MIPs
+                    if name.startswith('c_'):
+                        constraint_names.append(name)
+                        constraint_duals.append(nan if dual is None else float(dual))
+                        constraint_slacks.append(nan if slack is None else float(slack))
+                    elif name.startswith('r_l_') or name.startswith('r_u_'):
+                        rkey = 0 if name.startswith('r_l_') else 1
+                        rlabel = name[4:]
+                        if dual is not None:
+                            range_duals.setdefault(rlabel,[0,0])[rkey] = float(dual)
+                        if slack is not None:
+                            range_slacks.setdefault(rlabel,[0,0])[rkey] = float(slack)
+                parent.clear()
+            elif tag == "header":
+                parent = elem
+                self._process_soln_header(results, soln, elem.attrib)
+            else:
+                parent = elem
 
         if self._best_bound is not None:
             if results.problem.sense == ProblemSense.minimize:
@@ -652,17 +656,34 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
 
         # For the range constraints, supply only the dual with the largest
         # magnitude (at least one should always be numerically zero)
-        for key,(ld,ud) in iteritems(range_duals):
-            if abs(ld) > abs(ud):
-                soln_constraints['r_l_'+key] = {"Dual" : ld}
-            else:
-                soln_constraints['r_l_'+key] = {"Dual" : ud}                # Use the same key
-        # slacks
-        for key,(ls,us) in iteritems(range_slacks):
-            if abs(ls) > abs(us):
-                soln_constraints.setdefault('r_l_'+key,{})["Slack"] = ls
-            else:
-                soln_constraints.setdefault('r_l_'+key,{})["Slack"] = us    # Use the same key
+        for key in set(range_duals) | set(range_slacks):
+            constraint_names.append('r_l_'+key)                            # Use the same key
+            for pairs, values in ((range_duals, constraint_duals),
+                                  (range_slacks, constraint_slacks)):
+                pair = pairs.get(key, None)
+                if pair is None:
+                    values.append(nan)
+                elif abs(pair[0]) > abs(pair[1]):
+                    values.append(pair[0])
+                else:
+                    values.append(pair[1])
+
+        if len(variable_names):
+            columns = OrderedDict([('Value', variable_values)])
+            if extract_rc is True:
+                columns['Rc'] = variable_rc
+            if extract_lrc is True:
+                columns['Lrc'] = variable_lrc
+            if extract_urc is True:
+                columns['Urc'] = variable_urc
+            soln.variable = SymbolColumns(variable_names, columns)
+        if len(constraint_names):
+            columns = OrderedDict()
+            if extract_duals is True:
+                columns['Dual'] = constraint_duals
+            if extract_slacks is True:
+                columns['Slack'] = constraint_slacks
+            soln.constraint = SymbolColumns(constraint_names, columns)
 
         if not results.solver.status is SolverStatus.error:
             if results.solver.termination_condition in [TerminationCondition.unknown,
@@ -680,8 +701,6 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
                   (soln.status is not SolutionStatus.infeasible):
                 results.solution.insert(soln)
 
-        INPUT.close()
-
     def _postsolve(self):
 
         # take care of the annoying (and empty) CPLEX temporary files in the current directory.
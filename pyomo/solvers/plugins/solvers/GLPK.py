@@ -216,6 +216,9 @@ class GLPKSHELL(SystemCallSolver):
             for fname in problem_files[1:]:
                 cmd.extend(['--data', fname])
 
+        # glpsol has no interactive mode, so solves within a
+        # SolverSession start a new glpsol process (there is no
+        # 'session' entry in the command)
         return Bunch(cmd=cmd, log_file=self._log_file, env=None)
 
     def process_logfile(self):
@@ -12,6 +12,10 @@ import sys
 import re
 import time
 import logging
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
 
 import pyutilib.services
 import pyutilib.misc
@@ -353,9 +357,15 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
 
         soln = Solution()
 
-        # caching for efficiency
-        soln_variables = soln.variable
-        soln_constraints = soln.constraint
+        # The variable and constraint values are collected in lists
+        # and dictionaries, and stored as SymbolColumns.  Only the
+        # requested suffixes are read.
+        nan = float('nan')
+        variable_names = []
+        variable_values = []
+        variable_rc = {}
+        constraint_duals = {}
+        constraint_slacks = {}
 
         num_variables_read = 0
 
@@ -374,23 +384,54 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
 
         INPUT = open(self._soln_file, "r")
         for line in INPUT:
-            line = line.strip()
-            tokens = [token.strip() for token in line.split(":")]
-            if (tokens[0] == 'section'):
-                if (tokens[1] == 'problem'):
+            # only the leading tokens are stripped for the (many)
+            # variable and constraint lines
+            tokens = line.split(":")
+            key = tokens[0].strip()
+            if (key == 'section'):
+                name = tokens[1].strip()
+                if (name == 'problem'):
                     section = 1
-                elif (tokens[1] == 'solution'):
+                elif (name == 'solution'):
                     section = 2
                     solution_seen = True
-                elif (tokens[1] == 'solver'):
+                elif (name == 'solver'):
                     section = 3
-            else:
-                if (section == 2):
-                    if (tokens[0] == 'var'):
-                        if tokens[1] != "ONE_VAR_CONSTANT":
-                            soln_variables[tokens[1]] = {"Value" : float(tokens[2])}
-                            num_variables_read += 1
-                    elif (tokens[0] == 'status'):
+            elif (section == 2):
+                if (key == 'var'):
+                    name = tokens[1].strip()
+                    if name != "ONE_VAR_CONSTANT":
+                        variable_names.append(name)
+                        variable_values.append(float(tokens[2]))
+                        num_variables_read += 1
+                elif (key == 'varrc'):
+                    if extract_rc is True:
+                        name = tokens[1].strip()
+                        if name != "ONE_VAR_CONSTANT":
+                            variable_rc[name] = float(tokens[2])
+                elif (key == 'constraintdual'):
+                    if extract_duals is True:
+                        name = tokens[1].strip()
+                        if name.startswith('c_'):
+                            if name != "c_e_ONE_VAR_CONSTANT":
+                                constraint_duals[name] = float(tokens[2])
+                        elif name.startswith('r_l_'):
+                            range_duals.setdefault(name[4:],[0,0])[0] = float(tokens[2])
+                        elif name.startswith('r_u_'):
+                            range_duals.setdefault(name[4:],[0,0])[1] = float(tokens[2])
+                elif (key == 'constraintslack'):
+                    if extract_slacks is True:
+                        name = tokens[1].strip()
+                        if name.startswith('c_'):
+                            if name != "c_e_ONE_VAR_CONSTANT":
+                                constraint_slacks[name] = float(tokens[2])
+                        elif name.startswith('r_l_'):
+                            range_slacks.setdefault(name[4:],[0,0])[0] = float(tokens[2])
+                        elif name.startswith('r_u_'):
+                            range_slacks.setdefault(name[4:],[0,0])[1] = float(tokens[2])
+                else:
+                    tokens = [token.strip() for token in tokens]
+                    if (tokens[0] == 'status'):
                         soln.status = getattr(SolutionStatus, tokens[1])
                     elif (tokens[0] == 'gap'):
                         soln.gap = float(tokens[1])
@@ -400,51 +441,32 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
                             results.problem.upper_bound = float(tokens[1])
                         else:
                             results.problem.lower_bound = float(tokens[1])
-                    elif (tokens[0] == 'constraintdual'):
-                        name = tokens[1]
-                        if name != "c_e_ONE_VAR_CONSTANT":
-                            if name.startswith('c_'):
-                                soln_constraints.setdefault(tokens[1],{})["Dual"] = float(tokens[2])
-                            elif name.startswith('r_l_'):
-                                range_duals.setdefault(name[4:],[0,0])[0] = float(tokens[2])
-                            elif name.startswith('r_u_'):
-                                range_duals.setdefault(name[4:],[0,0])[1] = float(tokens[2])
-                    elif (tokens[0] == 'constraintslack'):
-                        name = tokens[1]
-                        if name != "c_e_ONE_VAR_CONSTANT":
-                            if name.startswith('c_'):
-                                soln_constraints.setdefault(tokens[1],{})["Slack"] = float(tokens[2])
-                            elif name.startswith('r_l_'):
-                                range_slacks.setdefault(name[4:],[0,0])[0] = float(tokens[2])
-                            elif name.startswith('r_u_'):
-                                range_slacks.setdefault(name[4:],[0,0])[1] = float(tokens[2])
-                    elif (tokens[0] == 'varrc'):
-                        if tokens[1] != "ONE_VAR_CONSTANT":
-                            soln_variables[tokens[1]]["Rc"] = float(tokens[2])
                     else:
                         setattr(soln, tokens[0], tokens[1])
-                elif (section == 1):
-                    if tokens[0] == 'sense':
-                        if tokens[1] == 'minimize':
-                            results.problem.sense = ProblemSense.minimize
-                        elif tokens[1] == 'maximize':
-                            results.problem.sense = ProblemSense.maximize
-                    else:
-                        try:
-                            val = eval(tokens[1])
-                        except:
-                            val = tokens[1]
-                        setattr(results.problem, tokens[0], val)
-                elif (section == 3):
-                    if (tokens[0] == 'status'):
-                        results.solver.status = getattr(SolverStatus, tokens[1])
-                    elif (tokens[0] == 'termination_condition'):
-                        try:
-                            results.solver.termination_condition = getattr(TerminationCondition, tokens[1])
-                        except AttributeError:
-                            results.solver.termination_condition = TerminationCondition.unknown
-                    else:
-                        setattr(results.solver, tokens[0], tokens[1])
+            elif (section == 1):
+                tokens = [token.strip() for token in tokens]
+                if tokens[0] == 'sense':
+                    if tokens[1] == 'minimize':
+                        results.problem.sense = ProblemSense.minimize
+                    elif tokens[1] == 'maximize':
+                        results.problem.sense = ProblemSense.maximize
+                else:
+                    try:
+                        val = eval(tokens[1])
+                    except:
+                        val = tokens[1]
+                    setattr(results.problem, tokens[0], val)
+            elif (section == 3):
+                tokens = [token.strip() for token in tokens]
+                if (tokens[0] == 'status'):
+                    results.solver.status = getattr(SolverStatus, tokens[1])
+                elif (tokens[0] == 'termination_condition'):
+                    try:
+                        results.solver.termination_condition = getattr(TerminationCondition, tokens[1])
+                    except AttributeError:
+                        results.solver.termination_condition = TerminationCondition.unknown
+                else:
+                    setattr(results.solver, tokens[0], tokens[1])
 
         INPUT.close()
 
@@ -452,15 +474,34 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
         # magnitude (at least one should always be numerically zero)
         for key,(ld,ud) in iteritems(range_duals):
             if abs(ld) > abs(ud):
-                soln_constraints['r_l_'+key] = {"Dual" : ld}
+                constraint_duals['r_l_'+key] = ld
             else:
-                soln_constraints['r_l_'+key] = {"Dual" : ud}                # Use the same key
+                constraint_duals['r_l_'+key] = ud                # Use the same key
         # slacks
         for key,(ls,us) in iteritems(range_slacks):
             if abs(ls) > abs(us):
-                soln_constraints.setdefault('r_l_'+key,{})["Slack"] = ls
+                constraint_slacks['r_l_'+key] = ls
             else:
-                soln_constraints.setdefault('r_l_'+key,{})["Slack"] = us    # Use the same key
+                constraint_slacks['r_l_'+key] = us               # Use the same key
+
+        if len(variable_names):
+            columns = OrderedDict([('Value', variable_values)])
+            if len(variable_rc):
+                columns['Rc'] = [variable_rc.get(name, nan)
+                                 for name in variable_names]
+            soln.variable = SymbolColumns(variable_names, columns)
+        constraint_names = list(constraint_duals)
+        constraint_names.extend(name for name in constraint_slacks
+                                if name not in constraint_duals)
+        if len(constraint_names):
+            columns = OrderedDict()
+            if len(constraint_duals):
+                columns['Dual'] = [constraint_duals.get(name, nan)
+                                   for name in constraint_names]
+            if len(constraint_slacks):
+                columns['Slack'] = [constraint_slacks.get(name, nan)
+                                    for name in constraint_names]
+            soln.constraint = SymbolColumns(constraint_names, columns)
 
         if solution_seen is True:
             results.solution.insert(soln)
@@ -0,0 +1,182 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for the 'pool' solver manager
+#
+
+import os
+import re
+import time
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+import pyutilib.misc
+import pyutilib.services
+
+import pyomo.opt
+from pyomo.opt import (ProblemFormat,
+                       SolverResults,
+                       SolutionStatus,
+                       SymbolColumns,
+                       TerminationCondition)
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionStatus,
+                                        FailedActionHandle)
+from pyomo.util.plugin import alias
+from pyomo.environ import *
+
+class PoolTestSolver(pyomo.opt.OptSolver):
+    """
+    A solver that sets every variable bounded in an LP file to the
+    'value' option, after sleeping for 'sleep' seconds.  The solver message
+    is the id of the process that solved the problem.
+    """
+
+    alias('_pool_test')
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_pool_test'
+        pyomo.opt.OptSolver.__init__(self, **kwds)
+        self._problem_format = ProblemFormat.cpxlp
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self._capabilities = pyutilib.misc.Options()
+        self._capabilities.linear = True
+
+    def _apply_solver(self):
+        time.sleep(self.options.get('sleep', 0))
+        if self.options.get('fail', False):
+            raise RuntimeError("Forced failure")
+        return pyutilib.misc.Bunch(rc=0, log="")
+
+    def _postsolve(self):
+        with open(self._problem_files[0]) as f:
+            bounds = f.read().split('\nbounds\n')[1]
+        symbols = re.findall(r'\bx\d+\b', bounds)
+        results = SolverResults()
+        results.solver.message = str(os.getpid())
+        results.solver.termination_condition = TerminationCondition.optimal
+        soln = results.solution.add()
+        soln.status = SolutionStatus.optimal
+        for symbol in symbols:
+            soln.variable[symbol] = {"Value": self.options.get('value', 1)}
+        return results
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(0, 10))
+    m.o = Objective(expr=summation(m.x))
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    return m
+
+class TestPoolManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = SolverManagerFactory('pool', num_workers=3)
+
+    def tearDown(self):
+        self.manager.deactivate()
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def test_factory(self):
+        self.assertIn('pool', SolverManagerFactory.services())
+        self.assertEqual(self.manager.num_workers, 3)
+        # PySP passes the pyro options to every solver manager
+        mngr = SolverManagerFactory('pool', host=None, port=None)
+        self.assertTrue(mngr.num_workers >= 1)
+        mngr.deactivate()
+
+    def test_solve(self):
+        m = _model()
+        results = self.manager.solve(m, opt='_pool_test',
+                                     options={'value': 2})
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertNotEqual(results.solver.message, str(os.getpid()))
+        for i in m.x:
+            self.assertEqual(m.x[i].value, 2)
+        self.assertEqual(len(m.solutions), 1)
+        self.assertEqual(self.manager.num_queued(), 0)
+
+    def test_load_solutions_false(self):
+        m = _model()
+        opt = SolverFactory('_pool_test')
+        ah = self.manager.queue(m, opt=opt, load_solutions=False)
+        results = self.manager.wait_for(ah)
+        self.assertEqual(m.x[1].value, None)
+        self.assertEqual(len(results.solution), 1)
+        # the worker returns columnar solutions
+        self.assertIs(type(results.solution[0].variable), SymbolColumns)
+        m.solutions.load_from(results)
+        self.assertEqual(m.x[1].value, 1)
+
+    def test_queue_wait_any(self):
+        models = [_model() for i in range(4)]
+        ahs = []
+        for i, m in enumerate(models):
+            ahs.append(self.manager.queue(m, opt='_pool_test',
+                                          options={'value': i}))
+        self.assertEqual(self.manager.num_queued(), 4)
+        done = []
+        for i in range(4):
+            ah = self.manager.wait_any()
+            self.assertEqual(ah.status, ActionStatus.done)
+            done.append(ah)
+        self.assertEqual(sorted(done), sorted(ahs))
+        self.assertEqual(self.manager.num_queued(), 0)
+        self.assertEqual(self.manager.wait_any(), FailedActionHandle)
+        for i, (ah, m) in enumerate(zip(ahs, models)):
+            self.assertEqual(m.x[3].value, i)
+            self.assertIsNotNone(self.manager.get_results(ah))
+            self.assertIsNone(self.manager.get_results(ah))
+
+    def test_wait_all(self):
+        models = [_model() for i in range(3)]
+        ahs = [self.manager.queue(m, opt='_pool_test') for m in models]
+        self.manager.wait_all(ahs[1])
+        self.assertEqual(ahs[1].status, ActionStatus.done)
+        self.assertEqual(self.manager.wait_any(ahs[1]), ahs[1])
+        self.manager.wait_all()
+        for ah in ahs:
+            self.assertEqual(ah.status, ActionStatus.done)
+        self.assertEqual(self.manager.num_queued(), 0)
+        self.assertRaises(ActionManagerError, self.manager.wait_for,
+                          FailedActionHandle)
+
+    def test_solve_all(self):
+        models = [_model() for i in range(3)]
+        self.manager.solve_all('_pool_test', models, options={'value': 4})
+        for m in models:
+            self.assertEqual(m.x[2].value, 4)
+
+    def test_concurrent(self):
+        # The solves overlap, even on a single core
+        models = [_model() for i in range(3)]
+        start = time.time()
+        ahs = [self.manager.queue(m, opt='_pool_test',
+                                  options={'sleep': 1})
+               for m in models]
+        self.manager.wait_all(ahs)
+        self.assertTrue(time.time() - start < 2.5)
+        pids = set(self.manager.get_results(ah).solver.message
+                   for ah in ahs)
+        self.assertEqual(len(pids), 3)
+
+    def test_worker_error(self):
+        m = _model()
+        ah = self.manager.queue(m, opt='_pool_test', options={'fail': True})
+        self.assertRaises(RuntimeError, self.manager.wait_for, ah)
+        self.assertEqual(ah.status, ActionStatus.error)
+        self.assertEqual(self.manager.num_queued(), 0)
+
+    def test_no_solver(self):
+        self.assertRaises(ActionManagerError, self.manager.queue, _model())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for the solution file parsers of the CPLEX and GUROBI
+# shell solvers
+#
+
+import os
+import time
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.opt import (SolverResults,
+                       SolverStatus,
+                       SolutionStatus,
+                       ProblemSense,
+                       TerminationCondition,
+                       SymbolColumns)
+from pyomo.environ import *
+
+_cplex_header = """<?xml version = "1.0" standalone="yes"?>
+<?xml-stylesheet href="http://www.ilog.com/products/cplex/xmlv1.1/solution.xsl" type="text/xsl"?>
+<CPLEXSolution version="1.1">
+ <header
+   problemName="%s"
+   objectiveValue="3.5"
+   solutionTypeValue="1"
+   solutionTypeString="basic"
+   solutionStatusValue="1"
+   solutionStatusString="optimal"
+   solutionMethodString="dual"
+   primalFeasible="1"
+   dualFeasible="1"
+   simplexIterations="0"/>
+"""
+
+_cplex_soln = """ <linearConstraints>
+  <constraint name="c_l_c1_" index="0" status="LL" slack="0" dual="1"/>
+  <constraint name="r_l_c2_" index="1" status="LL" slack="0.5" dual="-2"/>
+  <constraint name="r_u_c2_" index="2" status="BS" slack="0" dual="0"/>
+ </linearConstraints>
+ <variables>
+  <variable name="x1" index="0" status="LL" value="0" reducedCost="2"/>
+  <variable name="x2" index="1" status="BS" value="1.5" reducedCost="0"/>
+  <variable name="x3" index="2" status="UL" value="4" reducedCost="-1"/>
+  <variable name="ONE_VAR_CONSTANT" index="3" status="BS" value="1" reducedCost="0"/>
+ </variables>
+</CPLEXSolution>
+"""
+
+_gurobi_soln = """section:problem
+name: test
+sense:maximize
+number_of_objectives: 1
+number_of_variables: 3
+section:solver
+status: ok
+message: Model was solved to optimality: tolerances
+termination_condition: optimal
+section:solution
+status:optimal
+message: Model was solved to optimality
+objective: 3.5
+gap: 0.0
+var: x1 : 0
+var: x2 : 1.5
+var: x3 : 4
+var: ONE_VAR_CONSTANT : 1
+varrc: x1 : 2
+varrc: x2 : 0
+varrc: x3 : -1
+varrc: ONE_VAR_CONSTANT : 0
+constraintdual: c_l_c1_ : 1
+constraintdual: r_l_c2_ : -2
+constraintdual: r_u_c2_ : 0
+constraintdual: c_e_ONE_VAR_CONSTANT : 0
+constraintslack: c_l_c1_ : 0
+constraintslack: r_l_c2_ : 0.5
+constraintslack: r_u_c2_ : 0
+constraintslack: c_e_ONE_VAR_CONSTANT : 0
+"""
+
+def _write_cplex_soln(filename, problem_file, variables, constraints):
+    """
+    Write a CPLEX solution file with (name, value, reduced cost)
+    variables and (name, dual) constraints.
+    """
+    with open(filename, 'w') as f:
+        f.write(_cplex_header % (problem_file,))
+        f.write(' <linearConstraints>\n')
+        for i, (name, dual) in enumerate(constraints):
+            f.write('  <constraint name="%s" index="%d" status="LL" '
+                    'slack="0" dual="%r"/>\n' % (name, i, dual))
+        f.write(' </linearConstraints>\n <variables>\n')
+        for i, (name, val, rc) in enumerate(variables):
+            f.write('  <variable name="%s" index="%d" status="BS" '
+                    'value="%r" reducedCost="%r"/>\n' % (name, i, val, rc))
+        f.write(' </variables>\n</CPLEXSolution>\n')
+
+class TestSolnFile(unittest.TestCase):
+
+    def setUp(self):
+        pyutilib.services.TempfileManager.push()
+        self.problem_file = pyutilib.services.TempfileManager.\
+                            create_tempfile(suffix='.lp')
+        with open(self.problem_file, 'w') as f:
+            f.write("\\* Source Pyomo model name=test *\\\n\nmin \no:\n+1 x1\n")
+        self.soln_file = pyutilib.services.TempfileManager.\
+                         create_tempfile(suffix='.sol')
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.pop(remove=True)
+
+    def _process(self, name, text, suffixes):
+        with open(self.soln_file, 'w') as f:
+            f.write(text)
+        opt = SolverFactory(name)
+        opt._soln_file = self.soln_file
+        opt._suffixes = suffixes
+        opt._best_bound = None
+        opt._gap = None
+        results = SolverResults()
+        opt.process_soln_file(results)
+        opt.deactivate()
+        self.assertEqual(len(results.solution), 1)
+        return results
+
+    def _cplex(self, suffixes):
+        return self._process('_cplex_shell',
+                             _cplex_header % (self.problem_file,)
+                             + _cplex_soln,
+                             suffixes)
+
+    def test_cplex(self):
+        results = self._cplex(['dual', 'slack', 'rc', 'lrc', 'urc'])
+        soln = results.solution(0)
+        self.assertEqual(soln.status, SolutionStatus.optimal)
+        self.assertEqual(soln.objective['__default_objective__']['Value'],
+                         3.5)
+        self.assertEqual(results.problem.sense, ProblemSense.minimize)
+        self.assertEqual(results.problem.upper_bound, 3.5)
+        self.assertIs(type(soln.variable), SymbolColumns)
+        self.assertEqual(soln.variable.todict(),
+                         {'x1': {'Value': 0, 'Rc': 2, 'Lrc': 2, 'Urc': 0},
+                          'x2': {'Value': 1.5, 'Rc': 0, 'Lrc': 0, 'Urc': 0},
+                          'x3': {'Value': 4, 'Rc': -1, 'Lrc': 0, 'Urc': -1}})
+        self.assertIs(type(soln.constraint), SymbolColumns)
+        self.assertEqual(soln.constraint.todict(),
+                         {'c_l_c1_': {'Dual': 1, 'Slack': 0},
+                          'r_l_c2_': {'Dual': -2, 'Slack': 0.5}})
+
+    def test_cplex_suffixes(self):
+        # only the requested suffixes are read
+        soln = self._cplex(['dual']).solution(0)
+        self.assertEqual(list(soln.variable.columns), ['Value'])
+        self.assertEqual(list(soln.constraint.columns), ['Dual'])
+        self.assertEqual(soln.constraint['r_l_c2_']['Dual'], -2)
+        soln = self._cplex([]).solution(0)
+        self.assertEqual(soln.variable['x2']['Value'], 1.5)
+        self.assertEqual(len(soln.constraint), 0)
+        self.assertRaises(RuntimeError, self._cplex, ['bad'])
+
+    def test_cplex_infeasible(self):
+        text = _cplex_header % (self.problem_file,)
+        text = text.replace('solutionStatusValue="1"',
+                            'solutionStatusValue="3"')
+        text = text.replace('solutionStatusString="optimal"',
+                            'solutionStatusString="infeasible"')
+        results = self._process('_cplex_shell',
+                                text + "</CPLEXSolution>\n", [])
+        soln = results.solution(0)
+        self.assertEqual(soln.status, SolutionStatus.infeasible)
+        self.assertEqual(len(soln.variable), 0)
+
+    def test_gurobi(self):
+        results = self._process('_gurobi_shell', _gurobi_soln,
+                                ['dual', 'slack', 'rc'])
+        self.assertEqual(results.problem.sense, ProblemSense.maximize)
+        self.assertEqual(results.problem.lower_bound, 3.5)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        soln = results.solution(0)
+        self.assertEqual(soln.status, SolutionStatus.optimal)
+        self.assertEqual(soln.gap, 0.0)
+        self.assertIs(type(soln.variable), SymbolColumns)
+        self.assertEqual(soln.variable.todict(),
+                         {'x1': {'Value': 0, 'Rc': 2},
+                          'x2': {'Value': 1.5, 'Rc': 0},
+                          'x3': {'Value': 4, 'Rc': -1}})
+        self.assertEqual(soln.constraint.todict(),
+                         {'c_l_c1_': {'Dual': 1, 'Slack': 0},
+                          'r_l_c2_': {'Dual': -2, 'Slack': 0.5}})
+
+    def test_gurobi_suffixes(self):
+        # only the requested suffixes are read
+        soln = self._process('_gurobi_shell', _gurobi_soln,
+                             ['slack']).solution(0)
+        self.assertEqual(list(soln.variable.columns), ['Value'])
+        self.assertEqual(soln.constraint.todict(),
+                         {'c_l_c1_': {'Slack': 0},
+                          'r_l_c2_': {'Slack': 0.5}})
+        soln = self._process('_gurobi_shell', _gurobi_soln,
+                             []).solution(0)
+        self.assertEqual(soln.variable['x3']['Value'], 4)
+        self.assertEqual(len(soln.constraint), 0)
+
+    def test_load(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 10))
+        m.o = Objective(expr=summation(m.x))
+        m.c = Constraint([1, 2], rule=lambda m, i: m.x[i] + m.x[i+1] >= i)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.rc = Suffix(direction=Suffix.IMPORT)
+        fname, smap_id = m.write(self.problem_file,
+                                 io_options={'symbolic_solver_labels': True})
+        variables = [('x(%d)' % i, i + 0.5, -i) for i in m.x]
+        constraints = [('c_l_c(%d)_' % i, 2.0 * i) for i in m.c]
+        _write_cplex_soln(self.soln_file, self.problem_file,
+                          variables, constraints)
+        opt = SolverFactory('_cplex_shell')
+        opt._soln_file = self.soln_file
+        opt._suffixes = ['dual', 'rc']
+        opt._best_bound = None
+        opt._gap = None
+        results = SolverResults()
+        opt.process_soln_file(results)
+        opt.deactivate()
+        results._smap_id = smap_id
+        m.solutions.load_from(results)
+        for i in m.x:
+            self.assertEqual(m.x[i].value, i + 0.5)
+            self.assertEqual(m.rc[m.x[i]], -i)
+        for i in m.c:
+            self.assertEqual(m.dual[m.c[i]], 2.0 * i)
+
+@unittest.category('performance', include_in_all=False)
+class TestSolnFilePerformance(unittest.TestCase):
+    """
+    Time the parsing of a CPLEX solution file with 200000 variables
+    and constraints, with and without reduced costs.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_cplex(self):
+        N = 200000
+        with pyutilib.services.TempfileManager.push():
+            problem_file = pyutilib.services.TempfileManager.\
+                           create_tempfile(suffix='.lp')
+            with open(problem_file, 'w') as f:
+                f.write("min \no:\n+1 x1\n")
+            soln_file = pyutilib.services.TempfileManager.\
+                        create_tempfile(suffix='.sol')
+            _write_cplex_soln(soln_file,
+                              problem_file,
+                              [('x%d' % i, i + 0.5, -i) for i in range(N)],
+                              [('c_l_c(%d)_' % i, 2.0 * i) for i in range(N)])
+            for suffixes in (['dual'], ['dual', 'rc']):
+                opt = SolverFactory('_cplex_shell')
+                opt._soln_file = soln_file
+                opt._suffixes = suffixes
+                opt._best_bound = None
+                opt._gap = None
+                start = time.time()
+                opt.process_soln_file(SolverResults())
+                seconds = time.time() - start
+                opt.deactivate()
+                label = ','.join(suffixes)
+                self.recordTestData(label + ' seconds', seconds)
+                print("%s: %.2f s" % (label, seconds))
+
+if __name__ == "__main__":
+    unittest.main()
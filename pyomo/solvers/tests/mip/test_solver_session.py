@@ -0,0 +1,208 @@
+#  _________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2014 Sandia Corporation.
+#  Under the terms of Contract DE-AC04-94AL85000 with Sandia Corporation,
+#  the U.S. Government retains certain rights in this software.
+#  This software is distributed under the BSD License.
+#  _________________________________________________________________________
+#
+# Unit Tests for interactive solver sessions
+#
+
+import os
+import sys
+import stat
+import time
+import tempfile
+
+import pyutilib.th as unittest
+import pyutilib.services
+from pyutilib.common import ApplicationError
+
+from pyomo.opt import ProblemFormat, TerminationCondition
+from pyomo.environ import *
+
+# An interactive solver that reads CBC commands.  The solution sets
+# every variable in the bounds section of the LP file to the 'value'
+# setting.
+_fake_cbc = """#!%s
+import os, re, sys, time
+settings = {}
+symbols = []
+def prompt():
+    sys.stdout.write('Coin:')
+    sys.stdout.flush()
+sys.stdout.write('Fake CBC\\n')
+prompt()
+for line in iter(sys.stdin.readline, ''):
+    tokens = line.split()
+    if tokens[0] == 'import':
+        with open(tokens[1]) as f:
+            bounds = f.read().split('\\nbounds\\n')[1]
+        symbols = re.findall(r'\\bx\\d+\\b', bounds)
+    elif tokens[0] == 'solve':
+        if 'hang' in settings:
+            time.sleep(60)
+        sys.stdout.write('pid %%d\\n' %% os.getpid())
+        sys.stdout.write('Result - Optimal solution found\\n\\n')
+        sys.stdout.write('Objective value:   1.0\\n')
+    elif tokens[0] == 'solution':
+        with open(tokens[1], 'w') as f:
+            f.write('Optimal - objective value 1.0\\n')
+            f.write('0 c_dummy 0 0\\n')
+            for i, symbol in enumerate(symbols):
+                f.write('%%d %%s %%s 0\\n'
+                        %% (i, symbol, settings.get('value', '1')))
+    elif tokens[0] == 'stop':
+        sys.exit(0)
+    else:
+        settings[tokens[0]] = ' '.join(tokens[1:])
+    prompt()
+""" % (sys.executable,)
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(0, 10))
+    m.o = Objective(expr=summation(m.x))
+    m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+    return m
+
+class TestSolverSession(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        fd, cls.executable = tempfile.mkstemp(suffix='.py')
+        with os.fdopen(fd, 'w') as f:
+            f.write(_fake_cbc)
+        os.chmod(cls.executable,
+                 os.stat(cls.executable).st_mode | stat.S_IXUSR)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.executable)
+
+    def setUp(self):
+        self.opt = SolverFactory('_cbc_shell', executable=self.executable)
+
+    def tearDown(self):
+        self.opt.deactivate()
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def test_session(self):
+        with self.opt.session() as session:
+            self.assertIs(self.opt._session, session)
+            self.assertIsNone(session.pid)
+            pids = set()
+            for i in range(3):
+                m = _model()
+                results = self.opt.solve(m)
+                self.assertEqual(results.solver.termination_condition,
+                                 TerminationCondition.optimal)
+                for j in m.x:
+                    self.assertEqual(m.x[j].value, 1)
+                self.assertIn('pid %d' % session.pid, self.opt._log)
+                pids.add(session.pid)
+            self.assertEqual(len(pids), 1)
+            self.assertNotEqual(pids.pop(), os.getpid())
+        self.assertIsNone(session.pid)
+        self.assertIsNone(self.opt._session)
+
+    def test_settings(self):
+        with self.opt.session() as session:
+            m = _model()
+            self.opt.solve(m, options={'value': 2})
+            self.assertEqual(m.x[1].value, 2)
+            pid = session.pid
+            self.opt.solve(m, options={'value': 2})
+            self.assertEqual(session.pid, pid)
+            # the solver is restarted when the settings change
+            self.opt.solve(m, options={'value': 3})
+            self.assertEqual(m.x[1].value, 3)
+            self.assertNotEqual(session.pid, pid)
+            pid = session.pid
+            self.opt.solve(m)
+            self.assertEqual(m.x[1].value, 1)
+            self.assertNotEqual(session.pid, pid)
+
+    def test_solver_exit(self):
+        # action options are run after the solution is written
+        with self.opt.session() as session:
+            m = _model()
+            results = self.opt.solve(m, options={'value': 2, 'stop': ''})
+            self.assertEqual(m.x[1].value, 2)
+            self.assertEqual(results.solver.error_rc, 0)
+            self.assertIsNone(session.pid)
+            self.opt.solve(m, options={'value': 4})
+            self.assertEqual(m.x[1].value, 4)
+            self.assertIsNotNone(session.pid)
+
+    def test_timelimit(self):
+        with self.opt.session() as session:
+            m = _model()
+            start = time.time()
+            self.assertRaises(ApplicationError, self.opt.solve, m,
+                              timelimit=1, options={'hang': 1})
+            self.assertTrue(time.time() - start < 30)
+            self.assertIsNone(session.pid)
+            self.opt.solve(m, timelimit=5)
+            self.assertEqual(m.x[1].value, 1)
+
+    def test_nested(self):
+        with self.opt.session():
+            self.assertRaises(RuntimeError, self.opt.session().__enter__)
+        with self.opt.session():
+            pass
+
+    def test_command(self):
+        # the time limit is normally set by solve()
+        self.opt._timelimit = 10
+        command = self.opt.create_command_line(
+            'cbc', ['problem.lp'])
+        self.assertEqual(command.session.cmd, ['cbc'])
+        self.assertEqual(command.session.prompt, 'Coin:')
+        self.assertEqual(command.session.settings,
+                         ['sec 10', 'printingOptions all'])
+        self.assertEqual(command.session.script,
+                         ['import problem.lp',
+                          'solve',
+                          'solution problem.soln'])
+        self.opt.set_problem_format(ProblemFormat.nl)
+        command = self.opt.create_command_line(
+            'cbc', ['problem.nl'])
+        self.assertIsNone(command.session)
+
+@unittest.skipIf(pyutilib.services.registered_executable('cbc') is None,
+                 "The 'cbc' executable is not available")
+@unittest.category('performance', include_in_all=False)
+class TestSolverSessionPerformance(unittest.TestCase):
+    """
+    Compare the time per solve of a small MIP with and without a CBC
+    session.
+
+    Run with PYUTILIB_UNITTEST_CATEGORY=performance.
+    """
+
+    def test_latency(self):
+        N = 50
+        m = _model()
+        m.y = Var(within=Binary)
+        m.d = Constraint(expr=m.x[3] <= 10*m.y)
+        opt = SolverFactory('cbc')
+        start = time.time()
+        for i in range(N):
+            opt.solve(m)
+        shell = (time.time() - start) / N
+        with opt.session():
+            start = time.time()
+            for i in range(N):
+                opt.solve(m)
+            session = (time.time() - start) / N
+        opt.deactivate()
+        self.recordTestData('shell seconds per solve', shell)
+        self.recordTestData('session seconds per solve', session)
+        print("shell:   %.4f s per solve" % (shell,))
+        print("session: %.4f s per solve" % (session,))
+
+if __name__ == "__main__":
+    unittest.main()